@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+Claude Plugins Validation - Benchmark and Regression Suite
+
+Generates synthetic plugins of configurable size and times each validation
+entry point against them. Every entry point runs in a fresh child process so
+that peak RSS is measured per validator rather than for the whole run.
+
+Measured entry points:
+    validate_plugin               - full plugin validation (as run by CI)
+    validate_scoring              - compute_quality_score (all validators)
+    validate_security             - validate_security
+    validate_encoding             - validate_encoding
+    validate_skill_comprehensive  - validate_skill for every skill directory
+    validate_xref                 - validate_cross_references
+
+Usage:
+    uv run python scripts/benchmark_validation.py
+    uv run python scripts/benchmark_validation.py --skills 500 --agents 200 --files 10000
+    uv run python scripts/benchmark_validation.py --save-baseline bench-baseline.json
+    uv run python scripts/benchmark_validation.py --baseline bench-baseline.json --tolerance 0.2
+    uv run python scripts/benchmark_validation.py --plugin /path/to/plugin --only validate_security
+
+Output is JSON (stdout or --output) with wall time, files/s, MB/s and peak
+RSS per entry point.
+
+Exit codes:
+    0 - Benchmark completed (and no regression against the baseline)
+    1 - Error (invalid arguments, entry point crashed)
+    2 - Performance regression detected against the baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Entry points in execution order
+ENTRY_POINTS = [
+    "validate_plugin",
+    "validate_scoring",
+    "validate_security",
+    "validate_encoding",
+    "validate_skill_comprehensive",
+    "validate_xref",
+]
+
+# Default synthetic plugin size (small enough for a quick local run)
+DEFAULT_SKILLS = 50
+DEFAULT_AGENTS = 20
+DEFAULT_FILES = 1000
+DEFAULT_SECRET_DENSITY = 0.01
+DEFAULT_PATH_DENSITY = 0.02
+
+# Default allowed slowdown before a result counts as a regression (20%)
+DEFAULT_TOLERANCE = 0.2
+
+# Fake findings injected into generated files (match validation_common patterns)
+FAKE_SECRETS = [
+    "AKIA" + "ABCDEFGHIJKLMNOP",
+    "ghp_" + "a1b2c3d4e5" * 3 + "f6g7h8",
+    'api_key = "' + "x" * 24 + '"',
+]
+FAKE_PATHS = [
+    "/home/benchuser/projects/demo/config.yaml",
+    "/Users/benchuser/Library/cache.db",
+]
+
+
+# =============================================================================
+# Synthetic Plugin Generation
+# =============================================================================
+
+
+def _words(rng: random.Random, count: int) -> str:
+    """Return `count` pseudo-random lowercase words."""
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(count))
+
+
+def _body_line(rng: random.Random, secret_density: float, path_density: float) -> str:
+    """Return one line of filler text, occasionally carrying a fake finding."""
+    roll = rng.random()
+    if roll < secret_density:
+        return f"Example credential: {rng.choice(FAKE_SECRETS)}"
+    if roll < secret_density + path_density:
+        return f"See {rng.choice(FAKE_PATHS)} for details."
+    return _words(rng, rng.randint(6, 14)).capitalize() + "."
+
+
+def generate_synthetic_plugin(
+    root: Path,
+    skills: int = DEFAULT_SKILLS,
+    agents: int = DEFAULT_AGENTS,
+    files: int = DEFAULT_FILES,
+    secret_density: float = DEFAULT_SECRET_DENSITY,
+    path_density: float = DEFAULT_PATH_DENSITY,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Generate a synthetic plugin tree for benchmarking.
+
+    Args:
+        root: Directory to create the plugin in (created if missing)
+        skills: Number of skill directories
+        agents: Number of agent definitions
+        files: Total number of files to reach (filler reference docs make up the rest)
+        secret_density: Fraction of filler lines carrying a fake secret
+        path_density: Fraction of filler lines carrying a hardcoded user path
+        seed: Random seed (same seed -> identical tree)
+
+    Returns:
+        Dictionary describing the generated tree (counts and total bytes)
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+
+    def write(rel_path: str, content: str) -> None:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        written.append(path)
+
+    agent_names = [f"bench-agent-{i:04d}" for i in range(agents)]
+    skill_names = [f"bench-skill-{i:04d}" for i in range(skills)]
+
+    manifest = {
+        "name": "bench-plugin",
+        "version": "1.0.0",
+        "description": "Synthetic plugin generated for validator benchmarks",
+        "author": {"name": "Bench"},
+        "license": "MIT",
+        "agents": [f"./agents/{name}.md" for name in agent_names],
+        "skills": "./skills/",
+    }
+    write(".claude-plugin/plugin.json", json.dumps(manifest, indent=2) + "\n")
+    write("README.md", "# Bench Plugin\n\n## Installation\n\n```bash\nclaude plugin install bench-plugin\n```\n")
+    write("LICENSE", "MIT License\n\nCopyright (c) Bench\n")
+
+    for name in agent_names:
+        skill_refs = "".join(f"  - {rng.choice(skill_names)}\n" for _ in range(min(3, skills)))
+        body = "\n".join(_body_line(rng, secret_density, path_density) for _ in range(20))
+        write(
+            f"agents/{name}.md",
+            f"---\nname: {name}\ndescription: Synthetic benchmark agent {name}. Use when benchmarking.\n"
+            f"model: sonnet\nskills:\n{skill_refs}---\n\n# {name}\n\n{body}\n",
+        )
+
+    for name in skill_names:
+        body = "\n".join(_body_line(rng, secret_density, path_density) for _ in range(30))
+        write(
+            f"skills/{name}/SKILL.md",
+            f"---\nname: {name}\ndescription: Synthetic benchmark skill {name}. "
+            f"Use when benchmarking validators. Trigger with benchmark requests.\n---\n\n"
+            f"# {name}\n\n## Overview\n\n{body}\n\n## Instructions\n\n1. Read [reference](references/guide.md)\n",
+        )
+        write(f"skills/{name}/references/guide.md", f"# Guide\n\n{_words(rng, 40)}\n")
+
+    # Filler documents until the requested total file count is reached
+    remaining = max(0, files - len(written))
+    for i in range(remaining):
+        owner = skill_names[i % skills] if skills else "shared"
+        base = f"skills/{owner}/references" if skills else "docs"
+        body = "\n".join(_body_line(rng, secret_density, path_density) for _ in range(rng.randint(10, 60)))
+        write(f"{base}/doc-{i:06d}.md", f"# Document {i}\n\n{body}\n")
+
+    return {
+        "skills": skills,
+        "agents": agents,
+        "files": len(written),
+        "bytes": sum(p.stat().st_size for p in written),
+        "secret_density": secret_density,
+        "path_density": path_density,
+        "seed": seed,
+    }
+
+
+def measure_tree(root: Path) -> dict[str, int]:
+    """Count files and bytes in an existing plugin tree (skipping .git)."""
+    files = 0
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+                files += 1
+            except OSError:
+                pass
+    return {"files": files, "bytes": total}
+
+
+# =============================================================================
+# Entry Points (run inside the child process)
+# =============================================================================
+
+
+def _run_validate_plugin(plugin_root: Path) -> int:
+    from validate_plugin import (
+        ValidationReport,
+        validate_agents,
+        validate_commands,
+        validate_hooks,
+        validate_license,
+        validate_manifest,
+        validate_mcp,
+        validate_no_local_paths,
+        validate_readme,
+        validate_scripts,
+        validate_skills,
+        validate_structure,
+        validate_workflow_inline_python,
+    )
+
+    report = ValidationReport()
+    validate_manifest(plugin_root, report, False)
+    validate_structure(plugin_root, report, False)
+    validate_commands(plugin_root, report)
+    validate_agents(plugin_root, report)
+    validate_hooks(plugin_root, report)
+    validate_mcp(plugin_root, report)
+    validate_scripts(plugin_root, report)
+    validate_skills(plugin_root, report, None)
+    validate_readme(plugin_root, report)
+    validate_license(plugin_root, report)
+    validate_no_local_paths(plugin_root, report)
+    validate_workflow_inline_python(plugin_root, report)
+    return report.exit_code
+
+
+def _run_validate_scoring(plugin_root: Path) -> int:
+    from validate_scoring import compute_quality_score
+
+    report = compute_quality_score(plugin_root)
+    return 0 if report.status == "PASS" else 1
+
+
+def _run_validate_security(plugin_root: Path) -> int:
+    from validate_security import validate_security
+
+    return validate_security(plugin_root).exit_code
+
+
+def _run_validate_encoding(plugin_root: Path) -> int:
+    from validate_encoding import validate_encoding
+
+    return validate_encoding(plugin_root).exit_code
+
+
+def _run_validate_skill_comprehensive(plugin_root: Path) -> int:
+    from validate_skill_comprehensive import validate_skill
+
+    codes: list[int] = []
+    skills_dir = plugin_root / "skills"
+    if skills_dir.is_dir():
+        for skill_dir in sorted(d for d in skills_dir.iterdir() if d.is_dir()):
+            codes.append(validate_skill(skill_dir).exit_code)
+    # Lower non-zero exit codes are more severe (1=CRITICAL, 2=MAJOR, 3=MINOR)
+    failures = [code for code in codes if code]
+    return min(failures) if failures else 0
+
+
+def _run_validate_xref(plugin_root: Path) -> int:
+    from validate_xref import validate_cross_references
+
+    return validate_cross_references(plugin_root).exit_code
+
+
+RUNNERS: dict[str, Callable[[Path], int]] = {
+    "validate_plugin": _run_validate_plugin,
+    "validate_scoring": _run_validate_scoring,
+    "validate_security": _run_validate_security,
+    "validate_encoding": _run_validate_encoding,
+    "validate_skill_comprehensive": _run_validate_skill_comprehensive,
+    "validate_xref": _run_validate_xref,
+}
+
+
+def peak_rss_mb() -> float | None:
+    """Return this process's peak resident set size in MB (None if unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def run_entry_point_child(name: str, plugin_root: Path) -> dict[str, Any]:
+    """Run one entry point in this (child) process and measure it."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    runner = RUNNERS[name]
+    # Silence validator console output so it does not skew timings
+    with open(os.devnull, "w") as devnull:
+        saved_stdout = sys.stdout
+        sys.stdout = devnull
+        start = time.perf_counter()
+        try:
+            exit_code = runner(plugin_root)
+            error = None
+        except Exception as e:
+            exit_code = -1
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            elapsed = time.perf_counter() - start
+            sys.stdout = saved_stdout
+    return {"seconds": elapsed, "peak_rss_mb": peak_rss_mb(), "exit_code": exit_code, "error": error}
+
+
+# =============================================================================
+# Benchmark Driver
+# =============================================================================
+
+
+def time_entry_point(name: str, plugin_root: Path, tree: dict[str, int], repeat: int) -> dict[str, Any]:
+    """Time an entry point `repeat` times, each in a fresh child process.
+
+    Returns:
+        Result dictionary with median/min seconds, throughput and peak RSS
+    """
+    samples: list[dict[str, Any]] = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--run-one", name, str(plugin_root)],
+            capture_output=True,
+            text=True,
+        )
+        try:
+            samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        except (json.JSONDecodeError, IndexError):
+            samples.append({"seconds": 0.0, "peak_rss_mb": None, "exit_code": -1, "error": proc.stderr.strip()[-500:]})
+
+    seconds = [s["seconds"] for s in samples]
+    median = statistics.median(seconds)
+    rss_values = [s["peak_rss_mb"] for s in samples if s.get("peak_rss_mb") is not None]
+    errors = [s["error"] for s in samples if s.get("error")]
+    return {
+        "seconds": round(median, 4),
+        "seconds_min": round(min(seconds), 4),
+        "files_per_sec": round(tree["files"] / median, 1) if median > 0 else None,
+        "mb_per_sec": round(tree["bytes"] / (1024 * 1024) / median, 2) if median > 0 else None,
+        "peak_rss_mb": max(rss_values) if rss_values else None,
+        "exit_code": samples[-1]["exit_code"],
+        "errors": errors,
+    }
+
+
+def compare_to_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[dict[str, Any]]:
+    """Compare benchmark results with a stored baseline.
+
+    An entry point regresses when its median time or peak RSS exceeds the
+    baseline value by more than `tolerance` (a fraction, 0.2 = 20%).
+
+    Args:
+        current: Benchmark output of this run
+        baseline: Previously saved benchmark output
+        tolerance: Allowed relative increase
+
+    Returns:
+        List of regression records (empty when nothing regressed)
+    """
+    regressions: list[dict[str, Any]] = []
+    base_results = baseline.get("results", {})
+    for name, result in current.get("results", {}).items():
+        base = base_results.get(name)
+        if not base:
+            continue
+        for metric in ("seconds", "peak_rss_mb"):
+            now, before = result.get(metric), base.get(metric)
+            if not now or not before:
+                continue
+            ratio = now / before
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    {
+                        "entry_point": name,
+                        "metric": metric,
+                        "baseline": before,
+                        "current": now,
+                        "change_pct": round((ratio - 1) * 100, 1),
+                    }
+                )
+    return regressions
+
+
+def run_benchmark(
+    plugin_root: Path,
+    tree: dict[str, Any],
+    entry_points: list[str],
+    repeat: int = 1,
+) -> dict[str, Any]:
+    """Run the benchmark for the selected entry points.
+
+    Returns:
+        Machine-readable benchmark output
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tree": tree,
+        "repeat": repeat,
+        "results": {name: time_entry_point(name, plugin_root, tree, repeat) for name in entry_points},
+    }
+
+
+# =============================================================================
+# CLI Main
+# =============================================================================
+
+
+def main() -> int:
+    """CLI entry point."""
+    if len(sys.argv) == 4 and sys.argv[1] == "--run-one":
+        print(json.dumps(run_entry_point_child(sys.argv[2], Path(sys.argv[3]))))
+        return 0
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the plugin validation toolchain on synthetic plugins",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--plugin", type=Path, help="Benchmark an existing plugin instead of a synthetic one")
+    parser.add_argument("--skills", type=int, default=DEFAULT_SKILLS, help="Synthetic skill count")
+    parser.add_argument("--agents", type=int, default=DEFAULT_AGENTS, help="Synthetic agent count")
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES, help="Total synthetic file count")
+    parser.add_argument(
+        "--secret-density", type=float, default=DEFAULT_SECRET_DENSITY, help="Fraction of lines with fake secrets"
+    )
+    parser.add_argument(
+        "--path-density", type=float, default=DEFAULT_PATH_DENSITY, help="Fraction of lines with hardcoded paths"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic plugin")
+    parser.add_argument("--only", nargs="+", choices=ENTRY_POINTS, help="Entry points to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per entry point (median is reported)")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Compare against a saved baseline JSON file")
+    parser.add_argument("--save-baseline", type=Path, help="Save this run as the new baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown before regression (0.2 = 20%%)"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the generated synthetic plugin")
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        print("Error: --repeat must be >= 1", file=sys.stderr)
+        return 1
+
+    temp_dir: Path | None = None
+    if args.plugin:
+        if not args.plugin.is_dir():
+            print(f"Error: {args.plugin} is not a directory", file=sys.stderr)
+            return 1
+        plugin_root = args.plugin.resolve()
+        tree: dict[str, Any] = measure_tree(plugin_root)
+    else:
+        temp_dir = Path(tempfile.mkdtemp(prefix="bench-plugin-"))
+        plugin_root = temp_dir / "bench-plugin"
+        tree = generate_synthetic_plugin(
+            plugin_root,
+            skills=args.skills,
+            agents=args.agents,
+            files=args.files,
+            secret_density=args.secret_density,
+            path_density=args.path_density,
+            seed=args.seed,
+        )
+
+    try:
+        output = run_benchmark(plugin_root, tree, args.only or ENTRY_POINTS, args.repeat)
+    finally:
+        if temp_dir is not None:
+            if args.keep:
+                print(f"Synthetic plugin kept at: {plugin_root}", file=sys.stderr)
+            else:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    exit_code = 0
+    if any(result["errors"] for result in output["results"].values()):
+        exit_code = 1
+
+    if args.baseline:
+        try:
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 1
+        if baseline.get("tree") != output["tree"]:
+            print("Warning: baseline was recorded on a different tree; comparison may be meaningless", file=sys.stderr)
+        output["regressions"] = compare_to_baseline(output, baseline, args.tolerance)
+        if output["regressions"]:
+            exit_code = 2
+
+    text = json.dumps(output, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.save_baseline:
+        args.save_baseline.write_text(text + "\n", encoding="utf-8")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
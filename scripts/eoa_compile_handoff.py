@@ -6,13 +6,19 @@ Compiles a handoff document for an agent from module specification and context.
 Reads requirements from design/requirements/ and context from design/memory/.
 Generates compiled handoff in design/handoffs/{agent-id}/.
 
+With --batch, the design tree is indexed once and handoffs are compiled for
+many (agent, module) assignments in one run; each handoff is written as soon
+as it is compiled and index.yaml is updated once at the end.
+
 Usage:
     python3 eoa_compile_handoff.py MODULE_ID AGENT_ID
     python3 eoa_compile_handoff.py auth-core implementer-1 --platform web
     python3 eoa_compile_handoff.py auth-core implementer-1 --include-context decision-001
+    python3 eoa_compile_handoff.py --batch assignments.json
 """
 
 import argparse
+import fnmatch
 import json
 import sys
 import uuid
@@ -64,102 +70,133 @@ def read_yaml_file(path: Path) -> dict[str, Any]:
         return {}
 
 
-def find_module_spec(
-    root: Path, module_id: str, platform: str | None = None
-) -> tuple[Path | None, str]:
-    """Find the module specification file. Returns (path, content)."""
-    search_paths = []
+class DesignTree:
+    """Lazily built index of a design folder, shared across handoff compilations.
+
+    Requirement spec and RDD listings, the memory document list, file
+    contents and the orchestration state are each read at most once, so
+    compiling many handoffs costs one scan of the design tree.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._requirements: dict[str, dict[str, list[Path]]] | None = None
+        self._memory_docs: list[Path] | None = None
+        self._contents: dict[Path, str] = {}
+        self._state_modules: list[dict[str, Any]] | None = None
+
+    def requirements(self) -> dict[str, dict[str, list[Path]]]:
+        """Platform -> {"specs": [...], "rdd": [...]} markdown files, in directory order."""
+        if self._requirements is None:
+            self._requirements = {}
+            requirements_dir = self.root / "requirements"
+            if requirements_dir.exists():
+                for platform_dir in requirements_dir.iterdir():
+                    if platform_dir.is_dir():
+                        self._requirements[platform_dir.name] = {
+                            kind: list((platform_dir / kind).glob("*.md"))
+                            if (platform_dir / kind).exists()
+                            else []
+                            for kind in ("specs", "rdd")
+                        }
+        return self._requirements
+
+    def _exists(self, platform: str, kind: str, name: str) -> Path | None:
+        path = self.root / "requirements" / platform / kind / name
+        files = self.requirements().get(platform)
+        if files is None or "/" in platform:
+            # Not a direct child of requirements/: fall back to the filesystem
+            return path if path.exists() else None
+        return path if path in files[kind] else None
+
+    def read(self, path: Path) -> str:
+        """Read a file once; later calls return the cached content."""
+        if path not in self._contents:
+            self._contents[path] = path.read_text(encoding="utf-8")
+        return self._contents[path]
+
+    def find_module_spec(self, module_id: str, platform: str | None = None) -> tuple[Path | None, str]:
+        """Find the module specification file. Returns (path, content)."""
+        names = [f"{module_id}.md", f"{module_id}-spec.md"]
+        platforms = [platform, "shared"] if platform else ["shared"]
+        for search_platform in platforms:
+            for name in names:
+                path = self._exists(search_platform, "specs", name)
+                if path is not None:
+                    return path, self.read(path)
+
+        # Search all platforms if not found
+        pattern = f"*{module_id}*.md"
+        for files in self.requirements().values():
+            for spec_file in files["specs"]:
+                if fnmatch.fnmatchcase(spec_file.name, pattern) and spec_file.exists():
+                    return spec_file, self.read(spec_file)
+
+        return None, ""
+
+    def find_rdd_file(self, module_id: str, platform: str | None = None) -> tuple[Path | None, str]:
+        """Find the RDD file for a module. Returns (path, content)."""
+        names = [f"{module_id}.md", f"{module_id}-rdd.md"]
+        platforms = [platform, "shared"] if platform else ["shared"]
+        for search_platform in platforms:
+            for name in names:
+                path = self._exists(search_platform, "rdd", name)
+                if path is not None:
+                    return path, self.read(path)
+
+        return None, ""
+
+    def find_context_docs(self, doc_ids: list[str]) -> list[tuple[str, str]]:
+        """Find context documents by ID. Returns list of (id, content)."""
+        if self._memory_docs is None:
+            memory_dir = self.root / "memory"
+            self._memory_docs = list(memory_dir.rglob("*.md")) if memory_dir.exists() else []
+
+        results: list[tuple[str, str]] = []
+        for doc_id in doc_ids:
+            # First file whose name contains the ID
+            for md_file in self._memory_docs:
+                if doc_id in md_file.stem:
+                    results.append((doc_id, self.read(md_file)))
+                    break
 
-    if platform:
-        # Search platform-specific first
-        search_paths.append(
-            root / "requirements" / platform / "specs" / f"{module_id}.md"
-        )
-        search_paths.append(
-            root / "requirements" / platform / "specs" / f"{module_id}-spec.md"
-        )
+        return results
 
-    # Search shared
-    search_paths.append(root / "requirements" / "shared" / "specs" / f"{module_id}.md")
-    search_paths.append(
-        root / "requirements" / "shared" / "specs" / f"{module_id}-spec.md"
-    )
+    def get_module_from_state(self, module_id: str) -> dict[str, Any] | None:
+        """Get module info from orchestration state file."""
+        if self._state_modules is None:
+            data, _ = parse_frontmatter(EXEC_STATE_FILE)
+            self._state_modules = data.get("modules", []) or []
 
-    # Search all platforms if not found
-    requirements_dir = root / "requirements"
-    if requirements_dir.exists():
-        for platform_dir in requirements_dir.iterdir():
-            if platform_dir.is_dir():
-                specs_dir = platform_dir / "specs"
-                if specs_dir.exists():
-                    for spec_file in specs_dir.glob(f"*{module_id}*.md"):
-                        search_paths.append(spec_file)
+        for module in self._state_modules:
+            if module.get("id") == module_id:
+                return cast(dict[str, Any], module)
+
+        return None
 
-    for path in search_paths:
-        if path.exists():
-            return path, path.read_text(encoding="utf-8")
 
-    return None, ""
+def find_module_spec(
+    root: Path, module_id: str, platform: str | None = None
+) -> tuple[Path | None, str]:
+    """Find the module specification file. Returns (path, content)."""
+    return DesignTree(root).find_module_spec(module_id, platform)
 
 
 def find_rdd_file(
     root: Path, module_id: str, platform: str | None = None
 ) -> tuple[Path | None, str]:
     """Find the RDD file for a module. Returns (path, content)."""
-    search_paths = []
-
-    if platform:
-        search_paths.append(
-            root / "requirements" / platform / "rdd" / f"{module_id}.md"
-        )
-        search_paths.append(
-            root / "requirements" / platform / "rdd" / f"{module_id}-rdd.md"
-        )
-
-    search_paths.append(root / "requirements" / "shared" / "rdd" / f"{module_id}.md")
-    search_paths.append(
-        root / "requirements" / "shared" / "rdd" / f"{module_id}-rdd.md"
-    )
-
-    for path in search_paths:
-        if path.exists():
-            return path, path.read_text(encoding="utf-8")
-
-    return None, ""
+    return DesignTree(root).find_rdd_file(module_id, platform)
 
 
 def find_context_docs(root: Path, doc_ids: list[str]) -> list[tuple[str, str]]:
     """Find context documents by ID. Returns list of (id, content)."""
-    results: list[tuple[str, str]] = []
-    memory_dir = root / "memory"
-
-    if not memory_dir.exists():
-        return results
-
-    for doc_id in doc_ids:
-        # Search for files matching the ID
-        for md_file in memory_dir.rglob("*.md"):
-            if doc_id in md_file.stem:
-                content = md_file.read_text(encoding="utf-8")
-                results.append((doc_id, content))
-                break
-
-    return results
+    return DesignTree(root).find_context_docs(doc_ids)
 
 
 def get_module_from_state(module_id: str) -> dict[str, Any] | None:
     """Get module info from orchestration state file."""
-    if not EXEC_STATE_FILE.exists():
-        return None
-
-    data, _ = parse_frontmatter(EXEC_STATE_FILE)
-    modules = data.get("modules", [])
-
-    for module in modules:
-        if module.get("id") == module_id:
-            return cast(dict[str, Any], module)
-
-    return None
+    return DesignTree(Path(DEFAULT_ROOT)).get_module_from_state(module_id)
 
 
 def compile_handoff(
@@ -169,24 +206,30 @@ def compile_handoff(
     platform: str | None = None,
     context_ids: list[str] | None = None,
     config_files: list[str] | None = None,
+    tree: DesignTree | None = None,
 ) -> dict[str, Any]:
-    """Compile a handoff document from available sources."""
+    """Compile a handoff document from available sources.
+
+    Pass the same DesignTree to compile several handoffs from one scan.
+    """
     handoff_id = str(uuid.uuid4())[:8]
     timestamp = datetime.now(timezone.utc).isoformat()
+    if tree is None:
+        tree = DesignTree(root)
 
     # Find module specification
-    spec_path, spec_content = find_module_spec(root, module_id, platform)
+    spec_path, spec_content = tree.find_module_spec(module_id, platform)
 
     # Find RDD
-    rdd_path, rdd_content = find_rdd_file(root, module_id, platform)
+    rdd_path, rdd_content = tree.find_rdd_file(module_id, platform)
 
     # Get module from state file (for additional info)
-    module_state = get_module_from_state(module_id)
+    module_state = tree.get_module_from_state(module_id)
 
     # Find context documents
     context_docs = []
     if context_ids:
-        context_docs = find_context_docs(root, context_ids)
+        context_docs = tree.find_context_docs(context_ids)
 
     # Build handoff content
     handoff_lines = [
@@ -352,6 +395,11 @@ def write_handoff(root: Path, agent_id: str, module_id: str, content: str) -> Pa
 
 def update_index(root: Path, handoff_info: dict[str, Any], handoff_path: Path) -> bool:
     """Update the design index with the new handoff."""
+    return update_index_entries(root, [(handoff_info, handoff_path)])
+
+
+def update_index_entries(root: Path, handoffs: list[tuple[dict[str, Any], Path]]) -> bool:
+    """Add several handoffs to the design index with a single read and write."""
     index_file = root / "index.yaml"
     if not index_file.exists():
         return False
@@ -359,33 +407,33 @@ def update_index(root: Path, handoff_info: dict[str, Any], handoff_path: Path) -
     try:
         index_data = read_yaml_file(index_file)
 
-        # Add to handoffs list
-        handoff_entry = {
-            "id": handoff_info["handoff_id"],
-            "agent_id": handoff_info["agent_id"],
-            "module_id": handoff_info["module_id"],
-            "platform": handoff_info["platform"],
-            "path": str(handoff_path),
-            "generated_at": handoff_info["generated_at"],
-        }
-
         if "documents" not in index_data:
             index_data["documents"] = {}
         if "handoffs" not in index_data["documents"]:
             index_data["documents"]["handoffs"] = []
+        if "stats" not in index_data:
+            index_data["stats"] = {"total_documents": 0, "by_type": {}}
+        if "by_type" not in index_data["stats"]:
+            index_data["stats"]["by_type"] = {}
 
-        index_data["documents"]["handoffs"].append(handoff_entry)
+        for handoff_info, handoff_path in handoffs:
+            # Add to handoffs list
+            handoff_entry = {
+                "id": handoff_info["handoff_id"],
+                "agent_id": handoff_info["agent_id"],
+                "module_id": handoff_info["module_id"],
+                "platform": handoff_info["platform"],
+                "path": str(handoff_path),
+                "generated_at": handoff_info["generated_at"],
+            }
+            index_data["documents"]["handoffs"].append(handoff_entry)
 
         # Update stats
-        if "stats" not in index_data:
-            index_data["stats"] = {"total_documents": 0, "by_type": {}}
         index_data["stats"]["total_documents"] = (
-            index_data["stats"].get("total_documents", 0) + 1
+            index_data["stats"].get("total_documents", 0) + len(handoffs)
         )
-        if "by_type" not in index_data["stats"]:
-            index_data["stats"]["by_type"] = {}
         index_data["stats"]["by_type"]["handoffs"] = (
-            index_data["stats"]["by_type"].get("handoffs", 0) + 1
+            index_data["stats"]["by_type"].get("handoffs", 0) + len(handoffs)
         )
 
         # Write updated index
@@ -400,10 +448,113 @@ def update_index(root: Path, handoff_info: dict[str, Any], handoff_path: Path) -
         return False
 
 
+def compile_handoffs(
+    assignments: list[dict[str, Any]],
+    root: Path,
+    dry_run: bool = False,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Compile and write handoffs for many (agent, module) assignments.
+
+    Each assignment has module_id and agent_id, and optionally platform,
+    context_ids (or include_context) and config_files. The design tree is
+    indexed once; each handoff is written as soon as it is compiled, and the
+    index is updated once at the end, even if a later assignment raises.
+    Returns (results without content, index_updated).
+    """
+    tree = DesignTree(root)
+    results: list[dict[str, Any]] = []
+    written: list[tuple[dict[str, Any], Path]] = []
+    index_updated = False
+
+    try:
+        for assignment in assignments:
+            if not assignment.get("module_id") or not assignment.get("agent_id"):
+                results.append(
+                    {"success": False, "error": "module_id and agent_id are required", **assignment}
+                )
+                continue
+
+            handoff_info = compile_handoff(
+                module_id=assignment["module_id"],
+                agent_id=assignment["agent_id"],
+                root=root,
+                platform=assignment.get("platform"),
+                context_ids=assignment.get("context_ids", assignment.get("include_context")),
+                config_files=assignment.get("config_files"),
+                tree=tree,
+            )
+            content = handoff_info.pop("content")
+            result = {"success": True, **handoff_info}
+
+            if not dry_run:
+                handoff_path = write_handoff(
+                    root, handoff_info["agent_id"], handoff_info["module_id"], content
+                )
+                result["path"] = str(handoff_path)
+                written.append((handoff_info, handoff_path))
+            results.append(result)
+    finally:
+        # Handoffs already on disk get their index entries even if a later one raised
+        if written:
+            index_updated = update_index_entries(root, written)
+    return results, index_updated
+
+
+def run_batch(batch_file: Path, root: Path, dry_run: bool, as_json: bool) -> int:
+    """Compile every assignment listed in a JSON or YAML batch file."""
+    try:
+        assignments = yaml.safe_load(batch_file.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError) as e:
+        message = f"Cannot read batch file: {e}"
+        print(json.dumps({"success": False, "error": message}) if as_json else f"ERROR: {message}")
+        return 1
+    if not isinstance(assignments, list) or not all(isinstance(a, dict) for a in assignments):
+        message = "Batch file must contain a list of {module_id, agent_id, ...} entries"
+        print(json.dumps({"success": False, "error": message}) if as_json else f"ERROR: {message}")
+        return 1
+
+    results, index_updated = compile_handoffs(assignments, root, dry_run=dry_run)
+    failed = [r for r in results if not r["success"]]
+
+    if as_json:
+        print(
+            json.dumps(
+                {
+                    "success": not failed,
+                    "dry_run": dry_run,
+                    "index_updated": index_updated,
+                    "handoffs": results,
+                },
+                indent=2,
+            )
+        )
+    else:
+        verb = "Compiled (dry run)" if dry_run else "Compiled"
+        print(f"{verb} {len(results) - len(failed)}/{len(results)} handoff(s)")
+        for r in results:
+            if not r["success"]:
+                print(f"  ERROR: {r.get('agent_id', '?')} <- {r.get('module_id', '?')}: {r['error']}")
+                continue
+            notes = [] if r["spec_found"] else ["no spec"]
+            if not r["rdd_found"]:
+                notes.append("no RDD")
+            suffix = f" ({', '.join(notes)})" if notes else ""
+            print(f"  {r['agent_id']} <- {r['module_id']}: {r.get('path', r['handoff_id'])}{suffix}")
+        if not dry_run:
+            print(f"Index updated: {index_updated}")
+
+    return 1 if failed else 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Compile handoff document for agent")
-    parser.add_argument("module_id", help="Module ID to compile handoff for")
-    parser.add_argument("agent_id", help="Agent ID receiving the handoff")
+    parser.add_argument("module_id", nargs="?", help="Module ID to compile handoff for")
+    parser.add_argument("agent_id", nargs="?", help="Agent ID receiving the handoff")
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        help="JSON/YAML list of {module_id, agent_id, platform?, context_ids?, config_files?}",
+    )
     parser.add_argument("--root", default=DEFAULT_ROOT, help="Design folder root")
     parser.add_argument("--platform", help="Target platform (e.g., web, ios, android)")
     parser.add_argument(
@@ -439,6 +590,11 @@ def main() -> int:
             print("Run eoa_init_design_folders.py first")
         return 1
 
+    if args.batch:
+        return run_batch(args.batch, root, args.dry_run, args.json)
+    if not args.module_id or not args.agent_id:
+        parser.error("module_id and agent_id are required (or use --batch)")
+
     # Compile handoff
     handoff_info = compile_handoff(
         module_id=args.module_id,
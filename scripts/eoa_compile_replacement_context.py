@@ -15,6 +15,12 @@ Data sources:
   3. GitHub Issues (gh issue list --assignee)
   4. Design docs in design/ directory
 
+All sources are gathered concurrently through eoa_replacement_context.py.
+GitHub results are cached for this replacement (the failed agent), so
+running eoa_generate_replacement_handoff.py afterwards reuses them; each run
+of this script starts a new cache (--no-cache to disable). Git state is
+always queried live.
+
 Usage:
     python3 eoa_compile_replacement_context.py --failed-agent NAME --output FILE
     python3 eoa_compile_replacement_context.py --failed-agent impl-1 --output context.md
@@ -37,11 +43,19 @@ Examples:
 
 import argparse
 import json
-import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from eoa_replacement_context import (
+    GIT_AHEAD,
+    GIT_BRANCH,
+    GIT_LAST_COMMIT,
+    GIT_STATUS,
+    ContextCollector,
+    split_last_commit,
+)
+
 
 # State file location relative to the project root
 STATE_FILE_PATH = ".emasoft/orchestration-state.json"
@@ -161,54 +175,45 @@ def get_agent_blockers(state, failed_agent):
     return blockers
 
 
-def run_git_command(args, project_root, timeout=15):
-    """Run a git command and return its stdout, or None on failure.
-
-    Args:
-        args: List of arguments to pass to git (without the 'git' prefix).
-        project_root: Path to the project root (used as cwd).
-        timeout: Timeout in seconds for the git command.
+# Recent commits and diff stat are only needed by this script
+GIT_RECENT_COMMITS = ["log", "--oneline", "-15", "--format=%h %s"]
+GIT_DIFF_STAT = ["diff", "--stat", "origin/main...HEAD"]
 
-    Returns:
-        The stdout string on success, or None on any failure.
-    """
-    try:
-        result = subprocess.run(
-            ["git"] + args,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=str(project_root),
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-    return None
+# Issue fields shown in the Open Issues section
+ISSUE_LIST_FIELDS = "number,title,state,labels,assignees,body"
 
 
-def gather_git_status(project_root):
+def gather_git_status(project_root, collector=None):
     """Gather comprehensive git status for the project.
 
     Collects: current branch, uncommitted changes, recent commit log,
-    diff stats, and commits ahead of main.
+    diff stats, and commits ahead of main. All git commands are started
+    at once and run concurrently.
 
     Args:
         project_root: Path to the project root directory.
+        collector: Optional ContextCollector shared with other gatherers.
 
     Returns:
         A dictionary with git state information. Keys may be absent
         if the corresponding git command failed.
     """
+    if collector is None:
+        with ContextCollector(project_root) as collector:
+            return gather_git_status(project_root, collector)
+
+    collector.prefetch_git(
+        GIT_BRANCH, GIT_STATUS, GIT_RECENT_COMMITS, GIT_DIFF_STAT, GIT_AHEAD, GIT_LAST_COMMIT
+    )
     git_info = {}
 
     # Current branch
-    branch = run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], project_root)
+    branch = collector.git(GIT_BRANCH)
     if branch:
         git_info["branch"] = branch
 
     # Modified files (staged + unstaged)
-    porcelain = run_git_command(["status", "--porcelain"], project_root)
+    porcelain = collector.git(GIT_STATUS)
     if porcelain is not None:
         files = [line.strip() for line in porcelain.split("\n") if line.strip()]
         git_info["modified_files"] = files
@@ -217,25 +222,19 @@ def gather_git_status(project_root):
         git_info["has_uncommitted_changes"] = False
 
     # Recent commits (last 15)
-    log_output = run_git_command(
-        ["log", "--oneline", "-15", "--format=%h %s"],
-        project_root,
-    )
+    log_output = collector.git(GIT_RECENT_COMMITS)
     if log_output:
         git_info["recent_commits"] = [
             line for line in log_output.split("\n") if line.strip()
         ]
 
     # Diff stat against main (shows files changed and lines added/removed)
-    diff_stat = run_git_command(["diff", "--stat", "origin/main...HEAD"], project_root)
+    diff_stat = collector.git(GIT_DIFF_STAT)
     if diff_stat:
         git_info["diff_stat_vs_main"] = diff_stat
 
     # Commits ahead of main
-    ahead_count = run_git_command(
-        ["rev-list", "--count", "HEAD", "--not", "origin/main"],
-        project_root,
-    )
+    ahead_count = collector.git(GIT_AHEAD)
     if ahead_count:
         try:
             git_info["commits_ahead_of_main"] = int(ahead_count)
@@ -243,80 +242,56 @@ def gather_git_status(project_root):
             pass
 
     # Last commit details
-    last_commit = run_git_command(
-        ["log", "-1", "--format=%H|%an|%ai|%s"],
-        project_root,
-    )
-    if last_commit and "|" in last_commit:
-        parts = last_commit.split("|", 3)
-        if len(parts) == 4:
-            git_info["last_commit_hash"] = parts[0]
-            git_info["last_commit_author"] = parts[1]
-            git_info["last_commit_date"] = parts[2]
-            git_info["last_commit_message"] = parts[3]
+    last_commit = split_last_commit(collector.git(GIT_LAST_COMMIT))
+    if last_commit:
+        git_info["last_commit_hash"] = last_commit[0]
+        git_info["last_commit_author"] = last_commit[1]
+        git_info["last_commit_date"] = last_commit[2]
+        git_info["last_commit_message"] = last_commit[3]
 
     return git_info
 
 
-def gather_github_issues(failed_agent, project_root):
+def gather_github_issues(failed_agent, project_root, collector=None):
     """Fetch open GitHub issues assigned to the failed agent.
 
     Uses the gh CLI tool to list issues. Tries both --assignee filter
-    and label-based filter (assigned:<agent>).
+    and label-based filter (assigned:<agent>); both queries run
+    concurrently.
 
     Args:
         failed_agent: The agent ID to search for.
         project_root: Path to the project root (used as cwd for gh).
+        collector: Optional ContextCollector shared with other gatherers.
 
     Returns:
         A list of issue dictionaries with number, title, state, labels,
         and assignees fields. Returns an empty list on failure.
     """
+    if collector is None:
+        with ContextCollector(project_root) as collector:
+            return gather_github_issues(failed_agent, project_root, collector)
+
+    by_assignee = ["issue", "list", "--assignee", failed_agent,
+                   "--state", "open", "--json", ISSUE_LIST_FIELDS, "--limit", "50"]
+    by_label = ["issue", "list", "--label", "assigned:{}".format(failed_agent),
+                "--state", "open", "--json", ISSUE_LIST_FIELDS, "--limit", "50"]
+    collector.prefetch_gh(by_assignee, by_label)
+
     issues = []
 
     # Try by assignee
-    try:
-        result = subprocess.run(
-            ["gh", "issue", "list",
-             "--assignee", failed_agent,
-             "--state", "open",
-             "--json", "number,title,state,labels,assignees,body",
-             "--limit", "50"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(project_root),
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
-            if isinstance(data, list):
-                issues.extend(data)
-    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError, OSError):
-        pass
+    data = collector.gh_json(by_assignee)
+    if isinstance(data, list):
+        issues.extend(data)
 
     # Also try by label (assigned:<agent>)
     seen_numbers = {i.get("number") for i in issues}
-    label = "assigned:{}".format(failed_agent)
-    try:
-        result = subprocess.run(
-            ["gh", "issue", "list",
-             "--label", label,
-             "--state", "open",
-             "--json", "number,title,state,labels,assignees,body",
-             "--limit", "50"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(project_root),
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            data = json.loads(result.stdout)
-            if isinstance(data, list):
-                for issue in data:
-                    if issue.get("number") not in seen_numbers:
-                        issues.append(issue)
-    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError, OSError):
-        pass
+    data = collector.gh_json(by_label)
+    if isinstance(data, list):
+        for issue in data:
+            if issue.get("number") not in seen_numbers:
+                issues.append(issue)
 
     return issues
 
@@ -594,6 +569,10 @@ def main():
         "--project-root", type=str, default=".",
         help="Path to the project root directory (default: current directory)"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", default=False,
+        help="Do not reuse or store command results from this replacement"
+    )
 
     args = parser.parse_args()
 
@@ -607,26 +586,34 @@ def main():
 
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    # 1. Load orchestration state
-    state = load_state(project_root)
+    with ContextCollector(
+        project_root, replacement=None if args.no_cache else args.failed_agent, fresh=True
+    ) as collector:
+        # Start every source at once; the gatherers below only wait on them
+        state_future = collector.submit(load_state, project_root)
+        design_future = collector.submit(gather_design_docs, project_root)
+        issues_future = collector.submit(
+            gather_github_issues, args.failed_agent, project_root, collector
+        )
 
-    # 2. Extract agent-specific data from state
-    assignments = []
-    modules = []
-    blockers = []
-    if state:
-        assignments = get_agent_task_assignments(state, args.failed_agent)
-        modules = get_agent_modules(state, args.failed_agent)
-        blockers = get_agent_blockers(state, args.failed_agent)
+        # 1. Gather git branch analysis
+        git_info = gather_git_status(project_root, collector)
 
-    # 3. Gather git branch analysis
-    git_info = gather_git_status(project_root)
+        # 2. Load orchestration state and extract agent-specific data
+        state = state_future.result()
+        assignments = []
+        modules = []
+        blockers = []
+        if state:
+            assignments = get_agent_task_assignments(state, args.failed_agent)
+            modules = get_agent_modules(state, args.failed_agent)
+            blockers = get_agent_blockers(state, args.failed_agent)
 
-    # 4. Gather GitHub issues
-    github_issues = gather_github_issues(args.failed_agent, project_root)
+        # 3. Gather GitHub issues
+        github_issues = issues_future.result()
 
-    # 5. Gather design documents
-    design_docs = gather_design_docs(project_root)
+        # 4. Gather design documents
+        design_docs = design_future.result()
 
     # Build the context document
     context_document = build_replacement_context_document(
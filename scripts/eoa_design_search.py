@@ -11,14 +11,24 @@ Usage:
     python3 eoa_design_search.py --type requirements
     python3 eoa_design_search.py --type handoffs --agent implementer-1
     python3 eoa_design_search.py --recent 5
+    python3 eoa_design_search.py --query 'token "refresh flow" auth*'
+
+Searches use a persistent inverted index (design/.search_index.json) that is
+updated incrementally from file mtimes and hashes; --no-search-index scans the
+tree instead.
 """
 
 import argparse
+import bisect
+import fnmatch
+import hashlib
 import json
+import math
+import os
 import re
 import sys
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 import yaml
@@ -221,6 +231,394 @@ def search_index(root: Path, doc_type: str | None = None) -> list[dict[str, Any]
     return results
 
 
+# Persistent search index, kept under the design root and refreshed from file stats
+SEARCH_INDEX_FILE = ".search_index.json"
+SEARCH_INDEX_VERSION = 1
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def document_info_from_content(file_path: Path, root: Path, content: str, stat: Any) -> dict[str, Any]:
+    """Build the extract_document_info() result from already-read content."""
+    rel_path = file_path.relative_to(root)
+    parts = list(rel_path.parts)
+    doc_type = parts[0] if parts else "unknown"
+
+    uuid_match = re.search(r'(?:ID|UUID|Handoff ID|Document ID|Decision ID):\s*([a-zA-Z0-9-]+)', content)
+    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+
+    platform = parts[1] if len(parts) > 2 and doc_type == "requirements" else None
+    agent = None
+    if doc_type == "handoffs" and len(parts) > 1 and parts[1] != "templates":
+        agent = parts[1]
+
+    return {
+        "path": str(file_path),
+        "relative_path": str(rel_path),
+        "type": doc_type,
+        "title": title_match.group(1) if title_match else file_path.stem,
+        "id": uuid_match.group(1) if uuid_match else None,
+        "platform": platform,
+        "agent": agent,
+        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "size": stat.st_size,
+    }
+
+
+def matches_doc_type(relative_path: str, doc_type: str) -> bool:
+    """Check whether a relative path is under one of the DOC_TYPES patterns.
+
+    Mirrors root.glob(f"{pattern}/**/*.md") without touching the filesystem.
+    """
+    parts = PurePosixPath(relative_path).parts
+    for pattern in DOC_TYPES.get(doc_type, []):
+        pattern_parts = pattern.split("/")
+        if len(parts) <= len(pattern_parts):
+            continue
+        if all(
+            fnmatch.fnmatchcase(part, glob) and not (part.startswith(".") and glob == "*")
+            for part, glob in zip(parts, pattern_parts)
+        ):
+            return True
+    return False
+
+
+class DesignIndex:
+    """Inverted index over the design documents.
+
+    Each document entry keeps its stat fingerprint, content hash, the
+    extract_document_info() fields and its term frequencies. Postings, the
+    sorted vocabulary (for prefix queries) are derived in memory
+    on first use. refresh() re-reads only files whose size or mtime changed.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Create an empty index for root; use open() to load the saved one."""
+        self.root = root
+        self.path = root / SEARCH_INDEX_FILE
+        self.docs: dict[str, dict[str, Any]] = {}
+        self.recent_order: list[str] = []
+        self._postings: dict[str, dict[str, int]] | None = None
+        self._vocabulary: list[str] | None = None
+        self._types: dict[str, frozenset[str]] | None = None
+
+    @classmethod
+    def open(cls, root: Path, refresh: bool = True) -> "DesignIndex":
+        """Load the index from disk (if valid) and bring it up to date."""
+        index = cls(root)
+        try:
+            data = json.loads(index.path.read_text(encoding="utf-8"))
+            if data.get("version") == SEARCH_INDEX_VERSION:
+                index.docs = data.get("docs", {})
+                index.recent_order = data.get("recent", [])
+        except (OSError, ValueError, AttributeError):
+            index.docs = {}
+        if refresh and index.refresh():
+            index.save()
+        return index
+
+    def refresh(self) -> bool:
+        """Re-index added, changed and deleted documents. Returns True if anything changed."""
+        changed = False
+        seen: set[str] = set()
+        for md_file in self.root.rglob("*.md"):
+            try:
+                stat = md_file.stat()
+            except OSError:
+                continue
+            if not md_file.is_file():
+                continue
+            rel = md_file.relative_to(self.root).as_posix()
+            seen.add(rel)
+            entry = self.docs.get(rel)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            try:
+                raw = md_file.read_bytes()
+                content = raw.decode("utf-8")
+            except (OSError, UnicodeDecodeError):
+                if self.docs.pop(rel, None) is not None:
+                    changed = True
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry and entry["sha256"] == digest:
+                # Touched but unchanged: keep terms, refresh the stat fingerprint
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+                entry["info"]["modified"] = datetime.fromtimestamp(stat.st_mtime).isoformat()
+                changed = True
+                continue
+            self.docs[rel] = self._make_entry(md_file, content, stat, digest)
+            changed = True
+
+        for rel in [rel for rel in self.docs if rel not in seen]:
+            del self.docs[rel]
+            changed = True
+
+        if changed or len(self.recent_order) != len(self.docs):
+            self.recent_order = sorted(self.docs, key=lambda rel: (-self.docs[rel]["mtime_ns"], rel))
+            self._postings = self._vocabulary = self._types = None
+            changed = True
+        return changed
+
+    def _make_entry(self, md_file: Path, content: str, stat: Any, digest: str) -> dict[str, Any]:
+        """Index entry for one document, so refresh() reads each file only once."""
+        terms = tokenize(content) + tokenize(md_file.stem)
+        tf: dict[str, int] = {}
+        for term in terms:
+            tf[term] = tf.get(term, 0) + 1
+        return {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "info": document_info_from_content(md_file, self.root, content, stat),
+            "length": len(terms),
+            "tf": tf,
+        }
+
+    def save(self) -> None:
+        """Write the index atomically (failures are non-fatal)."""
+        # Per-process temp name so concurrent searches never write the same file
+        temp_file = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        # json.dumps uses the C encoder; json.dump to a file would not
+        data = json.dumps(
+            {"version": SEARCH_INDEX_VERSION, "docs": self.docs, "recent": self.recent_order},
+            separators=(",", ":"),
+        )
+        try:
+            temp_file.write_text(data, encoding="utf-8")
+            temp_file.replace(self.path)
+        except OSError as e:
+            print(f"WARNING: Could not save search index: {e}", file=sys.stderr)
+
+    @property
+    def postings(self) -> dict[str, dict[str, int]]:
+        """Term -> {relative path: term frequency}."""
+        if self._postings is None:
+            postings: dict[str, dict[str, int]] = {}
+            for rel, entry in self.docs.items():
+                for term, count in entry["tf"].items():
+                    postings.setdefault(term, {})[rel] = count
+            self._postings = postings
+        return self._postings
+
+    @property
+    def vocabulary(self) -> list[str]:
+        """Sorted terms, for prefix lookups with bisect."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    @property
+    def types(self) -> dict[str, frozenset[str]]:
+        """Relative path -> DOC_TYPES names whose patterns contain it."""
+        if self._types is None:
+            self._types = {
+                rel: frozenset(name for name in DOC_TYPES if matches_doc_type(rel, name)) for rel in self.docs
+            }
+        return self._types
+
+    def _info(self, rel: str) -> dict[str, Any]:
+        """Stored document info, shaped like extract_document_info() output."""
+        info = dict(self.docs[rel]["info"])
+        # Paths are stored relative so the index survives moving the design folder
+        info["path"] = str(self.root / rel)
+        return info
+
+    def _prefix_terms(self, prefix: str) -> list[str]:
+        """Terms starting with prefix, found by bisecting the sorted vocabulary."""
+        vocabulary = self.vocabulary
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = bisect.bisect_left(vocabulary, prefix + "￿")
+        return vocabulary[start:end]
+
+    def _docs_with_prefix(self, prefix: str) -> set[str]:
+        """Documents containing a term that starts with prefix."""
+        docs: set[str] = set()
+        for term in self._prefix_terms(prefix):
+            docs.update(self.postings[term])
+        return docs
+
+    def _docs_with_any(self, terms: Any) -> set[str]:
+        """Documents containing at least one of terms (all must be indexed)."""
+        docs: set[str] = set()
+        for term in terms:
+            docs.update(self.postings[term])
+        return docs
+
+    def _substring_candidates(self, text: str) -> set[str] | None:
+        """Documents whose content may contain text as a substring (None: read all).
+
+        Content is indexed as [a-z0-9]+ tokens, so an occurrence of text covers its
+        terms in order: a single term may sit anywhere inside a token, otherwise
+        the first term ends a token, the last one starts a token and the ones in
+        between are whole tokens. Text without any term cannot be narrowed.
+        """
+        terms = tokenize(text)
+        if not terms:
+            return None
+        vocabulary = self.vocabulary
+        if len(terms) == 1:
+            return self._docs_with_any(t for t in vocabulary if terms[0] in t)
+        docs = self._docs_with_any(t for t in vocabulary if t.endswith(terms[0]))
+        for term in terms[1:-1]:
+            docs &= set(self.postings.get(term, ()))
+        return docs & self._docs_with_prefix(terms[-1])
+
+    def _docs_with_all(self, terms: list[str], last_is_prefix: bool = False) -> set[str]:
+        """Documents containing every term (the last one optionally as a prefix)."""
+        result: set[str] | None = None
+        for i, term in enumerate(terms):
+            if last_is_prefix and i == len(terms) - 1:
+                docs = self._docs_with_prefix(term)
+            else:
+                docs = set(self.postings.get(term, ()))
+            result = docs if result is None else result & docs
+            if not result:
+                return set()
+        return result or set()
+
+    def _read(self, rel: str) -> str:
+        """Current content of a document, or "" if it can no longer be read.
+
+        Matches are confirmed against the file, not the index, so results
+        reflect edits made since the last refresh.
+        """
+        try:
+            with open(self.root / rel, encoding="utf-8") as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return ""
+
+    def _filter(self, rels: Any, doc_type: str | None) -> list[str]:
+        """Keep the documents of doc_type (all of them when doc_type is None)."""
+        return [rel for rel in rels if not doc_type or doc_type in self.types[rel]]
+
+    def search_keyword(self, keyword: str, doc_type: str | None = None) -> list[dict[str, Any]]:
+        """Keyword search with the semantics of search_by_keyword().
+
+        Candidates come from the index (filename match, or a vocabulary match
+        that can make up the substring); only candidates are read to confirm it.
+        """
+        keyword_lower = keyword.lower()
+        if doc_type in DOC_TYPES:
+            searchable = [rel for rel, types in self.types.items() if doc_type in types]
+        else:
+            searchable = [rel for rel, types in self.types.items() if types]
+        candidates = self._substring_candidates(keyword)
+        results = []
+        for rel in sorted(searchable):
+            if keyword_lower in rel.rsplit("/", 1)[-1].lower() or (
+                (candidates is None or rel in candidates) and keyword_lower in self._read(rel).lower()
+            ):
+                results.append(self._info(rel))
+        return results
+
+    def search_uuid(self, uuid: str) -> list[dict[str, Any]]:
+        """ID search with the semantics of search_by_uuid(), reading only index candidates."""
+        candidates = self._substring_candidates(uuid)
+        if candidates is None:
+            candidates = set(self.docs)
+        return [self._info(rel) for rel in sorted(candidates) if uuid in self._read(rel)]
+
+    def search_type(self, doc_type: str, agent: str | None = None, platform: str | None = None) -> list[dict[str, Any]]:
+        """Type search with the semantics of search_by_type(), without reading files."""
+        results = []
+        for rel in self._filter(sorted(self.docs), doc_type):
+            info = self.docs[rel]["info"]
+            if agent and info.get("agent") != agent:
+                continue
+            if platform and info.get("platform") != platform:
+                continue
+            results.append(self._info(rel))
+        return results
+
+    def recent(self, count: int = 10) -> list[dict[str, Any]]:
+        """Most recently modified documents (templates excluded), from the mtime-ordered list."""
+        results = []
+        for rel in self.recent_order:
+            if "templates" in str(self.root / rel):
+                continue
+            results.append(self._info(rel))
+            if len(results) >= count:
+                break
+        return results
+
+    def query(self, text: str, doc_type: str | None = None, limit: int = 20) -> list[dict[str, Any]]:
+        """Ranked search (BM25).
+
+        Every clause must match: plain words, "quoted phrases" (terms adjacent
+        in order, confirmed on the candidate documents) and prefix* terms, which
+        expand to all indexed terms with that prefix.
+        """
+        clauses: list[tuple[str, list[str]]] = []
+        for phrase, word in QUERY_RE.findall(text):
+            if phrase:
+                terms = tokenize(phrase)
+                if terms:
+                    clauses.append(("phrase", terms))
+            elif word.endswith("*") and tokenize(word):
+                clauses.append(("prefix", tokenize(word)))
+            else:
+                terms = tokenize(word)
+                if len(terms) == 1:
+                    clauses.append(("term", terms))
+                elif terms:
+                    clauses.append(("phrase", terms))
+        if not clauses or not self.docs:
+            return []
+
+        candidates: set[str] | None = None
+        scored_terms: list[str] = []
+        for kind, terms in clauses:
+            if kind == "prefix":
+                docs = self._docs_with_all(terms, last_is_prefix=True)
+                scored_terms.extend(terms[:-1] + self._prefix_terms(terms[-1]))
+            else:
+                docs = self._docs_with_all(terms)
+                scored_terms.extend(terms)
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return []
+        assert candidates is not None
+
+        candidates = set(self._filter(candidates, doc_type))
+        for kind, terms in clauses:
+            if kind == "phrase" and len(terms) > 1:
+                pattern = re.compile(r"(?<![a-z0-9])" + r"[^a-z0-9]+".join(map(re.escape, terms)) + r"(?![a-z0-9])")
+                candidates = {rel for rel in candidates if pattern.search(self._read(rel).lower())}
+
+        total = len(self.docs)
+        avg_length = sum(entry["length"] for entry in self.docs.values()) / total or 1.0
+        scores: dict[str, float] = {}
+        for term in dict.fromkeys(scored_terms):
+            posting = self.postings.get(term, {})
+            idf = math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for rel in candidates:
+                count = posting.get(rel)
+                if count:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self.docs[rel]["length"] / avg_length)
+                    scores[rel] = scores.get(rel, 0.0) + idf * count * (BM25_K1 + 1) / (count + norm)
+
+        ranked = sorted(candidates, key=lambda rel: (-scores.get(rel, 0.0), rel))[:limit]
+        results = []
+        for rel in ranked:
+            info = self._info(rel)
+            info["score"] = round(scores.get(rel, 0.0), 4)
+            results.append(info)
+        return results
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Search design documents")
     parser.add_argument("--root", default=DEFAULT_ROOT, help="Design folder root")
@@ -235,7 +633,19 @@ def main() -> int:
     parser.add_argument("--agent", help="Filter handoffs by agent ID")
     parser.add_argument("--platform", help="Filter by platform")
     parser.add_argument("--recent", type=int, metavar="N", help="Show N most recent documents")
+    parser.add_argument(
+        "--query",
+        "-q",
+        help='Ranked search: words, "exact phrases" and prefix* terms (all must match)',
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Maximum results for --query (default: 20)")
     parser.add_argument("--use-index", action="store_true", help="Search using index file")
+    parser.add_argument(
+        "--no-search-index",
+        action="store_true",
+        help=f"Scan every document instead of using {SEARCH_INDEX_FILE}",
+    )
+    parser.add_argument("--rebuild-index", action="store_true", help=f"Rebuild {SEARCH_INDEX_FILE} from scratch")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
 
@@ -252,8 +662,35 @@ def main() -> int:
 
     results: list[dict[str, Any]] = []
 
+    if args.query and args.no_search_index:
+        parser.error("--query requires the search index")
+    if args.query and args.use_index:
+        parser.error("--query cannot be combined with --use-index")
+
+    index: DesignIndex | None = None
+    if not args.no_search_index and not args.use_index:
+        if args.rebuild_index:
+            index = DesignIndex(root)
+            index.refresh()
+            index.save()
+        else:
+            index = DesignIndex.open(root)
+
     # Determine search type
-    if args.uuid:
+    if index is not None:
+        if args.query:
+            results = index.query(args.query, args.type, args.limit)
+        elif args.uuid:
+            results = index.search_uuid(args.uuid)
+        elif args.keyword:
+            results = index.search_keyword(args.keyword, args.type)
+        elif args.recent:
+            results = index.recent(args.recent)
+        elif args.type:
+            results = index.search_type(args.type, args.agent, args.platform)
+        else:
+            results = index.recent(100)
+    elif args.uuid:
         results = search_by_uuid(root, args.uuid)
     elif args.keyword:
         results = search_by_keyword(root, args.keyword, args.type)
@@ -296,6 +733,8 @@ def main() -> int:
                 if doc.get('agent'):
                     print(f"    Agent: {doc['agent']}")
                 print(f"    Modified: {doc['modified']}")
+                if "score" in doc:
+                    print(f"    Score: {doc['score']}")
                 print()
 
     return 0
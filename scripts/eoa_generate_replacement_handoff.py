@@ -7,6 +7,11 @@ Compiles task context from: orchestration state file, GitHub issues (via gh CLI)
 and git branch state to create a document the replacement agent can use to
 continue the failed agent's work.
 
+Git and GitHub queries run concurrently through eoa_replacement_context.py.
+GitHub results already fetched by eoa_compile_replacement_context.py for the
+same failed agent are reused (--no-cache to disable); git state is always
+queried live.
+
 Usage:
     python3 eoa_generate_replacement_handoff.py --failed-agent impl-1 --new-agent impl-2
     python3 eoa_generate_replacement_handoff.py --failed-agent impl-1 --new-agent impl-2 --output handoff.md
@@ -39,6 +44,15 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from eoa_replacement_context import (
+    GIT_AHEAD,
+    GIT_BRANCH,
+    GIT_LAST_COMMIT,
+    GIT_STATUS,
+    ContextCollector,
+    split_last_commit,
+)
+
 
 # State file location (matches codebase convention)
 EXEC_STATE_FILE = Path(".claude/orchestrator-exec-phase.local.md")
@@ -46,6 +60,12 @@ EXEC_STATE_FILE = Path(".claude/orchestrator-exec-phase.local.md")
 # Default handoff output directory
 HANDOFF_DIR = Path("docs_dev/handoffs")
 
+# Issue fields fetched by get_github_issue_context()
+ISSUE_VIEW_FIELDS = "number,title,body,state,labels,assignees,comments"
+
+# Issue fields the handoff document actually uses
+HANDOFF_ISSUE_FIELDS = "number,title,body"
+
 
 def parse_yaml_frontmatter(content):
     """Parse YAML frontmatter from markdown content without external dependencies.
@@ -256,88 +276,71 @@ def get_failed_agent_modules(state_data, failed_agent):
     return [m for m in modules if isinstance(m, dict) and m.get("assigned_to") == failed_agent]
 
 
-def get_github_issue_context(issue_number):
+def get_github_issue_context(issue_number, collector=None, fields=ISSUE_VIEW_FIELDS):
     """Fetch GitHub issue details using the gh CLI.
 
     Args:
         issue_number: The GitHub issue number (integer or string like '#42').
+        collector: Optional ContextCollector; an issue it already listed
+            with all requested fields is returned without another gh call.
+        fields: Comma-separated gh --json field list.
 
     Returns:
         A dictionary with issue fields, or None if the fetch fails.
     """
     if not issue_number:
         return None
-
-    # Strip leading '#' if present
-    issue_num = str(issue_number).lstrip("#")
-
-    try:
-        result = subprocess.run(
-            ["gh", "issue", "view", issue_num, "--json",
-             "number,title,body,state,labels,assignees,comments"],
-            capture_output=True, text=True, timeout=30,
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
-        pass
-    return None
+    if collector is None:
+        with ContextCollector() as collector:
+            return get_github_issue_context(issue_number, collector, fields)
+    return collector.issue(issue_number, fields)
 
 
-def get_git_branch_state():
+def get_git_branch_state(collector=None):
     """Gather git branch state information.
 
     Checks current branch, modified files, uncommitted changes,
-    and the most recent commit message.
+    and the most recent commit message. All git commands run concurrently.
+
+    Args:
+        collector: Optional ContextCollector shared with other gatherers.
 
     Returns:
         A dictionary with git state information, or an empty dict
         if git is not available.
     """
-    git_info = {}
-    try:
-        # Current branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if result.returncode == 0:
-            git_info["branch"] = result.stdout.strip()
+    if collector is None:
+        with ContextCollector() as collector:
+            return get_git_branch_state(collector)
 
-        # Modified files (staged + unstaged)
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if result.returncode == 0:
-            files = [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
-            git_info["modified_files"] = files
-            git_info["has_uncommitted_changes"] = len(files) > 0
-
-        # Last commit
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%H %s"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if result.returncode == 0:
-            parts = result.stdout.strip().split(" ", 1)
-            if len(parts) == 2:
-                git_info["last_commit_hash"] = parts[0]
-                git_info["last_commit_message"] = parts[1]
-
-        # Commits ahead of main
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD", "--not", "origin/main"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if result.returncode == 0:
-            try:
-                git_info["commits_ahead_of_main"] = int(result.stdout.strip())
-            except ValueError:
-                pass
+    collector.prefetch_git(GIT_BRANCH, GIT_STATUS, GIT_LAST_COMMIT, GIT_AHEAD)
+    git_info = {}
 
-    except (FileNotFoundError, OSError):
-        pass
+    # Current branch
+    branch = collector.git(GIT_BRANCH)
+    if branch is not None:
+        git_info["branch"] = branch
+
+    # Modified files (staged + unstaged)
+    porcelain = collector.git(GIT_STATUS)
+    if porcelain is not None:
+        files = [line.strip() for line in porcelain.split("\n") if line.strip()]
+        git_info["modified_files"] = files
+        git_info["has_uncommitted_changes"] = len(files) > 0
+
+    # Last commit
+    last_commit = split_last_commit(collector.git(GIT_LAST_COMMIT))
+    if last_commit and last_commit[3]:
+        git_info["last_commit_hash"] = last_commit[0]
+        git_info["last_commit_message"] = last_commit[3]
+
+    # Commits ahead of main
+    ahead_count = collector.git(GIT_AHEAD)
+    if ahead_count is not None:
+        try:
+            git_info["commits_ahead_of_main"] = int(ahead_count)
+        except ValueError:
+            pass
 
     return git_info
 
@@ -586,34 +589,47 @@ def main():
         "--upload", action="store_true", default=False,
         help="Upload handoff to relevant GitHub issue as a comment"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", default=False,
+        help="Do not reuse or store command results from this replacement"
+    )
 
     args = parser.parse_args()
 
-    # Load orchestration state
-    state_data, _ = load_exec_state()
-
-    # Get failed agent's assignments and modules
-    assignments = get_failed_agent_assignments(state_data, args.failed_agent)
-    modules = get_failed_agent_modules(state_data, args.failed_agent)
-
-    # Gather GitHub issue context for each assignment
-    github_contexts = {}
-    if args.include_context:
-        issue_numbers = set()
-        for assignment in assignments:
-            gh_issue = assignment.get("github_issue")
-            if gh_issue:
-                issue_numbers.add(str(gh_issue).lstrip("#"))
-        for module in modules:
-            gh_issue = module.get("github_issue")
-            if gh_issue:
-                issue_numbers.add(str(gh_issue).lstrip("#"))
+    with ContextCollector(
+        Path.cwd(), replacement=None if args.no_cache else args.failed_agent
+    ) as collector:
+        # Start git queries first so they run while the state file is parsed
+        git_future = collector.submit(get_git_branch_state, collector)
+
+        # Load orchestration state
+        state_data, _ = load_exec_state()
+
+        # Get failed agent's assignments and modules
+        assignments = get_failed_agent_assignments(state_data, args.failed_agent)
+        modules = get_failed_agent_modules(state_data, args.failed_agent)
+
+        # Gather GitHub issue context for each assignment
+        github_contexts = {}
+        if args.include_context:
+            issue_numbers = set()
+            for assignment in assignments:
+                gh_issue = assignment.get("github_issue")
+                if gh_issue:
+                    issue_numbers.add(str(gh_issue).lstrip("#"))
+            for module in modules:
+                gh_issue = module.get("github_issue")
+                if gh_issue:
+                    issue_numbers.add(str(gh_issue).lstrip("#"))
 
-        for issue_num in issue_numbers:
-            github_contexts[issue_num] = get_github_issue_context(issue_num)
+            collector.prefetch_issues(issue_numbers, HANDOFF_ISSUE_FIELDS)
+            for issue_num in issue_numbers:
+                github_contexts[issue_num] = get_github_issue_context(
+                    issue_num, collector, HANDOFF_ISSUE_FIELDS
+                )
 
-    # Gather git state
-    git_state = get_git_branch_state()
+        # Gather git state
+        git_state = git_future.result()
 
     # Build the handoff document
     handoff_content = build_handoff_document(
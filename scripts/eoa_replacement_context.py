@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+EOA Replacement Context Collector
+
+Shared, concurrent gatherer for the git, GitHub and filesystem context used
+when replacing a failed agent. Both eoa_compile_replacement_context.py and
+eoa_generate_replacement_handoff.py run their queries through a
+ContextCollector:
+
+  - Queries are started together in a thread pool, so slow gh network calls
+    overlap with local git commands and directory scans.
+  - Identical commands run once per process; the two scripts use the same
+    git command lines (see GIT_* below) so their overlapping queries match.
+  - Successful gh results are cached per replacement (project root and
+    failed agent) in a private per-user cache directory for at most
+    CACHE_TTL seconds. The context compilation starts a fresh cache and
+    the handoff generation reuses it. Git queries are cheap and describe
+    the live working tree, so they are never persisted.
+  - `gh issue view` is skipped when an earlier `gh issue list` already
+    returned the requested fields for that issue.
+
+This module is imported by the two scripts above and has no CLI.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+# Queries are subprocess-bound, so more threads than CPUs is fine
+DEFAULT_WORKERS = 8
+
+# Seconds a cached gh result stays valid (upper bound for one replacement)
+CACHE_TTL = 600
+
+# Cache file layout version; bump when the format changes
+CACHE_VERSION = 2
+
+# Directory (under the user's cache dir) holding per-replacement cache files
+CACHE_DIR_NAME = "eoa-replacement-context"
+
+# Only these commands are persisted across processes
+CACHED_COMMANDS = ("gh",)
+
+GIT_TIMEOUT = 15
+GH_TIMEOUT = 30
+
+# Git queries shared by both replacement scripts
+GIT_BRANCH = ["rev-parse", "--abbrev-ref", "HEAD"]
+GIT_STATUS = ["status", "--porcelain"]
+GIT_LAST_COMMIT = ["log", "-1", "--format=%H|%an|%ai|%s"]
+GIT_AHEAD = ["rev-list", "--count", "HEAD", "--not", "origin/main"]
+
+
+def cache_dir():
+    """Return the per-user directory holding replacement caches.
+
+    Uses $XDG_CACHE_HOME (default ~/.cache) rather than the shared temp
+    directory, so other local users cannot pre-create or edit the files.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / CACHE_DIR_NAME
+
+
+def cache_path(project_root, replacement):
+    """Return the cache file used for one replacement.
+
+    Args:
+        project_root: Path to the project root directory.
+        replacement: Identifier of the replacement (the failed agent ID).
+
+    Returns:
+        Path of the cache file in the per-user cache directory.
+    """
+    key = "{}\0{}".format(Path(project_root).resolve(), replacement)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return cache_dir() / "{}.json".format(digest[:32])
+
+
+def split_last_commit(output):
+    """Split the output of GIT_LAST_COMMIT into its fields.
+
+    Args:
+        output: The stripped stdout of GIT_LAST_COMMIT, or None.
+
+    Returns:
+        A (hash, author, date, subject) tuple, or None if the output
+        does not have all four fields.
+    """
+    if not output or "|" not in output:
+        return None
+    parts = output.split("|", 3)
+    if len(parts) != 4:
+        return None
+    return tuple(parts)
+
+
+class ContextCollector:
+    """Runs context queries concurrently, each at most once per replacement.
+
+    Use as a context manager so the thread pool is shut down and the
+    command cache is saved on exit.
+    """
+
+    def __init__(self, project_root=".", replacement=None, fresh=False, ttl=CACHE_TTL, workers=DEFAULT_WORKERS):
+        """Create a collector for a project.
+
+        Args:
+            project_root: Path to the project root (cwd for all commands).
+            replacement: Failed agent ID scoping the on-disk gh cache;
+                None disables the on-disk cache.
+            fresh: Start a new replacement: ignore (and later replace)
+                any existing cache for it instead of reusing it.
+            ttl: Seconds a cached gh result stays valid.
+            workers: Maximum number of concurrent queries.
+        """
+        self.project_root = Path(project_root).resolve()
+        self.use_cache = replacement is not None
+        self.ttl = ttl
+        self.cache_file = cache_path(self.project_root, replacement) if self.use_cache else None
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.stats = {"commands_run": 0, "cache_hits": 0, "issue_views_skipped": 0}
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._fresh_start = fresh
+        self._cached = self._load_cache() if self.use_cache and not fresh else {}
+        self._fresh = {}
+        self._issues = {}
+        for key, entry in self._cached.items():
+            self._remember_issues(json.loads(key), entry["stdout"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Wait for outstanding queries, then save the gh cache."""
+        self.pool.shutdown(wait=True)
+        if self.use_cache and (self._fresh or self._fresh_start):
+            self._save_cache()
+
+    def _load_cache(self):
+        """Load unexpired entries from the cache file.
+
+        Returns:
+            A dict mapping command keys to {"time", "stdout"} entries.
+        """
+        try:
+            if self.cache_file.stat().st_uid != os.getuid():
+                return {}
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        now = time.time()
+        return {
+            key: entry
+            for key, entry in data.get("entries", {}).items()
+            if now - entry.get("time", 0) < self.ttl
+        }
+
+    def _save_cache(self):
+        """Write the replacement's gh entries to the cache file atomically.
+
+        A fresh start drops earlier entries; otherwise unexpired entries
+        written by the other script are kept.
+        """
+        entries = {} if self._fresh_start else self._load_cache()
+        entries.update(self._fresh)
+        try:
+            self.cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_name("{}.{}.tmp".format(self.cache_file.name, os.getpid()))
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+            tmp_path.replace(self.cache_file)
+        except OSError:
+            pass
+
+    def _remember_issues(self, argv, stdout):
+        """Index the issues returned by a `gh issue list --json` command."""
+        if argv[:3] != ["gh", "issue", "list"] or "--json" not in argv:
+            return
+        try:
+            data = json.loads(stdout)
+        except ValueError:
+            return
+        if not isinstance(data, list):
+            return
+        with self._lock:
+            for issue in data:
+                if isinstance(issue, dict) and "number" in issue:
+                    self._issues.setdefault(str(issue["number"]), issue)
+
+    def submit(self, fn, *args, **kwargs):
+        """Run a filesystem or other gathering function in the pool.
+
+        Returns:
+            A Future for the function's result.
+        """
+        return self.pool.submit(fn, *args, **kwargs)
+
+    def command(self, argv, timeout):
+        """Start a command (once) and return a Future for its result.
+
+        Args:
+            argv: Full command line as a list of strings.
+            timeout: Timeout in seconds for the command.
+
+        Returns:
+            A Future resolving to (returncode, stdout), or to None if the
+            command could not be run or timed out.
+        """
+        key = json.dumps(list(argv))
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self.pool.submit(self._run, key, list(argv), timeout)
+                self._futures[key] = future
+        return future
+
+    def _run(self, key, argv, timeout):
+        """Run a command, preferring a cached successful gh result."""
+        persist = argv[0] in CACHED_COMMANDS
+        entry = self._cached.get(key) if persist else None
+        if entry is not None:
+            with self._lock:
+                self.stats["cache_hits"] += 1
+            return 0, entry["stdout"]
+        try:
+            result = subprocess.run(
+                argv,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=str(self.project_root),
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            return None
+        with self._lock:
+            self.stats["commands_run"] += 1
+            if persist and result.returncode == 0:
+                self._fresh[key] = {"time": time.time(), "stdout": result.stdout}
+        if result.returncode == 0:
+            self._remember_issues(argv, result.stdout)
+        return result.returncode, result.stdout
+
+    def prefetch_git(self, *queries):
+        """Start several git queries without waiting for them."""
+        for args in queries:
+            self.command(["git"] + list(args), GIT_TIMEOUT)
+
+    def prefetch_gh(self, *queries):
+        """Start several gh queries without waiting for them."""
+        for args in queries:
+            self.command(["gh"] + list(args), GH_TIMEOUT)
+
+    def git(self, args):
+        """Run a git query and return its stripped stdout, or None on failure."""
+        result = self.command(["git"] + list(args), GIT_TIMEOUT).result()
+        if result is None or result[0] != 0:
+            return None
+        return result[1].strip()
+
+    def gh_json(self, args):
+        """Run a gh query and return its parsed JSON output, or None.
+
+        Empty output and invalid JSON are treated as failures.
+        """
+        result = self.command(["gh"] + list(args), GH_TIMEOUT).result()
+        if result is None or result[0] != 0 or not result[1].strip():
+            return None
+        try:
+            return json.loads(result[1])
+        except ValueError:
+            return None
+
+    def _known_issue(self, number, fields):
+        """Return an issue from an earlier list query if it has all fields."""
+        with self._lock:
+            issue = self._issues.get(number)
+        if issue is not None and all(field in issue for field in fields.split(",")):
+            return issue
+        return None
+
+    def prefetch_issues(self, numbers, fields):
+        """Start `gh issue view` for issues not already known from a list."""
+        for number in numbers:
+            number = str(number).lstrip("#")
+            if self._known_issue(number, fields) is None:
+                self.command(["gh", "issue", "view", number, "--json", fields], GH_TIMEOUT)
+
+    def issue(self, number, fields):
+        """Return the requested fields of a GitHub issue, or None.
+
+        Args:
+            number: Issue number (integer or string like '#42').
+            fields: Comma-separated gh --json field list.
+
+        Returns:
+            The issue dict. When an earlier `gh issue list` already
+            returned every requested field, that entry is returned
+            as-is and no `gh issue view` is run.
+        """
+        number = str(number).lstrip("#")
+        issue = self._known_issue(number, fields)
+        if issue is not None:
+            with self._lock:
+                self.stats["issue_views_skipped"] += 1
+            return issue
+        return self.gh_json(["issue", "view", number, "--json", fields])
@@ -107,9 +107,9 @@ class AgentValidationReport(ValidationReport):
 
     agent_path: str = ""
 
-    def to_dict(self) -> dict[str, object]:
+    def to_dict(self, include_results: bool = True) -> dict[str, object]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
+        base = super().to_dict(include_results)
         base["agent_path"] = self.agent_path
         return base
 
@@ -77,9 +77,9 @@ class CommandValidationReport(ValidationReport):
 
     command_path: str = ""
 
-    def to_dict(self) -> dict[str, object]:
+    def to_dict(self, include_results: bool = True) -> dict[str, object]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
+        base = super().to_dict(include_results)
         base["command_path"] = self.command_path
         return base
 
@@ -176,9 +176,9 @@ class EncodingValidationReport(ValidationReport):
             "shell_crlf_issues": 0,
         }
 
-    def to_dict(self) -> dict[str, object]:
+    def to_dict(self, include_results: bool = True) -> dict[str, object]:
         """Override to include encoding-specific statistics."""
-        base = super().to_dict()
+        base = super().to_dict(include_results)
         base["encoding_stats"] = self.stats
         return base
 
@@ -594,9 +594,8 @@ Exit Codes:
 
     # Output results
     if args.json:
-        output = report.to_dict()
-        output["plugin_path"] = str(args.plugin_path)
-        print(json.dumps(output, indent=2))
+        report.write_json(sys.stdout, extra={"plugin_path": str(args.plugin_path)})
+        print()
     else:
         print_results_by_level(report, verbose=args.verbose)
         print_report_summary(report, title=f"Encoding Validation: {args.plugin_path.name}")
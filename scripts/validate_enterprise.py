@@ -182,9 +182,9 @@ class EnterpriseComplianceReport(ValidationReport):
         compliant = self.compliant_skills + self.compliant_agents
         return (compliant / total) * 100
 
-    def to_dict(self) -> dict[str, object]:
+    def to_dict(self, include_results: bool = True) -> dict[str, object]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
+        base = super().to_dict(include_results)
         base.update(
             {
                 "plugin_path": self.plugin_path,
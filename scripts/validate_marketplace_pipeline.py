@@ -33,9 +33,11 @@ import argparse
 import ast
 import configparser
 import json
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -74,6 +76,17 @@ GITHUB_HTTPS_URL_PATTERN = re.compile(r"^https://github\.com/[a-zA-Z0-9_.-]+/[a-
 # Version pattern (semver)
 VERSION_PATTERN = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$")
 
+# Worker threads for concurrent git queries and per-submodule probes
+DEFAULT_MAX_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+# Accepted names for a plugin's marketplace notification workflow
+NOTIFY_WORKFLOW_NAMES = [
+    "notify-marketplace.yml",
+    "notify.yml",
+    "marketplace-notify.yml",
+    "update-marketplace.yml",
+]
+
 
 # =============================================================================
 # Data Classes
@@ -412,6 +425,118 @@ def run_git_command(cwd: Path, *args: str) -> tuple[bool, str]:
         return False, str(e)
 
 
+# =============================================================================
+# Shared Marketplace State (collected once, reused by all phases)
+# =============================================================================
+
+
+@dataclass
+class SubmoduleSnapshot:
+    """Filesystem facts about one plugin submodule, probed once per run."""
+
+    name: str
+    path: str
+    url: str
+    is_dir: bool = False
+    has_workflows_dir: bool = False
+    notify_workflow: Path | None = None
+    notify_data: dict[str, Any] | None = None
+    notify_content: str = ""
+
+
+@dataclass
+class MarketplaceGitState:
+    """Git and submodule state shared by the structure and workflow phases.
+
+    Attributes:
+        submodules: Parsed .gitmodules (name -> {path, url})
+        status_ok: Whether ``git submodule status`` succeeded
+        status_output: Output of the single ``git submodule status`` call
+        snapshots: Per-submodule filesystem probes, keyed by submodule name
+    """
+
+    submodules: dict[str, dict[str, str]] = field(default_factory=dict)
+    status_ok: bool = False
+    status_output: str = ""
+    snapshots: dict[str, SubmoduleSnapshot] = field(default_factory=dict)
+
+
+def snapshot_submodule(marketplace_path: Path, name: str, config: dict[str, str]) -> SubmoduleSnapshot:
+    """Probe a submodule working tree for the files the pipeline checks need.
+
+    Args:
+        marketplace_path: Path to marketplace root directory
+        name: Submodule name from .gitmodules
+        config: Submodule config (path, url)
+
+    Returns:
+        SubmoduleSnapshot with directory, workflow and notify-workflow data
+    """
+    path = config.get("path", name)
+    snapshot = SubmoduleSnapshot(name=name, path=path, url=config.get("url", ""))
+    plugin_path = marketplace_path / path
+    snapshot.is_dir = plugin_path.is_dir()
+    if not snapshot.is_dir:
+        return snapshot
+
+    workflows_dir = plugin_path / ".github" / "workflows"
+    snapshot.has_workflows_dir = workflows_dir.is_dir()
+    if not snapshot.has_workflows_dir:
+        return snapshot
+
+    for workflow_name in NOTIFY_WORKFLOW_NAMES:
+        candidate = workflows_dir / workflow_name
+        if candidate.exists():
+            snapshot.notify_workflow = candidate
+            snapshot.notify_data = load_yaml_file(candidate)
+            try:
+                snapshot.notify_content = candidate.read_text()
+            except (OSError, UnicodeDecodeError):
+                snapshot.notify_content = ""
+            break
+
+    return snapshot
+
+
+def collect_marketplace_state(
+    marketplace_path: Path,
+    max_workers: int | None = None,
+) -> MarketplaceGitState:
+    """Gather all git and submodule data the pipeline phases need, concurrently.
+
+    A single ``git submodule status`` covers every submodule, and it runs on
+    the worker pool alongside the per-submodule filesystem probes instead of
+    each phase re-parsing .gitmodules and re-walking submodules serially.
+
+    Args:
+        marketplace_path: Path to marketplace root directory
+        max_workers: Thread pool size (default DEFAULT_MAX_WORKERS)
+
+    Returns:
+        MarketplaceGitState shared by all validation phases
+    """
+    state = MarketplaceGitState()
+    gitmodules_path = marketplace_path / ".gitmodules"
+    if not gitmodules_path.exists():
+        return state
+
+    state.submodules = parse_gitmodules(gitmodules_path)
+    if not state.submodules:
+        return state
+
+    with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_MAX_WORKERS) as pool:
+        status_future = pool.submit(run_git_command, marketplace_path, "submodule", "status")
+        snapshot_futures = {
+            name: pool.submit(snapshot_submodule, marketplace_path, name, config)
+            for name, config in state.submodules.items()
+        }
+        state.status_ok, state.status_output = status_future.result()
+        # Keep .gitmodules order so reported lists stay deterministic
+        state.snapshots = {name: future.result() for name, future in snapshot_futures.items()}
+
+    return state
+
+
 # =============================================================================
 # Category 1: Marketplace Structure Validation (25 points)
 # =============================================================================
@@ -420,6 +545,7 @@ def run_git_command(cwd: Path, *args: str) -> tuple[bool, str]:
 def validate_marketplace_structure(
     marketplace_path: Path,
     report: PipelineValidationReport,
+    state: MarketplaceGitState | None = None,
 ) -> dict[str, Any] | None:
     """Validate marketplace structure and return parsed marketplace.json.
 
@@ -523,7 +649,7 @@ def validate_marketplace_structure(
         submodules = {}
     else:
         report.passed(category, ".gitmodules exists", 5.0, str(gitmodules_path))
-        submodules = parse_gitmodules(gitmodules_path)
+        submodules = state.submodules if state is not None else parse_gitmodules(gitmodules_path)
         report.submodules_found = list(submodules.keys())
 
     # Check 5: .gitmodules has entries for all plugins (4 pts, MAJOR)
@@ -633,6 +759,7 @@ def validate_marketplace_structure(
 def validate_submodule_health(
     marketplace_path: Path,
     report: PipelineValidationReport,
+    state: MarketplaceGitState | None = None,
 ) -> None:
     """Validate git submodule health.
 
@@ -655,7 +782,9 @@ def validate_submodule_health(
         )
         return
 
-    submodules = parse_gitmodules(gitmodules_path)
+    if state is None:
+        state = collect_marketplace_state(marketplace_path)
+    submodules = state.submodules
     if not submodules:
         report.info(category, "No submodules defined in .gitmodules")
         # Award all points since there's nothing to fail
@@ -667,7 +796,7 @@ def validate_submodule_health(
         return
 
     # Check 1: All submodules initialized (5 pts, CRITICAL)
-    success, output = run_git_command(marketplace_path, "submodule", "status")
+    success, output = state.status_ok, state.status_output
     if not success:
         report.critical(
             category,
@@ -716,12 +845,7 @@ def validate_submodule_health(
         report.passed(category, "All submodule URLs are valid", 5.0)
 
     # Check 3: Submodule paths exist as directories (4 pts, MAJOR)
-    missing_paths = []
-    for name, config in submodules.items():
-        path = config.get("path", name)
-        full_path = marketplace_path / path
-        if not full_path.is_dir():
-            missing_paths.append(path)
+    missing_paths = [snapshot.path for snapshot in state.snapshots.values() if not snapshot.is_dir]
 
     if missing_paths:
         report.major(
@@ -963,6 +1087,7 @@ def validate_marketplace_workflows(
 def validate_plugin_workflows(
     marketplace_path: Path,
     report: PipelineValidationReport,
+    state: MarketplaceGitState | None = None,
 ) -> None:
     """Validate GitHub workflows in each plugin for marketplace notification.
 
@@ -986,7 +1111,9 @@ def validate_plugin_workflows(
         )
         return
 
-    submodules = parse_gitmodules(gitmodules_path)
+    if state is None:
+        state = collect_marketplace_state(marketplace_path)
+    submodules = state.submodules
     if not submodules:
         report.info(category, "No plugin submodules to validate workflows for")
         # Award points since there's nothing to fail
@@ -1007,47 +1134,31 @@ def validate_plugin_workflows(
     plugins_with_push_trigger = 0
     plugins_with_dispatch = 0
 
-    for name, config in submodules.items():
-        path = config.get("path", name)
-        plugin_path = marketplace_path / path
-
-        if not plugin_path.is_dir():
+    for snapshot in state.snapshots.values():
+        # Check 1: .github/workflows/ exists
+        if not snapshot.has_workflows_dir:
             continue
+        plugins_with_workflows += 1
 
-        workflows_dir = plugin_path / ".github" / "workflows"
-
-        # Check 1: .github/workflows/ exists
-        if workflows_dir.is_dir():
-            plugins_with_workflows += 1
-
-            # Check 2: notify-marketplace.yml exists
-            notify_workflow = workflows_dir / "notify-marketplace.yml"
-            if not notify_workflow.exists():
-                # Try alternatives
-                alternatives = ["notify.yml", "marketplace-notify.yml", "update-marketplace.yml"]
-                for alt in alternatives:
-                    alt_path = workflows_dir / alt
-                    if alt_path.exists():
-                        notify_workflow = alt_path
-                        break
-
-            if notify_workflow.exists():
-                plugins_with_notify += 1
-
-                # Check 3 & 4: Workflow contents
-                workflow_data = load_yaml_file(notify_workflow)
-                if workflow_data:
-                    # YAML 1.1 treats 'on' as boolean True, so check both keys
-                    triggers_value = workflow_data.get("on") or workflow_data.get(True, {})  # type: ignore[call-overload]
-                    triggers = triggers_value if isinstance(triggers_value, dict) else {}
-                    # Check push trigger
-                    if "push" in triggers:
-                        plugins_with_push_trigger += 1
-
-                    # Check for repository_dispatch action
-                    workflow_content = notify_workflow.read_text()
-                    if "repository_dispatch" in workflow_content or "repository-dispatch" in workflow_content:
-                        plugins_with_dispatch += 1
+        # Check 2: notify-marketplace.yml (or an alternative name) exists
+        if snapshot.notify_workflow is None:
+            continue
+        plugins_with_notify += 1
+
+        # Check 3 & 4: Workflow contents
+        workflow_data = snapshot.notify_data
+        if workflow_data:
+            # YAML 1.1 treats 'on' as boolean True, so check both keys
+            triggers_value = workflow_data.get("on") or workflow_data.get(True, {})  # type: ignore[call-overload]
+            triggers = triggers_value if isinstance(triggers_value, dict) else {}
+            # Check push trigger
+            if "push" in triggers:
+                plugins_with_push_trigger += 1
+
+            # Check for repository_dispatch action
+            workflow_content = snapshot.notify_content
+            if "repository_dispatch" in workflow_content or "repository-dispatch" in workflow_content:
+                plugins_with_dispatch += 1
 
     # Report results
     if plugins_with_workflows == plugin_count:
@@ -1225,7 +1336,6 @@ def validate_sync_scripts(
         report.passed(category, "sync_marketplace_versions.py exists", 4.0, str(sync_script))
 
     # Check 3: Script is executable (2 pts, MINOR)
-    import os
     import stat
 
     file_stat = os.stat(sync_script)
@@ -1345,23 +1455,29 @@ def validate_documentation(
 def validate_marketplace_pipeline(
     marketplace_path: Path,
     _verbose: bool = False,
+    max_workers: int | None = None,
 ) -> PipelineValidationReport:
     """Run all pipeline validation checks.
 
+    Git and submodule state is collected once, concurrently, and shared by
+    the structure, submodule health and plugin workflow phases.
+
     Args:
         marketplace_path: Path to marketplace root directory
         _verbose: Reserved for future use (currently unused)
+        max_workers: Thread pool size for git queries and submodule probes
 
     Returns:
         Complete validation report
     """
     report = PipelineValidationReport(marketplace_path=marketplace_path)
+    state = collect_marketplace_state(marketplace_path, max_workers)
 
     # Run all category validations
-    validate_marketplace_structure(marketplace_path, report)
-    validate_submodule_health(marketplace_path, report)
+    validate_marketplace_structure(marketplace_path, report, state)
+    validate_submodule_health(marketplace_path, report, state)
     validate_marketplace_workflows(marketplace_path, report)
-    validate_plugin_workflows(marketplace_path, report)
+    validate_plugin_workflows(marketplace_path, report, state)
     validate_sync_scripts(marketplace_path, report)
     validate_documentation(marketplace_path, report)
 
@@ -1493,6 +1609,13 @@ Exit Codes:
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help=f"Worker threads for git queries and submodule checks (default: {DEFAULT_MAX_WORKERS})",
+    )
 
     args = parser.parse_args()
 
@@ -1506,7 +1629,7 @@ Exit Codes:
         return EXIT_MINOR
 
     # Run validation
-    report = validate_marketplace_pipeline(args.marketplace_path, _verbose=args.verbose)
+    report = validate_marketplace_pipeline(args.marketplace_path, _verbose=args.verbose, max_workers=args.jobs)
 
     # Output results
     if args.json:
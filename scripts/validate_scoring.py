@@ -59,6 +59,7 @@ from validate_skill import validate_skill
 # Import shared validation infrastructure
 from validation_common import (
     COLORS,
+    ResultList,
     ValidationReport,
     ValidationResult,
     calculate_letter_grade,
@@ -242,6 +243,16 @@ def calculate_category_score(
     Returns:
         Tuple of (score, critical_count, major_count, minor_count, passed_count)
     """
+    if isinstance(results, ResultList):
+        # Counters are maintained incrementally - no need to re-walk results
+        counts = results.counts
+        critical_count = counts.get("CRITICAL", 0)
+        major_count = counts.get("MAJOR", 0)
+        minor_count = counts.get("MINOR", 0)
+        passed_count = counts.get("PASSED", 0)
+        score = max_score - 3.0 * critical_count - 1.5 * major_count - 0.5 * minor_count
+        return max(0.0, score), critical_count, major_count, minor_count, passed_count
+
     score = max_score
     critical_count = 0
     major_count = 0
@@ -278,65 +289,80 @@ def categorize_results(
         Dictionary of category name -> list of ValidationResults
     """
     categories: dict[str, list[ValidationResult]] = {
-        "schema_compliance": [],
-        "security": [],
-        "matcher_validity": [],
-        "script_existence": [],
-        "hook_types": [],
-        "documentation": [],
-        "maintainability": [],
+        "schema_compliance": ResultList(),
+        "security": ResultList(),
+        "matcher_validity": ResultList(),
+        "script_existence": ResultList(),
+        "hook_types": ResultList(),
+        "documentation": ResultList(),
+        "maintainability": ResultList(),
     }
 
-    # Helper to categorize based on message content
-    def categorize_result(result: ValidationResult, validator_name: str) -> None:
-        msg_lower = result.message.lower()
+    # Messages are heavily repeated in large scans, so the
+    # keyword classification is computed once per distinct message
+    category_cache: dict[str, str] = {}
+
+    def classify_message(message: str) -> str:
+        msg_lower = message.lower()
 
-        # Security category - from security validator or security-related messages
-        if validator_name == "security" or any(
+        # Security category - security-related messages
+        if any(
             keyword in msg_lower
             for keyword in ["security", "secret", "credential", "injection", "traversal", "dangerous", "unsafe"]
         ):
-            categories["security"].append(result)
+            return "security"
 
         # Schema compliance - manifest, JSON, required fields
-        elif any(
+        if any(
             keyword in msg_lower
             for keyword in ["json", "manifest", "plugin.json", "required field", "schema", "kebab-case", "name must"]
         ):
-            categories["schema_compliance"].append(result)
+            return "schema_compliance"
 
         # Matcher validity - hook matchers
-        elif any(keyword in msg_lower for keyword in ["matcher", "regex", "pattern invalid", "tool name", "wildcard"]):
-            categories["matcher_validity"].append(result)
+        if any(keyword in msg_lower for keyword in ["matcher", "regex", "pattern invalid", "tool name", "wildcard"]):
+            return "matcher_validity"
 
         # Script existence - scripts, executables
-        elif any(
+        if any(
             keyword in msg_lower
             for keyword in ["script", "executable", "shebang", "chmod", "file not found", "command not found"]
         ):
-            categories["script_existence"].append(result)
+            return "script_existence"
 
         # Hook types - hook configuration
-        elif any(
+        if any(
             keyword in msg_lower
             for keyword in ["hook type", "event type", "pretooluse", "posttooluse", "stop", "sessionstart"]
         ):
-            categories["hook_types"].append(result)
+            return "hook_types"
 
         # Documentation - README, descriptions, comments
-        elif any(keyword in msg_lower for keyword in ["readme", "description", "documentation", "missing docstring"]):
-            categories["documentation"].append(result)
+        if any(keyword in msg_lower for keyword in ["readme", "description", "documentation", "missing docstring"]):
+            return "documentation"
 
         # Maintainability - code quality, structure
-        elif any(
+        if any(
             keyword in msg_lower
             for keyword in ["version", "structure", "duplicate", "unused", "deprecated", "lint", "format"]
         ):
-            categories["maintainability"].append(result)
+            return "maintainability"
 
         # Default to schema_compliance if no specific category matches
-        else:
-            categories["schema_compliance"].append(result)
+        return "schema_compliance"
+
+    # Helper to categorize based on validator and message content
+    def categorize_result(result: ValidationResult, validator_name: str) -> None:
+        # Everything from the security validator is a security finding
+        if validator_name == "security":
+            categories["security"].append(result)
+            return
+
+        category = category_cache.get(result.message)
+        if category is None:
+            category = classify_message(result.message)
+            category_cache[result.message] = category
+        categories[category].append(result)
 
     # Process all results from all validators
     for validator_name, report in reports.items():
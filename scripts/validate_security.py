@@ -18,7 +18,6 @@ Security Checks Implemented:
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import re
 import stat
@@ -598,9 +597,8 @@ Exit Codes:
 
     # Output results
     if args.json:
-        output = report.to_dict()
-        output["plugin_path"] = str(args.plugin_path)
-        print(json.dumps(output, indent=2))
+        report.write_json(sys.stdout, extra={"plugin_path": str(args.plugin_path)})
+        print()
     else:
         print_results_by_level(report, verbose=args.verbose)
         print_report_summary(report, title=f"Security Validation: {args.plugin_path.name}")
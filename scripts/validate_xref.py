@@ -99,9 +99,9 @@ class CrossReferenceValidationReport(ValidationReport):
     version_sources: dict[str, str] = field(default_factory=dict)
     hook_script_refs: list[str] = field(default_factory=list)
 
-    def to_dict(self) -> dict[str, object]:
+    def to_dict(self, include_results: bool = True) -> dict[str, object]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
+        base = super().to_dict(include_results)
         base["plugin_path"] = self.plugin_path
         base["agent_refs"] = self.agent_refs
         base["skill_refs"] = self.skill_refs
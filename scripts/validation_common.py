@@ -13,20 +13,143 @@ All individual validators should import from this module to ensure consistency.
 
 from __future__ import annotations
 
-import fnmatch
+import hashlib
 import json
+import operator
 import os
 import re
 import subprocess
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import IO, Any, Callable, Literal, SupportsIndex
 
 # =============================================================================
 # Tool Resolution: local install → remote runner fallback (via smart_exec)
 # =============================================================================
 
-def resolve_tool_command(tool_name: str) -> list[str] | None:
+# Process-wide memo of resolved command prefixes (None = no executor found)
+_TOOL_COMMAND_CACHE: dict[str, list[str] | None] = {}
+
+# Memoized executor availability map (detect_executors runs ~12 shutil.which)
+_EXECUTORS: dict[str, bool] | None = None
+
+# Tools whose remote-runner package cache has already been warmed this run
+_PREWARMED_TOOLS: set[str] = set()
+
+# Optional on-disk cache of resolutions, enabled by pointing this env var at a file
+TOOL_CACHE_ENV = "CLAUDE_VALIDATION_TOOL_CACHE"
+
+# On-disk resolutions, read once per process: (cache file, tools) or None
+_DISK_TOOL_CACHE: tuple[Path, dict[str, list[str]]] | None = None
+
+# Remote runners that download the tool package on first use
+REMOTE_RUNNERS = {"uvx", "uv", "bunx", "bun"}
+
+# Timeout for the one-time warm-up download (much longer than per-file lint timeouts)
+PREWARM_TIMEOUT = 300
+
+
+def _tool_cache_key() -> str:
+    """Return the on-disk cache key: a digest of the current PATH."""
+    return hashlib.sha256(os.environ.get("PATH", "").encode("utf-8")).hexdigest()
+
+
+def _load_tool_cache(cache_file: Path) -> dict[str, list[str]]:
+    """Load cached tool resolutions for the current PATH.
+
+    Returns an empty dict when the file is missing, unreadable, or was
+    written under a different PATH. Unavailable (None) entries are skipped
+    so a tool installed later is picked up.
+    """
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("path_key") != _tool_cache_key():
+        return {}
+    tools = data.get("tools", {})
+    if not isinstance(tools, dict):
+        return {}
+    return {name: argv for name, argv in tools.items() if isinstance(argv, list)}
+
+
+def _disk_tool_cache(cache_file: Path) -> dict[str, list[str]]:
+    """Return the on-disk resolutions, reading the cache file once per process."""
+    global _DISK_TOOL_CACHE
+    if _DISK_TOOL_CACHE is None or _DISK_TOOL_CACHE[0] != cache_file:
+        _DISK_TOOL_CACHE = (cache_file, _load_tool_cache(cache_file))
+    return _DISK_TOOL_CACHE[1]
+
+
+def _save_tool_cache(cache_file: Path, tool_name: str, argv: list[str]) -> None:
+    """Add one resolution to the cache file for the current PATH (best effort).
+
+    The file is re-read just before writing so resolutions saved by other
+    runs since this process loaded it are kept.
+    """
+    tools = _load_tool_cache(cache_file)
+    tools[tool_name] = argv
+    _disk_tool_cache(cache_file)[tool_name] = argv
+    payload = {"path_key": _tool_cache_key(), "tools": tools}
+    tmp_file = cache_file.with_name(cache_file.name + f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _get_executors() -> dict[str, bool]:
+    """Detect available executors once per process."""
+    global _EXECUTORS
+    if _EXECUTORS is None:
+        from smart_exec import detect_executors
+
+        _EXECUTORS = detect_executors()
+    return _EXECUTORS
+
+
+def prewarm_tool_command(tool_name: str, argv: list[str]) -> None:
+    """Warm the remote runner's package cache for a tool, once per run.
+
+    A first-time ``uvx``/``bunx`` invocation downloads the tool package,
+    which can easily exceed the 30-second per-file lint timeout. Running
+    ``<argv> --version`` once with a generous timeout moves that download
+    out of the per-file loop. Locally installed tools are never warmed.
+
+    Args:
+        tool_name: Logical tool name (e.g. "ruff")
+        argv: Resolved command prefix from resolve_tool_command
+    """
+    if tool_name in _PREWARMED_TOOLS or not argv:
+        return
+    _PREWARMED_TOOLS.add(tool_name)
+    if Path(argv[0]).name not in REMOTE_RUNNERS:
+        return
+    try:
+        subprocess.run(
+            argv + ["--version"],
+            capture_output=True,
+            text=True,
+            timeout=PREWARM_TIMEOUT,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+
+
+def clear_tool_command_cache() -> None:
+    """Reset the process-wide tool resolution memo (e.g. after PATH changes)."""
+    global _EXECUTORS, _DISK_TOOL_CACHE
+    _TOOL_COMMAND_CACHE.clear()
+    _PREWARMED_TOOLS.clear()
+    _EXECUTORS = None
+    _DISK_TOOL_CACHE = None
+
+
+def resolve_tool_command(tool_name: str, prewarm: bool = True) -> list[str] | None:
     """Resolve a linting tool to its executable command prefix.
 
     Uses smart_exec's tool database and executor detection to find
@@ -36,19 +159,44 @@ def resolve_tool_command(tool_name: str) -> list[str] | None:
     Supports 25+ tools across Python, Node, Deno, native, and PowerShell
     ecosystems. See smart_exec.py for the full TOOL_DB and PRIORITY tables.
 
+    Resolutions are memoized for the lifetime of the process, so calling
+    this inside per-file loops is cheap. When the CLAUDE_VALIDATION_TOOL_CACHE
+    environment variable names a file, resolutions are also persisted there
+    and reused across runs for as long as PATH is unchanged (tools that were
+    not found are re-resolved on every run).
+
+    Args:
+        tool_name: Logical tool name (e.g. "ruff", "shellcheck")
+        prewarm: Warm the uvx/bunx package cache on first resolution
+
     Returns:
         Command prefix as list (e.g. ["uvx", "ruff@latest"]) or None if
         no suitable executor is available on this system.
     """
-    from smart_exec import choose_best, detect_executors, resolve_tool
+    if tool_name not in _TOOL_COMMAND_CACHE:
+        cache_env = os.environ.get(TOOL_CACHE_ENV, "").strip()
+        cache_file = Path(cache_env).expanduser() if cache_env else None
+        cached = _disk_tool_cache(cache_file) if cache_file else {}
+        if tool_name in cached:
+            _TOOL_COMMAND_CACHE[tool_name] = cached[tool_name]
+        else:
+            from smart_exec import choose_best, resolve_tool
 
-    spec = resolve_tool(tool_name)
-    executors = detect_executors()
-    try:
-        argv, _executor = choose_best(spec, [], executors)
-        return argv
-    except RuntimeError:
+            spec = resolve_tool(tool_name)
+            try:
+                argv, _executor = choose_best(spec, [], _get_executors())
+            except RuntimeError:
+                argv = None
+            _TOOL_COMMAND_CACHE[tool_name] = argv
+            if cache_file and argv is not None:
+                _save_tool_cache(cache_file, tool_name, argv)
+
+    argv = _TOOL_COMMAND_CACHE[tool_name]
+    if argv is None:
         return None
+    if prewarm:
+        prewarm_tool_command(tool_name, argv)
+    return list(argv)
 
 
 # =============================================================================
@@ -493,7 +641,9 @@ def get_gitignored_files(root_path: Path) -> set[str]:
     """Get set of files/directories that are gitignored.
 
     Uses git check-ignore to accurately determine what's ignored,
-    falling back to parsing .gitignore directly if git is not available.
+    falling back to a compiled GitignoreMatcher if git is not available.
+    Like ``git ls-files --directory``, an ignored directory is reported
+    once and its contents are not listed (the walk never descends into it).
 
     Args:
         root_path: Root directory to check for .gitignore
@@ -520,20 +670,14 @@ def get_gitignored_files(root_path: Path) -> set[str]:
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         pass
 
-    # Fallback: Parse .gitignore directly
-    gitignore_path = root_path / ".gitignore"
-    if gitignore_path.exists():
-        try:
-            patterns = parse_gitignore(gitignore_path)
-            # Scan directory and match patterns
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                rel_dir = Path(dirpath).relative_to(root_path)
-                for name in dirnames + filenames:
-                    rel_path = str(rel_dir / name) if str(rel_dir) != "." else name
-                    if is_path_gitignored(rel_path, patterns):
-                        ignored.add(rel_path)
-        except Exception:
-            pass
+    # Fallback: compiled matcher over root and nested .gitignore files
+    try:
+        matcher = GitignoreMatcher(root_path)
+        for _dirpath, rel_dir, _dirnames, _filenames, pruned in matcher.walk_with_ignored():
+            for name in pruned:
+                ignored.add(f"{rel_dir}/{name}" if rel_dir else name)
+    except Exception:
+        pass
 
     return ignored
 
@@ -561,56 +705,265 @@ def parse_gitignore(gitignore_path: Path) -> list[str]:
     return patterns
 
 
-def is_path_gitignored(rel_path: str, patterns: list[str]) -> bool:
+def _translate_gitignore_glob(pattern: str) -> str:
+    """Translate one gitignore glob (without !, leading / or trailing /) to regex.
+
+    Implements gitignore wildcard semantics: ``*`` and ``?`` never match
+    ``/``, ``[...]`` is a character class, a leading ``**/`` matches in all
+    directories, ``/**/`` matches zero or more directories and a trailing
+    ``/**`` matches everything inside. Other ``**`` behave like ``*``.
+    """
+    out: list[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if i + 2 == n:
+                    out.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+            while i < n and pattern[i] == "*":
+                i += 1
+            out.append("[^/]*")
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : j]
+                negate = body[:1] in ("!", "^")
+                if negate:
+                    body = body[1:]
+                body = body.replace("/", "")
+                out.append(f"[^/{body}]" if negate else f"[{body}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class CompiledGitignore:
+    """Gitignore pattern list compiled into two anchored alternation regexes.
+
+    Patterns are joined in reverse order, so the first alternative that
+    fully matches a path is the LAST matching pattern in file order, which
+    is the one git uses (this is how negation is resolved). Directory-only
+    patterns (trailing ``/``) are left out of the regex used for files.
+    """
+
+    __slots__ = ("file_regex", "file_negated", "dir_regex", "dir_negated")
+
+    def __init__(self, patterns: list[str]) -> None:
+        file_rules: list[tuple[str, bool]] = []
+        dir_rules: list[tuple[str, bool]] = []
+        for raw in patterns:
+            pattern = raw.rstrip()
+            if raw.endswith("\\ "):
+                pattern = raw[:-2] + "\\ "
+            if not pattern or pattern.startswith("#"):
+                continue
+            negated = pattern.startswith("!")
+            if negated or pattern.startswith(("\\!", "\\#")):
+                pattern = pattern[1:]
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if not pattern:
+                continue
+            # A slash at the start or in the middle anchors the pattern
+            anchored = "/" in pattern
+            pattern = pattern.lstrip("/")
+            regex = _translate_gitignore_glob(pattern)
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+            dir_rules.append((regex, negated))
+            if not dir_only:
+                file_rules.append((regex, negated))
+
+        self.file_regex, self.file_negated = self._combine(file_rules)
+        self.dir_regex, self.dir_negated = self._combine(dir_rules)
+
+    @staticmethod
+    def _combine(rules: list[tuple[str, bool]]) -> tuple[re.Pattern[str] | None, list[bool]]:
+        if not rules:
+            return None, []
+        ordered = rules[::-1]
+        regex = re.compile("|".join(f"({r})" for r, _ in ordered), re.DOTALL)
+        # Group index (1-based) -> negation flag
+        return regex, [False] + [neg for _, neg in ordered]
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool | None:
+        """Match a path relative to this .gitignore's directory.
+
+        Returns:
+            True if ignored, False if re-included by a negation,
+            None if no pattern matches
+        """
+        regex, negated = (self.dir_regex, self.dir_negated) if is_dir else (self.file_regex, self.file_negated)
+        if regex is None:
+            return None
+        m = regex.fullmatch(rel_path)
+        if m is None:
+            return None
+        return not negated[m.lastindex or 0]
+
+
+class GitignoreMatcher:
+    """Compiled gitignore engine for a directory tree.
+
+    Handles the root .gitignore plus nested .gitignore files (deeper files
+    take precedence), negation, directory-only rules and ``**``. Directory
+    decisions are memoized, and walk() prunes ignored directories so
+    os.walk never descends into ignored subtrees.
+
+    Usage:
+        matcher = GitignoreMatcher(root_path)
+        for dirpath, dirnames, filenames in matcher.walk():
+            ...
+        matcher.is_ignored("build/out.txt")
+    """
+
+    def __init__(self, root_path: Path | None = None, patterns: list[str] | None = None, nested: bool = True) -> None:
+        """Create a matcher.
+
+        Args:
+            root_path: Tree root; its .gitignore files are loaded lazily
+            patterns: Explicit root patterns (used instead of root .gitignore)
+            nested: Also honor .gitignore files in subdirectories
+        """
+        self.root_path = root_path
+        self.nested = nested and root_path is not None
+        self._rules: dict[str, CompiledGitignore | None] = {}
+        self._dir_cache: dict[str, bool] = {}
+        if patterns is not None:
+            self._rules[""] = CompiledGitignore(patterns)
+
+    def _rules_for(self, rel_dir: str) -> CompiledGitignore | None:
+        """Return the compiled .gitignore of a directory, loading it on first use."""
+        if rel_dir in self._rules:
+            return self._rules[rel_dir]
+        compiled = None
+        if self.root_path is not None and (rel_dir == "" or self.nested):
+            gitignore_path = self.root_path / rel_dir / ".gitignore"
+            if gitignore_path.is_file():
+                patterns = parse_gitignore(gitignore_path)
+                if patterns:
+                    compiled = CompiledGitignore(patterns)
+        self._rules[rel_dir] = compiled
+        return compiled
+
+    def _decide(self, rel_path: str, is_dir: bool) -> bool:
+        """Decide a single path, assuming none of its ancestors is ignored."""
+        parts = rel_path.split("/")
+        # Deepest .gitignore first: the first file with a matching rule wins
+        for depth in range(len(parts) - 1, -1, -1):
+            rel_dir = "/".join(parts[:depth])
+            rules = self._rules_for(rel_dir)
+            if rules is None:
+                continue
+            decision = rules.match("/".join(parts[depth:]), is_dir)
+            if decision is not None:
+                return decision
+        return False
+
+    def is_dir_ignored(self, rel_dir: str) -> bool:
+        """Return whether a directory (and so its whole subtree) is ignored."""
+        rel_dir = rel_dir.replace("\\", "/").strip("/")
+        if not rel_dir:
+            return False
+        cached = self._dir_cache.get(rel_dir)
+        if cached is None:
+            parent = rel_dir.rpartition("/")[0]
+            # A path inside an ignored directory can never be re-included
+            cached = self.is_dir_ignored(parent) or self._decide(rel_dir, True)
+            self._dir_cache[rel_dir] = cached
+        return cached
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Return whether a path relative to the root is ignored."""
+        rel_path = rel_path.replace("\\", "/").strip("/")
+        if not rel_path:
+            return False
+        if is_dir:
+            return self.is_dir_ignored(rel_path)
+        parent = rel_path.rpartition("/")[0]
+        return self.is_dir_ignored(parent) or self._decide(rel_path, False)
+
+    def walk_with_ignored(self) -> Iterator[tuple[str, str, list[str], list[str], list[str]]]:
+        """Walk the tree, yielding (dirpath, rel_dir, dirnames, filenames, ignored).
+
+        Ignored entries are removed from dirnames/filenames (so ignored
+        subtrees are never entered) and reported in ``ignored``. Callers
+        may prune dirnames further in place, as with os.walk.
+        """
+        if self.root_path is None:
+            return
+        for dirpath, dirnames, filenames in os.walk(self.root_path):
+            rel_dir = Path(dirpath).relative_to(self.root_path).as_posix()
+            if rel_dir == ".":
+                rel_dir = ""
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            ignored: list[str] = []
+            kept_dirs: list[str] = []
+            for d in dirnames:
+                rel = prefix + d
+                decision = self._decide(rel, True)
+                self._dir_cache[rel] = decision
+                (ignored if decision else kept_dirs).append(d)
+            kept_files: list[str] = []
+            for f in filenames:
+                (ignored if self._decide(prefix + f, False) else kept_files).append(f)
+            dirnames[:] = kept_dirs
+            yield dirpath, rel_dir, dirnames, kept_files, ignored
+
+    def walk(self) -> Iterator[tuple[str, list[str], list[str]]]:
+        """os.walk replacement that skips ignored files and prunes ignored directories."""
+        for dirpath, _rel_dir, dirnames, filenames, _ignored in self.walk_with_ignored():
+            yield dirpath, dirnames, filenames
+
+
+# Compiled matchers for is_path_gitignored, keyed by pattern list
+_PATTERN_MATCHERS: dict[tuple[str, ...], GitignoreMatcher] = {}
+
+
+def is_path_gitignored(rel_path: str, patterns: list[str], is_dir: bool = False) -> bool:
     """Check if a relative path matches any gitignore pattern.
 
+    The pattern list is compiled once (and memoized) into a GitignoreMatcher,
+    so repeated calls cost one regex match per uncached ancestor directory.
+
     Args:
         rel_path: Relative path to check
         patterns: List of gitignore patterns
+        is_dir: Whether rel_path is a directory (enables dir-only patterns)
 
     Returns:
-        True if path matches any pattern
+        True if the path (or one of its parent directories) is ignored
     """
-    # Normalize path separators
-    rel_path = rel_path.replace("\\", "/")
-    path_parts = rel_path.split("/")
-
-    for pattern in patterns:
-        # Handle negation (!) - not fully implemented, just skip
-        if pattern.startswith("!"):
-            continue
-
-        # Handle directory-only patterns (ending with /)
-        is_dir_pattern = pattern.endswith("/")
-        if is_dir_pattern:
-            pattern = pattern[:-1]
-
-        # Handle patterns starting with /
-        is_anchored = pattern.startswith("/")
-        if is_anchored:
-            pattern = pattern[1:]
-
-        # Convert gitignore pattern to fnmatch pattern
-        # Handle ** for directory matching
-        if "**" in pattern:
-            # Simplified: treat ** as matching any path
-            pattern = pattern.replace("**/", "*/").replace("/**", "/*")
-
-        # Check if pattern matches any component or the full path
-        if is_anchored:
-            # Anchored patterns only match from root
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-        else:
-            # Non-anchored patterns can match any component
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-            # Also check if any path component matches
-            for part in path_parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-
-    return False
+    key = tuple(patterns)
+    matcher = _PATTERN_MATCHERS.get(key)
+    if matcher is None:
+        matcher = GitignoreMatcher(patterns=patterns)
+        _PATTERN_MATCHERS[key] = matcher
+    return matcher.is_ignored(rel_path, is_dir)
 
 
 def get_skip_dirs_with_gitignore(root_path: Path, additional_skip: set[str] | None = None) -> set[str]:
@@ -656,10 +1009,17 @@ MAX_BODY_WORDS = 2000
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Single validation check result.
 
+    Uses __slots__ so that reports with tens of thousands of findings do not
+    store a per-result dict. Only level and phase are interned: they come
+    from small fixed sets, while messages and paths are mostly distinct and
+    interning them would only grow the interpreter's intern table.
+    Frozen so a result's level cannot change behind the per-level counters
+    of the ResultList holding it; use ResultList.relevel() instead.
+
     Attributes:
         level: Severity level (CRITICAL, MAJOR, MINOR, INFO, PASSED)
         message: Human-readable description of the result
@@ -678,6 +1038,12 @@ class ValidationResult:
     fixable: bool = False
     fix_id: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern the level and phase strings (small fixed sets)."""
+        object.__setattr__(self, "level", sys.intern(self.level))
+        if self.phase is not None:
+            object.__setattr__(self, "phase", sys.intern(self.phase))
+
     def to_dict(self) -> dict[str, str | int | bool | None]:
         """Convert to dictionary for JSON serialization."""
         result: dict[str, str | int | bool | None] = {"level": self.level, "message": self.message}
@@ -698,6 +1064,143 @@ class ValidationResult:
 FixFunction = Callable[[str, int | None], bool]  # (file_path, line) -> success
 
 
+# All result levels, in severity order
+RESULT_LEVELS: tuple[Level, ...] = ("CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED")
+
+
+class ResultList(list[ValidationResult]):
+    """List of ValidationResult that keeps per-level counters in sync.
+
+    Behaves like a plain list (validators append/extend it directly), but
+    every mutation updates ``counts`` so severity queries, exit codes and
+    scores never need to re-walk the results. Results are frozen, so the
+    counters cannot drift from the levels they count. The position of each
+    result is recorded when it is added, so relevel() does not scan.
+    """
+
+    __slots__ = ("counts", "_positions")
+
+    def __init__(self, iterable: Iterable[ValidationResult] = ()) -> None:
+        super().__init__()
+        self.counts: dict[str, int] = dict.fromkeys(RESULT_LEVELS, 0)
+        # Index of each result by identity; None after a mutation that shifts
+        # positions, rebuilt on the next relevel()
+        self._positions: dict[int, int] | None = {}
+        self.extend(iterable)
+
+    def _count(self, result: ValidationResult, delta: int) -> None:
+        self.counts[result.level] = self.counts.get(result.level, 0) + delta
+
+    def append(self, result: ValidationResult) -> None:
+        """Append a result and count it."""
+        if self._positions is not None:
+            self._positions.setdefault(id(result), len(self))
+        super().append(result)
+        self._count(result, 1)
+
+    def extend(self, iterable: Iterable[ValidationResult]) -> None:
+        """Extend with results, merging counters in bulk for ResultLists."""
+        if isinstance(iterable, ResultList):
+            if self._positions is not None:
+                for i, result in enumerate(iterable, start=len(self)):
+                    self._positions.setdefault(id(result), i)
+            super().extend(iterable)
+            for level, count in iterable.counts.items():
+                self.counts[level] = self.counts.get(level, 0) + count
+            return
+        for result in iterable:
+            self.append(result)
+
+    def __iadd__(self, iterable: Iterable[ValidationResult]) -> ResultList:  # type: ignore[override,misc]
+        self.extend(iterable)
+        return self
+
+    def insert(self, index: SupportsIndex, result: ValidationResult) -> None:
+        """Insert a result and count it."""
+        super().insert(index, result)
+        self._count(result, 1)
+        self._positions = None
+
+    def pop(self, index: SupportsIndex = -1) -> ValidationResult:
+        """Remove and return a result, uncounting it."""
+        result = super().pop(index)
+        self._count(result, -1)
+        self._positions = None
+        return result
+
+    def remove(self, result: ValidationResult) -> None:
+        """Remove a result, uncounting it."""
+        super().remove(result)
+        self._count(result, -1)
+        self._positions = None
+
+    def clear(self) -> None:
+        """Remove all results and reset counters."""
+        super().clear()
+        self.counts = dict.fromkeys(RESULT_LEVELS, 0)
+        self._positions = {}
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self.recount()
+            self._positions = None
+            return
+        old = self[index]
+        super().__setitem__(index, value)
+        self._count(old, -1)
+        self._count(value, 1)
+        if self._positions is not None:
+            position = operator.index(index) % len(self)
+            if self._positions.get(id(old)) == position:
+                del self._positions[id(old)]
+            self._positions.setdefault(id(value), position)
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self.recount()
+        self._positions = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Copy/pickle as ResultList(items) so counters are rebuilt, not doubled.
+
+        The default list protocol re-appends the items to a copy whose slots
+        are not restored yet, which double-counts on deepcopy and fails on
+        unpickling.
+        """
+        return (self.__class__, (list(self),))
+
+    def recount(self) -> None:
+        """Rebuild counters from scratch (after slice assignment/deletion)."""
+        self.counts = dict.fromkeys(RESULT_LEVELS, 0)
+        for result in self:
+            self._count(result, 1)
+
+    def relevel(self, result: ValidationResult, level: Level, message: str | None = None) -> ValidationResult:
+        """Replace a result with a copy at a new level (and message); returns the copy."""
+        updated = replace(result, level=level, message=result.message if message is None else message)
+        i = self._index_of(result)
+        if i is not None:
+            self[i] = updated
+        return updated
+
+    def _index_of(self, result: ValidationResult) -> int | None:
+        """Position of the first occurrence of result (by identity), or None."""
+        if self._positions is None:
+            self._positions = {}
+            for i, item in enumerate(self):
+                self._positions.setdefault(id(item), i)
+        i = self._positions.get(id(result))
+        if i is not None and i < len(self) and self[i] is result:
+            return i
+        # Another copy of the same object may have been replaced; fall back to a scan
+        for i, item in enumerate(self):
+            if item is result:
+                self._positions[id(result)] = i
+                return i
+        return None
+
+
 @dataclass
 class FixableIssue:
     """Represents an issue that can be automatically fixed.
@@ -737,11 +1240,26 @@ class ValidationReport:
     - Partial validation (return valid items even when some fail)
     """
 
-    results: list[ValidationResult] = field(default_factory=list)
+    results: list[ValidationResult] = field(default_factory=ResultList)
     fixable_issues: list[FixableIssue] = field(default_factory=list)
     valid_items: list[Any] = field(default_factory=list)
     failed_items: list[Any] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Ensure results is a counting ResultList."""
+        if not isinstance(self.results, ResultList):
+            self.results = ResultList(self.results)
+
+    @property
+    def _counts(self) -> dict[str, int]:
+        """Per-level counters (recomputed only for non-ResultList results)."""
+        if isinstance(self.results, ResultList):
+            return self.results.counts
+        counts: dict[str, int] = dict.fromkeys(RESULT_LEVELS, 0)
+        for r in self.results:
+            counts[r.level] = counts.get(r.level, 0) + 1
+        return counts
+
     def add(
         self,
         level: Level,
@@ -778,17 +1296,17 @@ class ValidationReport:
     @property
     def has_critical(self) -> bool:
         """Check if any CRITICAL issues exist."""
-        return any(r.level == "CRITICAL" for r in self.results)
+        return self._counts.get("CRITICAL", 0) > 0
 
     @property
     def has_major(self) -> bool:
         """Check if any MAJOR issues exist."""
-        return any(r.level == "MAJOR" for r in self.results)
+        return self._counts.get("MAJOR", 0) > 0
 
     @property
     def has_minor(self) -> bool:
         """Check if any MINOR issues exist."""
-        return any(r.level == "MINOR" for r in self.results)
+        return self._counts.get("MINOR", 0) > 0
 
     @property
     def exit_code(self) -> int:
@@ -812,41 +1330,71 @@ class ValidationReport:
         - Deduct 3 for each MINOR
         - INFO and PASSED don't affect score
         """
-        score = 100
-        for r in self.results:
-            if r.level == "CRITICAL":
-                score -= 25
-            elif r.level == "MAJOR":
-                score -= 10
-            elif r.level == "MINOR":
-                score -= 3
+        counts = self._counts
+        score = 100 - 25 * counts.get("CRITICAL", 0) - 10 * counts.get("MAJOR", 0) - 3 * counts.get("MINOR", 0)
         return max(0, score)
 
     def count_by_level(self) -> dict[str, int]:
         """Get count of results by level."""
-        counts: dict[str, int] = {"CRITICAL": 0, "MAJOR": 0, "MINOR": 0, "INFO": 0, "PASSED": 0}
-        for r in self.results:
-            counts[r.level] = counts.get(r.level, 0) + 1
-        return counts
+        return dict(self._counts)
 
     def merge(self, other: "ValidationReport") -> None:
         """Merge results from another report into this one."""
         self.results.extend(other.results)
 
-    def to_dict(self) -> dict[str, object]:
-        """Convert to dictionary for JSON serialization."""
+    def to_dict(self, include_results: bool = True) -> dict[str, object]:
+        """Convert to dictionary for JSON serialization.
+
+        Args:
+            include_results: Serialize the results; write_json passes False and
+                streams them itself (the "results" key is then an empty list)
+        """
         counts = self.count_by_level()
         return {
             "score": self.score,
             "grade": calculate_letter_grade(self.score),
             "exit_code": self.exit_code,
             "counts": counts,
-            "results": [r.to_dict() for r in self.results],
+            "results": [r.to_dict() for r in self.results] if include_results else [],
             "fixable_count": len(self.fixable_issues),
             "valid_items_count": len(self.valid_items),
             "failed_items_count": len(self.failed_items),
         }
 
+    def write_json(self, stream: IO[str], indent: int = 2, extra: dict[str, object] | None = None) -> None:
+        """Stream the report as JSON without building the full results list.
+
+        Produces the same text as ``json.dumps({**self.to_dict(), **extra},
+        indent=indent)`` but serializes one result at a time, so memory use
+        stays flat for reports with tens of thousands of findings.
+
+        Args:
+            stream: Text stream to write to (e.g. sys.stdout)
+            indent: JSON indentation level (default 2)
+            extra: Additional top-level keys appended after the report fields
+        """
+        summary = self.to_dict(include_results=False)
+        if extra:
+            summary.update(extra)
+
+        pad = " " * indent
+        inner = "\n" + pad * 2
+        stream.write("{")
+        for i, (key, value) in enumerate(summary.items()):
+            stream.write(("," if i else "") + "\n" + pad + json.dumps(key) + ": ")
+            if key != "results":
+                stream.write(json.dumps(value, indent=indent).replace("\n", "\n" + pad))
+                continue
+            if not self.results:
+                stream.write("[]")
+                continue
+            stream.write("[")
+            for j, result in enumerate(self.results):
+                text = json.dumps(result.to_dict(), indent=indent).replace("\n", inner)
+                stream.write(("," if j else "") + inner + text)
+            stream.write("\n" + pad + "]")
+        stream.write("\n}" if summary else "}")
+
     def to_json(self, indent: int = 2) -> str:
         """Convert report to JSON string.
 
@@ -1005,8 +1553,11 @@ class ValidationReport:
                 if success:
                     stats["applied"] += 1
                     # Update the result to PASSED if fix succeeded
-                    fixable.result.level = "PASSED"
-                    fixable.result.message = f"[FIXED] {fixable.result.message}"
+                    if not isinstance(self.results, ResultList):
+                        self.results = ResultList(self.results)
+                    fixable.result = self.results.relevel(
+                        fixable.result, "PASSED", f"[FIXED] {fixable.result.message}"
+                    )
                 else:
                     stats["failed"] += 1
             except Exception:
@@ -1498,14 +2049,15 @@ def scan_directory_for_private_info(
     # Combine skip dirs (includes gitignored dirs if respect_gitignore=True)
     if respect_gitignore:
         dirs_to_skip = get_skip_dirs_with_gitignore(root_path, skip_dirs)
-        gitignore_patterns = parse_gitignore(root_path / ".gitignore") if (root_path / ".gitignore").exists() else []
+        walker = GitignoreMatcher(root_path).walk()
     else:
         dirs_to_skip = set(PRIVATE_INFO_SKIP_DIRS)
         if skip_dirs:
             dirs_to_skip.update(skip_dirs)
-        gitignore_patterns = []
+        walker = os.walk(root_path)
 
-    for dirpath, dirnames, filenames in os.walk(root_path):
+    # Gitignored files are dropped and ignored directories pruned by the walker
+    for dirpath, dirnames, filenames in walker:
         # Skip excluded directories
         dirnames[:] = [d for d in dirnames if d not in dirs_to_skip]
 
@@ -1515,10 +2067,6 @@ def scan_directory_for_private_info(
             filepath = Path(dirpath) / filename
             rel_path = str(rel_dir / filename) if str(rel_dir) != "." else filename
 
-            # Skip gitignored files
-            if respect_gitignore and gitignore_patterns and is_path_gitignored(rel_path, gitignore_patterns):
-                continue
-
             # Check only relevant file types
             if filepath.suffix.lower() not in SCANNABLE_EXTENSIONS:
                 continue
@@ -1657,14 +2205,15 @@ def validate_no_absolute_paths(
     # Combine skip dirs (includes gitignored dirs if respect_gitignore=True)
     if respect_gitignore:
         dirs_to_skip = get_skip_dirs_with_gitignore(root_path, skip_dirs)
-        gitignore_patterns = parse_gitignore(root_path / ".gitignore") if (root_path / ".gitignore").exists() else []
+        walker = GitignoreMatcher(root_path).walk()
     else:
         dirs_to_skip = set(PRIVATE_INFO_SKIP_DIRS)
         if skip_dirs:
             dirs_to_skip.update(skip_dirs)
-        gitignore_patterns = []
+        walker = os.walk(root_path)
 
-    for dirpath, dirnames, filenames in os.walk(root_path):
+    # Gitignored files are dropped and ignored directories pruned by the walker
+    for dirpath, dirnames, filenames in walker:
         # Skip excluded directories (including gitignored)
         dirnames[:] = [d for d in dirnames if d not in dirs_to_skip]
 
@@ -1674,10 +2223,6 @@ def validate_no_absolute_paths(
             filepath = Path(dirpath) / filename
             rel_path = str(rel_dir / filename) if str(rel_dir) != "." else filename
 
-            # Skip gitignored files
-            if respect_gitignore and gitignore_patterns and is_path_gitignored(rel_path, gitignore_patterns):
-                continue
-
             # Check only relevant file types
             if filepath.suffix.lower() not in SCANNABLE_EXTENSIONS:
                 continue
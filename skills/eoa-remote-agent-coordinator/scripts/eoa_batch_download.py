@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+EOA Batch Document Downloader
+
+Parallel, resumable download engine shared by the EOA download scripts.
+
+- A worker pool fetches documents over keep-alive HTTP connections (one pool
+  of connections per thread) instead of one curl process per document.
+- Each URL's ETag / Last-Modified is remembered, so fetching an already
+  stored document again is a conditional request answered with 304.
+- Content is stored once in a blob store keyed by SHA-256 and hardlinked
+  into the category folders, so an attachment referenced from several tasks
+  occupies disk once.
+- Interrupted batches resume: finished jobs are journaled per batch and
+  partial downloads continue with HTTP Range requests.
+
+Usage (as a library):
+    downloader = BatchDownloader(storage_root / ".blobs")
+    results = downloader.run([{"url": URL, "dest": PATH}, ...])
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import http.client
+import json
+import os
+import shutil
+import ssl
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass_environment
+
+BLOB_DIR_NAME = ".blobs"
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+CHUNK_SIZE = 1 << 20
+MAX_REDIRECTS = 5
+REQUEST_TIMEOUT = 60
+USER_AGENT = "eoa-batch-download/1.0"
+
+
+class DownloadError(Exception):
+    """A document could not be fetched."""
+
+
+class HTTPSession:
+    """Minimal pooled HTTP client on http.client.
+
+    Connections are kept alive per thread and per (scheme, host, port), so a
+    worker fetching many attachments from the same host reuses one TLS
+    connection. Redirects (GitHub attachments redirect to object storage)
+    are followed.
+
+    HTTP_PROXY, HTTPS_PROXY and NO_PROXY are honored as curl does: https URLs
+    go through a CONNECT tunnel, http URLs are requested from the proxy with
+    their absolute URL. Only http:// proxies (optionally with user:password)
+    are supported.
+    """
+
+    def __init__(self, timeout: float = REQUEST_TIMEOUT) -> None:
+        self.timeout = timeout
+        self._local = threading.local()
+        self._ssl_context = ssl.create_default_context()
+        self._proxies = getproxies()
+
+    def _proxy(self, scheme: str, netloc: str) -> tuple[str, dict[str, str]] | None:
+        """(proxy host:port, proxy auth headers) for a URL, or None to connect directly."""
+        proxy = self._proxies.get(scheme)
+        host = urlsplit(f"//{netloc}").hostname or netloc
+        if not proxy or proxy_bypass_environment(host, self._proxies):
+            return None
+        parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        if parts.scheme != "http" or not parts.hostname:
+            raise DownloadError(f"Unsupported proxy: {proxy}")
+        headers = {}
+        if parts.username is not None:
+            credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        return f"{parts.hostname}:{parts.port or 80}", headers
+
+    def _connection(
+        self, scheme: str, netloc: str, fresh: bool = False
+    ) -> tuple[http.client.HTTPConnection, dict[str, str] | None]:
+        """Pooled connection for (scheme, netloc).
+
+        The second value is None for a direct or tunneled connection, or the
+        proxy headers to send when requests go to a plain HTTP proxy (which
+        also needs the absolute URL as request target).
+        """
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+        key = (scheme, netloc)
+        entry = pool.get(key)
+        if entry is None or fresh:
+            if entry is not None:
+                entry[0].close()
+            if scheme not in ("http", "https"):
+                raise DownloadError(f"Unsupported URL scheme: {scheme}")
+            proxy = self._proxy(scheme, netloc)
+            forward: dict[str, str] | None = None
+            if scheme == "https":
+                conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                    proxy[0] if proxy else netloc, timeout=self.timeout, context=self._ssl_context
+                )
+                if proxy:
+                    conn.set_tunnel(netloc, headers=proxy[1])
+            elif proxy:
+                conn = http.client.HTTPConnection(proxy[0], timeout=self.timeout)
+                forward = proxy[1]
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            entry = pool[key] = (conn, forward)
+        return entry
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> tuple[http.client.HTTPResponse, str]:
+        """Send a GET, following redirects. Returns (response, final URL).
+
+        The caller must read the response to the end (or close it) before the
+        thread issues another request.
+        """
+        request_headers = {"User-Agent": USER_AGENT, **(headers or {})}
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            target = parts.path or "/"
+            if parts.query:
+                target += "?" + parts.query
+            response = self._send(parts.scheme, parts.netloc, target, request_headers)
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                response.read()
+                url = urljoin(url, response.getheader("Location"))
+                continue
+            return response, url
+        raise DownloadError(f"Too many redirects: {url}")
+
+    def _send(self, scheme: str, netloc: str, target: str, headers: dict[str, str]) -> http.client.HTTPResponse:
+        for attempt in range(2):
+            conn, forward = self._connection(scheme, netloc, fresh=attempt > 0)
+            try:
+                if forward is None:
+                    conn.request("GET", target, headers=headers)
+                else:
+                    conn.request("GET", f"{scheme}://{netloc}{target}", headers={**headers, **forward})
+                return conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                # Typically an idle keep-alive connection closed by the server,
+                # or one left unusable by an interrupted response; retry once
+                conn.close()
+                if attempt:
+                    raise DownloadError(f"Request failed: {e}") from e
+        raise DownloadError("Request failed")
+
+    def close(self) -> None:
+        for conn, _ in getattr(self._local, "pool", {}).values():
+            conn.close()
+
+
+class BlobStore:
+    """Content-addressed storage: blobs/<sha256[:2]>/<sha256>.
+
+    Also keeps the HTTP validators (ETag, Last-Modified) and content digest
+    last seen for each URL, partial downloads, and per-batch journals.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.tmp_dir = root / "tmp"
+        self.batch_dir = root / "batches"
+        self.cache_path = root / "http-cache.json"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        try:
+            self.http_cache: dict[str, dict[str, str]] = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.http_cache = {}
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def has(self, digest: str) -> bool:
+        return self.path(digest).is_file()
+
+    def part_path(self, url: str) -> Path:
+        return self.tmp_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.part"
+
+    @staticmethod
+    def part_validator(part: Path) -> str | None:
+        """ETag or Last-Modified of the response a partial download came from."""
+        try:
+            return part.with_suffix(".validator").read_text(encoding="utf-8") or None
+        except OSError:
+            return None
+
+    def ingest(self, tmp_path: Path, digest: str) -> bool:
+        """Move a finished download into the store. Returns False if the blob already existed."""
+        blob = self.path(digest)
+        with self._lock:
+            if blob.is_file():
+                tmp_path.unlink(missing_ok=True)
+                return False
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, blob)
+            return True
+
+    def link(self, digest: str, dest: Path) -> None:
+        """Hardlink a blob to dest (copying if the filesystem cannot link)."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # Link under a temporary name and rename, so a dest left by an interrupted run is replaced
+        tmp_dest = dest.with_name(f".{dest.name}.{threading.get_ident()}.tmp")
+        tmp_dest.unlink(missing_ok=True)
+        try:
+            os.link(self.path(digest), tmp_dest)
+        except OSError:
+            shutil.copyfile(self.path(digest), tmp_dest)
+        os.replace(tmp_dest, dest)
+
+    def validators(self, url: str) -> dict[str, str] | None:
+        with self._lock:
+            entry = self.http_cache.get(url)
+        if entry and self.has(entry.get("sha256", "")):
+            return entry
+        return None
+
+    def remember(self, url: str, digest: str, etag: str | None, last_modified: str | None) -> None:
+        entry = {"sha256": digest}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+        with self._lock:
+            self.http_cache[url] = entry
+
+    def save(self) -> None:
+        """Persist the URL validators atomically.
+
+        The cache only saves revalidation requests, so a failed write is
+        ignored rather than aborting the download that called it.
+        """
+        with self._lock:
+            data = json.dumps(self.http_cache, indent=2)
+        # Per-process, per-thread temp name so concurrent savers never share a file
+        temp_file = self.cache_path.with_name(
+            f"{self.cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            temp_file.write_text(data, encoding="utf-8")
+            temp_file.replace(self.cache_path)
+        except OSError:
+            temp_file.unlink(missing_ok=True)
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file, read in CHUNK_SIZE blocks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def batch_id_for(jobs: list[dict[str, Any]]) -> str:
+    """Stable ID for a batch, derived from its jobs (used to find its resume journal)."""
+    encoded = json.dumps([[job["url"], str(job["dest"])] for job in jobs]).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class BatchDownloader:
+    """Download many documents concurrently into a blob store.
+
+    A job is a dict with "url" (direct or GitHub issue comment URL), "dest"
+    (the path to link the document to) and optionally "key", which identifies
+    the job across runs of the same batch (default: dest). run() returns one result dict
+    per job, in job order, with success, status ("downloaded", "resumed",
+    "revalidated", "deduplicated" or "skipped" when resumed from an earlier
+    run), sha256, size_bytes, download_url and error.
+    """
+
+    def __init__(
+        self,
+        blob_root: Path,
+        workers: int = DEFAULT_WORKERS,
+        resolver: Callable[[str], str | None] | None = None,
+        session: HTTPSession | None = None,
+    ) -> None:
+        self.store = BlobStore(blob_root)
+        self.workers = max(1, workers)
+        self.resolver = resolver
+        self.session = session or HTTPSession()
+        self._fetches: dict[str, Future[dict[str, Any]]] = {}
+        self._resolved: dict[str, Future[str | None]] = {}
+        self._lock = threading.Lock()
+        self._journal_lock = threading.Lock()
+
+    def run(self, jobs: Iterable[dict[str, Any]], batch_id: str | None = None) -> list[dict[str, Any]]:
+        """Download a batch, resuming an earlier interrupted run of the same batch."""
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        batch_id = batch_id or batch_id_for(jobs)
+        journal_path = self.store.batch_dir / f"{batch_id}.jsonl"
+        done = self._load_journal(journal_path)
+
+        results: list[dict[str, Any] | None] = [None] * len(jobs)
+        pending = []
+        for i, job in enumerate(jobs):
+            previous = done.get(str(job.get("key", job["dest"])))
+            if previous and Path(previous["dest"]).exists():
+                results[i] = {**previous, "status": "skipped"}
+            else:
+                pending.append(i)
+
+        self._fetches = {}
+        self._resolved = {}
+        with open(journal_path, "a", encoding="utf-8") as journal, ThreadPoolExecutor(
+            max_workers=self.workers
+        ) as pool:
+            futures = {i: pool.submit(self._run_job, jobs[i], journal) for i in pending}
+            for i, future in futures.items():
+                results[i] = future.result()
+
+        self.store.save()
+        final = [r for r in results if r is not None]
+        if all(r["success"] for r in final):
+            journal_path.unlink(missing_ok=True)
+        return final
+
+    @staticmethod
+    def _load_journal(path: Path) -> dict[str, dict[str, Any]]:
+        done: dict[str, dict[str, Any]] = {}
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return done
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                done[entry["key"]] = entry["result"]
+            except (ValueError, KeyError, TypeError):
+                continue
+        return done
+
+    def _resolve(self, url: str) -> str | None:
+        if "#issuecomment-" not in url or self.resolver is None:
+            return url
+        with self._lock:
+            future = self._resolved.get(url)
+            owner = future is None
+            if owner:
+                future = self._resolved[url] = Future()
+        if owner:
+            try:
+                future.set_result(self.resolver(url))
+            except Exception as e:  # resolver failures are per-job errors
+                future.set_exception(e)
+        return future.result()
+
+    def _run_job(self, job: dict[str, Any], journal: Any) -> dict[str, Any]:
+        url = job["url"]
+        result: dict[str, Any] = {
+            "success": False,
+            "url": url,
+            "dest": str(job["dest"]),
+            "download_url": None,
+            "status": None,
+            "sha256": None,
+            "size_bytes": 0,
+            "error": None,
+        }
+        try:
+            download_url = self._resolve(url)
+            if not download_url:
+                raise DownloadError("Could not extract attachment URL from comment")
+            result["download_url"] = download_url
+
+            # Jobs sharing a URL in one batch wait for a single fetch
+            with self._lock:
+                future = self._fetches.get(download_url)
+                owner = future is None
+                if owner:
+                    future = self._fetches[download_url] = Future()
+            if owner:
+                try:
+                    future.set_result(self._fetch(download_url))
+                except Exception as e:
+                    future.set_exception(e)
+            fetched = future.result()
+            status = fetched["status"] if owner else "deduplicated"
+
+            self.store.link(fetched["sha256"], Path(job["dest"]))
+            result.update(success=True, status=status, sha256=fetched["sha256"], size_bytes=fetched["size"])
+        except (DownloadError, OSError, http.client.HTTPException) as e:
+            result["error"] = str(e) or type(e).__name__
+            return result
+        except Exception as e:
+            # Anything else (a resolver timeout, a malformed header) fails this job only
+            result["error"] = f"{type(e).__name__}: {e}"
+            return result
+
+        # Journal as soon as the job is done so an interrupted batch keeps it
+        with self._journal_lock:
+            journal.write(json.dumps({"key": str(job.get("key", job["dest"])), "result": result}) + "\n")
+            journal.flush()
+        return result
+
+    def _fetch(self, url: str) -> dict[str, Any]:
+        """Fetch one URL into the blob store."""
+        headers: dict[str, str] = {}
+        cached = self.store.validators(url)
+        if cached:
+            if "etag" in cached:
+                headers["If-None-Match"] = cached["etag"]
+            if "last_modified" in cached:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        part = self.store.part_path(url)
+        offset = part.stat().st_size if part.exists() else 0
+        validator = self.store.part_validator(part) if offset else None
+        if offset and validator and not cached:
+            # If-Range makes the server send the whole document if it changed meanwhile
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+
+        response, _ = self.session.get(url, headers)
+        etag = response.getheader("ETag")
+        last_modified = response.getheader("Last-Modified")
+
+        if response.status == 304 and cached:
+            response.read()
+            size = self.store.path(cached["sha256"]).stat().st_size
+            return {"sha256": cached["sha256"], "size": size, "status": "revalidated"}
+
+        if response.status == 206 and offset:
+            mode, status = "ab", "resumed"
+        elif response.status == 200:
+            mode, status = "wb", "downloaded"
+        else:
+            response.read()
+            raise DownloadError(f"Download failed: HTTP {response.status} {response.reason}")
+
+        # Record what the partial file comes from so a later run can resume it
+        part.with_suffix(".validator").write_text(etag or last_modified or "", encoding="utf-8")
+        expected = response.getheader("Content-Length")
+        received = 0
+        with open(part, mode) as f:
+            while True:
+                block = response.read(CHUNK_SIZE)
+                if not block:
+                    break
+                f.write(block)
+                received += len(block)
+        if expected is not None and received != int(expected):
+            # Keep the partial file; the next run continues it with a Range request
+            raise DownloadError(f"Incomplete download: received {received} of {expected} bytes")
+
+        size = part.stat().st_size
+        if size == 0:
+            part.unlink(missing_ok=True)
+            raise DownloadError("Downloaded file is empty or missing")
+        digest = hash_file(part)
+        if not self.store.ingest(part, digest):
+            status = "deduplicated"
+        part.with_suffix(".validator").unlink(missing_ok=True)
+        self.store.remember(url, digest, etag, last_modified)
+        return {"sha256": digest, "size": size, "status": status}
@@ -7,23 +7,49 @@ orchestrator's agent-specific folder structure. Updates cross-agent indexes.
 
 Usage:
     python eoa_orchestrator_download.py download --url URL --agent AGENT --task-id TASK_ID --category CATEGORY
+    python eoa_orchestrator_download.py download-batch --file JOBS.json [--workers N]
     python eoa_orchestrator_download.py index-rebuild [--design-root PATH]
+    python eoa_orchestrator_download.py index-compact [--design-root PATH]
+
+Index updates are appended to a journal (index/journal/documents.jsonl) and
+loaded by compaction into the SQLite index store (index/index.sqlite3), which
+also writes the by-task/by-agent/by-category/by-date JSON files as views.
+Every download batch and update_index() call compacts right away, so the views
+are current when they return; if another process holds the index lock, a
+detached index-compact run finishes the job instead.
+
+Migration: a design root indexed before the store existed has only the JSON
+files. The first time any entry point (compaction, index-rebuild, a search)
+opens a store that has never been loaded, it bulk-loads every document under
+agents/ before applying the journal, so the views it writes keep the older
+entries. Documents without a metadata file cannot be reindexed and drop out of
+the views, as with index-rebuild --full.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
 import json
 import os
 import re
+import sqlite3
 import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+from eoa_batch_download import BLOB_DIR_NAME, DEFAULT_WORKERS, BatchDownloader
+
+# fcntl is POSIX-only; without it the index assumes a single writer
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
 # Categories for documents FROM agents (orchestrator receiving)
 RECEIVED_CATEGORIES = {
@@ -42,6 +68,12 @@ RECEIVED_CATEGORIES = {
 }
 
 
+INDEX_TYPES = ["by-task", "by-agent", "by-category", "by-date"]
+
+# SQLite store the by-* JSON indexes are generated from
+INDEX_DB_NAME = "index.sqlite3"
+
+
 def get_design_root() -> Path:
     """Get Design storage root from environment or current directory."""
     if "ATLAS_STORAGE_ROOT" in os.environ:
@@ -136,160 +168,590 @@ def ensure_agent_registered(agent_name: str, design_root: Path) -> Path:
     return agent_dir
 
 
-def update_agent_stats(agent_dir: Path) -> None:
-    """Update agent metadata after receiving a document."""
+def update_agent_stats(agent_dir: Path, count: int = 1) -> None:
+    """Update agent metadata after receiving documents."""
     agent_json = agent_dir / "agent.json"
     if agent_json.exists():
         try:
             metadata = json.loads(agent_json.read_text())
             metadata["last_activity"] = datetime.now(timezone.utc).isoformat()
-            metadata["total_documents_received"] = metadata.get("total_documents_received", 0) + 1
+            metadata["total_documents_received"] = metadata.get("total_documents_received", 0) + count
             agent_json.write_text(json.dumps(metadata, indent=2))
         except json.JSONDecodeError:
             pass
 
 
-def update_index(
-    design_root: Path,
-    task_id: str,
-    agent_name: str,
-    category: str,
-    doc_path: str,
-    timestamp: str,
-) -> None:
-    """Update cross-agent search indexes."""
-    index_dir = design_root / "index"
+def index_record(task_id: str, agent_name: str, category: str, doc_path: str, timestamp: str) -> dict[str, str]:
+    """Build the record that IndexWriter journals for one received document."""
+    return {
+        "task_id": task_id,
+        "agent": agent_name,
+        "category": category,
+        "path": doc_path,
+        "timestamp": timestamp,
+    }
 
-    # Update by-task index
-    task_index_path = index_dir / "by-task" / f"{task_id}.json"
-    task_index_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if task_index_path.exists():
+class IndexStore:
+    """SQLite store that is the single source of the cross-agent indexes.
+
+    One documents table holds the index records, with an FTS5 trigram table
+    over document content for substring search. The by-task, by-agent,
+    by-category and by-date JSON files are materialized views written from it
+    (write_views) for tools that read them directly. The manifest table keeps
+    the size, mtime and SHA256 each document (and its metadata file) had when
+    it was indexed, so rebuild_indexes only reprocesses what changed.
+
+    The SQLite user_version records whether the store has been bulk-loaded
+    from agents/ (see IndexWriter.bootstrap_locked); a new or never-loaded
+    store must not be used to rewrite the views on its own.
+    """
+
+    # user_version once every document under agents/ has been loaded
+    LOADED_VERSION = 1
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            agent TEXT NOT NULL,
+            category TEXT NOT NULL,
+            path TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            date TEXT NOT NULL,
+            blocker INTEGER NOT NULL DEFAULT 0,
+            UNIQUE (path, timestamp)
+        );
+        CREATE INDEX IF NOT EXISTS documents_task ON documents (task_id);
+        CREATE INDEX IF NOT EXISTS documents_agent ON documents (agent);
+        CREATE INDEX IF NOT EXISTS documents_category ON documents (category);
+        CREATE INDEX IF NOT EXISTS documents_date ON documents (date);
+        CREATE INDEX IF NOT EXISTS documents_blocker ON documents (blocker) WHERE blocker = 1;
+        CREATE TABLE IF NOT EXISTS manifest (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            metadata_size INTEGER NOT NULL,
+            metadata_mtime_ns INTEGER NOT NULL,
+            sha256 TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, design_root: Path) -> None:
+        self.design_root = design_root
+        self.index_dir = design_root / "index"
+        self.path = self.index_dir / INDEX_DB_NAME
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
         try:
-            task_index = json.loads(task_index_path.read_text())
-        except json.JSONDecodeError:
-            task_index = {"task_id": task_id, "documents": [], "assigned_agents": []}
-    else:
-        task_index = {
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(content, tokenize='trigram')"
+            )
+            self.fts = True
+        except sqlite3.OperationalError:
+            # SQLite without FTS5/trigram: content is kept in a plain table instead
+            self.conn.execute("CREATE TABLE IF NOT EXISTS documents_fts (rowid INTEGER PRIMARY KEY, content TEXT)")
+            self.fts = False
+        self.conn.commit()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the store has been bulk-loaded from agents/ at least once."""
+        return self.conn.execute("PRAGMA user_version").fetchone()[0] >= self.LOADED_VERSION
+
+    def mark_loaded(self) -> None:
+        self.conn.execute(f"PRAGMA user_version = {self.LOADED_VERSION}")
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> IndexStore:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def clear(self) -> None:
+        """Remove every document and manifest entry (used before a full rebuild)."""
+        with self.conn:
+            self.conn.execute("DELETE FROM documents")
+            self.conn.execute("DELETE FROM documents_fts")
+            self.conn.execute("DELETE FROM manifest")
+
+    def _content(self, doc_path: str) -> str:
+        try:
+            return (self.design_root / doc_path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return ""
+
+    def add(self, records: Iterable[dict[str, str]], contents: dict[str, str] | None = None) -> int:
+        """Insert index records (duplicates by path and timestamp are ignored). Returns rows added.
+
+        contents maps document paths to text already read by the caller;
+        other documents are read from disk for the full-text index.
+        """
+        added = 0
+        contents = contents or {}
+        with self.conn:
+            for record in records:
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO documents (task_id, agent, category, path, timestamp, date, blocker)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        record["task_id"],
+                        record["agent"],
+                        record["category"],
+                        record["path"],
+                        record["timestamp"],
+                        record["timestamp"][:10],
+                        int(record["category"] == "reports" and "blocker" in record["path"].lower()),
+                    ),
+                )
+                if cursor.rowcount:
+                    self.conn.execute(
+                        "INSERT INTO documents_fts (rowid, content) VALUES (?, ?)",
+                        (cursor.lastrowid, contents.get(record["path"]) or self._content(record["path"])),
+                    )
+                    added += 1
+        return added
+
+    def indexed(self) -> dict[str, set[tuple[str, str, str, str]]]:
+        """Path -> (task_id, agent, category, timestamp) of every indexed document."""
+        indexed: dict[str, set[tuple[str, str, str, str]]] = {}
+        for path, *record in self.conn.execute("SELECT path, task_id, agent, category, timestamp FROM documents"):
+            indexed.setdefault(path, set()).add(tuple(record))
+        return indexed
+
+    def remove_paths(self, paths: Iterable[str]) -> dict[str, set[str]]:
+        """Delete the documents at paths. Returns the view keys they belonged to."""
+        keys: dict[str, set[str]] = {index_type: set() for index_type in INDEX_TYPES}
+        paths = list(paths)
+        with self.conn:
+            for start in range(0, len(paths), 500):
+                chunk = paths[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT id, task_id, agent, category, date FROM documents WHERE path IN ({placeholders})", chunk
+                ).fetchall()
+                for _, task_id, agent, category, date in rows:
+                    keys["by-task"].add(task_id)
+                    keys["by-agent"].add(agent)
+                    keys["by-category"].add(category)
+                    keys["by-date"].add(date)
+                ids = [(row[0],) for row in rows]
+                self.conn.executemany("DELETE FROM documents_fts WHERE rowid = ?", ids)
+                self.conn.executemany("DELETE FROM documents WHERE id = ?", ids)
+        return keys
+
+    def manifest(self) -> dict[str, tuple[int, int, int, int, str]]:
+        """Path -> (size, mtime_ns, metadata_size, metadata_mtime_ns, sha256) recorded at indexing."""
+        return {
+            row[0]: tuple(row[1:])
+            for row in self.conn.execute(
+                "SELECT path, size, mtime_ns, metadata_size, metadata_mtime_ns, sha256 FROM manifest"
+            )
+        }
+
+    def update_manifest(self, entries: dict[str, tuple[int, int, int, int, str]], removed: Iterable[str] = ()) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO manifest (path, size, mtime_ns, metadata_size, metadata_mtime_ns, sha256)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(path, *entry) for path, entry in entries.items()],
+            )
+            self.conn.executemany("DELETE FROM manifest WHERE path = ?", [(path,) for path in removed])
+
+    def _rows(self, where: str = "", params: tuple[Any, ...] = ()) -> list[sqlite3.Row]:
+        """Matching documents in timestamp order.
+
+        Ordered by content rather than row id: reindexing a changed document
+        gives it a new id, and full and incremental rebuilds must produce the
+        same views. (path, timestamp) is unique, so path settles ties.
+        """
+        self.conn.row_factory = sqlite3.Row
+        try:
+            return self.conn.execute(
+                f"SELECT task_id, agent, category, path, timestamp FROM documents {where} ORDER BY timestamp, path",
+                params,
+            ).fetchall()
+        finally:
+            self.conn.row_factory = None
+
+    @staticmethod
+    def _task_view(task_id: str, rows: list[Any]) -> dict[str, Any]:
+        agents: dict[str, str] = {}
+        for row in rows:
+            agents.setdefault(row["agent"], row["timestamp"])
+        return {
             "task_id": task_id,
-            "created": timestamp,
+            "created": rows[0]["timestamp"],
             "status": "in-progress",
-            "assigned_agents": [],
-            "documents": [],
+            "assigned_agents": [{"agent": agent, "assigned_at": ts} for agent, ts in agents.items()],
+            "documents": [
+                {"type": r["category"], "path": r["path"], "agent": r["agent"], "timestamp": r["timestamp"]}
+                for r in rows
+            ],
         }
 
-    # Add agent if not present
-    agent_entry = next(
-        (a for a in task_index["assigned_agents"] if a.get("agent") == agent_name),
-        None
-    )
-    if not agent_entry:
-        task_index["assigned_agents"].append({
-            "agent": agent_name,
-            "assigned_at": timestamp,
-        })
+    @staticmethod
+    def _agent_view(agent: str, rows: list[Any]) -> dict[str, Any]:
+        return {
+            "agent": agent,
+            "tasks": list(dict.fromkeys(r["task_id"] for r in rows)),
+            "documents": [
+                {"task_id": r["task_id"], "category": r["category"], "path": r["path"], "timestamp": r["timestamp"]}
+                for r in rows
+            ],
+        }
 
-    # Add document
-    task_index["documents"].append({
-        "type": category,
-        "path": doc_path,
-        "agent": agent_name,
-        "timestamp": timestamp,
-    })
+    @staticmethod
+    def _category_view(rows: list[Any]) -> list[dict[str, str]]:
+        return [
+            {"task_id": r["task_id"], "agent": r["agent"], "path": r["path"], "timestamp": r["timestamp"]}
+            for r in rows
+        ]
 
-    task_index_path.write_text(json.dumps(task_index, indent=2))
+    @staticmethod
+    def _date_view(rows: list[Any]) -> list[dict[str, str]]:
+        return [
+            {
+                "task_id": r["task_id"],
+                "agent": r["agent"],
+                "category": r["category"],
+                "path": r["path"],
+                "timestamp": r["timestamp"],
+            }
+            for r in rows
+        ]
 
-    # Update by-agent index
-    agent_index_path = index_dir / "by-agent" / f"{agent_name}.json"
-    agent_index_path.parent.mkdir(parents=True, exist_ok=True)
+    def task(self, task_id: str) -> dict[str, Any] | None:
+        rows = self._rows("WHERE task_id = ?", (task_id,))
+        return self._task_view(task_id, rows) if rows else None
 
-    if agent_index_path.exists():
-        try:
-            agent_index = json.loads(agent_index_path.read_text())
-        except json.JSONDecodeError:
-            agent_index = {"agent": agent_name, "tasks": [], "documents": []}
-    else:
-        agent_index = {"agent": agent_name, "tasks": [], "documents": []}
+    def agent(self, agent: str) -> dict[str, Any] | None:
+        rows = self._rows("WHERE agent = ?", (agent,))
+        return self._agent_view(agent, rows) if rows else None
 
-    if task_id not in agent_index["tasks"]:
-        agent_index["tasks"].append(task_id)
+    def category(self, category: str) -> list[dict[str, str]]:
+        return self._category_view(self._rows("WHERE category = ?", (category,)))
 
-    agent_index["documents"].append({
-        "task_id": task_id,
-        "category": category,
-        "path": doc_path,
-        "timestamp": timestamp,
-    })
+    def date(self, date: str) -> list[dict[str, str]]:
+        return self._date_view(self._rows("WHERE date = ?", (date,)))
 
-    agent_index_path.write_text(json.dumps(agent_index, indent=2))
+    def blockers(self) -> list[dict[str, str]]:
+        """Blocker reports (reports whose path mentions a blocker)."""
+        return self._category_view(self._rows("WHERE blocker = 1"))
 
-    # Update by-category index
-    cat_index_path = index_dir / "by-category" / f"{category}.json"
-    cat_index_path.parent.mkdir(parents=True, exist_ok=True)
+    def fulltext_candidates(self, pattern: str) -> set[str] | None:
+        """Paths whose indexed content contains pattern (case-insensitive).
+
+        The indexed content is a snapshot taken at indexing time, so this is a
+        candidate filter only: callers confirm matches against the file on disk
+        and separately check documents changed or added since (see manifest).
+        Returns None when the trigram index cannot narrow the search (FTS5
+        unavailable or a pattern shorter than three characters).
+        """
+        if not self.fts or len(pattern) < 3:
+            return None
+        return {
+            path
+            for (path,) in self.conn.execute(
+                "SELECT d.path FROM documents_fts f JOIN documents d ON d.id = f.rowid WHERE documents_fts MATCH ?",
+                ('"' + pattern.replace('"', '""') + '"',),
+            )
+        }
+
+    def _view_path(self, index_type: str, key: str) -> Path:
+        if index_type == "by-date":
+            return self.index_dir / "by-date" / key[:7] / f"{key[8:10]}.json"
+        return self.index_dir / index_type / f"{key}.json"
+
+    def write_views(self, keys: dict[str, set[str]] | None = None) -> int:
+        """Write the by-* JSON views for the given keys per index type (all when None).
+
+        Views of keys that no longer have documents are deleted. Returns the
+        number of view files written.
+        """
+        if keys is None:
+            grouped: dict[str, dict[str, list[Any]]] = {index_type: {} for index_type in INDEX_TYPES}
+            for row in self._rows():
+                grouped["by-task"].setdefault(row["task_id"], []).append(row)
+                grouped["by-agent"].setdefault(row["agent"], []).append(row)
+                grouped["by-category"].setdefault(row["category"], []).append(row)
+                grouped["by-date"].setdefault(row["timestamp"][:10], []).append(row)
+        else:
+            columns = {"by-task": "task_id", "by-agent": "agent", "by-category": "category", "by-date": "date"}
+            grouped = {
+                index_type: {key: self._rows(f"WHERE {columns[index_type]} = ?", (key,)) for key in keys.get(index_type, ())}
+                for index_type in INDEX_TYPES
+            }
 
-    if cat_index_path.exists():
+        written = 0
+        for index_type, views in grouped.items():
+            for key, rows in views.items():
+                if not rows:
+                    self._view_path(index_type, key).unlink(missing_ok=True)
+                    continue
+                if index_type == "by-task":
+                    data: Any = self._task_view(key, rows)
+                elif index_type == "by-agent":
+                    data = self._agent_view(key, rows)
+                elif index_type == "by-category":
+                    data = self._category_view(rows)
+                else:
+                    data = self._date_view(rows)
+                path = self._view_path(index_type, key)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = path.with_suffix(".tmp")
+                temp_file.write_text(json.dumps(data, indent=2))
+                temp_file.replace(path)
+                written += 1
+        return written
+
+
+class IndexWriter:
+    """Journaled writer for the cross-agent index store.
+
+    append() adds one line per record to index/journal/documents.jsonl under a
+    shared lock, so a batch of N documents costs N appends. compact() takes the
+    exclusive lock, loads the journal into the IndexStore and rewrites the JSON
+    views touched by the batch once each. Inserts ignore records already in the
+    store and the touched views are derived from the journal itself, so a
+    compaction interrupted before the journal is removed can simply run again.
+    """
+
+    def __init__(self, design_root: Path) -> None:
+        self.design_root = design_root
+        self.index_dir = design_root / "index"
+        self.journal_dir = self.index_dir / "journal"
+        self.journal = self.journal_dir / "documents.jsonl"
+        self.lock_path = self.index_dir / ".lock"
+
+    def _lock(self, mode: int) -> Any:
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        lock = open(self.lock_path, "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock, mode)
+            except BlockingIOError:
+                lock.close()
+                return None
+        return lock
+
+    @staticmethod
+    def _unlock(lock: Any) -> None:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        lock.close()
+
+    def append(self, records: Iterable[dict[str, str]]) -> int:
+        """Journal a batch of index records. Returns the number appended."""
+        lines = [json.dumps(record) + "\n" for record in records]
+        if not lines:
+            return 0
+
+        lock = self._lock(fcntl.LOCK_SH if fcntl is not None else 0)
         try:
-            cat_index = json.loads(cat_index_path.read_text())
-        except json.JSONDecodeError:
-            cat_index = []
-    else:
-        cat_index = []
+            # One write per batch; O_APPEND keeps concurrent batches whole
+            with open(self.journal, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        finally:
+            self._unlock(lock)
+        return len(lines)
+
+    def pending_bytes(self) -> int:
+        """Size of the journal not yet compacted."""
+        try:
+            return self.journal.stat().st_size
+        except OSError:
+            return 0
+
+    def compact(self, blocking: bool = True) -> dict[str, int] | None:
+        """Load the journal into the store and refresh the affected views.
+
+        Returns counts of documents added and views written, or None if
+        blocking is False and another process holds the lock.
+        """
+        if not blocking and fcntl is None:
+            blocking = True
+        if not self.pending_bytes():
+            return {"documents": 0, "views": 0}
+        mode = fcntl.LOCK_EX if fcntl is not None else 0
+        if not blocking:
+            mode |= fcntl.LOCK_NB
+        lock = self._lock(mode)
+        if lock is None:
+            return None
+        try:
+            return self.compact_locked()
+        finally:
+            self._unlock(lock)
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the exclusive index lock (no appends or compactions meanwhile)."""
+        lock = self._lock(fcntl.LOCK_EX if fcntl is not None else 0)
+        try:
+            yield
+        finally:
+            self._unlock(lock)
+
+    def _remove_views(self) -> None:
+        for index_type in INDEX_TYPES:
+            type_dir = self.index_dir / index_type
+            if type_dir.exists():
+                for f in type_dir.rglob("*.json"):
+                    f.unlink()
+
+    def clear_views(self) -> None:
+        """Delete every by-* view and any pending journal (before a full rebuild)."""
+        self._remove_views()
+        self.journal.unlink(missing_ok=True)
+
+    def bootstrap_locked(self, workers: int = DEFAULT_WORKERS) -> dict[str, int] | None:
+        """Bulk-load agents/ into a store that has never been loaded.
+
+        Runs while the caller holds locked(). A design root migrated from the
+        JSON-only indexes would otherwise get an empty store whose first
+        write_views() replaces each view with just the newly journaled rows.
+        All views are rewritten from the loaded store (the journal is left for
+        compaction). Returns load counts, or None if the store was loaded already.
+        """
+        with IndexStore(self.design_root) as store:
+            if store.loaded:
+                return None
+            loaded = _load_all_documents(store, self.design_root, workers)
+            self._remove_views()
+            loaded["views"] = store.write_views()
+            store.mark_loaded()
+        return loaded
+
+    def bootstrap(self, workers: int = DEFAULT_WORKERS) -> dict[str, int] | None:
+        """bootstrap_locked() under the index lock, taken only if a load is needed."""
+        with IndexStore(self.design_root) as store:
+            if store.loaded:
+                return None
+        with self.locked():
+            return self.bootstrap_locked(workers)
+
+    def compact_locked(self) -> dict[str, int]:
+        """Compact the journal while the caller already holds locked().
+
+        A store that was never loaded is bootstrapped first. Journaled documents
+        also get their manifest entry, so verify_indexes and incremental
+        rebuilds treat them like rebuilt ones.
+        """
+        self.bootstrap_locked()
+        try:
+            raw_lines = self.journal.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return {"documents": 0, "views": 0}
 
-    cat_index.append({
-        "task_id": task_id,
-        "agent": agent_name,
-        "path": doc_path,
-        "timestamp": timestamp,
-    })
+        records = []
+        keys: dict[str, set[str]] = {index_type: set() for index_type in INDEX_TYPES}
+        for line in raw_lines:
+            try:
+                record = json.loads(line)
+                keys["by-task"].add(record["task_id"])
+                keys["by-agent"].add(record["agent"])
+                keys["by-category"].add(record["category"])
+                keys["by-date"].add(record["timestamp"][:10])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # A torn last line from a crashed writer carries no complete record
+                continue
+            records.append(record)
 
-    cat_index_path.write_text(json.dumps(cat_index, indent=2))
+        contents = {}
+        manifest_updates = {}
+        for record in records:
+            md_file = self.design_root / record["path"]
+            fingerprint = _fingerprint_document(md_file, md_file.with_name(f"{md_file.stem}_metadata.json"))
+            if fingerprint is not None:
+                contents[record["path"]], manifest_updates[record["path"]] = fingerprint
 
-    # Update by-date index
-    date_str = timestamp[:10]  # YYYY-MM-DD
-    year_month = timestamp[:7]  # YYYY-MM
-    date_index_dir = index_dir / "by-date" / year_month
-    date_index_dir.mkdir(parents=True, exist_ok=True)
-    date_index_path = date_index_dir / f"{date_str.split('-')[2]}.json"
+        with IndexStore(self.design_root) as store:
+            added = store.add(records, contents)
+            store.update_manifest(manifest_updates)
+            views = store.write_views(keys)
+        self.journal.unlink()
+        return {"documents": added, "views": views}
 
-    if date_index_path.exists():
-        try:
-            date_index = json.loads(date_index_path.read_text())
-        except json.JSONDecodeError:
-            date_index = []
-    else:
-        date_index = []
 
-    date_index.append({
-        "task_id": task_id,
-        "agent": agent_name,
-        "category": category,
-        "path": doc_path,
-        "timestamp": timestamp,
-    })
+def update_indexes(design_root: Path, records: Iterable[dict[str, str]]) -> int:
+    """Journal index records for a batch of documents and refresh the views.
 
-    date_index_path.write_text(json.dumps(date_index, indent=2))
+    The records are appended in one write, then refresh_indexes() folds them
+    into the store so the by-* JSON views can be read directly afterwards.
+    """
+    appended = IndexWriter(design_root).append(records)
+    if appended:
+        refresh_indexes(design_root)
+    return appended
 
 
-def download_to_agent_folder(
-    url: str,
-    agent_name: str,
+def update_index(
+    design_root: Path,
     task_id: str,
+    agent_name: str,
     category: str,
-    subcategory: str | None = None,
-    doc_type: str | None = None,
-    design_root: Path | None = None,
-) -> dict[str, Any]:
-    """Download document to agent-specific folder."""
+    doc_path: str,
+    timestamp: str,
+) -> None:
+    """Record cross-agent index updates for one document."""
+    update_indexes(design_root, [index_record(task_id, agent_name, category, doc_path, timestamp)])
+
+
+def compact_indexes(design_root: Path | None = None, blocking: bool = True) -> dict[str, int] | None:
+    """Load the pending index journal into the store and refresh the views."""
     if design_root is None:
         design_root = get_design_root()
+    return IndexWriter(design_root).compact(blocking=blocking)
 
-    if category not in RECEIVED_CATEGORIES:
-        return {
-            "success": False,
-            "error": f"Invalid category: {category}. Valid: {list(RECEIVED_CATEGORIES.keys())}",
-        }
 
-    # Ensure agent is registered
+def refresh_indexes(design_root: Path) -> None:
+    """Compact the pending journal without waiting on the index lock.
+
+    If the lock is free the views are rewritten before returning. If another
+    process holds it, a detached index-compact run waits for the lock and
+    compacts afterwards, so the caller never blocks and the records are not
+    left pending until the next search.
+    """
+    try:
+        if compact_indexes(design_root, blocking=False) is not None:
+            return
+    except (OSError, sqlite3.Error):
+        # The records stay journaled; the detached run below retries them
+        pass
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "index-compact", "--design-root", str(design_root)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def agent_document_target(
+    design_root: Path,
+    agent_name: str,
+    task_id: str,
+    category: str,
+    subcategory: str | None = None,
+    doc_type: str | None = None,
+    taken: set[Path] | None = None,
+) -> tuple[Path, datetime]:
+    """Return the path a received document is stored at and its timestamp.
+
+    Registers the agent and creates the folder. Paths in taken (already planned
+    in the same batch) or on disk get a numeric suffix.
+    """
     agent_dir = ensure_agent_registered(agent_name, design_root)
 
     # Determine target folder
@@ -315,43 +777,30 @@ def download_to_agent_folder(
         filename = f"{timestamp_str}_document.md"
 
     file_path = folder_path / filename
+    if taken is not None:
+        counter = 2
+        while file_path in taken or file_path.exists():
+            file_path = folder_path / f"{filename[:-3]}_{counter}.md"
+            counter += 1
+        taken.add(file_path)
+    return file_path, timestamp
 
-    # Extract attachment URL if needed
-    if "#issuecomment-" in url:
-        download_url = extract_attachment_url(url)
-        if not download_url:
-            return {
-                "success": False,
-                "error": "Could not extract attachment URL from comment",
-            }
-    else:
-        download_url = url
 
-    # Download file
-    try:
-        subprocess.run(
-            ["curl", "-fsSL", download_url, "-o", str(file_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=60,
-        )
-    except subprocess.CalledProcessError as e:
-        return {
-            "success": False,
-            "error": f"Download failed: {e.stderr}",
-        }
-
-    if not file_path.exists() or file_path.stat().st_size == 0:
-        return {
-            "success": False,
-            "error": "Downloaded file is empty or missing",
-        }
-
-    # Compute hash
-    sha256 = compute_sha256(file_path)
-
-    # Create metadata
+def write_agent_document_metadata(
+    file_path: Path,
+    url: str,
+    download_url: str,
+    sha256: str,
+    size_bytes: int,
+    timestamp: str,
+    agent_name: str,
+    task_id: str,
+    category: str,
+    subcategory: str | None = None,
+    doc_type: str | None = None,
+) -> Path:
+    """Write the metadata of a received document and lock both read-only."""
+    filename = file_path.name
     metadata = {
         "schema_version": "2.0.0",
         "file_name": filename,
@@ -365,10 +814,10 @@ def download_to_agent_folder(
             "download_url": download_url,
         },
         "download": {
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp,
             "agent": "orchestrator",
             "sha256": sha256,
-            "file_size_bytes": file_path.stat().st_size,
+            "file_size_bytes": size_bytes,
         },
         "sender": {
             "agent": agent_name,
@@ -383,106 +832,439 @@ def download_to_agent_folder(
         "ack_timestamp": None,
     }
 
-    metadata_path = folder_path / f"{filename.replace('.md', '')}_metadata.json"
+    metadata_path = file_path.parent / f"{filename.replace('.md', '')}_metadata.json"
     metadata_path.write_text(json.dumps(metadata, indent=2))
 
     # Set read-only
     set_readonly(file_path)
     set_readonly(metadata_path)
+    return metadata_path
 
-    # Update agent stats
-    update_agent_stats(agent_dir)
 
-    # Update indexes
-    update_index(
-        design_root=design_root,
-        task_id=task_id,
-        agent_name=agent_name,
-        category=category,
-        doc_path=str(file_path.relative_to(design_root)),
-        timestamp=timestamp.isoformat(),
-    )
+def add_received_documents(design_root: Path, agent_counts: dict[str, int]) -> None:
+    """Update agent and orchestrator document counters after downloads."""
+    for agent_name, count in agent_counts.items():
+        update_agent_stats(design_root / "agents" / agent_name, count)
 
-    # Update orchestrator stats
     orch_json = design_root / "orchestrator.json"
-    if orch_json.exists():
+    if agent_counts and orch_json.exists():
         try:
             orch_meta = json.loads(orch_json.read_text())
-            orch_meta["total_documents_received"] = orch_meta.get("total_documents_received", 0) + 1
+            orch_meta["total_documents_received"] = (
+                orch_meta.get("total_documents_received", 0) + sum(agent_counts.values())
+            )
             orch_json.write_text(json.dumps(orch_meta, indent=2))
         except json.JSONDecodeError:
             pass
 
+
+def download_batch_to_agent_folders(
+    items: list[dict[str, Any]],
+    design_root: Path | None = None,
+    workers: int = DEFAULT_WORKERS,
+) -> list[dict[str, Any]]:
+    """Download a batch of agent documents concurrently.
+
+    Each item has url, agent, task_id and category, and optionally subcategory
+    and doc_type (as for download_to_agent_folder). Identical content is
+    stored once under design/.blobs and hardlinked; each index record is
+    journaled as soon as its metadata is written, and the batch is compacted
+    into the views once before returning. Re-running an interrupted batch resumes it.
+    """
+    if design_root is None:
+        design_root = get_design_root()
+
+    results: list[dict[str, Any]] = [{} for _ in items]
+    jobs = []
+    planned: list[tuple[int, datetime]] = []
+    taken: set[Path] = set()
+
+    for i, item in enumerate(items):
+        category = item.get("category")
+        if category not in RECEIVED_CATEGORIES or not all(item.get(k) for k in ("url", "agent", "task_id")):
+            results[i] = {
+                "success": False,
+                "url": item.get("url"),
+                "error": f"Invalid item (needs url, agent, task_id and one of {list(RECEIVED_CATEGORIES.keys())})",
+            }
+            continue
+        file_path, timestamp = agent_document_target(
+            design_root, item["agent"], item["task_id"], category,
+            item.get("subcategory"), item.get("doc_type"), taken,
+        )
+        jobs.append({"url": item["url"], "dest": file_path, "key": str(i)})
+        planned.append((i, timestamp))
+
+    downloader = BatchDownloader(design_root / BLOB_DIR_NAME, workers=workers, resolver=extract_attachment_url)
+    # The batch is identified by its items, so re-running the same file resumes it
+    batch_key = json.dumps(items, sort_keys=True, default=str).encode("utf-8")
+    batch_id = hashlib.sha256(batch_key).hexdigest()[:16]
+
+    writer = IndexWriter(design_root)
+    journaled = 0
+    agent_counts: dict[str, int] = {}
+    for (i, timestamp), result in zip(planned, downloader.run(jobs, batch_id=batch_id)):
+        item = items[i]
+        file_path = Path(result["dest"])
+        metadata_path = file_path.parent / f"{file_path.stem}_metadata.json"
+        # Items resumed from an interrupted run may have stopped before their metadata
+        if result["success"] and not metadata_path.exists():
+            write_agent_document_metadata(
+                file_path, item["url"], result["download_url"], result["sha256"], result["size_bytes"],
+                timestamp.isoformat(), item["agent"], item["task_id"], item["category"],
+                item.get("subcategory"), item.get("doc_type"),
+            )
+            # Journal right after the metadata: a resumed run skips items that have
+            # metadata, so a record journaled later could be lost by a crash
+            journaled += writer.append([index_record(
+                item["task_id"], item["agent"], item["category"],
+                str(file_path.relative_to(design_root)), timestamp.isoformat(),
+            )])
+            agent_counts[item["agent"]] = agent_counts.get(item["agent"], 0) + 1
+        results[i] = {
+            "success": result["success"],
+            "url": item["url"],
+            "file_path": str(file_path) if result["success"] else None,
+            "agent": item["agent"],
+            "task_id": item["task_id"],
+            "category": item["category"],
+            "sha256": result["sha256"],
+            "size_bytes": result["size_bytes"],
+            "status": result["status"],
+            "error": result["error"],
+        }
+
+    add_received_documents(design_root, agent_counts)
+    if journaled:
+        refresh_indexes(design_root)
+    return results
+
+
+def download_to_agent_folder(
+    url: str,
+    agent_name: str,
+    task_id: str,
+    category: str,
+    subcategory: str | None = None,
+    doc_type: str | None = None,
+    design_root: Path | None = None,
+) -> dict[str, Any]:
+    """Download document to agent-specific folder."""
+    if design_root is None:
+        design_root = get_design_root()
+
+    if category not in RECEIVED_CATEGORIES:
+        return {
+            "success": False,
+            "error": f"Invalid category: {category}. Valid: {list(RECEIVED_CATEGORIES.keys())}",
+        }
+
+    result = download_batch_to_agent_folders(
+        [{
+            "url": url,
+            "agent": agent_name,
+            "task_id": task_id,
+            "category": category,
+            "subcategory": subcategory,
+            "doc_type": doc_type,
+        }],
+        design_root=design_root,
+        workers=1,
+    )[0]
+    if not result["success"]:
+        return {"success": False, "error": result["error"]}
+
     return {
         "success": True,
-        "file_path": str(file_path),
+        "file_path": result["file_path"],
         "agent": agent_name,
         "task_id": task_id,
         "category": category,
-        "sha256": sha256,
-        "size_bytes": file_path.stat().st_size,
+        "sha256": result["sha256"],
+        "size_bytes": result["size_bytes"],
     }
 
 
-def rebuild_indexes(design_root: Path | None = None) -> dict[str, Any]:
-    """Rebuild all cross-agent indexes from stored documents."""
-    if design_root is None:
-        design_root = get_design_root()
-
-    index_dir = design_root / "index"
+def _received_documents(agent_dir: Path, design_root: Path) -> list[tuple[str, Path, Path]]:
+    """(relative path, document, metadata file) for every received .md of an agent."""
+    received_dir = agent_dir / "received"
+    if not received_dir.exists():
+        return []
+    return [
+        (str(md_file.relative_to(design_root)), md_file, md_file.with_name(f"{md_file.stem}_metadata.json"))
+        for md_file in received_dir.rglob("*.md")
+    ]
 
-    # Clear existing indexes
-    for index_type in ["by-task", "by-agent", "by-category", "by-date"]:
-        type_dir = index_dir / index_type
-        if type_dir.exists():
-            for f in type_dir.rglob("*.json"):
-                f.unlink()
 
-    # Rebuild from all agent documents
+def _agent_dirs(design_root: Path) -> list[Path]:
     agents_dir = design_root / "agents"
-    stats = {"agents_scanned": 0, "documents_indexed": 0, "errors": 0}
-
     if not agents_dir.exists():
-        return {"success": True, **stats}
+        return []
+    return [d for d in agents_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
 
-    for agent_dir in agents_dir.iterdir():
-        if not agent_dir.is_dir() or agent_dir.name.startswith("."):
-            continue
 
-        stats["agents_scanned"] += 1
-        received_dir = agent_dir / "received"
+def _stat_agent(agent_dir: Path, design_root: Path) -> dict[str, tuple[Path, Path, tuple[int, int, int, int] | None]]:
+    """Stat an agent's documents: path -> (document, metadata, (size, mtime_ns, meta size, meta mtime_ns)).
 
-        if not received_dir.exists():
+    The stat tuple is None when the metadata file is missing.
+    """
+    stats: dict[str, tuple[Path, Path, tuple[int, int, int, int] | None]] = {}
+    for rel, md_file, metadata_path in _received_documents(agent_dir, design_root):
+        try:
+            md_stat = md_file.stat()
+            meta_stat = metadata_path.stat()
+        except FileNotFoundError:
+            stats[rel] = (md_file, metadata_path, None)
             continue
+        stats[rel] = (
+            md_file,
+            metadata_path,
+            (md_stat.st_size, md_stat.st_mtime_ns, meta_stat.st_size, meta_stat.st_mtime_ns),
+        )
+    return stats
+
+
+def _scan_documents(design_root: Path, workers: int) -> tuple[int, dict[str, Any]]:
+    """Stat all received documents, in parallel over agents."""
+    agent_dirs = _agent_dirs(design_root)
+    documents: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for stats in pool.map(lambda d: _stat_agent(d, design_root), agent_dirs):
+            documents.update(stats)
+    return len(agent_dirs), documents
+
+
+def _fingerprint_document(md_file: Path, metadata_path: Path) -> tuple[str, tuple[int, int, int, int, str]] | None:
+    """Read a document: (content, manifest entry), or None if it or its metadata file is missing."""
+    try:
+        md_stat = md_file.stat()
+        meta_stat = metadata_path.stat()
+        raw = md_file.read_bytes()
+    except OSError:
+        return None
+    entry = (
+        md_stat.st_size,
+        md_stat.st_mtime_ns,
+        meta_stat.st_size,
+        meta_stat.st_mtime_ns,
+        hashlib.sha256(raw).hexdigest(),
+    )
+    return raw.decode("utf-8", errors="replace"), entry
 
-        for md_file in received_dir.rglob("*.md"):
-            metadata_path = md_file.with_suffix("").with_name(f"{md_file.stem}_metadata.json")
 
+def _load_document(
+    rel: str, md_file: Path, metadata_path: Path, agent_name: str
+) -> tuple[dict[str, str], str, tuple[int, int, int, int, str]] | None:
+    """Read a document and its metadata: (index record, content, manifest entry), or None if invalid."""
+    fingerprint = _fingerprint_document(md_file, metadata_path)
+    if fingerprint is None:
+        return None
+    try:
+        metadata = json.loads(metadata_path.read_text())
+        task_id = metadata.get("task_id", "unknown")
+        category = metadata.get("category", "unknown")
+        timestamp = metadata.get("download", {}).get("timestamp", datetime.now(timezone.utc).isoformat())
+    except (OSError, json.JSONDecodeError, KeyError, AttributeError):
+        return None
+    record = index_record(task_id, agent_name, category, rel, timestamp)
+    return record, *fingerprint
+
+
+def _agent_name(rel: str) -> str:
+    # Paths are agents/<agent>/received/...
+    return Path(rel).parts[1]
+
+
+def _load_all_documents(store: IndexStore, design_root: Path, workers: int) -> dict[str, int]:
+    """Clear the store and bulk-load every document, reading agents in parallel.
+
+    The caller holds the index lock and rewrites the views afterwards.
+    """
+    stats = {"agents_scanned": 0, "documents_indexed": 0, "errors": 0}
+    agent_dirs = _agent_dirs(design_root)
+    stats["agents_scanned"] = len(agent_dirs)
+
+    def load_agent(agent_dir: Path) -> tuple[list[Any], int]:
+        loaded = []
+        errors = 0
+        for rel, md_file, metadata_path in _received_documents(agent_dir, design_root):
             if not metadata_path.exists():
-                stats["errors"] += 1
+                errors += 1
                 continue
+            document = _load_document(rel, md_file, metadata_path, agent_dir.name)
+            if document is None:
+                errors += 1
+            else:
+                loaded.append(document)
+        return loaded, errors
+
+    store.clear()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        # map keeps agent order, so full rebuilds produce identical views
+        for loaded, errors in pool.map(load_agent, agent_dirs):
+            stats["errors"] += errors
+            stats["documents_indexed"] += store.add(
+                [record for record, _, _ in loaded],
+                {record["path"]: content for record, content, _ in loaded},
+            )
+            store.update_manifest({record["path"]: entry for record, _, entry in loaded})
+    return stats
+
+
+def _full_rebuild(design_root: Path, workers: int) -> dict[str, Any]:
+    """Clear the store and views and bulk-load every document."""
+    writer = IndexWriter(design_root)
+    with writer.locked():
+        writer.clear_views()
+        with IndexStore(design_root) as store:
+            stats: dict[str, Any] = {"mode": "full", **_load_all_documents(store, design_root, workers)}
+            store.write_views()
+            store.mark_loaded()
+    return stats
+
+
+def rebuild_indexes(
+    design_root: Path | None = None,
+    full: bool = False,
+    workers: int = DEFAULT_WORKERS,
+) -> dict[str, Any]:
+    """Bring the cross-agent indexes up to date with the stored documents.
+
+    Incremental by default: documents whose size and mtime (and those of their
+    metadata file) match the manifest are skipped, touched documents with an
+    unchanged SHA256 only get their manifest entry refreshed, and only added,
+    changed or removed documents are reindexed. full=True clears and reloads
+    everything, reading agents in parallel.
+    """
+    if design_root is None:
+        design_root = get_design_root()
 
-            try:
-                metadata = json.loads(metadata_path.read_text())
-                task_id = metadata.get("task_id", "unknown")
-                category = metadata.get("category", "unknown")
-                timestamp = metadata.get("download", {}).get("timestamp", datetime.now(timezone.utc).isoformat())
-
-                update_index(
-                    design_root=design_root,
-                    task_id=task_id,
-                    agent_name=agent_dir.name,
-                    category=category,
-                    doc_path=str(md_file.relative_to(design_root)),
-                    timestamp=timestamp,
-                )
-                stats["documents_indexed"] += 1
-            except (json.JSONDecodeError, KeyError):
-                stats["errors"] += 1
+    if full:
+        return {"success": True, **_full_rebuild(design_root, workers)}
+
+    agents_scanned, documents = _scan_documents(design_root, workers)
+    stats: dict[str, Any] = {
+        "mode": "incremental",
+        "agents_scanned": agents_scanned,
+        "documents_indexed": 0,
+        "added": 0,
+        "changed": 0,
+        "removed": 0,
+        "unchanged": 0,
+        "errors": 0,
+    }
 
+    writer = IndexWriter(design_root)
+    with writer.locked():
+        # Downloads journaled since the last compaction are part of the index
+        writer.compact_locked()
+        with IndexStore(design_root) as store:
+            manifest = store.manifest()
+            indexed = store.indexed()
+
+            candidates = []
+            present = set()
+            for rel, (md_file, metadata_path, stat_key) in documents.items():
+                if stat_key is None:
+                    stats["errors"] += 1
+                    continue
+                present.add(rel)
+                entry = manifest.get(rel)
+                if entry is not None and entry[:4] == stat_key and len(indexed.get(rel, ())) == 1:
+                    stats["unchanged"] += 1
+                else:
+                    candidates.append((rel, md_file, metadata_path))
+
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                loaded = list(pool.map(
+                    lambda c: (c[0], _load_document(c[0], c[1], c[2], _agent_name(c[0]))), candidates
+                ))
+
+            records = []
+            contents = {}
+            manifest_updates = {}
+            reindex = set()
+            for rel, document in loaded:
+                if document is None:
+                    stats["errors"] += 1
+                    present.discard(rel)
+                    continue
+                record, content, entry = document
+                manifest_updates[rel] = entry
+                identity = (record["task_id"], record["agent"], record["category"], record["timestamp"])
+                if indexed.get(rel) == {identity}:
+                    # Touched, or indexed from the download journal: same record, nothing to redo
+                    old = manifest.get(rel)
+                    if old is not None and old[4] != entry[4]:
+                        reindex.add(rel)
+                    else:
+                        stats["unchanged"] += 1
+                        continue
+                elif rel in indexed:
+                    reindex.add(rel)
+                records.append(record)
+                contents[rel] = content
+                stats["changed" if rel in reindex else "added"] += 1
+                reindex.add(rel)
+
+            removed = (set(indexed) | set(manifest)) - present
+            stats["removed"] = len(removed & set(indexed))
+            keys = store.remove_paths(reindex | removed)
+            store.add(records, contents)
+            for record in records:
+                keys["by-task"].add(record["task_id"])
+                keys["by-agent"].add(record["agent"])
+                keys["by-category"].add(record["category"])
+                keys["by-date"].add(record["timestamp"][:10])
+            store.update_manifest(manifest_updates, removed)
+            store.write_views(keys)
+
+    stats["documents_indexed"] = len(records)
     return {"success": True, **stats}
 
 
+def verify_indexes(design_root: Path | None = None, workers: int = DEFAULT_WORKERS) -> dict[str, Any]:
+    """Check the index against the manifest and the files on disk, without rebuilding.
+
+    Only stats are compared (no hashing). Reports documents not indexed yet
+    (missing), changed since indexing (stale), indexed but gone (orphaned),
+    in the manifest but not in the index (unindexed), and documents without
+    a metadata file.
+    """
+    if design_root is None:
+        design_root = get_design_root()
+
+    _, documents = _scan_documents(design_root, workers)
+    with IndexStore(design_root) as store:
+        manifest = store.manifest()
+        indexed = set(store.indexed())
+
+    report: dict[str, Any] = {
+        "missing": [],
+        "stale": [],
+        "orphaned": sorted((set(manifest) | indexed) - set(documents)),
+        "unindexed": sorted(set(manifest) - indexed),
+        "no_metadata": [],
+    }
+    for rel, (_, _, stat_key) in sorted(documents.items()):
+        if stat_key is None:
+            report["no_metadata"].append(rel)
+        elif rel not in manifest:
+            # Indexed before the manifest recorded it: nothing to compare, not drift
+            if rel not in indexed:
+                report["missing"].append(rel)
+        elif manifest[rel][:4] != stat_key:
+            report["stale"].append(rel)
+
+    pending = IndexWriter(design_root).pending_bytes()
+    report["pending_journal_bytes"] = pending
+    report["documents"] = len(documents)
+    report["in_sync"] = not (
+        report["missing"] or report["stale"] or report["orphaned"] or report["unindexed"] or pending
+    )
+    return report
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -507,11 +1289,31 @@ def main() -> int:
     dl_parser.add_argument("--design-root", type=Path, help="Design storage root")
     dl_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
+    # download-batch command
+    batch_parser = subparsers.add_parser("download-batch", help="Download many agent documents concurrently")
+    batch_parser.add_argument(
+        "--file",
+        type=Path,
+        required=True,
+        help="JSON list of {url, agent, task_id, category, subcategory?, doc_type?}",
+    )
+    batch_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel downloads")
+    batch_parser.add_argument("--design-root", type=Path, help="Design storage root")
+    batch_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
     # index-rebuild command
-    idx_parser = subparsers.add_parser("index-rebuild", help="Rebuild all indexes")
+    idx_parser = subparsers.add_parser("index-rebuild", help="Update indexes for added, changed and removed documents")
     idx_parser.add_argument("--design-root", type=Path, help="Design storage root")
+    idx_parser.add_argument("--full", action="store_true", help="Clear and rebuild everything (parallel over agents)")
+    idx_parser.add_argument("--verify", action="store_true", help="Only check the index against the manifest")
+    idx_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel workers")
     idx_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
+    # index-compact command
+    compact_parser = subparsers.add_parser("index-compact", help="Fold pending index journals into the indexes")
+    compact_parser.add_argument("--design-root", type=Path, help="Design storage root")
+    compact_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
     args = parser.parse_args()
 
     if not args.command:
@@ -541,18 +1343,65 @@ def main() -> int:
                 print(f"ERROR: {result['error']}")
                 return 1
 
+    elif args.command == "download-batch":
+        try:
+            items = json.loads(args.file.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"ERROR: Cannot read batch file: {e}")
+            return 1
+        results = download_batch_to_agent_folders(items, design_root=args.design_root, workers=args.workers)
+        failed = [r for r in results if not r["success"]]
+
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"Downloaded {len(results) - len(failed)}/{len(results)} document(s)")
+            for r in failed:
+                print(f"  ERROR: {r['url']}: {r['error']}")
+        if failed:
+            return 1
+
     elif args.command == "index-rebuild":
-        result = rebuild_indexes(args.design_root)
+        if args.verify:
+            report = verify_indexes(args.design_root, workers=args.workers)
+
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                print(f"Index verification: {'in sync' if report['in_sync'] else 'DRIFT DETECTED'}")
+                print(f"  Documents: {report['documents']}")
+                for kind in ("missing", "stale", "orphaned", "unindexed", "no_metadata"):
+                    if report[kind]:
+                        print(f"  {kind.replace('_', ' ').capitalize()}: {len(report[kind])}")
+                        for rel in report[kind][:10]:
+                            print(f"    {rel}")
+                if report["pending_journal_bytes"]:
+                    print(f"  Pending journal: {report['pending_journal_bytes']} bytes")
+            return 0 if report["in_sync"] else 1
+
+        result = rebuild_indexes(args.design_root, full=args.full, workers=args.workers)
 
         if args.json:
             print(json.dumps(result, indent=2))
         else:
-            print("Index rebuild complete:")
+            print(f"Index rebuild complete ({result['mode']}):")
             print(f"  Agents scanned: {result['agents_scanned']}")
             print(f"  Documents indexed: {result['documents_indexed']}")
+            if result["mode"] == "incremental":
+                print(f"  Added: {result['added']}, changed: {result['changed']}, "
+                      f"removed: {result['removed']}, unchanged: {result['unchanged']}")
             if result["errors"]:
                 print(f"  Errors: {result['errors']}")
 
+    elif args.command == "index-compact":
+        applied = compact_indexes(args.design_root)
+        result = {"success": True, "applied": applied}
+
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"Index compaction complete: {(applied or {}).get('documents', 0)} documents added")
+
     return 0
 
 
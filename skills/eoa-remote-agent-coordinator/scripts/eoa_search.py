@@ -2,7 +2,10 @@
 """
 EOA Cross-Agent Search
 
-Searches across all agents' documents using the pre-built indexes.
+Searches across all agents' documents using the SQLite index store
+(index/index.sqlite3) maintained by eoa_orchestrator_download.py. Full-text
+search uses its FTS5 trigram index to pick which documents to read; matches
+are always confirmed against the current file on disk.
 
 Usage:
     python eoa_search.py by-task TASK_ID
@@ -10,6 +13,13 @@ Usage:
     python eoa_search.py by-date 2024-01-15
     python eoa_search.py by-category reports
     python eoa_search.py blockers
+    python eoa_search.py fulltext PATTERN
+    python eoa_search.py --compact by-task TASK_ID
+
+Searches only read the index, except that a design root whose store has never
+been loaded (e.g. indexed before the store existed) is bulk-loaded once. Downloads keep the store
+current; --compact first folds in any index journal a download left pending
+(this takes the index lock and writes the store and its JSON views).
 """
 
 from __future__ import annotations
@@ -20,7 +30,9 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from eoa_orchestrator_download import INDEX_DB_NAME, IndexStore, IndexWriter, compact_indexes
 
 
 def get_design_root() -> Path:
@@ -32,32 +44,44 @@ def get_design_root() -> Path:
     return Path.cwd() / "design"
 
 
+def open_store(design_root: Path) -> IndexStore | None:
+    """Open the index store for reading.
+
+    Pending journal updates are not applied here (call compact_indexes first,
+    or pass --compact). The one write is the bootstrap of a store that has
+    never been loaded from agents/ (see IndexWriter.bootstrap), done once.
+    Returns None when there is nothing to search.
+    """
+    if not (design_root / "index" / INDEX_DB_NAME).exists() and not (design_root / "agents").is_dir():
+        return None
+    IndexWriter(design_root).bootstrap()
+    return IndexStore(design_root)
+
+
 def search_by_task(task_id: str, design_root: Path) -> dict[str, Any]:
     """Search for all documents related to a task."""
-    index_path = design_root / "index" / "by-task" / f"{task_id}.json"
+    store = open_store(design_root)
+    index = None
+    if store is not None:
+        with store:
+            index = store.task(task_id)
 
-    if not index_path.exists():
+    if index is None:
         return {"found": False, "task_id": task_id, "message": "No index found for task"}
-
-    try:
-        index = json.loads(index_path.read_text())
-        return {"found": True, "task_id": task_id, **index}
-    except json.JSONDecodeError:
-        return {"found": False, "task_id": task_id, "error": "Invalid index file"}
+    return {"found": True, "task_id": task_id, **index}
 
 
 def search_by_agent(agent_name: str, design_root: Path) -> dict[str, Any]:
     """Search for all documents from an agent."""
-    index_path = design_root / "index" / "by-agent" / f"{agent_name}.json"
+    store = open_store(design_root)
+    index = None
+    if store is not None:
+        with store:
+            index = store.agent(agent_name)
 
-    if not index_path.exists():
+    if index is None:
         return {"found": False, "agent": agent_name, "message": "No index found for agent"}
-
-    try:
-        index = json.loads(index_path.read_text())
-        return {"found": True, **index}
-    except json.JSONDecodeError:
-        return {"found": False, "agent": agent_name, "error": "Invalid index file"}
+    return {"found": True, **index}
 
 
 def search_by_date(date_str: str, design_root: Path) -> dict[str, Any]:
@@ -65,83 +89,92 @@ def search_by_date(date_str: str, design_root: Path) -> dict[str, Any]:
     # Parse date
     try:
         date = datetime.strptime(date_str, "%Y-%m-%d")
-        year_month = date.strftime("%Y-%m")
-        day = date.strftime("%d")
     except ValueError:
         return {"found": False, "date": date_str, "error": "Invalid date format. Use YYYY-MM-DD"}
 
-    index_path = design_root / "index" / "by-date" / year_month / f"{day}.json"
+    store = open_store(design_root)
+    documents = []
+    if store is not None:
+        with store:
+            documents = store.date(date.strftime("%Y-%m-%d"))
 
-    if not index_path.exists():
+    if not documents:
         return {"found": False, "date": date_str, "message": "No documents found for date"}
-
-    try:
-        documents = json.loads(index_path.read_text())
-        return {"found": True, "date": date_str, "documents": documents, "count": len(documents)}
-    except json.JSONDecodeError:
-        return {"found": False, "date": date_str, "error": "Invalid index file"}
+    return {"found": True, "date": date_str, "documents": documents, "count": len(documents)}
 
 
 def search_by_category(category: str, design_root: Path) -> dict[str, Any]:
     """Search for all documents in a category."""
-    index_path = design_root / "index" / "by-category" / f"{category}.json"
+    store = open_store(design_root)
+    documents = []
+    if store is not None:
+        with store:
+            documents = store.category(category)
 
-    if not index_path.exists():
+    if not documents:
         return {"found": False, "category": category, "message": "No documents found for category"}
+    return {"found": True, "category": category, "documents": documents, "count": len(documents)}
 
-    try:
-        documents = json.loads(index_path.read_text())
-        return {"found": True, "category": category, "documents": documents, "count": len(documents)}
-    except json.JSONDecodeError:
-        return {"found": False, "category": category, "error": "Invalid index file"}
+
+def _received_markdown(design_root: Path) -> Iterator[tuple[str, Path]]:
+    """(agent name, document) for every received .md on disk, indexed or not."""
+    agents_dir = design_root / "agents"
+    if not agents_dir.is_dir():
+        return
+    for agent_dir in agents_dir.iterdir():
+        if not agent_dir.is_dir():
+            continue
+        received_dir = agent_dir / "received"
+        if not received_dir.exists():
+            continue
+        for md_file in received_dir.rglob("*.md"):
+            yield agent_dir.name, md_file
+
+
+def _blocker_files(design_root: Path) -> list[dict[str, str]]:
+    """Blocker reports found by walking received/reports/<task>/blockers directly.
+
+    Catches reports the index does not know about (e.g. no metadata sidecar).
+    """
+    blockers: list[dict[str, str]] = []
+    agents_dir = design_root / "agents"
+    if not agents_dir.exists():
+        return blockers
+    for agent_dir in agents_dir.iterdir():
+        if not agent_dir.is_dir():
+            continue
+
+        blockers_dir = agent_dir / "received" / "reports"
+        if not blockers_dir.exists():
+            continue
+
+        for task_dir in blockers_dir.iterdir():
+            if not task_dir.is_dir():
+                continue
+
+            blocker_dir = task_dir / "blockers"
+            if blocker_dir.exists():
+                for md_file in blocker_dir.glob("*.md"):
+                    blockers.append({
+                        "agent": agent_dir.name,
+                        "task_id": task_dir.name,
+                        "path": str(md_file.relative_to(design_root)),
+                        "filename": md_file.name,
+                    })
+    return blockers
 
 
 def search_blockers(design_root: Path) -> dict[str, Any]:
     """Find all blocker reports across all agents (critical operation)."""
-    # Search by category for blockers
-    result = search_by_category("reports", design_root)
-
-    if not result["found"]:
-        # Also check reports category which contains blockers subcategory
-        blockers: list[dict] = []
-
-        # Direct search in agents directories
-        agents_dir = design_root / "agents"
-        if agents_dir.exists():
-            for agent_dir in agents_dir.iterdir():
-                if not agent_dir.is_dir():
-                    continue
-
-                blockers_dir = agent_dir / "received" / "reports"
-                if not blockers_dir.exists():
-                    continue
-
-                for task_dir in blockers_dir.iterdir():
-                    if not task_dir.is_dir():
-                        continue
-
-                    blocker_dir = task_dir / "blockers"
-                    if blocker_dir.exists():
-                        for md_file in blocker_dir.glob("*.md"):
-                            blockers.append({
-                                "agent": agent_dir.name,
-                                "task_id": task_dir.name,
-                                "path": str(md_file.relative_to(design_root)),
-                                "filename": md_file.name,
-                            })
-
-        return {
-            "found": bool(blockers),
-            "blockers": blockers,
-            "count": len(blockers),
-            "critical": len(blockers) > 0,
-        }
-
-    # Filter for blocker reports from category index
-    blockers = [
-        doc for doc in result.get("documents", [])
-        if "blocker" in doc.get("path", "").lower()
-    ]
+    store = open_store(design_root)
+    blockers = []
+    if store is not None:
+        with store:
+            blockers = store.blockers()
+
+    # Unindexed blocker reports must never be missed
+    indexed = {blocker["path"] for blocker in blockers}
+    blockers.extend(b for b in _blocker_files(design_root) if b["path"] not in indexed)
 
     return {
         "found": bool(blockers),
@@ -152,40 +185,49 @@ def search_blockers(design_root: Path) -> dict[str, Any]:
 
 
 def search_fulltext(pattern: str, design_root: Path) -> dict[str, Any]:
-    """Search document contents for a pattern."""
-    results: list[dict] = []
-    agents_dir = design_root / "agents"
-
-    if not agents_dir.exists():
+    """Search document contents for a pattern.
+
+    The trigram index only narrows which files are read: documents it matches,
+    plus documents added or modified since they were indexed (no manifest entry
+    or a different size/mtime), are searched on disk, so results and previews
+    always reflect current content.
+    """
+    store = open_store(design_root)
+    if store is None:
         return {"found": False, "pattern": pattern, "message": "No agents directory"}
 
-    for agent_dir in agents_dir.iterdir():
-        if not agent_dir.is_dir():
-            continue
+    with store:
+        candidates = store.fulltext_candidates(pattern)
+        manifest = store.manifest() if candidates is not None else {}
 
-        received_dir = agent_dir / "received"
-        if not received_dir.exists():
-            continue
-
-        for md_file in received_dir.rglob("*.md"):
+    needle = pattern.lower()
+    results: list[dict] = []
+    for agent, md_file in _received_markdown(design_root):
+        rel = str(md_file.relative_to(design_root))
+        if candidates is not None and rel not in candidates:
+            entry = manifest.get(rel)
             try:
-                content = md_file.read_text()
-                if pattern.lower() in content.lower():
-                    # Extract context
-                    lines = content.split("\n")
-                    matching_lines = [
-                        (i, line) for i, line in enumerate(lines)
-                        if pattern.lower() in line.lower()
-                    ]
-
-                    results.append({
-                        "agent": agent_dir.name,
-                        "path": str(md_file.relative_to(design_root)),
-                        "matches": len(matching_lines),
-                        "preview": matching_lines[:3] if matching_lines else [],
-                    })
-            except (UnicodeDecodeError, PermissionError):
+                st = md_file.stat()
+            except OSError:
                 continue
+            if entry is not None and (st.st_size, st.st_mtime_ns) == entry[:2]:
+                continue
+        try:
+            content = md_file.read_text(encoding="utf-8")
+        except (UnicodeDecodeError, OSError):
+            continue
+        if needle not in content.lower():
+            continue
+        matching_lines = [
+            (i, line) for i, line in enumerate(content.split("\n"))
+            if needle in line.lower()
+        ]
+        results.append({
+            "agent": agent,
+            "path": rel,
+            "matches": len(matching_lines),
+            "preview": matching_lines[:3],
+        })
 
     return {
         "found": bool(results),
@@ -201,6 +243,12 @@ def main() -> int:
         description="EOA Cross-Agent Document Search"
     )
 
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Apply pending index journal updates before searching (writes the index)",
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Search commands")
 
     # by-task
@@ -245,6 +293,8 @@ def main() -> int:
         return 1
 
     design_root = args.design_root or get_design_root()
+    if args.compact:
+        compact_indexes(design_root)
 
     if args.command == "by-task":
         result = search_by_task(args.task_id, design_root)
@@ -7,9 +7,10 @@ standardized design folder structure with read-only enforcement.
 
 Usage:
     python eoa_skill_download.py download --url URL --task-id TASK_ID --category CATEGORY
+    python eoa_skill_download.py download-batch --file JOBS.json [--workers N]
     python eoa_skill_download.py init --project-root PATH
     python eoa_skill_download.py lookup --task-id TASK_ID
-    python eoa_skill_download.py verify --project-root PATH
+    python eoa_skill_download.py verify --project-root PATH [--sample 0.1] [--no-cache]
 """
 
 from __future__ import annotations
@@ -18,14 +19,19 @@ import argparse
 import hashlib
 import json
 import os
+import random
 import re
 import stat
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from eoa_batch_download import BLOB_DIR_NAME, DEFAULT_WORKERS, BatchDownloader
+
 # Category definitions with folder structure
 CATEGORIES: dict[str, dict[str, Any]] = {
     "tasks": {
@@ -141,11 +147,18 @@ def init_storage(project_root: Path) -> None:
     print("EOA design storage initialized successfully")
 
 
+# Digests of verified documents, keyed by path relative to the storage root
+VERIFY_CACHE_NAME = ".verify-cache.json"
+
+# 1 MiB reads keep hashing fast without loading whole documents
+HASH_CHUNK_SIZE = 1 << 20
+
+
 def compute_sha256(file_path: Path) -> str:
     """Compute SHA256 hash of a file."""
     sha256_hash = hashlib.sha256()
     with file_path.open("rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
@@ -213,25 +226,20 @@ def extract_attachment_url(comment_url: str) -> str | None:
     return None
 
 
-def download_document(
+def document_target(
+    storage_root: Path,
     url: str,
     task_id: str,
     category: str,
     subcategory: str | None = None,
     doc_type: str | None = None,
-    sender: str = "unknown",
-    project_root: Path | None = None,
-) -> Path | None:
-    """Download a document and store it in the correct category folder."""
-    storage_root = get_storage_root(project_root)
+    taken: set[Path] | None = None,
+) -> Path:
+    """Return the path a document is stored at, creating its folder.
 
-    # Validate category
-    if category not in CATEGORIES:
-        print(f"ERROR: Unknown category: {category}")
-        print(f"Valid categories: {list(CATEGORIES.keys())}")
-        return None
-
-    # Determine target folder
+    Paths in taken (already planned in the same batch) or on disk get a
+    numeric suffix, since several documents can arrive within one second.
+    """
     cat_config = CATEGORIES[category]
     folder_template = cat_config["path"]
 
@@ -258,42 +266,29 @@ def download_document(
             filename = f"{timestamp}_document.md"
 
     file_path = folder_path / filename
+    if taken is not None:
+        counter = 2
+        while file_path in taken or file_path.exists():
+            file_path = folder_path / f"{filename[:-3]}_{counter}.md"
+            counter += 1
+        taken.add(file_path)
+    return file_path
 
-    # Check if attachment URL needs extraction
-    if "#issuecomment-" in url:
-        attachment_url = extract_attachment_url(url)
-        if not attachment_url:
-            print("ERROR: Could not extract attachment URL from comment")
-            return None
-        download_url = attachment_url
-    else:
-        download_url = url
-
-    # Download file
-    print(f"Downloading: {download_url}")
-    print(f"Target: {file_path}")
-
-    try:
-        subprocess.run(
-            ["curl", "-fsSL", download_url, "-o", str(file_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=60,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"ERROR: Download failed: {e}")
-        print(f"stderr: {e.stderr}")
-        return None
-
-    if not file_path.exists() or file_path.stat().st_size == 0:
-        print("ERROR: Downloaded file is empty or missing")
-        return None
-
-    # Compute hash
-    sha256 = compute_sha256(file_path)
 
-    # Create metadata
+def write_document_metadata(
+    file_path: Path,
+    url: str,
+    download_url: str,
+    sha256: str,
+    size_bytes: int,
+    task_id: str,
+    category: str,
+    subcategory: str | None = None,
+    doc_type: str | None = None,
+    sender: str = "unknown",
+) -> Path:
+    """Write the metadata file of a downloaded document and lock both read-only."""
+    filename = file_path.name
     metadata = {
         "schema_version": "1.0.0",
         "file_name": filename,
@@ -310,7 +305,7 @@ def download_document(
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "agent": os.environ.get("EOA_AGENT_NAME", "unknown"),
             "sha256": sha256,
-            "file_size_bytes": file_path.stat().st_size,
+            "file_size_bytes": size_bytes,
         },
         "sender": {
             "agent": sender,
@@ -320,18 +315,124 @@ def download_document(
         "ack_timestamp": None,
     }
 
-    metadata_path = folder_path / f"{filename.replace('.md', '')}_metadata.json"
+    metadata_path = file_path.parent / f"{filename.replace('.md', '')}_metadata.json"
     metadata_path.write_text(json.dumps(metadata, indent=2))
 
     # Set read-only
     set_readonly(file_path)
     set_readonly(metadata_path)
-    set_readonly(folder_path)
+    return metadata_path
+
+
+def download_document(
+    url: str,
+    task_id: str,
+    category: str,
+    subcategory: str | None = None,
+    doc_type: str | None = None,
+    sender: str = "unknown",
+    project_root: Path | None = None,
+) -> Path | None:
+    """Download a document and store it in the correct category folder."""
+    storage_root = get_storage_root(project_root)
+
+    # Validate category
+    if category not in CATEGORIES:
+        print(f"ERROR: Unknown category: {category}")
+        print(f"Valid categories: {list(CATEGORIES.keys())}")
+        return None
+
+    file_path = document_target(storage_root, url, task_id, category, subcategory, doc_type)
+
+    # Download file (comment URLs are resolved to their attachment first)
+    print(f"Downloading: {url}")
+    print(f"Target: {file_path}")
+
+    downloader = BatchDownloader(storage_root / BLOB_DIR_NAME, workers=1, resolver=extract_attachment_url)
+    result = downloader.run([{"url": url, "dest": file_path}])[0]
+    if not result["success"]:
+        print(f"ERROR: {result['error']}")
+        return None
+
+    sha256 = result["sha256"]
+    write_document_metadata(
+        file_path, url, result["download_url"], sha256, result["size_bytes"],
+        task_id, category, subcategory, doc_type, sender,
+    )
+    set_readonly(file_path.parent)
 
     print(f"Downloaded and locked: {file_path}")
     print(f"SHA256: {sha256}")
 
-    return file_path
+    return Path(file_path)
+
+
+def download_documents(
+    items: list[dict[str, Any]],
+    project_root: Path | None = None,
+    workers: int = DEFAULT_WORKERS,
+) -> list[dict[str, Any]]:
+    """Download a batch of documents concurrently.
+
+    Each item has url, task_id and category, and optionally subcategory,
+    doc_type and sender (as for download_document). Identical content is stored
+    once and hardlinked; re-running an interrupted batch file resumes it.
+
+    Returns:
+        One result per item with success, file_path, sha256, status and error
+    """
+    storage_root = get_storage_root(project_root)
+    results: list[dict[str, Any]] = [{} for _ in items]
+    jobs = []
+    job_items = []
+    taken: set[Path] = set()
+
+    for i, item in enumerate(items):
+        category = item.get("category")
+        if category not in CATEGORIES or not item.get("url") or not item.get("task_id"):
+            results[i] = {
+                "success": False,
+                "url": item.get("url"),
+                "error": f"Invalid item (needs url, task_id and one of {list(CATEGORIES.keys())})",
+            }
+            continue
+        file_path = document_target(
+            storage_root, item["url"], item["task_id"], category,
+            item.get("subcategory"), item.get("doc_type"), taken,
+        )
+        jobs.append({"url": item["url"], "dest": file_path, "key": str(i)})
+        job_items.append(i)
+
+    downloader = BatchDownloader(storage_root / BLOB_DIR_NAME, workers=workers, resolver=extract_attachment_url)
+    # The batch is identified by its items, so re-running the same file resumes it
+    batch_key = json.dumps(items, sort_keys=True, default=str).encode("utf-8")
+    batch_id = hashlib.sha256(batch_key).hexdigest()[:16]
+    folders = set()
+    for i, job, result in zip(job_items, jobs, downloader.run(jobs, batch_id=batch_id)):
+        item = items[i]
+        file_path = Path(result["dest"])
+        metadata_path = file_path.parent / f"{file_path.stem}_metadata.json"
+        # Items resumed from an interrupted run may have stopped before their metadata
+        if result["success"] and not metadata_path.exists():
+            write_document_metadata(
+                file_path, item["url"], result["download_url"], result["sha256"], result["size_bytes"],
+                item["task_id"], item["category"], item.get("subcategory"), item.get("doc_type"),
+                item.get("sender", "unknown"),
+            )
+        if result["success"]:
+            folders.add(file_path.parent)
+        results[i] = {
+            "success": result["success"],
+            "url": item["url"],
+            "file_path": str(file_path) if result["success"] else None,
+            "sha256": result["sha256"],
+            "status": result["status"],
+            "error": result["error"],
+        }
+
+    for folder in folders:
+        set_readonly(folder)
+    return results
 
 
 def lookup_documents(
@@ -375,8 +476,89 @@ def lookup_documents(
     return results
 
 
-def verify_storage(project_root: Path | None = None) -> dict[str, Any]:
-    """Verify storage integrity and permissions."""
+def _load_verify_cache(storage_root: Path) -> dict[str, dict[str, Any]]:
+    try:
+        cache = json.loads((storage_root / VERIFY_CACHE_NAME).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_verify_cache(storage_root: Path, cache: dict[str, dict[str, Any]]) -> None:
+    cache_path = storage_root / VERIFY_CACHE_NAME
+    temp_file = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        temp_file.write_text(json.dumps(cache))
+        temp_file.replace(cache_path)
+    except OSError:
+        # A read-only storage root just means the next run hashes again
+        temp_file.unlink(missing_ok=True)
+
+
+def _verify_document(md_file: Path, cached: dict[str, Any] | None, rehash: bool) -> dict[str, Any]:
+    """Check one stored document: read-only mode, metadata and SHA256.
+
+    The cached digest is trusted when size, mtime_ns and inode are unchanged,
+    unless rehash is set. Returns the issues found, the file size, the cache
+    entry to keep and whether the content was hashed.
+    """
+    result: dict[str, Any] = {"issues": [], "size": 0, "entry": None, "hashed": False}
+    file_stat = md_file.stat()
+    result["size"] = file_stat.st_size
+
+    # Check read-only
+    mode = file_stat.st_mode
+    if mode & stat.S_IWUSR or mode & stat.S_IWGRP or mode & stat.S_IWOTH:
+        result["issues"].append({"type": "writable_file", "path": str(md_file), "message": "File is not read-only"})
+
+    # Check metadata exists
+    metadata_file = md_file.with_name(f"{md_file.stem}_metadata.json")
+    try:
+        metadata = json.loads(metadata_file.read_text())
+    except FileNotFoundError:
+        result["issues"].append({"type": "missing_metadata", "path": str(md_file), "message": "Metadata file missing"})
+        return result
+    except json.JSONDecodeError:
+        result["issues"].append(
+            {"type": "invalid_metadata", "path": str(metadata_file), "message": "Metadata JSON is invalid"}
+        )
+        return result
+
+    # Verify SHA256
+    stored_hash = metadata.get("download", {}).get("sha256")
+    if not stored_hash:
+        return result
+    fingerprint = {"size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns, "inode": file_stat.st_ino}
+    if not rehash and cached is not None and all(cached.get(k) == v for k, v in fingerprint.items()):
+        current_hash = cached["sha256"]
+    else:
+        current_hash = compute_sha256(md_file)
+        result["hashed"] = True
+    result["entry"] = {**fingerprint, "sha256": current_hash}
+    if stored_hash != current_hash:
+        result["issues"].append({
+            "type": "integrity_violation",
+            "path": str(md_file),
+            "message": f"SHA256 mismatch: stored={stored_hash[:16]}... current={current_hash[:16]}...",
+        })
+    return result
+
+
+def verify_storage(
+    project_root: Path | None = None,
+    workers: int = DEFAULT_WORKERS,
+    sample: float = 0.0,
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    """Verify storage integrity and permissions.
+
+    Documents are hashed in parallel. With use_cache, a digest recorded by an
+    earlier run is reused while the file's size, mtime_ns and inode are
+    unchanged; sample (0.0-1.0) is the fraction of those cached documents,
+    picked at random, that are hashed again anyway. Throughput is reported
+    under stats["verification"].
+    """
+    started = time.perf_counter()
     storage_root = get_storage_root(project_root)
     report: dict[str, Any] = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -396,60 +578,57 @@ def verify_storage(project_root: Path | None = None) -> dict[str, Any]:
         })
         return report
 
+    documents: list[tuple[str, Path, str]] = []
     for category in CATEGORIES:
         cat_path = storage_root / category
-        cat_stats = {"files": 0, "size_bytes": 0}
-
         if not cat_path.exists():
             continue
-
+        report["stats"]["by_category"][category] = {"files": 0, "size_bytes": 0}
         for md_file in cat_path.rglob("*.md"):
-            cat_stats["files"] += 1
-            cat_stats["size_bytes"] += md_file.stat().st_size
-            report["stats"]["total_files"] += 1
-            report["stats"]["total_size_bytes"] += md_file.stat().st_size
-
-            # Check read-only
-            mode = md_file.stat().st_mode
-            if mode & stat.S_IWUSR or mode & stat.S_IWGRP or mode & stat.S_IWOTH:
-                report["issues"].append({
-                    "type": "writable_file",
-                    "path": str(md_file),
-                    "message": "File is not read-only",
-                })
-
-            # Check metadata exists
-            metadata_file = md_file.with_suffix("").with_name(
-                f"{md_file.stem}_metadata.json"
-            )
-            if not metadata_file.exists():
-                report["issues"].append({
-                    "type": "missing_metadata",
-                    "path": str(md_file),
-                    "message": "Metadata file missing",
-                })
-            else:
-                # Verify SHA256
-                try:
-                    metadata = json.loads(metadata_file.read_text())
-                    stored_hash = metadata.get("download", {}).get("sha256")
-                    if stored_hash:
-                        current_hash = compute_sha256(md_file)
-                        if stored_hash != current_hash:
-                            report["issues"].append({
-                                "type": "integrity_violation",
-                                "path": str(md_file),
-                                "message": f"SHA256 mismatch: stored={stored_hash[:16]}... current={current_hash[:16]}...",
-                            })
-                except json.JSONDecodeError:
-                    report["issues"].append({
-                        "type": "invalid_metadata",
-                        "path": str(metadata_file),
-                        "message": "Metadata JSON is invalid",
-                    })
+            documents.append((category, md_file, str(md_file.relative_to(storage_root))))
+
+    cache = _load_verify_cache(storage_root) if use_cache else {}
+    cached_keys = [key for _, _, key in documents if key in cache]
+    rehash = set(random.sample(cached_keys, round(len(cached_keys) * min(max(sample, 0.0), 1.0))))
 
-        report["stats"]["by_category"][category] = cat_stats
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(
+            pool.map(
+                lambda doc: _verify_document(doc[1], cache.get(doc[2]), doc[2] in rehash),
+                documents,
+            )
+        )
 
+    new_cache: dict[str, dict[str, Any]] = {}
+    hashed_files = 0
+    hashed_bytes = 0
+    for (category, _, key), result in zip(documents, results):
+        cat_stats = report["stats"]["by_category"][category]
+        cat_stats["files"] += 1
+        cat_stats["size_bytes"] += result["size"]
+        report["stats"]["total_files"] += 1
+        report["stats"]["total_size_bytes"] += result["size"]
+        report["issues"].extend(result["issues"])
+        if result["entry"] is not None:
+            new_cache[key] = result["entry"]
+        if result["hashed"]:
+            hashed_files += 1
+            hashed_bytes += result["size"]
+
+    if use_cache and new_cache != cache:
+        _save_verify_cache(storage_root, new_cache)
+
+    seconds = time.perf_counter() - started
+    report["stats"]["verification"] = {
+        "workers": workers,
+        "hashed_files": hashed_files,
+        "hashed_bytes": hashed_bytes,
+        "cached_files": len(new_cache) - hashed_files,
+        "sampled_files": len(rehash),
+        "seconds": round(seconds, 3),
+        "files_per_sec": round(len(documents) / seconds, 1) if seconds else 0.0,
+        "hashed_mb_per_sec": round(hashed_bytes / 1_000_000 / seconds, 1) if seconds else 0.0,
+    }
     return report
 
 
@@ -486,6 +665,18 @@ def main() -> int:
     dl_parser.add_argument("--sender", default="unknown", help="Sender agent name")
     dl_parser.add_argument("--project-root", type=Path, help="Project root directory")
 
+    # download-batch command
+    batch_parser = subparsers.add_parser("download-batch", help="Download many documents concurrently")
+    batch_parser.add_argument(
+        "--file",
+        type=Path,
+        required=True,
+        help="JSON list of {url, task_id, category, subcategory?, doc_type?, sender?}",
+    )
+    batch_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel downloads")
+    batch_parser.add_argument("--project-root", type=Path, help="Project root directory")
+    batch_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
     # lookup command
     lookup_parser = subparsers.add_parser("lookup", help="Find documents by task ID")
     lookup_parser.add_argument("--task-id", required=True, help="Task ID to search")
@@ -495,6 +686,14 @@ def main() -> int:
     # verify command
     verify_parser = subparsers.add_parser("verify", help="Verify storage integrity")
     verify_parser.add_argument("--project-root", type=Path, help="Project root directory")
+    verify_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel hashing threads")
+    verify_parser.add_argument(
+        "--sample",
+        type=float,
+        default=0.0,
+        help="Fraction of cached documents to re-hash anyway (0.0-1.0)",
+    )
+    verify_parser.add_argument("--no-cache", action="store_true", help="Hash every document, ignoring cached digests")
     verify_parser.add_argument(
         "--json",
         action="store_true",
@@ -523,6 +722,22 @@ def main() -> int:
         )
         return 0 if result else 1
 
+    elif args.command == "download-batch":
+        try:
+            items = json.loads(args.file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"ERROR: Cannot read batch file: {e}")
+            return 1
+        results = download_documents(items, project_root=args.project_root, workers=args.workers)
+        failed = [r for r in results if not r["success"]]
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"Downloaded {len(results) - len(failed)}/{len(results)} document(s)")
+            for r in failed:
+                print(f"  ERROR: {r['url']}: {r['error']}")
+        return 1 if failed else 0
+
     elif args.command == "lookup":
         results = lookup_documents(
             task_id=args.task_id,
@@ -541,7 +756,12 @@ def main() -> int:
         return 0
 
     elif args.command == "verify":
-        report = verify_storage(args.project_root)
+        report = verify_storage(
+            args.project_root,
+            workers=args.workers,
+            sample=args.sample,
+            use_cache=not args.no_cache,
+        )
         if args.json:
             print(json.dumps(report, indent=2))
         else:
@@ -552,6 +772,15 @@ def main() -> int:
             print("\nBy Category:")
             for cat, stats in report["stats"]["by_category"].items():
                 print(f"  {cat}: {stats['files']} files, {stats['size_bytes']} bytes")
+            verification = report["stats"].get("verification")
+            if verification:
+                print(
+                    f"\nHashed {verification['hashed_files']} file(s) "
+                    f"({verification['sampled_files']} sampled), "
+                    f"{verification['cached_files']} cached digest(s) trusted, "
+                    f"in {verification['seconds']}s "
+                    f"({verification['files_per_sec']} files/s, {verification['hashed_mb_per_sec']} MB/s hashed)"
+                )
 
             if report["issues"]:
                 print(f"\nIssues Found: {len(report['issues'])}")
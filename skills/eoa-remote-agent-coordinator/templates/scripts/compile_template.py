@@ -8,6 +8,11 @@ Supports:
 - Conditional blocks: {{#IF CONDITION}}...{{/IF}}
 - Template includes: {{INCLUDE path/to/template.md}}
 - Validation of syntax and variables
+- Batch rendering of one template against many variable sets
+
+Templates are compiled once (includes expanded, conditionals parsed into a
+node tree) and cached until the template or any file it includes changes, so
+rendering is a single pass over the compiled nodes.
 """
 
 import argparse
@@ -18,11 +23,242 @@ from pathlib import Path
 from typing import Dict, Any, Optional, Set, List, Tuple
 
 
+INCLUDE_PATTERN = re.compile(r'{{\s*INCLUDE\s+([^\s}]+)\s*}}')
+VARIABLE_PATTERN = re.compile(r'{{\s*([A-Z_][A-Z0-9_]*)\s*}}')
+TOKEN_PATTERN = re.compile(
+    r'{{\s*#IF\s+(?P<condition>[^\s}]+)\s*}}'
+    r'|{{\s*/IF\s*}}'
+    r'|{{\s*(?P<variable>[A-Z_][A-Z0-9_]*)\s*}}'
+)
+
+# Node kinds of a compiled template: (TEXT, text), (VARIABLE, name),
+# (CONDITIONAL, condition, child nodes)
+TEXT, VARIABLE, CONDITIONAL = 0, 1, 2
+
+# Compiled templates are small; past this many entries the cache starts over
+MAX_CACHED_TEMPLATES = 512
+
+
 class TemplateError(Exception):
     """Base exception for template compilation errors."""
     pass
 
 
+class CompiledTemplate:
+    """A template with includes expanded and conditionals parsed into nodes."""
+
+    def __init__(self, nodes: List[tuple], dependencies: Dict[Path, int]):
+        """
+        Args:
+            nodes: Parsed template nodes (see TEXT, VARIABLE, CONDITIONAL)
+            dependencies: Files read while compiling, mapped to their mtime_ns
+        """
+        self.nodes = nodes
+        self.dependencies = dependencies
+
+    def is_current(self) -> bool:
+        """Check that no file read while compiling has changed since."""
+        for path, mtime_ns in self.dependencies.items():
+            try:
+                if path.stat().st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+# Template strings keyed by (template directory, text), since includes
+# resolve relative to the directory; template files keyed by path
+_compiled_cache: Dict[Tuple[Path, str], CompiledTemplate] = {}
+_file_cache: Dict[Path, CompiledTemplate] = {}
+
+
+def parse_template(template: str) -> List[tuple]:
+    """
+    Parse an include-expanded template into nodes.
+
+    {{#IF}} blocks nest; an unmatched {{#IF}} or {{/IF}} is kept as text.
+
+    Args:
+        template: Template string with includes already expanded
+
+    Returns:
+        List of nodes
+    """
+    nodes: List[tuple] = []
+    # Open {{#IF}} blocks: (marker text, condition, enclosing node list)
+    open_blocks: List[Tuple[str, str, List[tuple]]] = []
+    position = 0
+
+    for match in TOKEN_PATTERN.finditer(template):
+        if match.start() > position:
+            nodes.append((TEXT, template[position:match.start()]))
+        position = match.end()
+
+        if match.group('variable') is not None:
+            nodes.append((VARIABLE, match.group('variable')))
+        elif match.group('condition') is not None:
+            open_blocks.append((match.group(0), match.group('condition').strip(), nodes))
+            nodes = []
+        elif open_blocks:
+            _, condition, parent = open_blocks.pop()
+            parent.append((CONDITIONAL, condition, nodes))
+            nodes = parent
+        else:
+            nodes.append((TEXT, match.group(0)))
+
+    if position < len(template):
+        nodes.append((TEXT, template[position:]))
+
+    while open_blocks:
+        marker, _, parent = open_blocks.pop()
+        parent.append((TEXT, marker))
+        parent.extend(nodes)
+        nodes = parent
+
+    return nodes
+
+
+def expand_includes(
+    template: str,
+    template_dir: Path,
+    dependencies: Dict[Path, int],
+    include_stack: Optional[List[Path]] = None,
+) -> str:
+    """
+    Expand {{INCLUDE path/to/template.md}} directives recursively.
+
+    Args:
+        template: Template string
+        template_dir: Directory that include paths are relative to
+        dependencies: Receives every included file with its mtime_ns
+        include_stack: Files currently being expanded (for circular detection)
+
+    Returns:
+        Template with includes expanded
+
+    Raises:
+        TemplateError: If include file not found or circular include detected
+    """
+    if include_stack is None:
+        include_stack = []
+    active = set(include_stack)
+
+    def replace_include(match: re.Match) -> str:
+        include_path = template_dir / match.group(1)
+
+        # Check for circular includes
+        if include_path in active:
+            stack_str = ' -> '.join(str(p) for p in include_stack + [include_path])
+            raise TemplateError(f"Circular include detected: {stack_str}")
+
+        # Check if file exists
+        try:
+            dependencies[include_path] = include_path.stat().st_mtime_ns
+            included_content = include_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            raise TemplateError(f"Include file not found: {include_path}")
+
+        include_stack.append(include_path)
+        try:
+            return expand_includes(included_content, include_path.parent, dependencies, include_stack)
+        finally:
+            include_stack.pop()
+
+    return INCLUDE_PATTERN.sub(replace_include, template)
+
+
+def _cache_put(cache: Dict[Any, CompiledTemplate], key: Any, compiled: CompiledTemplate) -> None:
+    if len(cache) >= MAX_CACHED_TEMPLATES:
+        cache.clear()
+    cache[key] = compiled
+
+
+def compile_source(template: str, template_dir: Path) -> CompiledTemplate:
+    """
+    Compile a template string, reusing the cached result while its includes are unchanged.
+
+    Args:
+        template: Template string
+        template_dir: Directory that include paths are relative to
+
+    Returns:
+        Compiled template
+
+    Raises:
+        TemplateError: If an include is missing or circular
+    """
+    key = (template_dir, template)
+    compiled = _compiled_cache.get(key)
+    if compiled is not None and compiled.is_current():
+        return compiled
+
+    dependencies: Dict[Path, int] = {}
+    expanded = expand_includes(template, template_dir, dependencies)
+    compiled = CompiledTemplate(parse_template(expanded), dependencies)
+    _cache_put(_compiled_cache, key, compiled)
+    return compiled
+
+
+def load_template(template_path: Path) -> CompiledTemplate:
+    """
+    Compile a template file, reusing the cached result while it and its includes are unchanged.
+
+    Args:
+        template_path: Path to template file
+
+    Returns:
+        Compiled template
+
+    Raises:
+        OSError: If the template cannot be read
+        TemplateError: If an include is missing or circular
+    """
+    compiled = _file_cache.get(template_path)
+    if compiled is not None and compiled.is_current():
+        return compiled
+
+    dependencies = {template_path: template_path.stat().st_mtime_ns}
+    template = template_path.read_text(encoding='utf-8')
+    expanded = expand_includes(template, template_path.parent, dependencies)
+    compiled = CompiledTemplate(parse_template(expanded), dependencies)
+    _cache_put(_file_cache, template_path, compiled)
+    return compiled
+
+
+def render_batch(template_path: Path, variable_sets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Render one template against many variable sets, compiling it once.
+
+    Args:
+        template_path: Path to template file
+        variable_sets: One dictionary of variables per rendering
+
+    Returns:
+        One result per variable set, in order: output (None on error),
+        error, and sorted missing and unused variable names
+
+    Raises:
+        OSError: If the template cannot be read
+        TemplateError: If an include is missing or circular
+    """
+    compiled = load_template(template_path)
+    results = []
+
+    for variables in variable_sets:
+        compiler = TemplateCompiler(variables, template_path.parent)
+        result: Dict[str, Any] = {'output': None, 'error': None}
+        try:
+            result['output'] = compiler.render(compiled)
+        except TemplateError as e:
+            result['error'] = str(e)
+        result['missing'] = sorted(compiler.get_missing_variables())
+        result['unused'] = sorted(compiler.get_unused_variables())
+        results.append(result)
+
+    return results
+
+
 class TemplateCompiler:
     """Compiles markdown templates with variable substitution and control structures."""
 
@@ -38,7 +274,6 @@ class TemplateCompiler:
         self.template_dir = template_dir or Path.cwd()
         self.used_variables: Set[str] = set()
         self.required_variables: Set[str] = set()
-        self.include_stack: List[Path] = []
 
     def compile(self, template: str, template_path: Optional[Path] = None) -> str:
         """
@@ -57,124 +292,77 @@ class TemplateCompiler:
         if template_path:
             self.template_dir = template_path.parent
 
-        # Process includes first
-        template = self._process_includes(template, template_path)
-
-        # Process conditional blocks
-        template = self._process_conditionals(template)
-
-        # Process variable substitutions (with nested support)
-        template = self._process_variables(template)
-
-        return template
-
-    def _process_includes(self, template: str, current_path: Optional[Path]) -> str:
-        """
-        Process {{INCLUDE path/to/template.md}} directives.
-
-        Args:
-            template: Template string
-            current_path: Current template file path (for circular detection)
-
-        Returns:
-            Template with includes expanded
-
-        Raises:
-            TemplateError: If include file not found or circular include detected
-        """
-        include_pattern = re.compile(r'{{\s*INCLUDE\s+([^\s}]+)\s*}}')
-
-        def replace_include(match: re.Match) -> str:
-            include_path_str = match.group(1)
-            include_path = self.template_dir / include_path_str
+        return self.render(compile_source(template, self.template_dir))
 
-            # Check for circular includes
-            if include_path in self.include_stack:
-                stack_str = ' -> '.join(str(p) for p in self.include_stack + [include_path])
-                raise TemplateError(f"Circular include detected: {stack_str}")
-
-            # Check if file exists
-            if not include_path.exists():
-                raise TemplateError(f"Include file not found: {include_path}")
-
-            # Read and process included template
-            self.include_stack.append(include_path)
-            try:
-                included_content = include_path.read_text(encoding='utf-8')
-                # Recursively process the included template
-                old_dir = self.template_dir
-                self.template_dir = include_path.parent
-                result = self._process_includes(included_content, include_path)
-                self.template_dir = old_dir
-                return result
-            finally:
-                self.include_stack.pop()
-
-        return include_pattern.sub(replace_include, template)
-
-    def _process_conditionals(self, template: str) -> str:
+    def render(self, compiled: CompiledTemplate) -> str:
         """
-        Process {{#IF CONDITION}}...{{/IF}} blocks.
+        Render a compiled template with this compiler's variables.
 
         Args:
-            template: Template string
+            compiled: Template from compile_source or load_template
 
         Returns:
-            Template with conditionals evaluated
+            Rendered template string
 
         Raises:
-            TemplateError: If conditional syntax is invalid
+            TemplateError: If required variables are missing
         """
-        # Match nested conditionals using a simple recursive approach
-        conditional_pattern = re.compile(
-            r'{{\s*#IF\s+([^\s}]+)\s*}}(.*?){{\s*/IF\s*}}',
-            re.DOTALL
-        )
-
-        def evaluate_condition(condition: str) -> bool:
-            """Evaluate a condition variable (checks if truthy)."""
-            condition = condition.strip()
-            self.required_variables.add(condition)
-
-            if condition not in self.variables:
-                return False
-
-            self.used_variables.add(condition)
-            value = self.variables[condition]
-
-            # Evaluate truthiness
-            if isinstance(value, str):
-                return value.lower() not in ('', '0', 'false', 'no', 'none')
-            return bool(value)
-
-        def replace_conditional(match: re.Match) -> str:
-            condition = match.group(1)
-            content = match.group(2)
-
-            if evaluate_condition(condition):
-                # Recursively process nested conditionals
-                return self._process_conditionals(content)
-            else:
-                return ''
-
-        # Keep processing until no more conditionals found (handles nesting)
-        max_iterations = 100
-        iteration = 0
-        while conditional_pattern.search(template) and iteration < max_iterations:
-            template = conditional_pattern.sub(replace_conditional, template)
-            iteration += 1
-
-        if iteration >= max_iterations:
-            raise TemplateError("Maximum conditional nesting depth exceeded (possible infinite loop)")
-
-        return template
-
-    def _process_variables(self, template: str) -> str:
+        parts: List[str] = []
+        self._render_nodes(compiled.nodes, parts)
+        result = ''.join(parts)
+
+        # Values or nested references ({{VAR_{{SUFFIX}}}}) can leave new
+        # placeholders behind; resolve those like the first pass did
+        if '{{' in result and VARIABLE_PATTERN.search(result):
+            result = self._process_variables(result, iteration=1)
+        return result
+
+    def _render_nodes(self, nodes: List[tuple], parts: List[str]) -> None:
+        for node in nodes:
+            kind = node[0]
+            if kind == TEXT:
+                parts.append(node[1])
+            elif kind == VARIABLE:
+                parts.append(self._variable_value(node[1]))
+            elif self._evaluate_condition(node[1]):
+                self._render_nodes(node[2], parts)
+
+    def _evaluate_condition(self, condition: str) -> bool:
+        """Evaluate a condition variable (checks if truthy)."""
+        self.required_variables.add(condition)
+
+        if condition not in self.variables:
+            return False
+
+        self.used_variables.add(condition)
+        value = self.variables[condition]
+
+        # Evaluate truthiness
+        if isinstance(value, str):
+            return value.lower() not in ('', '0', 'false', 'no', 'none')
+        return bool(value)
+
+    def _variable_value(self, var_name: str) -> str:
+        self.required_variables.add(var_name)
+
+        if var_name not in self.variables:
+            raise TemplateError(f"Missing required variable: {var_name}")
+
+        self.used_variables.add(var_name)
+        value = self.variables[var_name]
+
+        # Convert value to string
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, indent=2)
+        return str(value)
+
+    def _process_variables(self, template: str, iteration: int = 0) -> str:
         """
         Process {{VARIABLE}} substitutions with nested support.
 
         Args:
             template: Template string
+            iteration: Substitution passes already applied
 
         Returns:
             Template with variables substituted
@@ -184,27 +372,9 @@ class TemplateCompiler:
         """
         # Process nested variables first (inside-out)
         max_iterations = 100
-        iteration = 0
-
-        variable_pattern = re.compile(r'{{\s*([A-Z_][A-Z0-9_]*)\s*}}')
 
-        while variable_pattern.search(template) and iteration < max_iterations:
-            def replace_variable(match: re.Match) -> str:
-                var_name = match.group(1)
-                self.required_variables.add(var_name)
-
-                if var_name not in self.variables:
-                    raise TemplateError(f"Missing required variable: {var_name}")
-
-                self.used_variables.add(var_name)
-                value = self.variables[var_name]
-
-                # Convert value to string
-                if isinstance(value, (dict, list)):
-                    return json.dumps(value, indent=2)
-                return str(value)
-
-            template = variable_pattern.sub(replace_variable, template)
+        while VARIABLE_PATTERN.search(template) and iteration < max_iterations:
+            template = VARIABLE_PATTERN.sub(lambda match: self._variable_value(match.group(1)), template)
             iteration += 1
 
         if iteration >= max_iterations:
@@ -305,6 +475,66 @@ def parse_cli_variables(var_args: List[str]) -> Dict[str, str]:
     return variables
 
 
+def run_batch(
+    template_path: Path,
+    batch_path: Path,
+    shared_variables: Dict[str, Any],
+    output_dir: Optional[Path],
+    strict: bool,
+) -> int:
+    """
+    Render a template for every variable set in a batch file (CLI --batch).
+
+    Args:
+        template_path: Path to template file
+        batch_path: JSON file with a list of variable objects
+        shared_variables: Variables from --config/--var, overridden per set
+        output_dir: Directory for the rendered files (None prints JSON)
+        strict: Treat unused variables as errors
+
+    Returns:
+        Exit code (0 if every set rendered cleanly, 1 otherwise)
+    """
+    try:
+        with open(batch_path, 'r', encoding='utf-8') as f:
+            variable_sets = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: Cannot read batch file: {e}", file=sys.stderr)
+        return 1
+    if not isinstance(variable_sets, list) or not all(isinstance(v, dict) for v in variable_sets):
+        print("Error: Batch file must contain a JSON list of objects", file=sys.stderr)
+        return 1
+
+    try:
+        results = render_batch(template_path, [{**shared_variables, **v} for v in variable_sets])
+    except (OSError, TemplateError) as e:
+        print(f"Error compiling template: {e}", file=sys.stderr)
+        return 1
+
+    failed = 0
+    width = len(str(len(results)))
+    for number, result in enumerate(results, 1):
+        if result['error'] is None and result['missing']:
+            result['error'] = f"Missing required variables: {', '.join(result['missing'])}"
+        if result['error'] is None and strict and result['unused']:
+            result['error'] = f"Unused variables: {', '.join(result['unused'])}"
+        if result['error'] is not None:
+            failed += 1
+            print(f"Error in variable set {number}: {result['error']}", file=sys.stderr)
+        elif output_dir:
+            output_path = output_dir / f"{template_path.stem}_{number:0{width}d}.md"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(result['output'], encoding='utf-8')
+            result['path'] = str(output_path)
+
+    if output_dir:
+        print(f"✓ Rendered {len(results) - failed}/{len(results)} variable set(s) into: {output_dir}", file=sys.stderr)
+    else:
+        print(json.dumps(results, indent=2))
+
+    return 1 if failed else 0
+
+
 def main() -> int:
     """
     Main entry point for template compiler CLI.
@@ -326,6 +556,9 @@ Examples:
   # Compile to file
   python compile_template.py --template task.md --config vars.json --output result.md
 
+  # Render once per variable set (JSON list of objects) into a directory
+  python compile_template.py --template task.md --batch agents.json --output-dir out/
+
   # Validate syntax only
   python compile_template.py --validate task.md
         """
@@ -356,6 +589,18 @@ Examples:
         help='Output file path (default: stdout)'
     )
 
+    parser.add_argument(
+        '--batch',
+        type=Path,
+        help='JSON file with a list of variable objects; renders the template once per object'
+    )
+
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        help='Directory for batch outputs, named <template>_<n>.md (default: JSON on stdout)'
+    )
+
     parser.add_argument(
         '--validate',
         type=Path,
@@ -418,6 +663,9 @@ Examples:
             print(f"Error: {e}", file=sys.stderr)
             return 1
 
+    if args.batch:
+        return run_batch(args.template, args.batch, variables, args.output_dir, args.strict)
+
     # Read template
     try:
         template_content = args.template.read_text(encoding='utf-8')
@@ -3,15 +3,28 @@
 Template validation script for remote-agent-coordinator skill.
 
 Validates template syntax, cross-references, content, and JSON schema.
+
+Each file is read and scanned once into a dependency graph (includes,
+checklist references, variables); cross-references are checked against that
+graph, files are checked in parallel, and per-file results are cached by
+content hash.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Bump when checks or cache keys change so cached results are discarded
+CACHE_VERSION = 2
+
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 4) * 2)
 
 
 @dataclass
@@ -44,6 +57,17 @@ class ValidationReport:
         return {"passed": passed, "failed": failed, "total": len(self.results)}
 
 
+@dataclass
+class ParsedTemplate:
+    """A template read once, with the references the checks need."""
+    path: Path
+    content: str
+    sha256: str
+    includes: List[str]
+    checklists: List[str]
+    variables: Set[str]
+
+
 class TemplateValidator:
     """Validates template files."""
 
@@ -51,54 +75,226 @@ class TemplateValidator:
     IF_BLOCK_START = re.compile(r'\{\{#IF\s+([A-Z_][A-Z0-9_]*)\}\}')
     IF_BLOCK_END = re.compile(r'\{\{/IF\}\}')
     INCLUDE_PATTERN = re.compile(r'\{\{INCLUDE\s+([^\}]+)\}\}')
+    CHECKLIST_PATTERN = re.compile(r'checklists/([^\s\)]+\.json)')
 
-    def __init__(self, templates_dir: Path):
-        """Initialize validator with templates directory."""
+    def __init__(self, templates_dir: Path, workers: int = DEFAULT_WORKERS, cache_path: Optional[Path] = None):
+        """
+        Initialize validator with templates directory.
+
+        Args:
+            templates_dir: Templates directory
+            workers: Files checked in parallel
+            cache_path: JSON file persisting per-file results between runs
+        """
         self.templates_dir = templates_dir
         self.scripts_dir = templates_dir / "scripts"
         self.checklists_dir = templates_dir / "checklists"
+        self.workers = workers
+        self.cache_path = cache_path
         self.report = ValidationReport()
+        # Dependency graph: every template parsed so far, by path
+        self.graph: Dict[Path, ParsedTemplate] = {}
+        self._files: Optional[Set[str]] = None
+        self._documented_vars: Optional[Set[str]] = None
+        self._cache: Dict[str, Dict[str, List[Any]]] = self._load_cache()
+        # Cache keys looked up this run; the rest are pruned on save
+        self._used: Set[str] = set()
+        self._complete = False
 
     def validate_all(self) -> ValidationReport:
         """Validate all templates and checklists."""
         # Find all template files (markdown files in templates/)
         template_files = list(self.templates_dir.glob("*.md"))
+        self._run_parallel(self._check_template, template_files)
 
-        for template_file in template_files:
-            self.validate_template(template_file)
+        for cycle in self.include_cycles():
+            self.report.add_result(ValidationResult(
+                file_path=str(cycle[0]),
+                check_type="cross-reference",
+                passed=False,
+                message="Circular INCLUDE: " + " -> ".join(p.name for p in cycle)
+            ))
 
         # Validate JSON checklists
         if self.checklists_dir.exists():
             checklist_files = list(self.checklists_dir.glob("*.json"))
-            for checklist_file in checklist_files:
-                self.validate_checklist(checklist_file)
+            self._run_parallel(self._check_checklist, checklist_files)
 
+        self._complete = True
         return self.report
 
     def validate_template(self, template_path: Path) -> None:
         """Validate a single template file."""
+        for result in self._check_template(template_path):
+            self.report.add_result(result)
+
+    def _run_parallel(self, check: Any, paths: List[Path]) -> None:
+        """Run a per-file check over paths in parallel, adding results in path order."""
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            for results in pool.map(check, paths):
+                for result in results:
+                    self.report.add_result(result)
+
+    def parse_template(self, template_path: Path) -> ParsedTemplate:
+        """
+        Read a template and add it to the dependency graph.
+
+        Raises:
+            OSError, UnicodeDecodeError: If the file cannot be read
+        """
+        parsed = self.graph.get(template_path)
+        if parsed is not None:
+            return parsed
+        content = template_path.read_text(encoding='utf-8')
+        parsed = ParsedTemplate(
+            path=template_path,
+            content=content,
+            sha256=hashlib.sha256(content.encode('utf-8')).hexdigest(),
+            includes=[m.group(1).strip() for m in self.INCLUDE_PATTERN.finditer(content)],
+            checklists=self.CHECKLIST_PATTERN.findall(content),
+            variables=set(self.VARIABLE_PATTERN.findall(content)),
+        )
+        self.graph[template_path] = parsed
+        return parsed
+
+    def _check_template(self, template_path: Path) -> List[ValidationResult]:
+        """Run every check on one template; syntax and content results come from the cache when possible."""
         try:
-            content = template_path.read_text(encoding='utf-8')
+            parsed = self.parse_template(template_path)
         except Exception as e:
-            self.report.add_result(ValidationResult(
+            return [ValidationResult(
                 file_path=str(template_path),
                 check_type="read",
                 passed=False,
                 message=f"Failed to read file: {e}"
-            ))
-            return
+            )]
+
+        key = f"template:{template_path.name}:{parsed.sha256}"
+        self._used.add(key)
+        cached = self._cache.get(key)
+        if cached is not None:
+            syntax = self._from_cache(template_path, cached["syntax"])
+            content = self._from_cache(template_path, cached["content"])
+        else:
+            # Syntax validation
+            syntax = self._validate_syntax(template_path, parsed.content)
+            # Content validation
+            content = self._validate_content(template_path, parsed.content)
+            self._cache[key] = {"syntax": self._to_cache(syntax), "content": self._to_cache(content)}
+
+        # Cross-references depend on other files, so they are checked every run
+        return syntax + self._validate_cross_references(parsed) + content
+
+    def _check_checklist(self, checklist_path: Path) -> List[ValidationResult]:
+        """Validate a checklist, reusing cached results for unchanged content."""
+        try:
+            raw = checklist_path.read_bytes()
+        except Exception as e:
+            return [ValidationResult(
+                file_path=str(checklist_path),
+                check_type="schema",
+                passed=False,
+                message=f"Failed to read file: {e}"
+            )]
 
-        # Syntax validation
-        self._validate_syntax(template_path, content)
+        key = f"checklist:{checklist_path.name}:{hashlib.sha256(raw).hexdigest()}"
+        self._used.add(key)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._from_cache(checklist_path, cached["schema"])
+        results = self._validate_checklist_data(checklist_path, raw)
+        self._cache[key] = {"schema": self._to_cache(results)}
+        return results
 
-        # Cross-reference validation
-        self._validate_cross_references(template_path, content)
+    @staticmethod
+    def _to_cache(results: List[ValidationResult]) -> List[Any]:
+        return [[r.check_type, r.passed, r.message, r.line_number] for r in results]
 
-        # Content validation
-        self._validate_content(template_path, content)
+    @staticmethod
+    def _from_cache(path: Path, entries: List[Any]) -> List[ValidationResult]:
+        return [ValidationResult(str(path), check_type, passed, message, line_number)
+                for check_type, passed, message, line_number in entries]
 
-    def _validate_syntax(self, template_path: Path, content: str) -> None:
+    def _load_cache(self) -> Dict[str, Dict[str, List[Any]]]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("results", {})
+
+    def save_cache(self) -> None:
+        """
+        Persist cached results to cache_path (no-op without one).
+
+        After validate_all() only the entries used in this run are kept. After a
+        partial run, older content hashes of the files checked are dropped and
+        entries for files not checked are kept. A failed write only prints a
+        warning; the next run re-checks the files.
+        """
+        if self.cache_path is None:
+            return
+        if self._complete:
+            results = {k: v for k, v in self._cache.items() if k in self._used}
+        else:
+            seen = {k.rsplit(":", 1)[0] for k in self._used}
+            results = {k: v for k, v in self._cache.items()
+                       if k in self._used or k.rsplit(":", 1)[0] not in seen}
+        temp_file = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_text(json.dumps({"version": CACHE_VERSION, "results": results}), encoding='utf-8')
+            temp_file.replace(self.cache_path)
+        except OSError as e:
+            print(f"Warning: could not write cache {self.cache_path}: {e}", file=sys.stderr)
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+    def _file_exists(self, path: Path) -> bool:
+        """Check a referenced path against one listing of the templates tree."""
+        if self._files is None:
+            self._files = {str(p) for p in self.templates_dir.rglob("*")}
+        return os.path.normpath(path) in self._files or path.exists()
+
+    def _documented_variables(self) -> Optional[Set[str]]:
+        """Variables documented in BASE_TOOLCHAIN.md, read once (None if it does not exist)."""
+        if self._documented_vars is None:
+            base_toolchain_path = self.templates_dir / "BASE_TOOLCHAIN.md"
+            if not base_toolchain_path.exists():
+                return None
+            self._documented_vars = self.parse_template(base_toolchain_path).variables
+        return self._documented_vars
+
+    def include_cycles(self) -> List[List[Path]]:
+        """Find INCLUDE cycles among the templates in the dependency graph."""
+        cycles: List[List[Path]] = []
+        state: Dict[Path, int] = {}  # 1 = on the current path, 2 = done
+
+        def visit(path: Path, trail: List[Path]) -> None:
+            state[path] = 1
+            trail.append(path)
+            parsed = self.graph.get(path)
+            for include in parsed.includes if parsed else []:
+                target = self.templates_dir / include
+                if state.get(target) == 1:
+                    cycles.append(trail[trail.index(target):] + [target])
+                elif target not in state and target in self.graph:
+                    visit(target, trail)
+            trail.pop()
+            state[path] = 2
+
+        for path in list(self.graph):
+            if path not in state:
+                visit(path, [])
+        return cycles
+
+    def _validate_syntax(self, template_path: Path, content: str) -> List[ValidationResult]:
         """Validate template syntax."""
+        results: List[ValidationResult] = []
         lines = content.split('\n')
 
         # Check variable syntax
@@ -106,7 +302,7 @@ class TemplateValidator:
             for match in self.VARIABLE_PATTERN.finditer(line):
                 var_name = match.group(1)
                 if not self._is_valid_identifier(var_name):
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="syntax",
                         passed=False,
@@ -114,7 +310,7 @@ class TemplateValidator:
                         line_number=i
                     ))
                 else:
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="syntax",
                         passed=True,
@@ -133,7 +329,7 @@ class TemplateValidator:
             # Check for IF block ends
             for _ in self.IF_BLOCK_END.finditer(line):
                 if not if_stack:
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="syntax",
                         passed=False,
@@ -146,7 +342,7 @@ class TemplateValidator:
         # Check for unclosed IF blocks
         if if_stack:
             for line_num, condition in if_stack:
-                self.report.add_result(ValidationResult(
+                results.append(ValidationResult(
                     file_path=str(template_path),
                     check_type="syntax",
                     passed=False,
@@ -154,29 +350,33 @@ class TemplateValidator:
                     line_number=line_num
                 ))
         else:
-            self.report.add_result(ValidationResult(
+            results.append(ValidationResult(
                 file_path=str(template_path),
                 check_type="syntax",
                 passed=True,
                 message="All IF blocks properly closed"
             ))
 
-    def _validate_cross_references(self, template_path: Path, content: str) -> None:
-        """Validate cross-references in template."""
+        return results
+
+    def _validate_cross_references(self, parsed: ParsedTemplate) -> List[ValidationResult]:
+        """Validate cross-references in template against the dependency graph."""
+        template_path = parsed.path
+        results: List[ValidationResult] = []
+
         # Check INCLUDE references
-        for match in self.INCLUDE_PATTERN.finditer(content):
-            include_path = match.group(1).strip()
+        for include_path in parsed.includes:
             full_path = self.templates_dir / include_path
 
-            if not full_path.exists():
-                self.report.add_result(ValidationResult(
+            if not self._file_exists(full_path):
+                results.append(ValidationResult(
                     file_path=str(template_path),
                     check_type="cross-reference",
                     passed=False,
                     message=f"INCLUDE file not found: {include_path}"
                 ))
             else:
-                self.report.add_result(ValidationResult(
+                results.append(ValidationResult(
                     file_path=str(template_path),
                     check_type="cross-reference",
                     passed=True,
@@ -184,15 +384,12 @@ class TemplateValidator:
                 ))
 
         # Check BASE_TOOLCHAIN.md variable documentation
-        base_toolchain_path = self.templates_dir / "BASE_TOOLCHAIN.md"
-        if base_toolchain_path.exists():
-            base_content = base_toolchain_path.read_text(encoding='utf-8')
-            template_vars = set(self.VARIABLE_PATTERN.findall(content))
-            documented_vars = set(self.VARIABLE_PATTERN.findall(base_content))
-
-            for var in template_vars:
+        documented_vars = self._documented_variables()
+        if documented_vars is not None:
+            base_toolchain_path = self.templates_dir / "BASE_TOOLCHAIN.md"
+            for var in parsed.variables:
                 if var not in documented_vars and template_path != base_toolchain_path:
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="cross-reference",
                         passed=False,
@@ -200,34 +397,35 @@ class TemplateValidator:
                     ))
 
         # Check checklist references
-        checklist_pattern = re.compile(r'checklists/([^\s\)]+\.json)')
-        for match in checklist_pattern.finditer(content):
-            checklist_file = match.group(1)
+        for checklist_file in parsed.checklists:
             checklist_path = self.checklists_dir / checklist_file
 
-            if not checklist_path.exists():
-                self.report.add_result(ValidationResult(
+            if not self._file_exists(checklist_path):
+                results.append(ValidationResult(
                     file_path=str(template_path),
                     check_type="cross-reference",
                     passed=False,
                     message=f"Checklist not found: {checklist_file}"
                 ))
             else:
-                self.report.add_result(ValidationResult(
+                results.append(ValidationResult(
                     file_path=str(template_path),
                     check_type="cross-reference",
                     passed=True,
                     message=f"Checklist exists: {checklist_file}"
                 ))
 
-    def _validate_content(self, template_path: Path, content: str) -> None:
+        return results
+
+    def _validate_content(self, template_path: Path, content: str) -> List[ValidationResult]:
         """Validate template content structure."""
+        results: List[ValidationResult] = []
         # Check for required sections in main templates
         if template_path.name not in ["BASE_TOOLCHAIN.md"]:
             required_sections = ["Quick Reference", "Variable Substitutions"]
             for section in required_sections:
                 if section in content:
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="content",
                         passed=True,
@@ -235,7 +433,7 @@ class TemplateValidator:
                     ))
                 else:
                     # Only warn, not fail, as not all templates need all sections
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="content",
                         passed=True,
@@ -252,14 +450,14 @@ class TemplateValidator:
 
                 # Basic validation - action should have org/repo format
                 if '/' not in action_name:
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="content",
                         passed=False,
                         message=f"Invalid GitHub Action format: {action_name}"
                     ))
                 else:
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(template_path),
                         check_type="content",
                         passed=True,
@@ -274,47 +472,52 @@ class TemplateValidator:
 
         for old_pattern, new_pattern, message in deprecated_patterns:
             if re.search(old_pattern, content):
-                self.report.add_result(ValidationResult(
+                results.append(ValidationResult(
                     file_path=str(template_path),
                     check_type="content",
                     passed=False,
                     message=f"Deprecated pattern found: {message}"
                 ))
 
+        return results
+
     def validate_checklist(self, checklist_path: Path) -> None:
         """Validate JSON checklist file."""
+        for result in self._check_checklist(checklist_path):
+            self.report.add_result(result)
+
+    def _validate_checklist_data(self, checklist_path: Path, raw: bytes) -> List[ValidationResult]:
+        """Validate the schema of a checklist's raw JSON."""
+        results: List[ValidationResult] = []
         try:
-            with open(checklist_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json.loads(raw.decode('utf-8'))
         except json.JSONDecodeError as e:
-            self.report.add_result(ValidationResult(
+            return [ValidationResult(
                 file_path=str(checklist_path),
                 check_type="schema",
                 passed=False,
                 message=f"Invalid JSON: {e}"
-            ))
-            return
+            )]
         except Exception as e:
-            self.report.add_result(ValidationResult(
+            return [ValidationResult(
                 file_path=str(checklist_path),
                 check_type="schema",
                 passed=False,
                 message=f"Failed to read file: {e}"
-            ))
-            return
+            )]
 
         # Validate schema
         required_fields = ["name", "version", "categories", "items"]
         for field_name in required_fields:
             if field_name not in data:
-                self.report.add_result(ValidationResult(
+                results.append(ValidationResult(
                     file_path=str(checklist_path),
                     check_type="schema",
                     passed=False,
                     message=f"Missing required field: {field_name}"
                 ))
             else:
-                self.report.add_result(ValidationResult(
+                results.append(ValidationResult(
                     file_path=str(checklist_path),
                     check_type="schema",
                     passed=True,
@@ -327,7 +530,7 @@ class TemplateValidator:
             for item in data["items"]:
                 # Check required item fields
                 if "id" not in item:
-                    self.report.add_result(ValidationResult(
+                    results.append(ValidationResult(
                         file_path=str(checklist_path),
                         check_type="schema",
                         passed=False,
@@ -336,7 +539,7 @@ class TemplateValidator:
                 else:
                     item_id = item["id"]
                     if item_id in item_ids:
-                        self.report.add_result(ValidationResult(
+                        results.append(ValidationResult(
                             file_path=str(checklist_path),
                             check_type="schema",
                             passed=False,
@@ -348,13 +551,15 @@ class TemplateValidator:
                 if "depends_on" in item:
                     for dep_id in item["depends_on"]:
                         if dep_id not in item_ids:
-                            self.report.add_result(ValidationResult(
+                            results.append(ValidationResult(
                                 file_path=str(checklist_path),
                                 check_type="schema",
                                 passed=False,
                                 message=f"Invalid depends_on reference: {dep_id}"
                             ))
 
+        return results
+
     @staticmethod
     def _is_valid_identifier(name: str) -> bool:
         """Check if name is a valid identifier."""
@@ -433,6 +638,17 @@ def main() -> int:
         type=Path,
         help="Output JSON report to file"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Files validated in parallel"
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="JSON file caching per-file results by content hash between runs"
+    )
     parser.add_argument(
         "--templates-dir",
         type=Path,
@@ -443,7 +659,7 @@ def main() -> int:
     args = parser.parse_args()
 
     # Initialize validator
-    validator = TemplateValidator(args.templates_dir)
+    validator = TemplateValidator(args.templates_dir, workers=args.workers, cache_path=args.cache)
 
     # Run validation
     if args.template:
@@ -464,6 +680,7 @@ def main() -> int:
 
     # Get report
     report = validator.report
+    validator.save_cache()
 
     # Output JSON report if requested
     if args.report:
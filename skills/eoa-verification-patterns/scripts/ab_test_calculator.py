@@ -9,14 +9,23 @@ and effect size calculations using only Python stdlib.
 WHY: Provides rigorous statistical validation for experiments without external dependencies.
 WHY: Adapted from ASO A/B test planning to be universally applicable.
 WHY: Class-based design allows reusable components across different test scenarios.
+WHY batch mode: Release verification compares hundreds of benchmark metrics at once.
+run_batch() evaluates them column-wise (NumPy when installed, a tight stdlib loop
+otherwise) and streams results, instead of one calculator call per comparison.
+WHY sequential mode: Benchmark runs are expensive. SequentialTest consumes
+observations as they arrive and stops as soon as the result is conclusive,
+without the false positive inflation of repeatedly peeking at a fixed test.
 """
 
 import argparse
+import csv
 import json
 import math
+import os
 import sys
 from pathlib import Path
-from typing import Any
+from statistics import NormalDist
+from typing import IO, Any, Iterable, Iterator
 
 # WHY: Import cross-platform utilities for consistency
 SKILLS_DIR = Path(__file__).parent.parent.parent
@@ -24,6 +33,85 @@ sys.path.insert(0, str(SKILLS_DIR / "shared"))
 from cross_platform import atomic_write_json  # type: ignore[import-not-found]  # noqa: E402
 from thresholds import VERIFICATION  # type: ignore[import-not-found]  # noqa: E402
 
+# WHY: NumPy is optional; batch mode falls back to the stdlib without it
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+# WHY: Rows are evaluated in chunks so output streams while memory stays bounded
+BATCH_CHUNK_SIZE = 4096
+
+# WHY: Exact inverse normal CDF from the stdlib for critical values
+STANDARD_NORMAL = NormalDist()
+
+# WHY: Hardcoded t-critical values for common df and alpha=0.05
+# WHY: Source: Standard t-distribution tables
+T_CRITICAL_ALPHA_05 = {
+    1: 12.706,
+    2: 4.303,
+    3: 3.182,
+    4: 2.776,
+    5: 2.571,
+    6: 2.447,
+    7: 2.365,
+    8: 2.306,
+    9: 2.262,
+    10: 2.228,
+    11: 2.201,
+    12: 2.179,
+    13: 2.160,
+    14: 2.145,
+    15: 2.131,
+    16: 2.120,
+    17: 2.110,
+    18: 2.101,
+    19: 2.093,
+    20: 2.086,
+    21: 2.080,
+    22: 2.074,
+    23: 2.069,
+    24: 2.064,
+    25: 2.060,
+    26: 2.056,
+    27: 2.052,
+    28: 2.048,
+    29: 2.045,
+    30: 2.042,
+}
+
+# WHY: Sequential methods - mixture SPRT and Lan-DeMets alpha-spending boundaries
+SEQUENTIAL_METHODS = ("msprt", "obrien-fleming", "pocock")
+
+# WHY: Variance estimates from a handful of observations are too noisy to act on
+SEQUENTIAL_MIN_SAMPLES = 30
+
+# WHY: Result fields flattened for CSV output (confidence interval split in two)
+BATCH_CSV_FIELDS = [
+    "metric",
+    "test_type",
+    "control_rate",
+    "treatment_rate",
+    "control_mean",
+    "treatment_mean",
+    "difference",
+    "z_statistic",
+    "t_statistic",
+    "degrees_of_freedom",
+    "p_value",
+    "ci_lower",
+    "ci_upper",
+    "cohens_h",
+    "cohens_d",
+    "significant",
+    "alpha",
+    "recommendation",
+    "error",
+]
+
 
 class ABTestCalculator:
     """
@@ -82,73 +170,21 @@ class ABTestCalculator:
 
     def _z_score(self, confidence: float) -> float:
         """
-        Calculate z-score for given confidence level using inverse normal CDF.
+        Calculate z-score for given cumulative probability using inverse normal CDF.
 
-        WHY: Z-scores are fundamental to hypothesis testing but not in stdlib.
-        WHY: Approximation using Taylor series is accurate enough for our purposes.
+        WHY: Callers pass the one-sided quantile they need (1 - alpha/2 for a
+        two-tailed critical value, power for Z_beta), so this must be the plain
+        inverse CDF rather than a two-sided critical value lookup.
+        WHY NormalDist: statistics.NormalDist.inv_cdf is exact to double precision
+        and in the stdlib.
 
         Args:
-            confidence: Confidence level (e.g., 0.95 for 95% confidence)
+            confidence: Cumulative probability (e.g., 0.975 for the two-tailed 95% critical value)
 
         Returns:
-            Z-score corresponding to confidence level
-        """
-        # WHY: Common z-scores hardcoded for speed and accuracy
-        z_scores = {
-            0.80: 1.282,
-            0.85: 1.440,
-            0.90: 1.645,
-            0.95: 1.960,
-            0.975: 2.240,
-            0.99: 2.576,
-            0.995: 2.807,
-        }
-
-        if confidence in z_scores:
-            return z_scores[confidence]
-
-        # WHY: For non-standard confidence levels, use approximation
-        # WHY: This is the Beasley-Springer-Moro algorithm approximation
-        p = confidence
-        if p > 0.5:
-            p = 1 - p
-
-        # WHY: Coefficients from Beasley-Springer-Moro approximation
-        a = [2.50662823884, -18.61500062529, 41.39119773534, -25.44106049637]
-        b = [-8.47351093090, 23.08336743743, -21.06224101826, 3.13082909833]
-        c = [
-            0.3374754822726147,
-            0.9761690190917186,
-            0.1607979714918209,
-            0.0276438810333863,
-            0.0038405729373609,
-            0.0003951896511919,
-            0.0000321767881768,
-            0.0000002888167364,
-            0.0000003960315187,
-        ]
-
-        y = p - 0.5
-        r = y * y
-
-        if abs(y) < 0.42:
-            # WHY: Central region approximation
-            z = (
-                y
-                * (((a[3] * r + a[2]) * r + a[1]) * r + a[0])
-                / ((((b[3] * r + b[2]) * r + b[1]) * r + b[0]) * r + 1)
-            )
-        else:
-            # WHY: Tail region approximation
-            r = p if y < 0 else 1 - p
-            r = math.log(-math.log(r))
-            z = c[0]
-            for i in range(1, len(c)):
-                z += c[i] * (r**i)
-            if y < 0:
-                z = -z
-
-        return abs(z) if confidence > 0.5 else z
+            Z-score whose standard normal CDF equals confidence
+        """
+        return STANDARD_NORMAL.inv_cdf(confidence)
 
     def _t_critical(self, df: int, alpha: float) -> float:
         """
@@ -168,43 +204,8 @@ class ABTestCalculator:
         if df > 30:
             return self._z_score(1 - alpha / 2)
 
-        # WHY: Hardcoded t-critical values for common df and alpha=0.05
-        # WHY: Source: Standard t-distribution tables
-        t_table = {
-            1: 12.706,
-            2: 4.303,
-            3: 3.182,
-            4: 2.776,
-            5: 2.571,
-            6: 2.447,
-            7: 2.365,
-            8: 2.306,
-            9: 2.262,
-            10: 2.228,
-            11: 2.201,
-            12: 2.179,
-            13: 2.160,
-            14: 2.145,
-            15: 2.131,
-            16: 2.120,
-            17: 2.110,
-            18: 2.101,
-            19: 2.093,
-            20: 2.086,
-            21: 2.080,
-            22: 2.074,
-            23: 2.069,
-            24: 2.064,
-            25: 2.060,
-            26: 2.056,
-            27: 2.052,
-            28: 2.048,
-            29: 2.045,
-            30: 2.042,
-        }
-
         if abs(alpha - 0.05) < 0.001:  # WHY: alpha ≈ 0.05
-            return t_table.get(df, self._z_score(1 - alpha / 2))
+            return T_CRITICAL_ALPHA_05.get(df, self._z_score(1 - alpha / 2))
 
         # WHY: For other alpha values, use z-score approximation
         return self._z_score(1 - alpha / 2)
@@ -275,11 +276,23 @@ class ABTestCalculator:
             treatment = {"values": [150], "n": 1000}  # 15% conversion
         """
         # WHY: Extract raw counts from input format
-        control_successes = sum(control["values"])
-        control_n = control["n"]
-        treatment_successes = sum(treatment["values"])
-        treatment_n = treatment["n"]
+        self.results = self._proportion_stats(
+            sum(control["values"]),
+            control["n"],
+            sum(treatment["values"]),
+            treatment["n"],
+        )
+        return self.results
+
+    def _proportion_stats(
+        self, control_successes: float, control_n: float, treatment_successes: float, treatment_n: float
+    ) -> dict[str, Any]:
+        """
+        Compute the proportion test from success counts.
 
+        WHY: Shared by run_proportion_test and the stdlib batch path so both
+        produce identical numbers.
+        """
         # WHY: Calculate sample proportions
         p1 = control_successes / control_n
         p2 = treatment_successes / treatment_n
@@ -308,8 +321,7 @@ class ABTestCalculator:
         # WHY: Determine statistical significance
         significant = p_value < self.alpha
 
-        # WHY: Store results for interpretation
-        self.results = {
+        return {
             "test_type": "proportion_test",
             "control_rate": p1,
             "treatment_rate": p2,
@@ -321,12 +333,10 @@ class ABTestCalculator:
             "significant": significant,
             "alpha": self.alpha,
             "recommendation": self._make_recommendation(
-                significant, effect_size, p_value
+                significant, effect_size, p_value, "proportion_test"
             ),
         }
 
-        return self.results
-
     def run_mean_test(
         self, control: dict[str, Any], treatment: dict[str, Any]
     ) -> dict[str, Any]:
@@ -348,6 +358,9 @@ class ABTestCalculator:
 
         n1 = len(control_values)
         n2 = len(treatment_values)
+        # WHY: Sample variance is undefined for a single value
+        if n1 < 2 or n2 < 2:
+            raise ValueError(f"Mean test needs at least 2 values per group, got {n1} and {n2}")
 
         # WHY: Calculate sample means
         mean1 = sum(control_values) / n1
@@ -357,6 +370,18 @@ class ABTestCalculator:
         var1 = sum((x - mean1) ** 2 for x in control_values) / (n1 - 1)
         var2 = sum((x - mean2) ** 2 for x in treatment_values) / (n2 - 1)
 
+        self.results = self._mean_stats(mean1, var1, n1, mean2, var2, n2)
+        return self.results
+
+    def _mean_stats(
+        self, mean1: float, var1: float, n1: int, mean2: float, var2: float, n2: int
+    ) -> dict[str, Any]:
+        """
+        Compute the pooled t-test from summary statistics.
+
+        WHY: Batch inputs carry mean/std/n per group rather than raw observations;
+        sharing this with run_mean_test keeps both paths identical.
+        """
         # WHY: Pooled standard deviation (assumes equal variances)
         sp = math.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
 
@@ -384,8 +409,7 @@ class ABTestCalculator:
         # WHY: Determine statistical significance
         significant = p_value < self.alpha
 
-        # WHY: Store results for interpretation
-        self.results = {
+        return {
             "test_type": "mean_test",
             "control_mean": mean1,
             "treatment_mean": mean2,
@@ -398,12 +422,10 @@ class ABTestCalculator:
             "significant": significant,
             "alpha": self.alpha,
             "recommendation": self._make_recommendation(
-                significant, effect_size, p_value
+                significant, effect_size, p_value, "mean_test"
             ),
         }
 
-        return self.results
-
     def get_confidence_interval(
         self, data: dict[str, Any], confidence: float = 0.95
     ) -> tuple[float, float]:
@@ -422,6 +444,8 @@ class ABTestCalculator:
         """
         values = data["values"]
         n = len(values)
+        if n < 2:
+            raise ValueError(f"Confidence interval needs at least 2 values, got {n}")
 
         # WHY: Calculate sample mean
         mean = sum(values) / n
@@ -436,8 +460,8 @@ class ABTestCalculator:
         # WHY: Critical value depends on sample size
         df = n - 1
         if n > 30:
-            # WHY: Large sample: use z-score
-            critical = self._z_score(confidence)
+            # WHY: Large sample: use two-tailed z-score
+            critical = self._z_score(1 - (1 - confidence) / 2)
         else:
             # WHY: Small sample: use t-score
             alpha = 1 - confidence
@@ -504,11 +528,9 @@ class ABTestCalculator:
         # WHY: Absolute value for two-tailed test
         t = abs(t)
 
-        # WHY: Hill's approximation for t-distribution CDF
-        # WHY: Accurate for practical purposes (error < 0.005)
+        # WHY: Student t tail via the incomplete beta function:
+        # P(T > t) = I_x(df/2, 1/2) / 2 with x = df / (df + t^2)
         x = df / (df + t * t)
-
-        # WHY: Incomplete beta function approximation
         p = 0.5 * self._beta_cdf(x, df / 2.0, 0.5)
 
         # WHY: Two-tailed p-value
@@ -516,10 +538,10 @@ class ABTestCalculator:
 
     def _beta_cdf(self, x: float, a: float, b: float) -> float:
         """
-        Approximate cumulative distribution function of beta distribution.
+        Regularized incomplete beta function I_x(a, b).
 
         WHY: Beta CDF is used in t-distribution calculation.
-        WHY: No stdlib implementation available.
+        WHY: No stdlib implementation available; math.lgamma gives the prefactor.
 
         Args:
             x: Value at which to evaluate CDF
@@ -527,17 +549,31 @@ class ABTestCalculator:
             b: Second shape parameter
 
         Returns:
-            Approximate CDF value
+            CDF value
         """
-        # WHY: Simple approximation for t-test purposes
-        # WHY: More accurate methods require gamma function
         if x <= 0:
             return 0.0
         if x >= 1:
             return 1.0
 
-        # WHY: Use continued fraction approximation
-        # WHY: Lentz's algorithm for incomplete beta function
+        # WHY: Prefactor x^a (1-x)^b / B(a, b), in logs to avoid overflow
+        front = math.exp(
+            math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+            + a * math.log(x) + b * math.log(1.0 - x)
+        )
+        # WHY: The continued fraction converges fast only below (a+1)/(a+b+2);
+        # above it use the symmetry I_x(a, b) = 1 - I_{1-x}(b, a)
+        if x < (a + 1.0) / (a + b + 2.0):
+            return front * self._beta_fraction(x, a, b) / a
+        return 1.0 - front * self._beta_fraction(1.0 - x, b, a) / b
+
+    @staticmethod
+    def _beta_fraction(x: float, a: float, b: float) -> float:
+        """
+        Continued fraction for the incomplete beta function.
+
+        WHY: Lentz's algorithm, as in Numerical Recipes betacf.
+        """
         eps = 1e-10
         z = a + b
         c = 1.0
@@ -636,8 +672,244 @@ class ABTestCalculator:
 
         return (diff - margin, diff + margin)
 
+    # ==========================================================================
+    # BATCH MODE
+    # ==========================================================================
+
+    def run_batch(
+        self, rows: Iterable[dict[str, Any]], backend: str = "auto"
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Evaluate many control/treatment comparisons and stream the results.
+
+        WHY: Evaluating hundreds of benchmark metrics one calculator call at a
+        time spends most of its time in per-call Python overhead. Rows are
+        grouped by test type per chunk and evaluated column-wise.
+        WHY input order: Results come back in the order rows were given, so
+        they can be joined back to the input without keys.
+
+        Args:
+            rows: Comparison rows (see parse_batch_row for accepted fields)
+            backend: "numpy", "stdlib", or "auto" (NumPy when installed)
+
+        Yields:
+            One result dict per row, with "metric" and either the test
+            results or an "error" message
+        """
+        use_numpy = _resolve_backend(backend)
+        chunk: list[dict[str, Any]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= BATCH_CHUNK_SIZE:
+                yield from self._evaluate_chunk(chunk, use_numpy)
+                chunk = []
+        if chunk:
+            yield from self._evaluate_chunk(chunk, use_numpy)
+
+    def _evaluate_chunk(
+        self, chunk: list[dict[str, Any]], use_numpy: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluate one chunk of batch rows, preserving input order.
+
+        WHY: Invalid rows become error records instead of aborting the batch.
+        """
+        results: list[dict[str, Any]] = [{} for _ in chunk]
+        groups: dict[str, list[tuple[int, str, tuple[float, ...]]]] = {
+            "proportion": [],
+            "mean": [],
+        }
+        for position, row in enumerate(chunk):
+            metric = str(row.get("metric") or row.get("name") or f"row-{position}")
+            try:
+                kind, stats = parse_batch_row(row)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+                results[position] = {"metric": metric, "error": f"{type(e).__name__}: {e}"}
+                continue
+            groups[kind].append((position, metric, stats))
+
+        if use_numpy:
+            evaluated = self._numpy_proportion_stats(
+                [stats for _, _, stats in groups["proportion"]]
+            ) + self._numpy_mean_stats([stats for _, _, stats in groups["mean"]])
+        else:
+            # WHY: Same helpers as the single-test methods, with no per-row setup
+            proportion_stats = self._proportion_stats
+            mean_stats = self._mean_stats
+            evaluated = [proportion_stats(*stats) for _, _, stats in groups["proportion"]]
+            evaluated += [mean_stats(*stats) for _, _, stats in groups["mean"]]
+
+        for (position, metric, _), result in zip(
+            groups["proportion"] + groups["mean"], evaluated
+        ):
+            results[position] = {"metric": metric, **result}
+        return results
+
+    def _numpy_proportion_stats(
+        self, rows: list[tuple[float, ...]]
+    ) -> list[dict[str, Any]]:
+        """
+        Vectorized equivalent of _proportion_stats.
+
+        WHY: Same formulas and evaluation order, applied to whole columns.
+        """
+        if not rows:
+            return []
+        s1, n1, s2, n2 = (np.asarray(col, dtype=float) for col in zip(*rows))
+        p1 = s1 / n1
+        p2 = s2 / n2
+        p_pooled = (s1 + s2) / (n1 + n2)
+        se = np.sqrt(p_pooled * (1 - p_pooled) * (1 / n1 + 1 / n2))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_stat = np.where(se > 0, (p2 - p1) / se, 0.0)
+        p_value = _np_z_to_p_value(z_stat)
+        margin = self._z_score(1 - self.alpha / 2) * np.sqrt(
+            p1 * (1 - p1) / n1 + p2 * (1 - p2) / n2
+        )
+        diff = p2 - p1
+        cohens_h = 2 * (np.arcsin(np.sqrt(p2)) - np.arcsin(np.sqrt(p1)))
+        significant = p_value < self.alpha
+
+        results = []
+        for i in range(len(rows)):
+            effect = float(diff[i])
+            p = float(p_value[i])
+            sig = bool(significant[i])
+            results.append(
+                {
+                    "test_type": "proportion_test",
+                    "control_rate": float(p1[i]),
+                    "treatment_rate": float(p2[i]),
+                    "difference": effect,
+                    "z_statistic": float(z_stat[i]),
+                    "p_value": p,
+                    "confidence_interval": (effect - float(margin[i]), effect + float(margin[i])),
+                    "cohens_h": float(cohens_h[i]),
+                    "significant": sig,
+                    "alpha": self.alpha,
+                    "recommendation": self._make_recommendation(sig, effect, p, "proportion_test"),
+                }
+            )
+        return results
+
+    def _numpy_mean_stats(self, rows: list[tuple[float, ...]]) -> list[dict[str, Any]]:
+        """
+        Vectorized equivalent of _mean_stats.
+
+        WHY: Same formulas and evaluation order, applied to whole columns.
+        """
+        if not rows:
+            return []
+        mean1, var1, n1, mean2, var2, n2 = (np.asarray(col, dtype=float) for col in zip(*rows))
+        sp = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+        se = sp * np.sqrt(1 / n1 + 1 / n2)
+        diff = mean2 - mean1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_stat = np.where(se > 0, diff / se, 0.0)
+            cohens_d = np.where(sp > 0, diff / sp, 0.0)
+        df = (n1 + n2 - 2).astype(int)
+        p_value = _np_t_to_p_value(t_stat, df)
+
+        # WHY: Critical values mirror _t_critical: table for small df at alpha=0.05
+        z_critical = self._z_score(1 - self.alpha / 2)
+        critical = np.full(len(rows), z_critical)
+        if abs(self.alpha - 0.05) < 0.001:
+            table = np.array([z_critical] + [T_CRITICAL_ALPHA_05[k] for k in range(1, 31)])
+            small = df <= 30
+            critical[small] = table[df[small]]
+        margin = critical * se
+        significant = p_value < self.alpha
+
+        results = []
+        for i in range(len(rows)):
+            effect = float(diff[i])
+            p = float(p_value[i])
+            sig = bool(significant[i])
+            results.append(
+                {
+                    "test_type": "mean_test",
+                    "control_mean": float(mean1[i]),
+                    "treatment_mean": float(mean2[i]),
+                    "difference": effect,
+                    "t_statistic": float(t_stat[i]),
+                    "degrees_of_freedom": int(df[i]),
+                    "p_value": p,
+                    "confidence_interval": (effect - float(margin[i]), effect + float(margin[i])),
+                    "cohens_d": float(cohens_d[i]),
+                    "significant": sig,
+                    "alpha": self.alpha,
+                    "recommendation": self._make_recommendation(sig, effect, p, "mean_test"),
+                }
+            )
+        return results
+
+    def sample_size_grid(
+        self,
+        baseline_rates: list[float],
+        mdes: list[float] | None = None,
+        powers: list[float] | None = None,
+        backend: str = "auto",
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Calculate required sample sizes over a grid of rates, MDEs and powers.
+
+        WHY: Power-curve sweeps evaluate the sample size formula thousands of
+        times; only the z-scores need the per-value approximation, the rest is
+        one vectorized expression.
+
+        Args:
+            baseline_rates: Expected control proportions (0-1)
+            mdes: Minimum detectable effects (default: current mde)
+            powers: Statistical powers (default: current power)
+            backend: "numpy", "stdlib", or "auto"
+
+        Yields:
+            One dict per (rate, mde, power) combination, rate-major order
+
+        Raises:
+            ValueError: If any grid value is outside (0, 1)
+        """
+        mdes = mdes or [self.mde]
+        powers = powers or [self.power]
+        for name, values in (("Baseline rate", baseline_rates), ("MDE", mdes), ("Power", powers)):
+            for value in values:
+                if not 0 < value < 1:
+                    raise ValueError(f"{name} must be between 0 and 1, got {value}")
+
+        # WHY: Two-tailed test requires alpha/2
+        z_alpha = self._z_score(1 - self.alpha / 2)
+        z_betas = [self._z_score(power) for power in powers]
+
+        if _resolve_backend(backend):
+            p = np.asarray(baseline_rates, dtype=float)[:, None, None]
+            m = np.asarray(mdes, dtype=float)[None, :, None]
+            z_beta = np.asarray(z_betas, dtype=float)[None, None, :]
+            sizes = np.ceil(2 * ((z_alpha + z_beta) ** 2) * (p * (1 - p)) / (m**2)).astype(int)
+            lookup = sizes.tolist()
+        else:
+            lookup = [
+                [
+                    [math.ceil(2 * ((z_alpha + zb) ** 2) * (rate * (1 - rate)) / (mde**2)) for zb in z_betas]
+                    for mde in mdes
+                ]
+                for rate in baseline_rates
+            ]
+
+        for i, rate in enumerate(baseline_rates):
+            for j, mde in enumerate(mdes):
+                for k, power in enumerate(powers):
+                    n = int(lookup[i][j][k])
+                    yield {
+                        "baseline_rate": rate,
+                        "mde": mde,
+                        "power": power,
+                        "alpha": self.alpha,
+                        "required_sample_size_per_group": n,
+                        "total_required_sample_size": 2 * n,
+                    }
+
     def _make_recommendation(
-        self, significant: bool, effect_size: float, p_value: float
+        self, significant: bool, effect_size: float, p_value: float, test_type: str | None = None
     ) -> str:
         """
         Generate human-readable interpretation of results.
@@ -649,6 +921,7 @@ class ABTestCalculator:
             significant: Whether result is statistically significant
             effect_size: Magnitude of difference
             p_value: Probability under null hypothesis
+            test_type: Test the result belongs to (default: last stored result)
 
         Returns:
             Recommendation string
@@ -661,7 +934,7 @@ class ABTestCalculator:
             )
 
         # WHY: Significant result requires effect size interpretation
-        effect_interpretation = self._interpret_effect_size(effect_size)
+        effect_interpretation = self._interpret_effect_size(effect_size, test_type)
 
         direction = "increase" if effect_size > 0 else "decrease"
 
@@ -671,7 +944,7 @@ class ABTestCalculator:
             f"Recommendation: Consider implementing treatment if effect is practically meaningful for your use case."
         )
 
-    def _interpret_effect_size(self, effect: float) -> str:
+    def _interpret_effect_size(self, effect: float, test_type: str | None = None) -> str:
         """
         Interpret effect size magnitude using Cohen's guidelines.
 
@@ -680,6 +953,7 @@ class ABTestCalculator:
 
         Args:
             effect: Effect size (raw or standardized)
+            test_type: Test the effect belongs to (default: last stored result)
 
         Returns:
             Interpretation string
@@ -687,8 +961,12 @@ class ABTestCalculator:
         # WHY: Use absolute value for magnitude
         abs_effect = abs(effect)
 
+        # WHY: Explicit test type; self.results is not yet set while a test builds it
+        if test_type is None:
+            test_type = str(self.results.get("test_type", ""))
+
         # WHY: For proportions, use percentage point interpretation
-        if "proportion_test" in str(self.results.get("test_type", "")):
+        if "proportion_test" in test_type:
             pct = abs_effect * 100
             if pct < 1:
                 return f"very small ({pct:.2f} percentage points)"
@@ -828,6 +1106,613 @@ class ABTestCalculator:
         return "\n".join(interpretation)
 
 
+# ==============================================================================
+# SEQUENTIAL TESTING
+# ==============================================================================
+
+
+class SequentialTest:
+    """
+    Streaming sequential A/B test with early stopping.
+
+    WHY: Fixed-horizon tests must run to the planned sample size even when the
+    answer is clear early, and peeking at them repeatedly inflates false
+    positives. A sequential test is designed to be looked at as data arrives.
+    WHY O(1) updates: Each observation updates running count/mean/M2 per group
+    (Welford's algorithm), so no observations are stored and every update
+    costs the same regardless of how long the test has been running.
+
+    Methods:
+        msprt: Mixture sequential probability ratio test. Evaluated after every
+            observation; its always-valid p-value may be checked continuously.
+        obrien-fleming / pocock: Group sequential test with Lan-DeMets
+            alpha-spending, evaluated at `looks` equally spaced interim
+            analyses up to `max_samples` per group.
+    """
+
+    def __init__(
+        self,
+        calculator: ABTestCalculator | None = None,
+        test_type: str = "proportion",
+        method: str = "msprt",
+        max_samples: int | None = None,
+        looks: int = 5,
+        min_samples: int = SEQUENTIAL_MIN_SAMPLES,
+        mixing_sd: float | None = None,
+    ) -> None:
+        """
+        Create a sequential test.
+
+        WHY: Alpha and MDE come from the calculator so sequential and
+        fixed-horizon runs of the same experiment share their parameters.
+
+        Args:
+            calculator: Source of alpha and MDE (default: shared thresholds)
+            test_type: "proportion" (0/1 observations) or "mean"
+            method: "msprt", "obrien-fleming" or "pocock"
+            max_samples: Per-group sample size at which the test stops
+                (required for group sequential methods, optional for msprt)
+            looks: Number of interim analyses for group sequential methods
+            min_samples: Per-group observations before any decision is made
+            mixing_sd: mSPRT prior scale on the difference (default: MDE for
+                proportions, MDE x |control mean| for means)
+
+        Raises:
+            ValueError: If parameters are outside valid ranges
+        """
+        if test_type not in ("proportion", "mean"):
+            raise ValueError(f"Unknown test type: {test_type}")
+        if method not in SEQUENTIAL_METHODS:
+            raise ValueError(
+                f"Unknown sequential method: {method} (choose from {', '.join(SEQUENTIAL_METHODS)})"
+            )
+        if method != "msprt" and not max_samples:
+            raise ValueError(f"{method} boundaries require max_samples per group")
+        if max_samples is not None and max_samples < 2:
+            raise ValueError(f"max_samples must be at least 2, got {max_samples}")
+        if looks < 1:
+            raise ValueError(f"looks must be at least 1, got {looks}")
+        if min_samples < 2:
+            raise ValueError(f"min_samples must be at least 2, got {min_samples}")
+        if mixing_sd is not None and mixing_sd <= 0:
+            raise ValueError(f"mixing_sd must be positive, got {mixing_sd}")
+
+        self.calculator = calculator or ABTestCalculator()
+        self.alpha = self.calculator.alpha
+        self.test_type = test_type
+        self.method = method
+        self.max_samples = max_samples
+        self.looks = looks
+        self.min_samples = min_samples
+        self.mixing_sd = mixing_sd
+
+        # WHY: Index 0 = control, 1 = treatment
+        self._n = [0, 0]
+        self._mean = [0.0, 0.0]
+        self._m2 = [0.0, 0.0]
+
+        self._look = 0
+        self._spent = 0.0
+        self._boundary: float | None = None
+        self._tau2: float | None = None
+        self._p_value = 1.0
+        self._z = 0.0
+        self._outcome: str | None = None
+
+    @property
+    def stopped(self) -> bool:
+        """True once the test has reached a final decision."""
+        return self._outcome is not None
+
+    def update(self, group: str, value: float) -> dict[str, Any]:
+        """
+        Add one observation and return the current decision.
+
+        WHY: Observations after a stop are ignored so the reported decision
+        stays the one the stopping rule produced.
+
+        Args:
+            group: "control" or "treatment"
+            value: Observation (0 or 1 for proportion tests)
+
+        Returns:
+            Decision dict (see decision())
+
+        Raises:
+            ValueError: If the group or value is invalid
+        """
+        if self._outcome is not None:
+            return self.decision()
+        if group == "control":
+            i = 0
+        elif group == "treatment":
+            i = 1
+        else:
+            raise ValueError(f"Group must be 'control' or 'treatment', got {group!r}")
+        if self.test_type == "proportion" and value not in (0, 1):
+            raise ValueError(f"Proportion observations must be 0 or 1, got {value}")
+
+        # WHY: Welford update keeps mean and variance numerically stable
+        n = self._n[i] + 1
+        delta = value - self._mean[i]
+        self._mean[i] += delta / n
+        self._m2[i] += delta * (value - self._mean[i])
+        self._n[i] = n
+
+        if min(self._n) >= self.min_samples:
+            if self.method == "msprt":
+                self._evaluate_msprt()
+            else:
+                self._evaluate_group_sequential()
+        return self.decision()
+
+    def _variances(self) -> tuple[float, float]:
+        """
+        Per-observation variance of each group.
+
+        WHY: Bernoulli variance p(1-p) for proportions matches the unpooled
+        standard error used by run_proportion_test; sample variance for means.
+        """
+        if self.test_type == "proportion":
+            return (
+                self._mean[0] * (1 - self._mean[0]),
+                self._mean[1] * (1 - self._mean[1]),
+            )
+        return (self._m2[0] / (self._n[0] - 1), self._m2[1] / (self._n[1] - 1))
+
+    def _difference_variance(self) -> float:
+        """Variance of the treatment - control difference at the current counts."""
+        var_c, var_t = self._variances()
+        return var_c / self._n[0] + var_t / self._n[1]
+
+    def _evaluate_msprt(self) -> None:
+        """
+        Update the always-valid p-value after an observation.
+
+        WHY: The mixture likelihood ratio of a normal prior N(0, tau^2) on the
+        difference against the null is a martingale under H0, so rejecting when
+        it exceeds 1/alpha bounds the false positive rate by alpha no matter
+        how often it is checked (Johari et al., "Always Valid Inference").
+        """
+        v = self._difference_variance()
+        if v <= 0:
+            # WHY: All observations identical so far - nothing to test yet
+            return
+        diff = self._mean[1] - self._mean[0]
+        self._z = diff / math.sqrt(v)
+
+        if self._tau2 is None:
+            # WHY: Fixed once so the mixture does not adapt to the data seen later
+            if self.mixing_sd is not None:
+                tau = self.mixing_sd
+            elif self.test_type == "proportion":
+                tau = self.calculator.mde
+            else:
+                tau = self.calculator.mde * abs(self._mean[0]) or math.sqrt(v * self._n[0])
+            self._tau2 = tau * tau
+
+        tau2 = self._tau2
+        log_lr = 0.5 * math.log(v / (v + tau2)) + tau2 * diff * diff / (2 * v * (v + tau2))
+        if log_lr > 0:
+            self._p_value = min(self._p_value, math.exp(-log_lr))
+
+        if self._p_value <= self.alpha:
+            self._outcome = "treatment_better" if diff > 0 else "control_better"
+        elif self.max_samples and min(self._n) >= self.max_samples:
+            self._outcome = "no_difference"
+
+    def _spending(self, fraction: float) -> float:
+        """
+        Cumulative alpha spent at an information fraction (Lan-DeMets).
+
+        WHY: O'Brien-Fleming spends almost nothing early, keeping the final
+        analysis close to a fixed-horizon test; Pocock spends evenly and stops
+        earlier on large effects at the cost of a stricter final boundary.
+        """
+        if fraction >= 1:
+            return self.alpha
+        if self.method == "pocock":
+            return self.alpha * math.log(1 + (math.e - 1) * fraction)
+        z = self.calculator._z_score(1 - self.alpha / 2)
+        return min(self.alpha, self.calculator._z_to_p_value(z / math.sqrt(fraction)))
+
+    def _evaluate_group_sequential(self) -> None:
+        """
+        Run an interim analysis when the next look is reached.
+
+        WHY nominal levels: Exact group sequential boundaries need numerical
+        integration over the joint distribution of all looks. Testing each look
+        at the alpha newly spent there bounds the overall false positive rate
+        by alpha (union bound) at a small cost in power.
+        """
+        assert self.max_samples is not None
+        n = min(self._n)
+        next_look = self._look + 1
+        if n < math.ceil(next_look * self.max_samples / self.looks):
+            return
+        self._look = next_look
+
+        fraction = min(1.0, n / self.max_samples)
+        cumulative = self._spending(1.0 if next_look == self.looks else fraction)
+        level = max(0.0, cumulative - self._spent)
+        self._spent = cumulative
+        self._boundary = self._p_to_z(level) if level > 0 else None
+
+        v = self._difference_variance()
+        diff = self._mean[1] - self._mean[0]
+        if v > 0:
+            self._z = diff / math.sqrt(v)
+            self._p_value = self.calculator._z_to_p_value(self._z)
+        else:
+            self._z = 0.0
+            self._p_value = 1.0
+
+        if level > 0 and self._p_value <= level:
+            self._outcome = "treatment_better" if diff > 0 else "control_better"
+        elif next_look >= self.looks:
+            self._outcome = "no_difference"
+
+    def _p_to_z(self, p: float) -> float:
+        """
+        Two-sided critical z for a nominal level, by bisection on the p-value.
+
+        WHY: Only reported for the boundary, once per look, so bisection over
+        the calculator's own normal approximation keeps the two consistent.
+        """
+        lo, hi = 0.0, 40.0
+        for _ in range(80):
+            mid = (lo + hi) / 2
+            if self.calculator._z_to_p_value(mid) > p:
+                lo = mid
+            else:
+                hi = mid
+        return hi
+
+    def decision(self) -> dict[str, Any]:
+        """
+        Report the current state of the test.
+
+        Returns:
+            Dict with "status" ("continue" or "stop"), "outcome"
+            ("treatment_better", "control_better", "no_difference" or None),
+            group sizes and means, the test statistic and p-value. For msprt the
+            p-value is always valid; for group sequential methods it is the
+            nominal p-value of the last look, compared against "boundary".
+        """
+        result: dict[str, Any] = {
+            "method": self.method,
+            "test_type": self.test_type,
+            "status": "stop" if self._outcome else "continue",
+            "outcome": self._outcome,
+            "control_n": self._n[0],
+            "treatment_n": self._n[1],
+            "control_mean": self._mean[0],
+            "treatment_mean": self._mean[1],
+            "difference": self._mean[1] - self._mean[0],
+            "z_statistic": self._z,
+            "p_value": self._p_value,
+            "alpha": self.alpha,
+        }
+        if self.method != "msprt":
+            result["look"] = self._look
+            result["looks"] = self.looks
+            result["boundary"] = self._boundary
+        if self.max_samples:
+            result["max_samples"] = self.max_samples
+            result["information_fraction"] = min(1.0, min(self._n) / self.max_samples)
+        return result
+
+    def run(self, observations: Iterable[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Feed observation rows until the test stops or the input ends.
+
+        WHY: Stops reading as soon as a decision is reached - the remaining
+        observations are exactly the runs that early stopping saves.
+
+        Args:
+            observations: Rows with "group" and "value" keys
+
+        Returns:
+            Final decision dict with "observations" (rows consumed) added
+
+        Raises:
+            ValueError: If a row is malformed
+        """
+        count = 0
+        for count, row in enumerate(observations, start=1):
+            try:
+                value = float(row["value"])
+                group = str(row["group"]).strip().lower()
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Observation {count}: needs 'group' and numeric 'value' ({e})") from e
+            try:
+                self.update(group, value)
+            except ValueError as e:
+                raise ValueError(f"Observation {count}: {e}") from e
+            if self.stopped:
+                break
+        result = self.decision()
+        result["observations"] = count
+        return result
+
+
+# ==============================================================================
+# BATCH HELPERS
+# ==============================================================================
+
+
+def _resolve_backend(backend: str) -> bool:
+    """
+    Decide whether to use NumPy for batch evaluation.
+
+    WHY: "auto" silently degrades to the stdlib; an explicit "numpy" request
+    without NumPy installed is an error rather than a silent slowdown.
+    """
+    if backend == "stdlib":
+        return False
+    if backend == "numpy" and not NUMPY_AVAILABLE:
+        raise ValueError("NumPy backend requested but numpy is not installed")
+    return NUMPY_AVAILABLE
+
+
+def _np_z_to_p_value(z: Any) -> Any:
+    """
+    Vectorized ABTestCalculator._z_to_p_value (Abramowitz and Stegun).
+
+    WHY: Same polynomial in the same evaluation order as the scalar helper.
+    """
+    z = np.abs(z)
+    t = 1.0 / (1.0 + 0.2316419 * z)
+    d = 0.3989423 * np.exp(-z * z / 2.0)
+    p = (
+        d
+        * t
+        * (
+            0.3193815
+            + t * (-0.3565638 + t * (1.781478 + t * (-1.821256 + t * 1.330274)))
+        )
+    )
+    return 2.0 * p
+
+
+def _np_beta_cdf(x: Any, a: Any, b: float) -> Any:
+    """
+    Vectorized ABTestCalculator._beta_cdf (regularized incomplete beta).
+
+    WHY: Both continued fractions are evaluated for every element and the one
+    the scalar helper would use is selected, so results match it exactly.
+    """
+    lgamma = np.vectorize(math.lgamma, otypes=[float])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        front = np.exp(
+            lgamma(a + b) - lgamma(a) - lgamma(b) + a * np.log(x) + b * np.log(1.0 - x)
+        )
+        lower = front * _np_beta_fraction(x, a, b) / a
+        upper = 1.0 - front * _np_beta_fraction(1.0 - x, b, a) / b
+    h = np.where(x < (a + 1.0) / (a + b + 2.0), lower, upper)
+    h = np.where(x <= 0, 0.0, h)
+    return np.where(x >= 1, 1.0, h)
+
+
+def _np_beta_fraction(x: Any, a: Any, b: Any) -> Any:
+    """
+    Vectorized ABTestCalculator._beta_fraction (Lentz continued fraction).
+
+    WHY: Every element runs the same iterations as the scalar loop; elements
+    that converged are frozen so results match the scalar early exit.
+    """
+    eps = 1e-10
+    z = a + b
+    c = np.ones_like(x)
+    d = 1.0 - z * x / (a + 1.0)
+    d = np.where(np.abs(d) < eps, eps, d)
+    d = 1.0 / d
+    h = d.copy()
+    active = np.ones(x.shape, dtype=bool)
+
+    for i in range(1, 100):
+        m2 = 2 * i
+        aa = i * (b - i) * x / ((a + m2 - 1.0) * (a + m2))
+        d_new = 1.0 + aa * d
+        d_new = np.where(np.abs(d_new) < eps, eps, d_new)
+        c_new = 1.0 + aa / c
+        c_new = np.where(np.abs(c_new) < eps, eps, c_new)
+        d_new = 1.0 / d_new
+        h_new = h * (d_new * c_new)
+
+        aa = -(a + i) * (z + i) * x / ((a + m2) * (a + m2 + 1.0))
+        d_new = 1.0 + aa * d_new
+        d_new = np.where(np.abs(d_new) < eps, eps, d_new)
+        c_new = 1.0 + aa / c_new
+        c_new = np.where(np.abs(c_new) < eps, eps, c_new)
+        d_new = 1.0 / d_new
+        delta = d_new * c_new
+        h_new = h_new * delta
+
+        d = np.where(active, d_new, d)
+        c = np.where(active, c_new, c)
+        h = np.where(active, h_new, h)
+        active &= ~(np.abs(delta - 1.0) < eps)
+        if not active.any():
+            break
+
+    return h
+
+
+def _np_t_to_p_value(t: Any, df: Any) -> Any:
+    """
+    Vectorized ABTestCalculator._t_to_p_value.
+
+    WHY: Large df uses the normal approximation, small df the beta CDF,
+    exactly as the scalar helper decides per value.
+    """
+    p_values = _np_z_to_p_value(t)
+    small = df <= 30
+    if small.any():
+        t_small = np.abs(t[small])
+        df_small = df[small].astype(float)
+        x = df_small / (df_small + t_small * t_small)
+        p = 0.5 * _np_beta_cdf(x, df_small / 2.0, 0.5)
+        p_values[small] = np.where(p < 0.5, 2.0 * p, 1.0)
+    return p_values
+
+
+def _batch_number(row: dict[str, Any], key: str) -> float:
+    """Read a numeric batch field (CSV values arrive as strings)."""
+    value = row[key]
+    if value is None or value == "":
+        raise ValueError(f"missing value for {key}")
+    return float(value)
+
+
+def parse_batch_row(row: dict[str, Any]) -> tuple[str, tuple[float, ...]]:
+    """
+    Normalize a batch row to ("proportion" | "mean", summary statistics).
+
+    Accepted shapes:
+      Proportion: control_successes, control_n, treatment_successes, treatment_n
+      Mean:       control_mean, control_std, control_n,
+                  treatment_mean, treatment_std, treatment_n
+      Raw (JSON): control/treatment objects in the single-test input format
+
+    An optional test_type ("proportion" or "mean") overrides auto-detection.
+
+    WHY: Validation happens here so both backends reject the same rows.
+
+    Raises:
+        KeyError, ValueError: If required fields are missing or invalid
+    """
+    test_type = str(row.get("test_type") or "").replace("_test", "")
+
+    if isinstance(row.get("control"), dict) and isinstance(row.get("treatment"), dict):
+        control = row["control"]["values"]
+        treatment = row["treatment"]["values"]
+        if not test_type:
+            test_type = "proportion" if len(control) == 1 and len(treatment) == 1 else "mean"
+        if test_type == "proportion":
+            stats: dict[str, float] = {
+                "control_successes": sum(control),
+                "control_n": row["control"]["n"],
+                "treatment_successes": sum(treatment),
+                "treatment_n": row["treatment"]["n"],
+            }
+        else:
+            stats = {}
+            for prefix, values in (("control", control), ("treatment", treatment)):
+                n = len(values)
+                mean = sum(values) / n
+                stats[f"{prefix}_mean"] = mean
+                stats[f"{prefix}_var"] = sum((x - mean) ** 2 for x in values) / (n - 1)
+                stats[f"{prefix}_n"] = n
+        row = stats
+    elif not test_type:
+        test_type = "proportion" if "control_successes" in row else "mean"
+
+    if test_type == "proportion":
+        s1 = _batch_number(row, "control_successes")
+        n1 = _batch_number(row, "control_n")
+        s2 = _batch_number(row, "treatment_successes")
+        n2 = _batch_number(row, "treatment_n")
+        if n1 <= 0 or n2 <= 0:
+            raise ValueError("sample sizes must be positive")
+        if not (0 <= s1 <= n1 and 0 <= s2 <= n2):
+            raise ValueError("successes must be between 0 and n")
+        return "proportion", (s1, n1, s2, n2)
+
+    if test_type != "mean":
+        raise ValueError(f"unknown test_type: {row.get('test_type')}")
+
+    values: list[float] = []
+    for prefix in ("control", "treatment"):
+        mean = _batch_number(row, f"{prefix}_mean")
+        if f"{prefix}_var" in row:
+            var = _batch_number(row, f"{prefix}_var")
+        else:
+            var = _batch_number(row, f"{prefix}_std") ** 2
+        n = _batch_number(row, f"{prefix}_n")
+        if n < 2 or n != int(n):
+            raise ValueError(f"{prefix}_n must be an integer of at least 2")
+        if var < 0:
+            raise ValueError(f"{prefix} variance must be non-negative")
+        values += [mean, var, int(n)]
+    return "mean", tuple(values)
+
+
+def read_batch_rows(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Stream comparison rows from CSV, JSON, or JSON Lines.
+
+    WHY streaming: CSV and JSONL inputs are read row by row so large metric
+    exports never have to fit in memory. A JSON file may hold a list of rows
+    or an object with a "comparisons" list.
+
+    Args:
+        path: Input file path, or "-" for JSON Lines on stdin
+    """
+    if path == "-":
+        for line in sys.stdin:
+            if line.strip():
+                yield json.loads(line)
+        return
+
+    suffix = Path(path).suffix.lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if suffix == ".csv":
+            yield from csv.DictReader(f)
+        elif suffix in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            data = json.load(f)
+            yield from data.get("comparisons", []) if isinstance(data, dict) else data
+
+
+def write_batch_results(
+    records: Iterable[dict[str, Any]],
+    stream: IO[str],
+    fmt: str = "jsonl",
+    fieldnames: list[str] | None = None,
+) -> int:
+    """
+    Write result records as they are produced.
+
+    WHY: Streaming keeps memory flat and lets consumers start on the first rows.
+
+    Args:
+        records: Result dicts (from run_batch or sample_size_grid)
+        stream: Text stream to write to
+        fmt: "jsonl" or "csv"
+        fieldnames: CSV columns (default: keys of the first record)
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    writer: csv.DictWriter[str] | None = None
+    for record in records:
+        if fmt == "csv":
+            flat = dict(record)
+            ci = flat.pop("confidence_interval", None)
+            if ci is not None:
+                flat["ci_lower"], flat["ci_upper"] = ci
+            if writer is None:
+                writer = csv.DictWriter(
+                    stream, fieldnames=fieldnames or list(flat), extrasaction="ignore"
+                )
+                writer.writeheader()
+            writer.writerow(flat)
+        else:
+            stream.write(json.dumps(record) + "\n")
+        count += 1
+    return count
+
+
+def _parse_float_list(text: str) -> list[float]:
+    """Parse a comma-separated list of floats for grid options."""
+    return [float(part) for part in text.split(",") if part.strip()]
+
+
 def main() -> None:
     """
     CLI interface for A/B test calculator.
@@ -849,9 +1734,29 @@ Examples:
   # Calculate sample size
   python ab_test_calculator.py --sample-size 0.12 --mde 0.05 --power 0.80
 
+  # Batch mode: one comparison per row, results streamed as JSON Lines or CSV
+  python ab_test_calculator.py --batch metrics.csv --output results.jsonl
+  python ab_test_calculator.py --batch metrics.json --format csv
+
+  # Sequential test: stop as soon as the streamed observations are conclusive
+  python ab_test_calculator.py --sequential runs.jsonl --test-type mean
+  python ab_test_calculator.py --sequential runs.csv --test-type proportion \
+      --method obrien-fleming --sample-size 0.12 --looks 5
+
+  # Sample size grid (power-curve sweep)
+  python ab_test_calculator.py --sample-size-grid 0.05,0.1,0.2 --mde-grid 0.01,0.02 --power-grid 0.8,0.9
+
 Input format (JSON):
   Proportions: {"values": [120], "n": 1000}  # 120 successes out of 1000 trials
   Means: {"values": [1.2, 1.5, 1.8, ...], "n": 100}  # List of observations
+
+Batch rows (CSV columns or JSON keys, optional "metric" and "test_type"):
+  Proportions: control_successes, control_n, treatment_successes, treatment_n
+  Means: control_mean, control_std, control_n, treatment_mean, treatment_std, treatment_n
+  JSON rows may instead hold "control"/"treatment" objects in the input format above
+
+Sequential observations (CSV columns or JSON keys, one observation per row):
+  group ("control" or "treatment"), value (0/1 for proportion tests)
 """,
     )
 
@@ -899,12 +1804,183 @@ Input format (JSON):
         help="Calculate required sample size for given baseline rate",
     )
 
+    # WHY: Batch mode
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="FILE",
+        help="Evaluate many comparisons from CSV, JSON or JSONL ('-' = JSONL on stdin)",
+    )
+    parser.add_argument(
+        "--sample-size-grid",
+        type=str,
+        metavar="RATES",
+        help="Comma-separated baseline rates for a sample size grid",
+    )
+    parser.add_argument(
+        "--mde-grid", type=str, metavar="MDES", help="Comma-separated MDEs for the grid"
+    )
+    parser.add_argument(
+        "--power-grid", type=str, metavar="POWERS", help="Comma-separated powers for the grid"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        default="jsonl",
+        help="Output format for batch and grid modes (default: jsonl)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["auto", "numpy", "stdlib"],
+        default="auto",
+        help="Batch evaluation backend (default: numpy if installed)",
+    )
+
+    # WHY: Sequential mode
+    parser.add_argument(
+        "--sequential",
+        type=str,
+        metavar="FILE",
+        help="Run a sequential test over observations from CSV, JSON or JSONL ('-' = JSONL on stdin)",
+    )
+    parser.add_argument(
+        "--method",
+        choices=list(SEQUENTIAL_METHODS),
+        default="msprt",
+        help="Sequential method (default: msprt)",
+    )
+    parser.add_argument(
+        "--max-samples",
+        type=int,
+        help="Per-group sample size at which the sequential test stops "
+        "(default for proportions with --sample-size: the fixed-horizon size)",
+    )
+    parser.add_argument(
+        "--looks",
+        type=int,
+        default=5,
+        help="Interim analyses for obrien-fleming/pocock (default: 5)",
+    )
+    parser.add_argument(
+        "--min-samples",
+        type=int,
+        default=SEQUENTIAL_MIN_SAMPLES,
+        help=f"Per-group observations before any decision (default: {SEQUENTIAL_MIN_SAMPLES})",
+    )
+    parser.add_argument(
+        "--mixing-sd",
+        type=float,
+        help="mSPRT prior scale on the difference (default: derived from --mde)",
+    )
+
     args = parser.parse_args()
 
     # WHY: Initialize calculator
     calc = ABTestCalculator()
     calc.set_parameters(alpha=args.alpha, power=args.power, mde=args.mde)
 
+    # WHY: Batch and grid modes stream many records instead of one result
+    if args.batch or args.sample_size_grid:
+        try:
+            if args.batch:
+                records = calc.run_batch(read_batch_rows(args.batch), backend=args.backend)
+                fieldnames: list[str] | None = BATCH_CSV_FIELDS
+            else:
+                records = calc.sample_size_grid(
+                    _parse_float_list(args.sample_size_grid),
+                    _parse_float_list(args.mde_grid) if args.mde_grid else None,
+                    _parse_float_list(args.power_grid) if args.power_grid else None,
+                    backend=args.backend,
+                )
+                fieldnames = None
+
+            errors = 0
+            significant = 0
+
+            def tally(stream: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+                nonlocal errors, significant
+                for record in stream:
+                    errors += "error" in record
+                    significant += bool(record.get("significant"))
+                    yield record
+
+            if args.output:
+                # WHY: Stream into a temp file, then replace, so readers never
+                # see a partial result file (same guarantee as atomic_write_json)
+                output = Path(args.output)
+                tmp_path = output.with_name(output.name + ".tmp")
+                with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                    count = write_batch_results(tally(records), f, args.format, fieldnames)
+                os.replace(tmp_path, output)
+            else:
+                count = write_batch_results(tally(records), sys.stdout, args.format, fieldnames)
+
+            backend = "numpy" if _resolve_backend(args.backend) else "stdlib"
+            summary = f"{count} records ({backend} backend)"
+            if args.batch:
+                summary += f", {significant} significant, {errors} errors"
+            print(summary, file=sys.stderr)
+            if errors:
+                sys.exit(1)
+            return
+        except FileNotFoundError as e:
+            print(f"Error: File not found - {e}", file=sys.stderr)
+            sys.exit(1)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON - {e}", file=sys.stderr)
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # WHY: Sequential mode reads observations only until a decision is reached
+    if args.sequential:
+        if args.test_type == "auto":
+            parser.error("--sequential requires --test-type proportion or mean")
+        try:
+            max_samples = args.max_samples
+            if max_samples is None and args.sample_size is not None:
+                if args.test_type != "proportion":
+                    parser.error("--sample-size only sizes proportion tests; use --max-samples")
+                max_samples = calc.calculate_sample_size(args.sample_size)
+            test = SequentialTest(
+                calc,
+                test_type=args.test_type,
+                method=args.method,
+                max_samples=max_samples,
+                looks=args.looks,
+                min_samples=args.min_samples,
+                mixing_sd=args.mixing_sd,
+            )
+            result = test.run(read_batch_rows(args.sequential))
+
+            if args.output:
+                atomic_write_json(result, Path(args.output), indent=2)
+            else:
+                print(json.dumps(result, indent=2))
+
+            if args.verbose:
+                if result["status"] == "stop":
+                    print(
+                        f"\nStopped after {result['observations']} observations: {result['outcome']}",
+                        file=sys.stderr,
+                    )
+                else:
+                    print(
+                        f"\nNo decision after {result['observations']} observations - continue collecting",
+                        file=sys.stderr,
+                    )
+            return
+        except FileNotFoundError as e:
+            print(f"Error: File not found - {e}", file=sys.stderr)
+            sys.exit(1)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON - {e}", file=sys.stderr)
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
     # WHY: Sample size calculation mode
     if args.sample_size is not None:
         try:
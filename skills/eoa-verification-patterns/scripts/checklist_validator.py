@@ -7,14 +7,21 @@ validation of dependencies, blocking conditions, and completion status. This too
 prevents missed steps and identifies bottlenecks in multi-stage processes.
 
 Adapted from ASO launch checklist methodology for universal use.
+
+WHY graph engine: Release checklists reach thousands of items. Cycles, execution
+order, blockers and the critical path are derived in linear time from one
+iterative pass over the dependency graph and cached until checklist or status
+change.
 """
 
 import argparse
+import copy
 import json
 import sys
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # WHY: Import cross-platform utilities for consistency
 # NOTE: Dynamic path modification is required because shared modules are not installed packages
@@ -43,6 +50,120 @@ class ChecklistItem:
         return hash(self.id)
 
 
+class DependencyGraph:
+    """
+    Dependency structure of a checklist, computed once in O(V+E).
+
+    WHY Tarjan: One iterative depth-first pass yields the strongly connected
+    components. Any component with more than one item (or a self-dependency)
+    is a cycle, and components come out dependencies-first, which is already a
+    valid execution order. Iteration instead of recursion keeps deep
+    dependency chains clear of the recursion limit.
+    """
+
+    def __init__(self, items: Dict[str, ChecklistItem]) -> None:
+        """
+        Analyze the dependency graph of the given items.
+
+        Args:
+            items: Checklist items by ID (dependencies on unknown IDs are ignored)
+        """
+        self.order: List[str] = []  # WHY: Dependencies before dependents
+        self.component: Dict[str, int] = {}  # WHY: Component index per item
+        self.cycles: List[List[str]] = []  # WHY: One concrete cycle per component
+        self.cyclic: Set[str] = set()
+        self._analyze(items)
+
+    def _analyze(self, items: Dict[str, ChecklistItem]) -> None:
+        """Run iterative Tarjan over all items in checklist order."""
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
+
+        for root in items:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(items[root].depends_on))]
+
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in items:
+                        continue  # WHY: Undefined items handled elsewhere
+                    if dep not in index:
+                        index[dep] = low[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(items[dep].depends_on)))
+                        break
+                    if dep in on_stack:
+                        low[node] = min(low[node], index[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+
+        position = {item_id: i for i, item_id in enumerate(items)}
+        for number, component in enumerate(components):
+            for member in component:
+                self.component[member] = number
+            self.order.extend(reversed(component))
+            if len(component) > 1 or component[0] in items[component[0]].depends_on:
+                self.cyclic.update(component)
+                start = min(component, key=position.__getitem__)
+                self.cycles.append(self._cycle_path(items, start, number))
+
+        # WHY: Report cycles in checklist order, like every other error
+        self.cycles.sort(key=lambda cycle: position[cycle[0]])
+
+    def _cycle_path(
+        self, items: Dict[str, ChecklistItem], start: str, number: int
+    ) -> List[str]:
+        """
+        Find a concrete cycle through start inside its component.
+
+        WHY: A breadth-first search restricted to the component is linear in
+        its size and yields the shortest cycle, which is the clearest to report.
+
+        Returns:
+            Cycle as a list of IDs starting and ending with start
+        """
+        parent: Dict[str, Optional[str]] = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for dep in items[node].depends_on:
+                if self.component.get(dep) != number:
+                    continue
+                if dep == start:
+                    path = [start]
+                    current: Optional[str] = node
+                    while current is not None:
+                        path.append(current)
+                        current = parent[current]
+                    path.reverse()
+                    return path
+                if dep not in parent:
+                    parent[dep] = node
+                    queue.append(dep)
+        return [start, start]  # WHY: Unreachable for a true component
+
+
 class ChecklistValidator:
     """
     Validates hierarchical checklists against current completion status.
@@ -62,6 +183,10 @@ class ChecklistValidator:
         self.validation_errors: List[
             str
         ] = []  # WHY: Collect all errors for batch reporting
+        # WHY: Graph and status analysis are cached until their inputs change
+        self._version = 0
+        self._graph: Optional[Tuple[Tuple[Any, ...], DependencyGraph]] = None
+        self._analysis: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
 
     def load_checklist(self, filepath: Path) -> None:
         """
@@ -101,6 +226,7 @@ class ChecklistValidator:
                     category=category_name,
                 )
                 self.items[item.id] = item
+        self.invalidate()
 
     def load_status(self, filepath: Path) -> None:
         """
@@ -123,6 +249,37 @@ class ChecklistValidator:
         self.completed = set(data.get("completed", []))
         self.skipped = set(data.get("skipped", []))
         self.blocked = set(data.get("blocked", []))
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Drop cached graph and status analysis.
+
+        WHY: Loading a checklist or status invalidates automatically, and the
+        status sets are compared by content, so any change to them is detected.
+        The items dict is only compared by identity and size: call this after
+        replacing or editing an item in place.
+        """
+        self._version += 1
+
+    def _items_key(self) -> Tuple[Any, ...]:
+        """WHY: Cheap identity/size key, O(1) instead of hashing the graph."""
+        return (self._version, id(self.items), len(self.items))
+
+    def _status_key(self) -> Tuple[Any, ...]:
+        """WHY: Keyed on the status contents, since a same-size in-place swap
+        must not return stale results; O(n) is still far below the analysis."""
+        return self._items_key() + tuple(
+            frozenset(s) for s in (self.completed, self.skipped, self.blocked)
+        )
+
+    @property
+    def graph(self) -> DependencyGraph:
+        """Dependency graph of the loaded checklist (cached)."""
+        key = self._items_key()
+        if self._graph is None or self._graph[0] != key:
+            self._graph = (key, DependencyGraph(self.items))
+        return self._graph[1]
 
     def validate(self) -> bool:
         """
@@ -153,49 +310,14 @@ class ChecklistValidator:
                     )
 
         # WHY: Detect circular dependencies that would create impossible completion states
-        for item_id in self.items:
-            if self._has_circular_dependency(item_id):
-                self.validation_errors.append(
-                    f"Circular dependency detected involving item '{item_id}'"
-                )
+        # WHY: One error per cycle, naming its members in dependency order
+        for cycle in self.graph.cycles:
+            self.validation_errors.append(
+                f"Circular dependency detected: {' -> '.join(cycle)}"
+            )
 
         return len(self.validation_errors) == 0
 
-    def _has_circular_dependency(
-        self, item_id: str, visited: Optional[Set[str]] = None
-    ) -> bool:
-        """
-        Detect circular dependencies via depth-first search.
-
-        WHY: Circular dependencies create unresolvable blocking states. DFS is
-        efficient for dependency graphs and detects cycles during traversal.
-
-        Args:
-            item_id: ID of item to check
-            visited: Set of already-visited items in current path
-
-        Returns:
-            True if circular dependency found, False otherwise
-        """
-        if visited is None:
-            visited = set()
-
-        if item_id in visited:
-            return True  # WHY: Revisiting an item in current path means cycle exists
-
-        item = self.items.get(item_id)
-        if not item:
-            return False  # WHY: Undefined items handled elsewhere
-
-        visited.add(item_id)
-
-        # WHY: Recursively check all dependencies in current path
-        for dep_id in item.depends_on:
-            if self._has_circular_dependency(dep_id, visited.copy()):
-                return True
-
-        return False
-
     def get_progress(self) -> Dict[str, float]:
         """
         Calculate completion percentage overall and per category.
@@ -245,19 +367,68 @@ class ChecklistValidator:
         Returns:
             List of dicts describing blocked items and their blocking dependencies
         """
+        # WHY: Deep copy so callers editing nested lists cannot corrupt the cache
+        return copy.deepcopy(self._status_analysis()["blockers"])
+
+    def get_next_actions(self) -> List[Dict[str, Any]]:
+        """
+        Recommend next items that can be completed now (no blocking dependencies).
+
+        WHY: Next actions list enables workflow automation and prevents decision
+        paralysis by showing exactly what's actionable right now.
+
+        Returns:
+            List of dicts describing immediately actionable items
+        """
+        return copy.deepcopy(self._status_analysis()["next_actions"])
+
+    def get_critical_path(self) -> Dict[str, Any]:
+        """
+        Longest chain of remaining items, each depending on the previous one.
+
+        WHY: Its length is the minimum number of sequential steps left before
+        the checklist can finish, so these items deserve attention first.
+        Dependencies inside a cycle are ignored (the cycle is reported as an
+        error instead).
+
+        Returns:
+            Dict with "length" and "items" (first step first)
+        """
+        return copy.deepcopy(self._status_analysis()["critical_path"])
+
+    def get_execution_order(self) -> List[str]:
+        """
+        All item IDs with dependencies before dependents.
+
+        WHY: Topological order from the cached graph; items of a cycle are
+        adjacent in unspecified order.
+        """
+        return list(self.graph.order)
+
+    def _status_analysis(self) -> Dict[str, Any]:
+        """
+        Blockers, next actions and critical path in one pass (cached).
+
+        WHY: All three only need each item's dependencies and the status sets;
+        computing them together over the graph's execution order is O(V+E) and
+        the result is reused until checklist or status change.
+        """
+        key = self._status_key()
+        if self._analysis is not None and self._analysis[0] == key:
+            return self._analysis[1]
+
+        graph = self.graph
+        done = self.completed | self.skipped
         blockers = []
+        next_actions = []
 
         for item in self.items.values():
             # WHY: Skip items already completed or explicitly skipped
-            if item.id in self.completed or item.id in self.skipped:
+            if item.id in done:
                 continue
 
             # WHY: Find uncompleted dependencies that block this item
-            blocking_deps = [
-                dep_id
-                for dep_id in item.depends_on
-                if dep_id not in self.completed and dep_id not in self.skipped
-            ]
+            blocking_deps = [dep_id for dep_id in item.depends_on if dep_id not in done]
 
             if blocking_deps:
                 blockers.append(
@@ -274,38 +445,8 @@ class ChecklistValidator:
                         ],
                     }
                 )
-
-        # WHY: Sort by required status and category for readable reports
-        return sorted(blockers, key=lambda x: (not x["required"], x["category"]))
-
-    def get_next_actions(self) -> List[Dict[str, Any]]:
-        """
-        Recommend next items that can be completed now (no blocking dependencies).
-
-        WHY: Next actions list enables workflow automation and prevents decision
-        paralysis by showing exactly what's actionable right now.
-
-        Returns:
-            List of dicts describing immediately actionable items
-        """
-        next_actions = []
-
-        for item in self.items.values():
-            # WHY: Skip completed, skipped, or explicitly blocked items
-            if (
-                item.id in self.completed
-                or item.id in self.skipped
-                or item.id in self.blocked
-            ):
-                continue
-
-            # WHY: Check if all dependencies are satisfied
-            all_deps_met = all(
-                dep_id in self.completed or dep_id in self.skipped
-                for dep_id in item.depends_on
-            )
-
-            if all_deps_met:
+            elif item.id not in self.blocked:
+                # WHY: All dependencies satisfied and not explicitly blocked
                 next_actions.append(
                     {
                         "item_id": item.id,
@@ -315,8 +456,57 @@ class ChecklistValidator:
                     }
                 )
 
-        # WHY: Prioritize required items and group by category for organized execution
-        return sorted(next_actions, key=lambda x: (not x["required"], x["category"]))
+        # WHY: Longest remaining chain, walking dependencies before dependents
+        depth: Dict[str, int] = {}
+        previous: Dict[str, Optional[str]] = {}
+        end: Optional[str] = None
+        for item_id in graph.order:
+            if item_id in done:
+                depth[item_id] = 0
+                continue
+            best: Optional[str] = None
+            for dep_id in self.items[item_id].depends_on:
+                if (
+                    depth.get(dep_id, 0) > 0
+                    and graph.component[dep_id] != graph.component[item_id]
+                    and (best is None or depth[dep_id] > depth[best])
+                ):
+                    best = dep_id
+            depth[item_id] = 1 + (depth[best] if best is not None else 0)
+            previous[item_id] = best
+            if end is None or depth[item_id] > depth[end]:
+                end = item_id
+        path: List[str] = []
+        while end is not None:
+            path.append(end)
+            end = previous[end]
+        path.reverse()
+
+        self._analysis = (
+            key,
+            {
+                # WHY: Sort by required status and category for readable reports
+                "blockers": sorted(
+                    blockers, key=lambda x: (not x["required"], x["category"])
+                ),
+                # WHY: Prioritize required items and group by category for organized execution
+                "next_actions": sorted(
+                    next_actions, key=lambda x: (not x["required"], x["category"])
+                ),
+                "critical_path": {
+                    "length": len(path),
+                    "items": [
+                        {
+                            "item_id": item_id,
+                            "item_name": self.items[item_id].name,
+                            "category": self.items[item_id].category,
+                        }
+                        for item_id in path
+                    ],
+                },
+            },
+        )
+        return self._analysis[1]
 
     def export(self, filepath: Path, verbose: bool = False) -> None:
         """
@@ -327,7 +517,7 @@ class ChecklistValidator:
 
         Args:
             filepath: Path to output JSON file
-            verbose: If True, include full item details in report
+            verbose: If True, include full item details and execution order
         """
         report = {
             "validation": {
@@ -347,6 +537,7 @@ class ChecklistValidator:
             },
             "blockers": self.get_blockers(),
             "next_actions": self.get_next_actions(),
+            "critical_path": self.get_critical_path(),
         }
 
         # WHY: Verbose mode includes full checklist for self-contained reports
@@ -360,6 +551,7 @@ class ChecklistValidator:
                 }
                 for item in self.items.values()
             }
+            report["execution_order"] = self.get_execution_order()
 
         # WHY: Use atomic write for safe file operations
         atomic_write_json(report, Path(filepath), indent=2)
@@ -437,6 +629,10 @@ Examples:
         print(f"  Overall progress: {progress['overall']:.1f}%", file=sys.stderr)
         print(f"  Blockers: {len(validator.get_blockers())}", file=sys.stderr)
         print(f"  Next actions: {len(validator.get_next_actions())}", file=sys.stderr)
+        print(
+            f"  Critical path: {validator.get_critical_path()['length']} items",
+            file=sys.stderr,
+        )
 
         if not validation_passed:
             print("\n[ERROR] Validation errors found:", file=sys.stderr)
@@ -5,14 +5,24 @@ WHY: Provides a pluggable verification system that routes verification requests
 to appropriate source-specific verifiers (file, git, url, json, etc.).
 WHY: Enables batch verification with error aggregation and graceful degradation.
 WHY: Uses dict dispatch pattern for extensibility and clean separation of concerns.
+WHY: Batches run concurrently with one worker pool per source - I/O-bound file,
+URL and JSON checks fan out over threads, git lookups are grouped into one
+`git cat-file --batch-check` process per repository.
+WHY: File digests are cached by (device, inode, size, mtime_ns), optionally across
+runs, so re-verifying an unchanged artifact set costs one stat per file.
 """
 
 import argparse
 import hashlib
 import json
+import os
+import subprocess
 import sys
+import threading
+import time
 import urllib.request
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Union
 
@@ -23,6 +33,26 @@ sys.path.insert(0, str(SKILLS_DIR / "shared"))
 from cross_platform import run_command, atomic_write_json  # type: ignore[import-not-found]  # noqa: E402
 from thresholds import TIMEOUTS  # type: ignore[import-not-found]  # noqa: E402
 
+# WHY: Checks are I/O bound, so more threads than cores still pay off
+DEFAULT_MAX_CONCURRENCY = min(16, (os.cpu_count() or 4) * 2)
+
+# WHY: 1 MiB reads amortize syscalls without holding large artifacts in memory
+HASH_CHUNK_SIZE = 1 << 20
+
+# WHY: Bump when the on-disk hash cache layout changes so stale caches are ignored
+HASH_CACHE_VERSION = 1
+
+# WHY: Bounds the persistent cache; least recently used entries are dropped first
+HASH_CACHE_MAX_ENTRIES = 100_000
+
+# WHY: Git object types resolvable by cat-file, with the name to look up and
+# the error reported when it is missing (same messages as the per-item checks)
+GIT_BATCH_TYPES = {
+    "commit": ("{}", "Commit not found: {}"),
+    "branch": ("refs/heads/{}", "Branch not found: {}"),
+    "tag": ("refs/tags/{}", "Tag not found: {}"),
+}
+
 
 class Verifier(ABC):
     """Base class for all source-specific verifiers.
@@ -46,6 +76,150 @@ class Verifier(ABC):
         """
         pass
 
+    def group(self, requests: list[tuple[str, dict[str, Any]]]) -> list[list[int]]:
+        """Split batch requests into units of work that run as one task.
+
+        WHY: Default is one unit per item so independent checks run in
+        parallel; verifiers with a bulk backend group items that share it.
+
+        Args:
+            requests: (item, context) pairs for this source, in input order
+
+        Returns:
+            Lists of positions into requests
+        """
+        return [[i] for i in range(len(requests))]
+
+    def verify_many(
+        self, requests: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Verify one unit of work produced by group().
+
+        WHY: Verifiers with a bulk backend override this; the default simply
+        verifies each item in turn.
+
+        Returns:
+            One result dict per request, in the same order
+        """
+        return [self.verify(item, context) for item, context in requests]
+
+
+class FileHasher:
+    """Thread-safe file digest service with a stat-keyed cache.
+
+    WHY: The same build artifacts are verified many times across agents and
+    loops. A digest is reused while (device, inode, size, mtime_ns) is
+    unchanged, so only files that were rewritten are read again.
+    WHY threads: hashlib releases the GIL while hashing, so the file pool of
+    ConsistencyVerifier.verify_batch hashes many files in parallel; concurrent
+    requests for the same file share one computation.
+    """
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        """Create a hasher, loading a persistent cache if a path is given.
+
+        WHY: A missing, unreadable or outdated cache file just means a cold
+        cache - every digest is recomputed once.
+        """
+        self.cache_path = cache_path
+        self._cache: dict[str, str] = {}
+        self._inflight: dict[str, Future[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == HASH_CACHE_VERSION:
+                    self._cache = dict(data.get("entries", {}))
+            except (OSError, json.JSONDecodeError, AttributeError):
+                self._cache = {}
+
+    @staticmethod
+    def _key(stat: os.stat_result, algo: str) -> str:
+        """Cache key for a file state and algorithm."""
+        return f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}:{algo}"
+
+    def digest(self, path: Path, algo: str = "sha256") -> str:
+        """Return the hex digest of a file, from the cache when unchanged.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the hash algorithm is unknown
+        """
+        stat = os.stat(path)
+        key = self._key(stat, algo)
+        with self._lock:
+            cached = self._cache.pop(key, None)
+            if cached is not None:
+                # WHY: Re-insert so dict order tracks recency for pruning
+                self._cache[key] = cached
+                self.hits += 1
+                return cached
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+                self.misses += 1
+        assert future is not None
+        if not owner:
+            return future.result()
+
+        try:
+            value = self._compute(path, algo)
+            # WHY: A file rewritten while it was read must not be cached under
+            # the key of its old state
+            if self._key(os.stat(path), algo) == key:
+                with self._lock:
+                    self._cache[key] = value
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    @staticmethod
+    def _compute(path: Path, algo: str) -> str:
+        """Hash a file in large chunks.
+
+        WHY: hashlib.file_digest (Python 3.11+) reads into a reusable buffer
+        without per-chunk allocations; older versions use readinto with the
+        same buffer strategy.
+        """
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, algo).hexdigest()
+            hash_obj = hashlib.new(algo)
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hash_obj.update(view[:size])
+            return hash_obj.hexdigest()
+
+    def save(self) -> None:
+        """Persist the cache if a cache path was given.
+
+        WHY: Written atomically so concurrent agents never read a torn file;
+        only the most recently used entries are kept.
+        """
+        if self.cache_path is None:
+            return
+        with self._lock:
+            entries = list(self._cache.items())[-HASH_CACHE_MAX_ENTRIES:]
+        atomic_write_json(
+            {"version": HASH_CACHE_VERSION, "entries": dict(entries)},
+            self.cache_path,
+            indent=None,
+        )
+
 
 class FileVerifier(Verifier):
     """Verifies file existence, hashes, and permissions.
@@ -55,6 +229,10 @@ class FileVerifier(Verifier):
     WHY: Permission checks ensure security requirements are met.
     """
 
+    def __init__(self, hasher: FileHasher | None = None) -> None:
+        """WHY: A shared hasher lets all verifications reuse cached digests."""
+        self.hasher = hasher or FileHasher()
+
     def verify(self, item: str, context: dict[str, Any]) -> dict[str, Any]:
         """Verify file exists and optionally check hash/permissions."""
         path = Path(item)
@@ -97,14 +275,9 @@ class FileVerifier(Verifier):
         """Compute file hash using specified algorithm.
 
         WHY: Supports multiple hash algorithms for different use cases.
-        WHY: Streams file content to handle large files efficiently.
+        WHY: Delegates to the hasher so unchanged files are not re-read.
         """
-        hash_obj = hashlib.new(algo)
-        with open(path, "rb") as f:
-            # WHY: Read in chunks to avoid loading entire file into memory
-            for chunk in iter(lambda: f.read(65536), b""):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
+        return self.hasher.digest(path, algo)
 
 
 class GitVerifier(Verifier):
@@ -196,6 +369,98 @@ class GitVerifier(Verifier):
         except Exception as e:
             return {"verified": False, "error": f"Git verification failed: {e}"}
 
+    @staticmethod
+    def _batch_key(item: str, context: dict[str, Any]) -> str | None:
+        """Return the repository a request can be batched under, or None.
+
+        WHY: cat-file reads one object name per line, so names containing line
+        breaks (or empty names) keep the per-item command.
+        """
+        if context.get("type", "commit") not in GIT_BATCH_TYPES:
+            return None
+        if not item or "\n" in item or "\r" in item:
+            return None
+        return str(context.get("repo_path", "."))
+
+    def group(self, requests: list[tuple[str, dict[str, Any]]]) -> list[list[int]]:
+        """Group commit/branch/tag lookups by repository.
+
+        WHY: One cat-file process per repository replaces one subprocess per
+        item, which dominates the cost of verifying many references.
+        """
+        units: list[list[int]] = []
+        by_repo: dict[str, list[int]] = {}
+        for i, (item, context) in enumerate(requests):
+            repo = self._batch_key(item, context)
+            if repo is None:
+                units.append([i])
+            elif repo in by_repo:
+                by_repo[repo].append(i)
+            else:
+                by_repo[repo] = [i]
+                units.append(by_repo[repo])
+        return units
+
+    def verify_many(
+        self, requests: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Verify a same-repository group with one `git cat-file --batch-check`.
+
+        WHY: If the batch process cannot run (no git, not a repository), the
+        per-item commands are used so errors match verify().
+        """
+        if len(requests) < 2 or any(
+            self._batch_key(item, context) is None for item, context in requests
+        ):
+            return super().verify_many(requests)
+
+        repo_path = str(requests[0][1].get("repo_path", "."))
+        names = []
+        for item, context in requests:
+            template, _ = GIT_BATCH_TYPES[context.get("type", "commit")]
+            names.append(template.format(item))
+
+        try:
+            found = self._cat_file_batch(repo_path, names)
+        except subprocess.TimeoutExpired:
+            return [{"verified": False, "error": "Git command timeout"} for _ in requests]
+        if found is None:
+            return super().verify_many(requests)
+
+        results = []
+        for (item, context), exists in zip(requests, found):
+            if exists:
+                results.append({"verified": True, "error": None})
+            else:
+                _, message = GIT_BATCH_TYPES[context.get("type", "commit")]
+                results.append({"verified": False, "error": message.format(item)})
+        return results
+
+    def _cat_file_batch(self, repo_path: str, names: list[str]) -> list[bool] | None:
+        """Look up many object names in one git process.
+
+        WHY: --batch-check prints "<oid> <type> <size>" for objects that exist
+        and "<name> missing" (or "ambiguous") otherwise, one line per input.
+
+        Returns:
+            Existence flag per name, or None if git failed
+        """
+        try:
+            result = subprocess.run(
+                ["git", "-C", repo_path, "cat-file", "--batch-check"],
+                input="".join(name + "\n" for name in names),
+                capture_output=True,
+                text=True,
+                timeout=TIMEOUTS.GIT,
+            )
+        except OSError:
+            return None
+        lines = result.stdout.splitlines()
+        if result.returncode != 0 or len(lines) != len(names):
+            return None
+        # WHY: Only a found object ends in a numeric size field
+        return [line.rsplit(" ", 1)[-1].isdigit() for line in lines]
+
 
 class URLVerifier(Verifier):
     """Verifies URLs are reachable via HEAD request.
@@ -324,15 +589,17 @@ class ConsistencyVerifier:
     WHY: Graceful degradation allows partial verification when sources unavailable.
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, hash_cache: Path | None = None):
         """Initialize verifier with available backends.
 
         WHY: Dict dispatch avoids long if-elif chains and enables extensibility.
+        WHY hash_cache: Persists file digests between runs (see FileHasher).
         """
         self.verbose = verbose
+        self.hasher = FileHasher(hash_cache)
         # WHY: Registry pattern allows runtime addition of verifiers
         self.verifiers: dict[str, Verifier] = {
-            "file": FileVerifier(),
+            "file": FileVerifier(self.hasher),
             "git": GitVerifier(),
             "url": URLVerifier(),
             "json": JSONVerifier(),
@@ -372,42 +639,123 @@ class ConsistencyVerifier:
                 "error": f"Verification exception: {e}",
             }
 
-    def verify_batch(self, items: list[dict[str, Any]]) -> dict[str, Any]:
-        """Verify multiple items and aggregate results.
+    def _run_unit(
+        self, verifier: Verifier, requests: list[tuple[str, dict[str, Any]]]
+    ) -> tuple[list[dict[str, Any]], float]:
+        """Run one unit of work and time it.
 
-        WHY: Batch processing is more efficient than individual calls.
-        WHY: Error aggregation provides overview of all failures.
+        WHY: Exceptions are turned into per-item failures so one broken unit
+        never aborts the rest of the batch.
+
+        Returns:
+            Tuple of (results in request order, elapsed milliseconds)
         """
-        results = []
-        total = len(items)
-        verified_count = 0
-        failed_count = 0
+        start = time.perf_counter()
+        try:
+            results = verifier.verify_many(requests)
+        except Exception as e:
+            results = [
+                {"verified": False, "error": f"Verification exception: {e}"}
+                for _ in requests
+            ]
+        return results, (time.perf_counter() - start) * 1000
+
+    def verify_batch(
+        self, items: list[dict[str, Any]], max_concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Verify multiple items concurrently and aggregate results.
+
+        WHY: Each source gets its own thread pool, so slow URLs never hold up
+        file or git checks. Verifiers decide how their items are grouped into
+        units of work (git: one cat-file process per repository).
+        WHY deterministic: Results are reported in input order regardless of
+        completion order; "latency_ms" is the time of the unit that verified
+        the item (shared by items verified in one git batch).
+        WHY: Error aggregation provides overview of all failures.
+
+        Args:
+            items: Item specifications with "source", "item" and context keys
+            max_concurrency: Worker threads per source (1 = sequential)
 
-        for item_spec in items:
+        Returns:
+            Dict with total/verified/failed counts, "elapsed_ms" and
+            per-item "results"
+        """
+        workers = max_concurrency or DEFAULT_MAX_CONCURRENCY
+        if workers < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {workers}")
+        batch_start = time.perf_counter()
+
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        by_source: dict[str, list[int]] = {}
+        for index, item_spec in enumerate(items):
             source = item_spec.get("source", "")
             item = item_spec.get("item", "")
-            # WHY: Extract all other keys as verification context
-            context = {
-                k: v for k, v in item_spec.items() if k not in ("source", "item")
-            }
-
             if self.verbose:
                 print(f"Verifying {source}:{item}...", file=sys.stderr)
+            if source not in self.verifiers:
+                result = self.verify_item(source, item, {})
+                result["latency_ms"] = 0.0
+                results[index] = result
+            else:
+                by_source.setdefault(source, []).append(index)
 
-            result = self.verify_item(source, item, context)
-            results.append(result)
+        pools: list[ThreadPoolExecutor] = []
+        pending: list[tuple[list[int], Future[tuple[list[dict[str, Any]], float]]]] = []
+        try:
+            for source, indexes in by_source.items():
+                verifier = self.verifiers[source]
+                # WHY: Extract all other keys as verification context
+                requests = [
+                    (
+                        items[i].get("item", ""),
+                        {k: v for k, v in items[i].items() if k not in ("source", "item")},
+                    )
+                    for i in indexes
+                ]
+                units = verifier.group(requests)
+                pool = ThreadPoolExecutor(
+                    max_workers=min(workers, len(units)),
+                    thread_name_prefix=f"verify-{source}",
+                )
+                pools.append(pool)
+                for unit in units:
+                    future = pool.submit(
+                        self._run_unit, verifier, [requests[u] for u in unit]
+                    )
+                    pending.append(([indexes[u] for u in unit], future))
+
+            for unit_indexes, future in pending:
+                unit_results, elapsed_ms = future.result()
+                for index, result in zip(unit_indexes, unit_results):
+                    # WHY: Add source and item to result for batch processing
+                    result["source"] = items[index].get("source", "")
+                    result["item"] = items[index].get("item", "")
+                    result["latency_ms"] = round(elapsed_ms, 3)
+                    results[index] = result
+        finally:
+            for pool in pools:
+                pool.shutdown(wait=True)
 
+        verified_count = 0
+        failed_count = 0
+        for result in results:
+            assert result is not None
             if result["verified"]:
                 verified_count += 1
             else:
                 failed_count += 1
                 if self.verbose:
-                    print(f"  FAILED: {result['error']}", file=sys.stderr)
+                    print(
+                        f"  FAILED {result['source']}:{result['item']}: {result['error']}",
+                        file=sys.stderr,
+                    )
 
         return {
-            "total": total,
+            "total": len(items),
             "verified": verified_count,
             "failed": failed_count,
+            "elapsed_ms": round((time.perf_counter() - batch_start) * 1000, 3),
             "results": results,
         }
 
@@ -436,8 +784,21 @@ def main() -> None:
         action="store_true",
         help="Print verbose progress to stderr",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Worker threads per source (default: {DEFAULT_MAX_CONCURRENCY}, 1 = sequential)",
+    )
+    parser.add_argument(
+        "--hash-cache",
+        type=Path,
+        help="JSON file caching file digests between runs (keyed on inode, size, mtime)",
+    )
 
     args = parser.parse_args()
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
 
     # WHY: Read input specifications from JSON file
     try:
@@ -455,8 +816,19 @@ def main() -> None:
         sys.exit(1)
 
     # WHY: Perform batch verification
-    verifier = ConsistencyVerifier(verbose=args.verbose)
-    verification_results = verifier.verify_batch(items)
+    verifier = ConsistencyVerifier(verbose=args.verbose, hash_cache=args.hash_cache)
+    verification_results = verifier.verify_batch(items, max_concurrency=args.max_concurrency)
+
+    # WHY: A failed cache write only costs re-hashing next run
+    try:
+        verifier.hasher.save()
+    except Exception as e:
+        print(f"WARNING: Failed to write hash cache: {e}", file=sys.stderr)
+    if args.verbose and (verifier.hasher.hits or verifier.hasher.misses):
+        print(
+            f"Hash cache: {verifier.hasher.hits} hits, {verifier.hasher.misses} misses",
+            file=sys.stderr,
+        )
 
     # WHY: Write results to output file using atomic write
     try:
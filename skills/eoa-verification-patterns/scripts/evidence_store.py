@@ -9,25 +9,41 @@ to answer "What did we find?", "When did it happen?", "What's the severity distr
 WHY dataclass: Immutable evidence records prevent accidental modification of audit trail.
 WHY JSON persistence: Human-readable, version-controllable, diffable evidence archives.
 WHY predicate filtering: Enables complex queries without hardcoding every filter combination.
+WHY secondary indexes: Long audits accumulate hundreds of thousands of records; type,
+source and severity lookups go through posting lists and time ranges through bisect
+instead of scanning every record.
+WHY JSONL archive: EvidenceArchive appends one JSON line per record to segment files,
+so adding evidence never rewrites history and queries read only the records they return.
 """
 
 # WHY: future annotations enable forward references and modern type syntax in all Python 3.7+
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
 import sys
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Iterator, Self
+from typing import IO, Any, Callable, Iterable, Iterator, Self
 
 # WHY: Import cross-platform utilities for atomic file operations
 SKILLS_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(SKILLS_DIR / "shared"))
 from cross_platform import atomic_write_json  # type: ignore  # noqa: E402
 
+# WHY: fcntl is POSIX-only; without it the archive assumes a single writer
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# WHY: Bounded segments keep the unsealed tail (re-parsed on open) small
+SEGMENT_MAX_RECORDS = 50_000
+SEGMENT_PATTERN = "segment-*.jsonl"
+
 
 class EvidenceType(Enum):
     """Evidence classification for audit workflows.
@@ -104,6 +120,62 @@ class Evidence:
         return cls(**data)
 
 
+class EvidenceIndex:
+    """Secondary indexes over evidence rows.
+
+    WHY rows: Rows are insertion positions, so every posting list is already in
+    insertion order and results match the order of a full scan.
+    WHY parallel sorted arrays: bisect on timestamps answers range queries in
+    O(log n + k); ISO 8601 strings sort chronologically.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty indexes."""
+        self.ids: dict[str, int] = {}
+        self.by_type: dict[str, list[int]] = {}
+        self.by_source: dict[str, list[int]] = {}
+        self.by_severity: dict[str, list[int]] = {}
+        self._times: list[str] = []
+        self._time_rows: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed rows."""
+        return len(self.ids)
+
+    def add(self, evidence_id: str, type_value: str, source: str, severity_value: str, timestamp: str) -> int:
+        """Index a new record and return its row number.
+
+        WHY: Appends are usually in time order, so insertion lands at the end.
+        """
+        row = len(self.ids)
+        self.ids[evidence_id] = row
+        self.by_type.setdefault(type_value, []).append(row)
+        self.by_source.setdefault(source, []).append(row)
+        self.by_severity.setdefault(severity_value, []).append(row)
+        position = bisect.bisect_right(self._times, timestamp)
+        self._times.insert(position, timestamp)
+        self._time_rows.insert(position, row)
+        return row
+
+    def time_range(self, start: str | None, end: str | None) -> list[int]:
+        """Return rows with start <= timestamp <= end, in insertion order."""
+        low = bisect.bisect_left(self._times, start) if start else 0
+        high = bisect.bisect_right(self._times, end) if end else len(self._times)
+        return sorted(self._time_rows[low:high])
+
+    def statistics(self) -> dict[str, Any]:
+        """Compute counts from posting list lengths.
+
+        WHY: O(distinct keys) instead of a pass over every record.
+        """
+        return {
+            "total": len(self.ids),
+            "by_type": {t.value: len(self.by_type.get(t.value, [])) for t in EvidenceType},
+            "by_severity": {s.value: len(self.by_severity.get(s.value, [])) for s in Severity},
+            "by_source": {source: len(rows) for source, rows in self.by_source.items()},
+        }
+
+
 class EvidenceStore:
     """Thread-safe evidence collection with deduplication and filtering.
 
@@ -116,8 +188,11 @@ class EvidenceStore:
         """Initialize empty evidence store.
 
         WHY dict storage: O(1) deduplication by ID, preserves insertion order (Python 3.7+).
+        WHY row list: Index posting lists refer to rows, not IDs.
         """
         self._evidence: dict[str, Evidence] = {}
+        self._rows: list[Evidence] = []
+        self._index = EvidenceIndex()
 
     def add(self, evidence: Evidence) -> bool:
         """Add evidence with automatic deduplication.
@@ -131,6 +206,10 @@ class EvidenceStore:
         if evidence.id in self._evidence:
             return False
         self._evidence[evidence.id] = evidence
+        self._rows.append(evidence)
+        self._index.add(
+            evidence.id, evidence.type.value, evidence.source, evidence.severity.value, evidence.timestamp
+        )
         return True
 
     def filter_by_type(self, evidence_type: EvidenceType) -> list[Evidence]:
@@ -138,14 +217,21 @@ class EvidenceStore:
 
         WHY: Common query - "Show me all FINDINGS" for remediation planning.
         """
-        return [e for e in self._evidence.values() if e.type == evidence_type]
+        return [self._rows[row] for row in self._index.by_type.get(evidence_type.value, [])]
 
     def filter_by_source(self, source: str) -> list[Evidence]:
         """Filter evidence by originating source.
 
         WHY: Source isolation - "What did this specific test/scanner/audit find?"
         """
-        return [e for e in self._evidence.values() if e.source == source]
+        return [self._rows[row] for row in self._index.by_source.get(source, [])]
+
+    def filter_by_severity(self, severity: Severity) -> list[Evidence]:
+        """Filter evidence by severity.
+
+        WHY: Triage - "Show me every CRITICAL item regardless of source."
+        """
+        return [self._rows[row] for row in self._index.by_severity.get(severity.value, [])]
 
     def filter_by_time(
         self, start: str | None = None, end: str | None = None
@@ -159,14 +245,7 @@ class EvidenceStore:
             start: ISO 8601 timestamp (inclusive), None means no lower bound
             end: ISO 8601 timestamp (inclusive), None means no upper bound
         """
-        results = list(self._evidence.values())
-
-        if start:
-            results = [e for e in results if e.timestamp >= start]
-        if end:
-            results = [e for e in results if e.timestamp <= end]
-
-        return results
+        return [self._rows[row] for row in self._index.time_range(start, end)]
 
     def filter_by_predicate(
         self, predicate: Callable[[Evidence], bool]
@@ -189,21 +268,7 @@ class EvidenceStore:
         Returns:
             Dict with counts by type, severity, and source.
         """
-        type_counts: dict[str, int] = {t.value: 0 for t in EvidenceType}
-        severity_counts: dict[str, int] = {s.value: 0 for s in Severity}
-        source_counts: dict[str, int] = {}
-
-        for evidence in self._evidence.values():
-            type_counts[evidence.type.value] += 1
-            severity_counts[evidence.severity.value] += 1
-            source_counts[evidence.source] = source_counts.get(evidence.source, 0) + 1
-
-        return {
-            "total": len(self._evidence),
-            "by_type": type_counts,
-            "by_severity": severity_counts,
-            "by_source": source_counts,
-        }
+        return self._index.statistics()
 
     def save(self, filepath: Path) -> None:
         """Persist evidence store to JSON file.
@@ -211,22 +276,7 @@ class EvidenceStore:
         WHY JSON: Human-readable, git-friendly, language-agnostic evidence archive.
         WHY atomic write: Prevents corruption if interrupted during save.
         """
-        filepath = Path(filepath)
-
-        # WHY list conversion: JSON doesn't support dict keys directly
-        data = {
-            "evidence": [e.to_dict() for e in self._evidence.values()],
-            "saved_at": datetime.utcnow().isoformat() + "Z",
-        }
-
-        # WHY atomic_write_json: Cross-platform atomic file write prevents corruption
-        atomic_write_json(data, filepath, indent=2)
-
-        # WHY verify write: Ensure file was actually written and is valid JSON
-        if not filepath.exists():
-            raise IOError(f"Failed to write evidence store: {filepath}")
-        with open(filepath, "r", encoding="utf-8") as f:
-            json.load(f)  # Validate JSON integrity
+        export_json(iter(self), filepath)
 
     def load(self, filepath: Path) -> None:
         """Load evidence from JSON file.
@@ -242,6 +292,8 @@ class EvidenceStore:
             data = json.load(f)
 
         self._evidence.clear()
+        self._rows.clear()
+        self._index = EvidenceIndex()
         for evidence_dict in data.get("evidence", []):
             evidence = Evidence.from_dict(evidence_dict)
             self.add(evidence)
@@ -261,7 +313,336 @@ class EvidenceStore:
         return iter(self._evidence.values())
 
 
-def verify(store: EvidenceStore, filepath: Path | None = None) -> bool:
+class EvidenceArchive:
+    """Append-only on-disk evidence store with the EvidenceStore query API.
+
+    WHY JSONL segments: Each record is one line appended to the newest segment, so
+    adding evidence costs one write regardless of archive size. Segments rotate every
+    SEGMENT_MAX_RECORDS records; a sealed segment gets a sidecar index so reopening
+    the archive parses only the unsealed tail.
+    WHY offsets: Indexes hold (segment, byte offset) per row, never Evidence objects,
+    so memory grows with the index fields only and queries read just their results.
+    WHY file lock: Several agents may append to the same archive; appends happen
+    under an exclusive flock and first pick up records written by other processes.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Open (or create) an archive directory and build its indexes.
+
+        WHY: Sealed segments load from their sidecar index; only the tail is parsed.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index = EvidenceIndex()
+        self._locations: list[tuple[int, int]] = []
+        self._segments: list[int] = []
+        self._segment_counts: dict[int, int] = {}
+        self._tail_size = 0
+        self._readers: dict[int, IO[bytes]] = {}
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # Segment bookkeeping
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> Path:
+        """Return the JSONL path of a segment."""
+        return self.directory / f"segment-{segment:06d}.jsonl"
+
+    def _sidecar_path(self, segment: int) -> Path:
+        """Return the sidecar index path of a sealed segment."""
+        return self.directory / f"segment-{segment:06d}.idx.json"
+
+    def _index_record(self, segment: int, offset: int, data: dict[str, Any]) -> None:
+        """Add one on-disk record to the in-memory indexes."""
+        if data["id"] in self._index.ids:
+            return
+        self._index.add(data["id"], data["type"], data["source"], data["severity"], data["timestamp"])
+        self._locations.append((segment, offset))
+        self._segment_counts[segment] = self._segment_counts.get(segment, 0) + 1
+
+    def _scan_segment(self, segment: int, start: int) -> int:
+        """Index complete lines of a segment from a byte offset; return the new end.
+
+        WHY complete lines only: Another writer may be mid-append; its partial
+        line is picked up by the next refresh.
+        """
+        path = self._segment_path(segment)
+        offset = start
+        with open(path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    # WHY: A torn line from a crashed writer is skipped, not fatal
+                    data = None
+                if data is not None:
+                    self._index_record(segment, offset, data)
+                offset += len(line)
+        return offset
+
+    def _load_sidecar(self, segment: int) -> bool:
+        """Index a sealed segment from its sidecar; False if missing or stale."""
+        sidecar = self._sidecar_path(segment)
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("size") != self._segment_path(segment).stat().st_size:
+                return False
+        except (OSError, json.JSONDecodeError):
+            return False
+        for evidence_id, type_value, source, severity_value, timestamp, offset in data["records"]:
+            self._index_record(
+                segment,
+                offset,
+                {"id": evidence_id, "type": type_value, "source": source, "severity": severity_value, "timestamp": timestamp},
+            )
+        return True
+
+    def _seal(self, segment: int) -> None:
+        """Write the sidecar index of a full segment.
+
+        WHY: Lets later opens skip parsing the segment entirely.
+        """
+        records = []
+        offset = 0
+        with open(self._segment_path(segment), "rb") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    data = None
+                if data is not None and self._locations[self._index.ids[data["id"]]] == (segment, offset):
+                    records.append(
+                        [data["id"], data["type"], data["source"], data["severity"], data["timestamp"], offset]
+                    )
+                offset += len(line)
+        atomic_write_json({"size": offset, "records": records}, self._sidecar_path(segment), indent=None)
+
+    def refresh(self) -> None:
+        """Pick up segments and records appended since the last refresh.
+
+        WHY: Other processes may append to the same archive; a size check on the
+        tail segment makes this a single stat when nothing changed.
+        """
+        on_disk = sorted(int(p.name[8:14]) for p in self.directory.glob(SEGMENT_PATTERN))
+        new_segments = [seg for seg in on_disk if not self._segments or seg > self._segments[-1]]
+        if new_segments and self._segments:
+            # WHY: A newer segment exists, so the previous tail is complete
+            self._scan_segment(self._segments[-1], self._tail_size)
+        for segment in new_segments:
+            self._segments.append(segment)
+            self._tail_size = 0
+            if segment != on_disk[-1]:
+                if self._load_sidecar(segment):
+                    self._tail_size = self._segment_path(segment).stat().st_size
+                else:
+                    self._tail_size = self._scan_segment(segment, 0)
+        if self._segments:
+            tail = self._segments[-1]
+            try:
+                size = self._segment_path(tail).stat().st_size
+            except OSError:
+                return
+            if size > self._tail_size:
+                self._tail_size = self._scan_segment(tail, self._tail_size)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _read(self, row: int) -> Evidence:
+        """Read one record by row number.
+
+        WHY cached handles: Queries touching many rows reuse one open file per segment.
+        """
+        segment, offset = self._locations[row]
+        reader = self._readers.get(segment)
+        if reader is None:
+            reader = open(self._segment_path(segment), "rb")
+            self._readers[segment] = reader
+        reader.seek(offset)
+        return Evidence.from_dict(json.loads(reader.readline()))
+
+    def _iter_rows(self, rows: Iterable[int]) -> Iterator[Evidence]:
+        """Lazily read records for the given rows."""
+        for row in rows:
+            yield self._read(row)
+
+    def close(self) -> None:
+        """Close cached read handles."""
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    def __enter__(self) -> Self:
+        """Support with-blocks so read handles are closed."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close cached read handles on exit."""
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, evidence: Evidence) -> bool:
+        """Append evidence with automatic deduplication.
+
+        Returns:
+            True if evidence was added, False if duplicate ID existed.
+        """
+        return self.add_many([evidence]) == 1
+
+    def add_many(self, evidence: Iterable[Evidence]) -> int:
+        """Append a batch of evidence under one lock and one flush.
+
+        WHY batch: Collectors usually emit many records at once; one lock and one
+        flush per batch keeps streaming ingestion cheap.
+
+        Returns:
+            Number of records added (duplicates are skipped).
+        """
+        added = 0
+        lock_path = self.directory / ".lock"
+        with open(lock_path, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self.refresh()
+                if not self._segments:
+                    self._segments.append(1)
+                    self._tail_size = 0
+                segment = self._segments[-1]
+                out = open(self._segment_path(segment), "ab")
+                try:
+                    for item in evidence:
+                        if item.id in self._index.ids:
+                            continue
+                        if self._segment_counts.get(segment, 0) >= SEGMENT_MAX_RECORDS:
+                            out.close()
+                            self._seal(segment)
+                            segment += 1
+                            self._segments.append(segment)
+                            self._tail_size = 0
+                            out = open(self._segment_path(segment), "ab")
+                        line = (json.dumps(item.to_dict(), separators=(",", ":")) + "\n").encode("utf-8")
+                        out.write(line)
+                        self._index_record(segment, self._tail_size, item.to_dict())
+                        self._tail_size += len(line)
+                        added += 1
+                finally:
+                    out.close()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+        return added
+
+    # ------------------------------------------------------------------
+    # EvidenceStore-compatible queries
+    # ------------------------------------------------------------------
+
+    def filter_by_type(self, evidence_type: EvidenceType) -> list[Evidence]:
+        """Filter evidence by type classification."""
+        return list(self._iter_rows(self._index.by_type.get(evidence_type.value, [])))
+
+    def filter_by_source(self, source: str) -> list[Evidence]:
+        """Filter evidence by originating source."""
+        return list(self._iter_rows(self._index.by_source.get(source, [])))
+
+    def filter_by_severity(self, severity: Severity) -> list[Evidence]:
+        """Filter evidence by severity."""
+        return list(self._iter_rows(self._index.by_severity.get(severity.value, [])))
+
+    def filter_by_time(self, start: str | None = None, end: str | None = None) -> list[Evidence]:
+        """Filter evidence by inclusive ISO 8601 timestamp range (bisect, not a scan)."""
+        return list(self._iter_rows(self._index.time_range(start, end)))
+
+    def filter_by_predicate(self, predicate: Callable[[Evidence], bool]) -> list[Evidence]:
+        """Filter evidence using a custom predicate (streams the archive once)."""
+        return [e for e in self if predicate(e)]
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Compute evidence distribution statistics from the indexes."""
+        return self._index.statistics()
+
+    def save(self, filepath: Path) -> None:
+        """Export the archive as an EvidenceStore-compatible JSON file.
+
+        WHY: Downstream tools and verify() consume the single-file JSON format.
+        """
+        export_json(iter(self), filepath)
+
+    def load(self, filepath: Path) -> None:
+        """Append evidence from an EvidenceStore JSON file.
+
+        WHY append, not replace: The archive is append-only; IDs already present
+        are skipped, so importing the same file twice is harmless.
+        """
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"Evidence file not found: {filepath}")
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.add_many(Evidence.from_dict(d) for d in data.get("evidence", []))
+
+    def __len__(self) -> int:
+        """Return total evidence count."""
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Evidence]:
+        """Stream every record in insertion order without loading the archive.
+
+        WHY sequential read: Iterating segments line by line avoids per-row seeks.
+        """
+        for segment in self._segments:
+            offset = 0
+            with open(self._segment_path(segment), "rb") as f:
+                for line in f:
+                    start = offset
+                    offset += len(line)
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    # WHY: Only yield the indexed copy of each ID, and only records
+                    # that were indexed (not ones appended after the last refresh)
+                    row = self._index.ids.get(data["id"])
+                    if row is not None and self._locations[row] == (segment, start):
+                        yield Evidence.from_dict(data)
+
+
+def export_json(evidence: Iterable[Evidence], filepath: Path) -> None:
+    """Write evidence in the EvidenceStore JSON format and verify the result.
+
+    WHY shared: EvidenceStore.save and EvidenceArchive.save must produce the same file.
+    WHY atomic write: Prevents corruption if interrupted during save.
+    """
+    filepath = Path(filepath)
+
+    # WHY list conversion: JSON doesn't support dict keys directly
+    data = {
+        "evidence": [e.to_dict() for e in evidence],
+        "saved_at": datetime.utcnow().isoformat() + "Z",
+    }
+
+    # WHY atomic_write_json: Cross-platform atomic file write prevents corruption
+    atomic_write_json(data, filepath, indent=2)
+
+    # WHY verify write: Ensure file was actually written and is valid JSON
+    if not filepath.exists():
+        raise IOError(f"Failed to write evidence store: {filepath}")
+    with open(filepath, "r", encoding="utf-8") as f:
+        json.load(f)  # Validate JSON integrity
+
+
+def verify(store: EvidenceStore | EvidenceArchive, filepath: Path | None = None) -> bool:
     """Verify evidence store integrity and output validity.
 
     WHY verify: Ensures data integrity before reporting success.
@@ -291,8 +672,8 @@ def verify(store: EvidenceStore, filepath: Path | None = None) -> bool:
             print(f"VERIFY FAILED: Invalid severity for {evidence.id}", file=sys.stderr)
             return False
 
-    # WHY: If filepath provided, verify file contents match store
-    if filepath and filepath.exists():
+    # WHY: If filepath provided, verify file contents match store (archives are directories)
+    if filepath and filepath.is_file():
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -334,6 +715,11 @@ Examples:
 
   # Filter by source
   %(prog)s --store audit.json --filter source=pytest
+
+  # Append-only archive directory (indexed, for long audits)
+  %(prog)s --store audit-archive --archive --add '{...}'
+  %(prog)s --store audit-archive --archive --filter time=2025-01-01T00:00:00Z..2025-01-31T23:59:59Z
+  %(prog)s --store audit-archive --archive --export audit.json
         """,
     )
 
@@ -341,6 +727,12 @@ Examples:
         "--store", type=Path, required=True, help="Path to evidence store JSON file"
     )
 
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Treat --store as an append-only JSONL archive directory",
+    )
+
     parser.add_argument(
         "--add", type=str, metavar="JSON", help="Add evidence from JSON string"
     )
@@ -349,7 +741,7 @@ Examples:
         "--filter",
         type=str,
         metavar="KEY=VALUE",
-        help="Filter evidence (type=X, severity=X, source=X)",
+        help="Filter evidence (type=X, severity=X, source=X, time=START..END)",
     )
 
     parser.add_argument("--stats", action="store_true", help="Show evidence statistics")
@@ -361,14 +753,26 @@ Examples:
         help="Write filtered results to JSON file",
     )
 
+    parser.add_argument(
+        "--export",
+        type=Path,
+        metavar="FILE",
+        help="Export the whole store to an EvidenceStore JSON file",
+    )
+
     args = parser.parse_args()
 
     # WHY try/except: Robust error handling for I/O operations with explicit exit codes
     try:
         # WHY load-or-create: Idempotent operation for new/existing stores
-        store = EvidenceStore()
-        if args.store.exists():
-            store.load(args.store)
+        store: EvidenceStore | EvidenceArchive
+        if args.archive:
+            # WHY: Opening an archive reads indexes only; records stay on disk
+            store = EvidenceArchive(args.store)
+        else:
+            store = EvidenceStore()
+            if args.store.exists():
+                store.load(args.store)
 
         # WHY add before filter: New evidence should be immediately queryable
         if args.add:
@@ -378,18 +782,30 @@ Examples:
                 print(f"Added evidence: {evidence.id}")
             else:
                 print(f"Duplicate evidence ID: {evidence.id}")
-            store.save(args.store)
+            # WHY: Archives persist on add; only the JSON store is rewritten
+            if not args.archive:
+                store.save(args.store)
 
         # WHY filter operations don't modify store: Read-only projections
         if args.filter:
             key, value = args.filter.split("=", 1)
 
+            # WHY upper: Enum values are upper case; type=finding should still match
+            if key in ("type", "severity"):
+                enum_cls = EvidenceType if key == "type" else Severity
+                choices = [member.value for member in enum_cls]
+                if value.upper() not in choices:
+                    print(f"Unknown {key}: {value} (expected one of {', '.join(choices)})", file=sys.stderr)
+                    return 1
             if key == "type":
-                results = store.filter_by_type(EvidenceType(value))
+                results = store.filter_by_type(EvidenceType(value.upper()))
             elif key == "severity":
-                results = store.filter_by_predicate(lambda e: e.severity.value == value)
+                results = store.filter_by_severity(Severity(value.upper()))
             elif key == "source":
                 results = store.filter_by_source(value)
+            elif key == "time":
+                start, _, end = value.partition("..")
+                results = store.filter_by_time(start or None, end or None)
             else:
                 print(f"Unknown filter key: {key}", file=sys.stderr)
                 return 1
@@ -410,6 +826,10 @@ Examples:
             stats = store.get_statistics()
             print(json.dumps(stats, indent=2))
 
+        if args.export:
+            store.save(args.export)
+            print(f"Exported {len(store)} evidence to {args.export}")
+
         # WHY verify: Ensure output integrity before reporting success
         output_path = args.output if args.filter and args.output else args.store
         if not verify(store, output_path if output_path.exists() else None):
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Incremental Finding Baselines for Verification Scanners.
+
+WHY: Scanners like quality_pattern_detector.py and test_quality_analyzer.py are
+run on every agent delivery. Rescanning the whole tree each time is wasted work
+and buries the regressions an agent introduced under findings that were already
+there. A baseline persists the findings of each file together with its content
+hash, so later runs rescan only changed files and report what is new or resolved.
+
+WHY content hash + stat: size and mtime_ns are checked first because they are
+free; a changed stat falls back to a SHA-256 of the content so a touched but
+unmodified file (checkout, rebase) is still reused.
+
+WHY git mode: With a git ref, the changed set comes from `git diff` plus
+untracked files, so unchanged files are not even stat'ed against the baseline.
+"""
+
+# WHY: future annotations enable forward references and modern type syntax
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# WHY: Bump when the on-disk layout changes so stale baselines are ignored
+# (2: entries carry the file's line count)
+BASELINE_VERSION = 2
+
+# WHY: 1 MiB reads keep hashing memory flat regardless of file size
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def content_hash(path: Path) -> str:
+    """
+    Return the SHA-256 hex digest of a file's content.
+
+    WHY: Content identity is what decides whether old findings still apply,
+    independent of timestamps.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_hash(config: Any) -> str:
+    """
+    Return a stable digest of the scanner configuration.
+
+    WHY: Findings recorded with different patterns or options are not
+    comparable, so a configuration change invalidates every stored file.
+    """
+    encoded = json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def git_changed_files(root: Path, ref: str) -> set[str] | None:
+    """
+    Return paths (relative to root) changed since a git ref, plus untracked files.
+
+    WHY: Git already knows which files differ, which is cheaper than statting
+    every file in a large tree.
+
+    Returns:
+        Set of POSIX-style relative paths, or None if git is unavailable or the
+        ref is unknown (callers then fall back to stat/hash checks)
+    """
+    commands = [
+        ["git", "-C", str(root), "diff", "--name-only", "--relative", ref, "--"],
+        ["git", "-C", str(root), "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed: set[str] = set()
+    for command in commands:
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=60)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        changed.update(line for line in result.stdout.splitlines() if line)
+    return changed
+
+
+def diff_findings(
+    baseline: Iterable[dict[str, Any]],
+    current: Iterable[dict[str, Any]],
+    key: Callable[[dict[str, Any]], tuple[Any, ...]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Split findings into those new since the baseline and those resolved.
+
+    WHY multiset: Keys deliberately omit line numbers so that code moving up or
+    down a file is not reported as one resolved plus one new finding. Counting
+    occurrences keeps a second copy of an existing issue visible as new.
+
+    Args:
+        baseline: Findings recorded in the baseline
+        current: Findings from this run
+        key: Function returning the identity of a finding
+
+    Returns:
+        Tuple of (new findings, resolved findings)
+    """
+    remaining = Counter(key(f) for f in baseline)
+    new: list[dict[str, Any]] = []
+    for finding in current:
+        identity = key(finding)
+        if remaining[identity] > 0:
+            remaining[identity] -= 1
+        else:
+            new.append(finding)
+
+    resolved: list[dict[str, Any]] = []
+    for finding in baseline:
+        identity = key(finding)
+        if remaining[identity] > 0:
+            remaining[identity] -= 1
+            resolved.append(finding)
+    return new, resolved
+
+
+class FindingBaseline:
+    """
+    Per-file findings with the content fingerprint they were computed from.
+
+    WHY class: Keeps the file table, the configuration digest and the change
+    checks together so both scanners use the same reuse rules.
+    """
+
+    def __init__(self, tool: str, config: str) -> None:
+        """
+        Create an empty baseline for a tool and configuration digest.
+
+        WHY: An empty baseline behaves like a first run - every file is scanned.
+        """
+        self.tool = tool
+        self.config = config
+        self.created = datetime.now().isoformat()
+        self.files: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: Path, tool: str, config: str) -> FindingBaseline:
+        """
+        Load a baseline, discarding it if it belongs to another tool or config.
+
+        WHY: A mismatched baseline would silently reuse findings that the
+        current patterns would not produce.
+        """
+        baseline = cls(tool, config)
+        if not path.exists():
+            return baseline
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return baseline
+        if (
+            data.get("version") != BASELINE_VERSION
+            or data.get("tool") != tool
+            or data.get("config") != config
+        ):
+            return baseline
+        baseline.created = data.get("created", baseline.created)
+        baseline.files = data.get("files", {})
+        return baseline
+
+    def save(self, path: Path) -> None:
+        """
+        Persist the baseline atomically.
+
+        WHY: A crash mid-write must not leave a truncated baseline behind.
+        Written with a temp file + os.replace so test_quality_analyzer.py keeps
+        working without the shared cross_platform helpers.
+        """
+        data = {
+            "version": BASELINE_VERSION,
+            "tool": self.tool,
+            "config": self.config,
+            "created": self.created,
+            "updated": datetime.now().isoformat(),
+            "files": self.files,
+        }
+        # WHY: Per-process temp name so concurrent runs never write the same file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def findings(self, rel_path: str) -> list[dict[str, Any]]:
+        """Return the stored findings of a file (empty if not in the baseline)."""
+        entry = self.files.get(rel_path)
+        return list(entry["findings"]) if entry else []
+
+    def lines(self, rel_path: str) -> int:
+        """Return the stored line count of a file (0 if not recorded)."""
+        entry = self.files.get(rel_path)
+        return entry.get("lines", 0) if entry else 0
+
+    def is_unchanged(self, rel_path: str, path: Path) -> bool:
+        """
+        Check whether a file still has the content its findings were computed from.
+
+        WHY: Stat first (free), hash only when the stat differs. A hash match
+        refreshes the stored stat so the next run skips hashing too.
+        """
+        entry = self.files.get(rel_path)
+        if entry is None:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if stat.st_size != entry["size"]:
+            return False
+        try:
+            if content_hash(path) != entry["sha256"]:
+                return False
+        except OSError:
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+
+    def record(
+        self, rel_path: str, path: Path, findings: list[dict[str, Any]], lines: int | None = None
+    ) -> None:
+        """
+        Store fresh findings for a file with its current fingerprint.
+
+        WHY: The fingerprint is taken after the scan; if the file changed in
+        between, the next run simply rescans it.
+        WHY lines: Lets a scanner report line totals for reused files without
+        reading them.
+        """
+        try:
+            stat = path.stat()
+            digest = content_hash(path)
+        except OSError:
+            self.files.pop(rel_path, None)
+            return
+        self.files[rel_path] = {
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "findings": findings,
+        }
+        if lines is not None:
+            self.files[rel_path]["lines"] = lines
+
+    def retain(self, rel_paths: Iterable[str]) -> list[str]:
+        """
+        Drop files that are no longer part of the scan.
+
+        WHY: Deleted or excluded files must not keep contributing findings.
+
+        Returns:
+            Relative paths that were dropped
+        """
+        keep = set(rel_paths)
+        dropped = [rel for rel in self.files if rel not in keep]
+        for rel in dropped:
+            del self.files[rel]
+        return dropped
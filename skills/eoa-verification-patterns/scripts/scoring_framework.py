@@ -10,13 +10,20 @@ WHY stdlib only: Ensures portability and zero external dependencies for universa
 WHY class-based: Encapsulates scoring logic for reusability across different scoring scenarios.
 WHY normalization: Different metrics have different scales; normalization ensures fair comparison.
 WHY weighted scoring: Different dimensions have different importance in different contexts.
+WHY columnar scoring: Candidate sets run to tens of thousands of entities. Scores are
+computed one metric column at a time (NumPy when installed, plain lists otherwise),
+and top/bottom selection uses a bounded heap over streamed input instead of a full sort.
 """
 
 import argparse
+import csv
+import heapq
 import json
+import math
+import os
 import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Callable, Optional
+from typing import IO, List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 
 # WHY: Import cross-platform utilities for consistency
@@ -25,6 +32,22 @@ SKILLS_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(SKILLS_DIR / "shared"))
 from cross_platform import atomic_write_json  # type: ignore[import-not-found]  # noqa: E402
 
+# WHY: NumPy is optional; columnar scoring falls back to list loops without it
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+# WHY: Streamed input is scored in chunks so memory stays bounded
+SCORE_CHUNK_SIZE = 4096
+
+# WHY: Normalizations with a column-wise implementation; "custom" callables are
+# applied value by value
+VECTOR_NORMALIZATIONS = ("clamp", "linear", "log", "sigmoid", "inverse")
+
 
 @dataclass
 class ScoringMetric:
@@ -34,12 +57,15 @@ class ScoringMetric:
     WHY dataclass: Clean, immutable structure for metric definitions.
     WHY normalize_fn: Each metric may need different normalization (linear, log, sigmoid, etc.).
     WHY weight: Allows flexible importance tuning across different use cases.
+    WHY normalization: Names the built-in normalize_fn so a whole column can be
+    normalized at once; "custom" means only the callable is known.
     """
 
     name: str
     weight: float
     normalize_fn: Callable[[float], float]
     description: str = ""
+    normalization: str = "custom"
 
     def __post_init__(self) -> None:
         """WHY: Validate weight is between 0 and 1 to prevent scoring errors."""
@@ -102,6 +128,7 @@ class ScoringFramework:
         self.entities: List[Dict[str, Any]] = []
         self.metrics: List[ScoringMetric] = []
         self.scored_entities: List[ScoredEntity] = []
+        self.total_scored = 0  # WHY: Entity count of the last ranking or selection
         self.verbose = verbose
 
     def load_entities(self, filepath: str) -> None:
@@ -116,20 +143,10 @@ class ScoringFramework:
             {"name": "entity1", "metrics": {"volume": 100, "quality": 0.8}},
             {"name": "entity2", "metrics": {"volume": 50, "quality": 0.9}}
         ]
-        """
-        path = Path(filepath)
-        if not path.exists():
-            raise FileNotFoundError(f"Input file not found: {filepath}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            self.entities = json.load(f)
-
-        # WHY validation: Fail fast if input format is incorrect
-        for entity in self.entities:
-            if "name" not in entity:
-                raise ValueError(f"Entity missing 'name' field: {entity}")
-            if "metrics" not in entity or not isinstance(entity["metrics"], dict):
-                raise ValueError(f"Entity missing or invalid 'metrics' field: {entity}")
+        JSON Lines and CSV files are also accepted (see iter_entities).
+        """
+        self.entities = list(iter_entities(filepath))
 
         if self.verbose:
             print(
@@ -143,6 +160,7 @@ class ScoringFramework:
         weight: float,
         normalize_fn: Optional[Callable[[float], float]] = None,
         description: str = "",
+        normalization: Optional[str] = None,
     ) -> None:
         """
         Define a scoring metric with weight and normalization function.
@@ -155,6 +173,8 @@ class ScoringFramework:
             weight: Importance weight (0-1, will be normalized if sum != 1)
             normalize_fn: Function to normalize raw value to 0-100 scale
             description: Human-readable description of what this metric measures
+            normalization: Built-in normalization that normalize_fn implements
+                (enables column-wise scoring; default "custom")
         """
         if normalize_fn is None:
             # WHY default: Linear normalization assumes values are already in reasonable range
@@ -162,9 +182,14 @@ class ScoringFramework:
                 return min(100.0, max(0.0, x))
 
             normalize_fn = default_normalize
+            normalization = "clamp"
 
         metric = ScoringMetric(
-            name=name, weight=weight, normalize_fn=normalize_fn, description=description
+            name=name,
+            weight=weight,
+            normalize_fn=normalize_fn,
+            description=description,
+            normalization=normalization or "custom",
         )
         self.metrics.append(metric)
 
@@ -242,8 +267,9 @@ class ScoringFramework:
                     return self._linear_normalization(x)
 
                 normalize_fn = default_wrapper
+                norm_type = "linear"
 
-            self.define_metric(name, weight, normalize_fn, description)
+            self.define_metric(name, weight, normalize_fn, description, norm_type)
 
         if self.verbose:
             print(
@@ -294,7 +320,11 @@ class ScoringFramework:
         import math
 
         # WHY sigmoid: Creates smooth transition between 0 and 100
-        normalized = 100 / (1 + math.exp(-steepness * (value - midpoint)))
+        try:
+            normalized = 100 / (1 + math.exp(-steepness * (value - midpoint)))
+        except OverflowError:
+            # WHY: Far below the midpoint the curve has saturated at 0
+            return 0.0
         return normalized
 
     @staticmethod
@@ -330,6 +360,121 @@ class ScoringFramework:
                     file=sys.stderr,
                 )
 
+    def _normalize_column(self, metric: ScoringMetric, column: List[Any]) -> Any:
+        """
+        Normalize one metric column.
+
+        WHY: Built-in normalizations are applied to the whole column (NumPy, or
+        a list comprehension without it) using the same arithmetic as the scalar
+        functions, avoiding two function calls per value. Custom callables are
+        called once per value.
+
+        Returns:
+            NumPy array or list of normalized values
+        """
+        kind = metric.normalization
+        if kind not in VECTOR_NORMALIZATIONS:
+            fn = metric.normalize_fn
+            return [fn(value) for value in column]
+
+        if not NUMPY_AVAILABLE:
+            if kind == "clamp":
+                return [min(100.0, max(0.0, v)) for v in column]
+            if kind == "linear":
+                return [max(0, min(100, (v / 100) * 100)) for v in column]
+            if kind == "log":
+                log_base = math.log10(10)
+                return [
+                    0 if v <= 0 else min(100, (math.log10(v + 1) / log_base) * 100)
+                    for v in column
+                ]
+            if kind == "sigmoid":
+                exp = math.exp
+                try:
+                    return [100 / (1 + exp(-0.1 * (v - 50))) for v in column]
+                except OverflowError:
+                    # WHY: Rare; redo value by value so saturated inputs score 0 as with NumPy
+                    return [self._sigmoid_normalization(v) for v in column]
+            return [100 if v <= 0 else max(0, 100 - (v / 100) * 100) for v in column]
+
+        values = np.asarray(column, dtype=float)
+        if kind == "clamp":
+            return np.minimum(100.0, np.maximum(0.0, values))
+        if kind == "linear":
+            return np.clip((values / 100.0) * 100.0, 0.0, 100.0)
+        if kind == "log":
+            logs = np.minimum(100.0, (np.log10(np.maximum(values, 0.0) + 1.0) / math.log10(10)) * 100.0)
+            return np.where(values <= 0, 0.0, logs)
+        if kind == "sigmoid":
+            # WHY: exp overflow for very negative inputs correctly saturates to 0
+            with np.errstate(over="ignore"):
+                return 100.0 / (1.0 + np.exp(-0.1 * (values - 50.0)))
+        # WHY inverse: lower is better, non-positive values score 100
+        return np.where(values <= 0, 100.0, np.maximum(0.0, 100.0 - (values / 100.0) * 100.0))
+
+    def score_batch(
+        self, entities: List[Dict[str, Any]]
+    ) -> Tuple[List[float], Dict[str, Any]]:
+        """
+        Score a batch of entities column by column.
+
+        WHY: One value list per metric replaces a dict-building loop per entity;
+        scores accumulate in metric order so they match score_entity() exactly.
+
+        Returns:
+            Tuple of (scores in input order, normalized value list per metric name)
+        """
+        if not self.metrics:
+            raise ValueError(
+                "No metrics defined. Call define_metric() or load_weights() first."
+            )
+
+        raw = [entity["metrics"] for entity in entities]
+        normalized: Dict[str, Any] = {}
+        totals: Any = np.zeros(len(raw)) if NUMPY_AVAILABLE else [0.0] * len(raw)
+
+        for metric in self.metrics:
+            name = metric.name
+            if self.verbose:
+                for entity in entities:
+                    if name not in entity["metrics"]:
+                        print(
+                            f"⚠ Entity '{entity['name']}' missing metric '{name}', using 0",
+                            file=sys.stderr,
+                        )
+            column = self._normalize_column(metric, [m.get(name, 0) for m in raw])
+            normalized[name] = column
+            weight = metric.weight
+            if NUMPY_AVAILABLE:
+                totals = totals + np.asarray(column, dtype=float) * weight
+            else:
+                totals = [t + v * weight for t, v in zip(totals, column)]
+
+        if NUMPY_AVAILABLE:
+            for name, column in normalized.items():
+                if not isinstance(column, list):
+                    normalized[name] = column.tolist()
+            return (totals * 100).tolist(), normalized
+        return [t * 100 for t in totals], normalized
+
+    def _scored(
+        self,
+        entity: Dict[str, Any],
+        score: float,
+        rank: int,
+        normalized: Dict[str, Any],
+        index: int,
+    ) -> ScoredEntity:
+        """WHY: Builds ScoredEntity objects only for entities that are returned."""
+        return ScoredEntity(
+            name=entity["name"],
+            score=score,
+            rank=rank,
+            metrics=entity["metrics"],
+            raw_metrics=entity["metrics"],
+            normalized_metrics={name: column[index] for name, column in normalized.items()},
+        )
+
     def score_entity(self, entity: Dict[str, Any]) -> ScoredEntity:
         """
         Calculate weighted score for a single entity.
@@ -397,15 +542,33 @@ class ScoringFramework:
         # WHY normalize first: Ensures weights are correct before scoring
         self._normalize_weights()
 
-        # WHY list comprehension: Efficient batch processing
-        self.scored_entities = [self.score_entity(entity) for entity in self.entities]
+        # WHY columnar: Scores all entities one metric column at a time
+        scores, normalized = self.score_batch(self.entities)
+
+        # WHY stable descending sort of indices: Ties keep input order
+        if NUMPY_AVAILABLE:
+            order = np.argsort(-np.asarray(scores), kind="stable").tolist()
+        else:
+            order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
 
-        # WHY sort descending: Best scores first
-        self.scored_entities.sort(key=lambda x: x.score, reverse=True)
+        # WHY rows: zip transposes the normalized columns once instead of
+        # indexing every column for every entity
+        names = list(normalized)
+        rows = list(zip(*normalized.values())) if names else [()] * len(scores)
 
         # WHY enumerate: Assign ranks based on sorted position
-        for rank, entity in enumerate(self.scored_entities, start=1):
-            entity.rank = rank
+        self.scored_entities = [
+            ScoredEntity(
+                name=self.entities[i]["name"],
+                score=scores[i],
+                rank=rank,
+                metrics=self.entities[i]["metrics"],
+                raw_metrics=self.entities[i]["metrics"],
+                normalized_metrics=dict(zip(names, rows[i])),
+            )
+            for rank, i in enumerate(order, start=1)
+        ]
+        self.total_scored = len(self.scored_entities)
 
         if self.verbose:
             print(
@@ -465,67 +628,287 @@ class ScoringFramework:
             return self.scored_entities[rank - 1]
         return None
 
-    def export(self, filepath: str, include_details: bool = True) -> None:
+    def select_top(
+        self, n: int, entities: Optional[Iterable[Dict[str, Any]]] = None
+    ) -> List[ScoredEntity]:
+        """
+        Select the N highest-scoring entities without ranking all of them.
+
+        WHY: A bounded heap keeps only N candidates, so streamed input is
+        never materialized and no full sort is needed. Result and ranks match
+        rank_all()[:n], including tie order.
+
+        Args:
+            n: Number of entities to return
+            entities: Entities to score (default: loaded entities); may be a
+                stream such as iter_entities()
+        """
+        return self._select(n, entities, bottom=False)
+
+    def select_bottom(
+        self, n: int, entities: Optional[Iterable[Dict[str, Any]]] = None
+    ) -> List[ScoredEntity]:
+        """
+        Select the N lowest-scoring entities without ranking all of them.
+
+        WHY: Same bounded-heap selection as select_top(); matches
+        rank_all()[-n:] with ranks counted from the top.
         """
-        Export scored and ranked entities to JSON file.
+        return self._select(n, entities, bottom=True)
+
+    def _select(
+        self,
+        n: int,
+        entities: Optional[Iterable[Dict[str, Any]]],
+        bottom: bool,
+    ) -> List[ScoredEntity]:
+        """
+        Heap selection over chunked, column-scored input.
+
+        WHY keys: (score, -index) for top and (-score, index) for bottom make
+        every key unique and reproduce the stable descending sort of rank_all().
+        """
+        if entities is None:
+            if not self.entities:
+                raise ValueError("No entities loaded. Call load_entities() first.")
+            entities = self.entities
+
+        self._normalize_weights()
+        heap: List[Tuple[Tuple[float, int], ScoredEntity]] = []
+        total = 0
+        chunk: List[Dict[str, Any]] = []
+
+        def consume(chunk: List[Dict[str, Any]], offset: int) -> None:
+            scores, normalized = self.score_batch(chunk)
+            for j, score in enumerate(scores):
+                index = offset + j
+                key = (-score, index) if bottom else (score, -index)
+                if len(heap) < n:
+                    heapq.heappush(heap, (key, self._scored(chunk[j], score, 0, normalized, j)))
+                elif key > heap[0][0]:
+                    heapq.heapreplace(heap, (key, self._scored(chunk[j], score, 0, normalized, j)))
+
+        for entity in entities:
+            chunk.append(entity)
+            if len(chunk) >= SCORE_CHUNK_SIZE:
+                consume(chunk, total)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            consume(chunk, total)
+            total += len(chunk)
+
+        if n <= 0:
+            selected: List[ScoredEntity] = []
+        elif bottom:
+            selected = [entity for _, entity in sorted(heap)]
+        else:
+            selected = [entity for _, entity in sorted(heap, reverse=True)]
+        first_rank = total - len(selected) + 1 if bottom else 1
+        for rank, entity in enumerate(selected, start=first_rank):
+            entity.rank = rank
+        self.total_scored = total
+
+        if self.verbose:
+            print(
+                f"✓ Selected {len(selected)} of {total} entities "
+                f"({'bottom' if bottom else 'top'})",
+                file=sys.stderr,
+            )
+        return selected
+
+    def export(
+        self,
+        filepath: str,
+        include_details: bool = True,
+        entities: Optional[List[ScoredEntity]] = None,
+    ) -> None:
+        """
+        Export scored and ranked entities to JSON, JSON Lines or CSV.
 
         WHY: Persists results for downstream processing or reporting.
         WHY include_details: Allows compact output when only scores/ranks needed.
+        WHY streamed formats: .jsonl and .csv outputs are written row by row.
 
         Args:
-            filepath: Output file path
+            filepath: Output file path (format chosen by suffix)
             include_details: If True, includes raw and normalized metrics
+            entities: Entities to export (default: result of rank_all())
         """
-        if not self.scored_entities:
-            raise ValueError("No scored entities. Call rank_all() first.")
+        if entities is None:
+            if not self.scored_entities:
+                raise ValueError("No scored entities. Call rank_all() first.")
+            entities = self.scored_entities
 
-        output_data = []
-        for entity in self.scored_entities:
-            entity_dict = entity.to_dict()
-            if not include_details:
-                # WHY compact: Remove detailed metrics for smaller output
-                entity_dict = {
-                    "name": entity_dict["name"],
-                    "score": entity_dict["score"],
-                    "rank": entity_dict["rank"],
-                }
-            output_data.append(entity_dict)
+        path = Path(filepath)
+        fmt = path.suffix.lower().lstrip(".")
+        if fmt in ("jsonl", "ndjson", "csv"):
+            # WHY: Temp file + replace gives the same guarantee as atomic_write_json
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                count = write_scored(
+                    entities,
+                    f,
+                    "csv" if fmt == "csv" else "jsonl",
+                    include_details,
+                    [m.name for m in self.metrics],
+                )
+            os.replace(tmp_path, path)
+        else:
+            output_data = [_entity_record(e, include_details) for e in entities]
+            count = len(output_data)
 
-        # WHY: Use atomic write for safe file operations
-        atomic_write_json(output_data, Path(filepath), indent=2)
+            # WHY: Use atomic write for safe file operations
+            atomic_write_json(output_data, path, indent=2)
 
         if self.verbose:
             print(
-                f"✓ Exported {len(output_data)} scored entities to {filepath}",
+                f"✓ Exported {count} scored entities to {filepath}",
                 file=sys.stderr,
             )
 
-    def print_summary(self, top_n: int = 10) -> None:
+    def print_summary(
+        self, top_n: int = 10, entities: Optional[List[ScoredEntity]] = None
+    ) -> None:
         """
         Print human-readable summary of scoring results.
 
         WHY: Quick inspection of results without opening JSON files.
+        WHY entities: Lets a select_top()/select_bottom() result be summarized.
         """
-        if not self.scored_entities:
-            print(
-                "No scored entities available. Call rank_all() first.", file=sys.stderr
-            )
-            return
+        if entities is None:
+            if not self.scored_entities:
+                print(
+                    "No scored entities available. Call rank_all() first.", file=sys.stderr
+                )
+                return
+            shown = self.get_top(top_n)
+            title = f"Top {top_n} Entities"
+        else:
+            shown = entities[:top_n]
+            title = f"{len(shown)} of {len(entities)} Selected Entities"
 
         print("\n" + "=" * 80)
-        print(f"SCORING SUMMARY - Top {top_n} Entities")
+        print(f"SCORING SUMMARY - {title}")
         print("=" * 80)
         print(f"{'Rank':<6} {'Score':<8} {'Entity Name':<40}")
         print("-" * 80)
 
-        for entity in self.get_top(top_n):
+        for entity in shown:
             print(f"{entity.rank:<6} {entity.score:<8.2f} {entity.name:<40}")
 
         print("=" * 80)
-        print(f"Total entities scored: {len(self.scored_entities)}")
+        print(f"Total entities scored: {self.total_scored}")
         print()
 
 
+def _validate_entity(entity: Any, where: str) -> Dict[str, Any]:
+    """WHY: Fail fast if input format is incorrect, whatever the file format."""
+    if not isinstance(entity, dict) or "name" not in entity:
+        raise ValueError(f"Entity missing 'name' field{where}: {entity}")
+    if "metrics" not in entity or not isinstance(entity["metrics"], dict):
+        raise ValueError(f"Entity missing or invalid 'metrics' field{where}: {entity}")
+    return entity
+
+
+def iter_entities(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream entities from JSON, JSON Lines, or CSV.
+
+    WHY streaming: JSONL and CSV are read row by row so large candidate sets
+    can be scored with select_top()/select_bottom() without loading them.
+
+    Formats:
+        .json: list of {"name": ..., "metrics": {...}}
+        .jsonl/.ndjson: one such object per line
+        .csv: a "name" column; every other non-empty column is a numeric metric
+    """
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {filepath}")
+
+    suffix = path.suffix.lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if suffix in (".jsonl", ".ndjson"):
+            for line_no, line in enumerate(f, start=1):
+                if line.strip():
+                    yield _validate_entity(json.loads(line), f" (line {line_no})")
+        elif suffix == ".csv":
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or "name" not in reader.fieldnames:
+                raise ValueError(f"CSV input needs a 'name' column: {filepath}")
+            for line_no, row in enumerate(reader, start=2):
+                name = row.pop("name")
+                try:
+                    metrics = {
+                        key: float(value)
+                        for key, value in row.items()
+                        if key is not None and value not in (None, "")
+                    }
+                except ValueError as e:
+                    raise ValueError(f"Non-numeric metric on line {line_no}: {e}") from e
+                yield {"name": name, "metrics": metrics}
+        else:
+            for entity in json.load(f):
+                yield _validate_entity(entity, "")
+
+
+def _entity_record(entity: ScoredEntity, include_details: bool) -> Dict[str, Any]:
+    """WHY compact: Remove detailed metrics for smaller output."""
+    entity_dict = entity.to_dict()
+    if include_details:
+        return entity_dict
+    return {
+        "name": entity_dict["name"],
+        "score": entity_dict["score"],
+        "rank": entity_dict["rank"],
+    }
+
+
+def write_scored(
+    entities: Iterable[ScoredEntity],
+    stream: IO[str],
+    fmt: str = "jsonl",
+    include_details: bool = True,
+    metric_names: Optional[List[str]] = None,
+) -> int:
+    """
+    Write scored entities as JSON Lines or CSV, one row at a time.
+
+    WHY: CSV rows are flat - detailed output adds the raw value and a
+    "<metric>_normalized" column per metric.
+
+    Returns:
+        Number of entities written
+    """
+    count = 0
+    if fmt == "csv":
+        fields = ["rank", "name", "score"]
+        if include_details:
+            for name in metric_names or []:
+                fields += [name, f"{name}_normalized"]
+        writer = csv.DictWriter(stream, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for entity in entities:
+            row: Dict[str, Any] = {
+                "rank": entity.rank,
+                "name": entity.name,
+                "score": round(entity.score, 2),
+            }
+            if include_details:
+                for name in metric_names or []:
+                    row[name] = entity.raw_metrics.get(name, "")
+                    value = entity.normalized_metrics.get(name)
+                    row[f"{name}_normalized"] = "" if value is None else round(value, 2)
+            writer.writerow(row)
+            count += 1
+    else:
+        for entity in entities:
+            stream.write(json.dumps(_entity_record(entity, include_details)) + "\n")
+            count += 1
+    return count
+
+
 def main() -> None:
     """
     CLI entry point for universal scoring framework.
@@ -546,6 +929,12 @@ Example usage:
   # Show top 20 instead of default 10
   %(prog)s --input entities.json --weights weights.json --output scored.json --top 20
 
+  # Stream a large CSV/JSONL candidate set and keep only the 100 best (heap selection)
+  %(prog)s --input risks.jsonl --weights weights.json --output top.jsonl --limit 100
+
+  # Keep the 50 lowest-scoring entities as CSV
+  %(prog)s --input features.csv --weights weights.json --output low.csv --limit 50 --bottom
+
 Use cases:
   - Keyword ranking (volume, competition, relevance)
   - Feature prioritization (impact, effort, risk)
@@ -555,7 +944,9 @@ Use cases:
     )
 
     parser.add_argument(
-        "--input", required=True, help="Input JSON file with entities to score"
+        "--input",
+        required=True,
+        help="Input file with entities to score (.json, .jsonl or .csv)",
     )
 
     parser.add_argument(
@@ -563,7 +954,9 @@ Use cases:
     )
 
     parser.add_argument(
-        "--output", required=True, help="Output JSON file for scored results"
+        "--output",
+        required=True,
+        help="Output file for scored results (.json, .jsonl or .csv)",
     )
 
     parser.add_argument(
@@ -583,16 +976,41 @@ Use cases:
         help="Export compact output (scores/ranks only, no detailed metrics)",
     )
 
+    parser.add_argument(
+        "--limit",
+        type=int,
+        help="Only keep the N best entities; input is streamed and heap-selected",
+    )
+
+    parser.add_argument(
+        "--bottom",
+        action="store_true",
+        help="With --limit, keep the N lowest-scoring entities instead",
+    )
+
     args = parser.parse_args()
+    if args.bottom and args.limit is None:
+        parser.error("--bottom requires --limit")
 
     try:
-        # WHY: Clear workflow - load, configure, score, export
         framework = ScoringFramework(verbose=args.verbose)
-        framework.load_entities(args.input)
-        framework.load_weights(args.weights)
-        framework.rank_all()
-        framework.export(args.output, include_details=not args.compact)
-        framework.print_summary(top_n=args.top)
+        if args.limit is not None:
+            # WHY: Selection mode never holds more than --limit scored entities
+            framework.load_weights(args.weights)
+            stream = iter_entities(args.input)
+            if args.bottom:
+                selected = framework.select_bottom(args.limit, stream)
+            else:
+                selected = framework.select_top(args.limit, stream)
+            framework.export(args.output, include_details=not args.compact, entities=selected)
+            framework.print_summary(top_n=args.top, entities=selected)
+        else:
+            # WHY: Clear workflow - load, configure, score, export
+            framework.load_entities(args.input)
+            framework.load_weights(args.weights)
+            framework.rank_all()
+            framework.export(args.output, include_details=not args.compact)
+            framework.print_summary(top_n=args.top)
 
         if args.verbose:
             print(
@@ -7,12 +7,19 @@ actual behavior. Flags skeleton tests and stub implementations.
 USAGE:
   python test_quality_analyzer.py <test_file_or_directory>
   python test_quality_analyzer.py --min-score 70 tests/
+  python test_quality_analyzer.py --baseline .test-quality-baseline.json tests/
 
 EXITS:
   0 = All tests meet quality threshold
   1 = Some tests below quality threshold
   2 = Error in analysis
 
+BASELINE MODE:
+  With --baseline, only test files changed since the baseline are re-analyzed
+  (by stat/content hash, or git diff with --changed-since). The report adds the
+  issues that are new or resolved, and exit code 1 means a regression: a new
+  issue or a file that newly fell below the threshold.
+
 QUALITY METRICS:
 - Has behavioral assertions (not just exit code checks)
 - Verifies output content (not just success status)
@@ -25,10 +32,19 @@ import argparse
 import json
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+# WHY: Baseline helpers live next to this script and are shared with quality_pattern_detector.py
+sys.path.insert(0, str(Path(__file__).parent))
+from finding_baseline import (  # noqa: E402
+    FindingBaseline,
+    config_hash,
+    diff_findings,
+    git_changed_files,
+)
+
 
 # ==============================================================================
 # LOW-QUALITY PATTERNS (indicate build-only or skeleton tests)
@@ -246,31 +262,130 @@ def analyze_test_file(file_path: Path) -> TestAnalysis:
     return analysis
 
 
-def analyze_directory(directory: Path, recursive: bool = True) -> list[TestAnalysis]:
-    """Analyze all test files in a directory."""
-    results = []
-
-    # Test file patterns
-    test_patterns = [
-        "**/test_*.py",
-        "**/*_test.py",
-        "**/tests/*.py",
-        "**/test/*.rs",
-        "**/*_test.rs",
-        "**/*.test.js",
-        "**/*.test.ts",
-        "**/*.spec.js",
-        "**/*.spec.ts",
-    ]
+# Test file patterns
+TEST_FILE_PATTERNS = [
+    "**/test_*.py",
+    "**/*_test.py",
+    "**/tests/*.py",
+    "**/test/*.rs",
+    "**/*_test.rs",
+    "**/*.test.js",
+    "**/*.test.ts",
+    "**/*.spec.js",
+    "**/*.spec.ts",
+]
+
 
+def find_test_files(directory: Path) -> list[Path]:
+    """Find test files in a directory, in pattern order without duplicates."""
+    files = []
     seen_files = set()
-    for pattern in test_patterns:
+    for pattern in TEST_FILE_PATTERNS:
         for file_path in directory.glob(pattern):
             if file_path.is_file() and file_path not in seen_files:
                 seen_files.add(file_path)
-                results.append(analyze_test_file(file_path))
+                files.append(file_path)
+    return files
+
+
+def analyze_directory(directory: Path, recursive: bool = True) -> list[TestAnalysis]:
+    """Analyze all test files in a directory."""
+    return [analyze_test_file(file_path) for file_path in find_test_files(directory)]
+
+
+def analysis_from_dict(file_path: Path, data: dict[str, Any]) -> TestAnalysis:
+    """Rebuild a stored analysis for a file."""
+    return TestAnalysis(
+        file_path=str(file_path),
+        language=data["language"],
+        test_count=data["test_count"],
+        low_quality_count=data["low_quality_count"],
+        behavioral_count=data["behavioral_count"],
+        issues=[TestIssue(**issue) for issue in data["issues"]],
+        score=data["score"],
+    )
+
 
-    return results
+def _issue_key(issue: dict[str, Any]) -> tuple[str, str]:
+    """Identity of an issue across runs (line numbers shift with unrelated edits)."""
+    return (issue["issue_type"], issue["description"])
+
+
+def analyze_incremental(
+    directory: Path,
+    baseline: FindingBaseline,
+    min_score: int = 70,
+    changed: set[str] | None = None,
+) -> tuple[list[TestAnalysis], dict[str, Any]]:
+    """
+    Analyze only test files changed since the baseline.
+
+    Unchanged files reuse their stored analysis, so the returned list still
+    covers every test file. The baseline is updated in place.
+
+    Args:
+        directory: Directory to analyze
+        baseline: Baseline with stored per-file analyses
+        min_score: Threshold used to detect files that newly fail
+        changed: Relative paths known to have changed (e.g. from git);
+            None means every file is checked by stat and content hash
+
+    Returns:
+        Tuple of (analyses for all test files, baseline delta)
+    """
+    files = find_test_files(directory)
+    analyses = []
+    new_issues: list[dict[str, Any]] = []
+    resolved_issues: list[dict[str, Any]] = []
+    newly_failing: list[str] = []
+    rescanned = 0
+    rel_paths = []
+
+    for file_path in files:
+        rel = file_path.relative_to(directory).as_posix()
+        rel_paths.append(rel)
+        stored = baseline.findings(rel)
+        if changed is not None:
+            unchanged = rel in baseline.files and rel not in changed
+        else:
+            unchanged = baseline.is_unchanged(rel, file_path)
+        if unchanged:
+            analyses.append(analysis_from_dict(file_path, stored[0]))
+            continue
+
+        rescanned += 1
+        analysis = analyze_test_file(file_path)
+        analyses.append(analysis)
+        data = asdict(analysis)
+        del data["file_path"]
+
+        old_issues = stored[0]["issues"] if stored else []
+        added, removed = diff_findings(old_issues, data["issues"], _issue_key)
+        new_issues.extend({"file": str(file_path), **issue} for issue in added)
+        resolved_issues.extend({"file": str(file_path), **issue} for issue in removed)
+
+        was_passing = not stored or stored[0]["score"] >= min_score or stored[0]["test_count"] == 0
+        if was_passing and analysis.test_count > 0 and analysis.score < min_score:
+            newly_failing.append(str(file_path))
+
+        # Each file stores a single finding: its whole analysis
+        baseline.record(rel, file_path, [data])
+
+    previous = {rel: baseline.findings(rel) for rel in baseline.files}
+    removed_files = baseline.retain(rel_paths)
+    for rel in removed_files:
+        for issue in previous[rel][0]["issues"] if previous[rel] else []:
+            resolved_issues.append({"file": str(directory / rel), **issue})
+
+    delta = {
+        "files_rescanned": rescanned,
+        "files_reused": len(files) - rescanned,
+        "files_removed": len(removed_files),
+        "new_issues": new_issues,
+        "resolved_issues": resolved_issues,
+        "newly_failing_files": newly_failing,
+    }
+    return analyses, delta
 
 
 def generate_report(
@@ -356,9 +471,31 @@ def print_report(report: dict[str, Any], verbose: bool = False) -> None:
                 if len(file_info["issues"]) > 5:
                     print(f"  ... and {len(file_info['issues']) - 5} more issues")
 
+    baseline = report.get("baseline")
+    if baseline:
+        print("\n" + "-" * 70)
+        print("CHANGES SINCE BASELINE")
+        print("-" * 70)
+        print(
+            f"Files re-analyzed:   {baseline['files_rescanned']} "
+            f"(reused {baseline['files_reused']}, removed {baseline['files_removed']})"
+        )
+        print(f"New issues:          {len(baseline['new_issues'])}")
+        print(f"Resolved issues:     {len(baseline['resolved_issues'])}")
+        print(f"Newly failing files: {len(baseline['newly_failing_files'])}")
+        for issue in baseline["new_issues"][:10]:
+            print(f"  + {issue['file']}:{issue['line_number']}: {issue['description']}")
+        if len(baseline["new_issues"]) > 10:
+            print(f"  ... and {len(baseline['new_issues']) - 10} more new issues")
+
     print("\n" + "=" * 70)
 
-    if summary["failing_files"] > 0:
+    if baseline:
+        if baseline["new_issues"] or baseline["newly_failing_files"]:
+            print("RESULT: FAIL - Test quality regressed since baseline")
+        else:
+            print("RESULT: PASS - No test quality regressions since baseline")
+    elif summary["failing_files"] > 0:
         print("RESULT: FAIL - Some test files below quality threshold")
     else:
         print("RESULT: PASS - All test files meet quality threshold")
@@ -393,6 +530,22 @@ def main() -> int:
         default=True,
         help="Search recursively (default: True)",
     )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON file; re-analyze only changed files and report "
+        "new/resolved issues (created on first use)",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="With --baseline, take the changed files from git diff against REF",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="With --baseline, save this run's analyses as the new baseline",
+    )
 
     args = parser.parse_args()
 
@@ -402,8 +555,36 @@ def main() -> int:
         print(f"ERROR: Path does not exist: {path}", file=sys.stderr)
         return 2
 
+    if args.baseline and not path.is_dir():
+        print("ERROR: --baseline requires a directory", file=sys.stderr)
+        return 2
+    if (args.changed_since or args.update_baseline) and not args.baseline:
+        print("ERROR: --changed-since and --update-baseline require --baseline", file=sys.stderr)
+        return 2
+
+    delta = None
     if path.is_file():
         analyses = [analyze_test_file(path)]
+    elif args.baseline:
+        # Stored analyses only carry over while the pattern tables are unchanged
+        config = config_hash(
+            {
+                "low_quality": [LOW_QUALITY_PATTERNS_RUST, LOW_QUALITY_PATTERNS_PYTHON, LOW_QUALITY_PATTERNS_JS],
+                "required": [REQUIRED_PATTERNS_RUST, REQUIRED_PATTERNS_PYTHON, REQUIRED_PATTERNS_JS],
+                "files": TEST_FILE_PATTERNS,
+            }
+        )
+        baseline_exists = args.baseline.exists()
+        baseline = FindingBaseline.load(args.baseline, "test_quality_analyzer", config)
+        changed = git_changed_files(path, args.changed_since) if args.changed_since else None
+        if args.changed_since and changed is None:
+            print(
+                f"WARNING: git diff against {args.changed_since} failed, falling back to content checks",
+                file=sys.stderr,
+            )
+        analyses, delta = analyze_incremental(path, baseline, args.min_score, changed)
+        if args.update_baseline or not baseline_exists:
+            baseline.save(args.baseline)
     else:
         analyses = analyze_directory(path, recursive=args.recursive)
 
@@ -412,12 +593,18 @@ def main() -> int:
         return 0
 
     report = generate_report(analyses, min_score=args.min_score)
+    if delta is not None:
+        report["baseline"] = delta
 
     if args.json:
         print(json.dumps(report, indent=2))
     else:
         print_report(report, verbose=args.verbose)
 
+    # Against a baseline, only regressions fail the run
+    if delta is not None:
+        return 1 if delta["new_issues"] or delta["newly_failing_files"] else 0
+
     # Exit with failure if any files are below threshold
     if report["summary"]["failing_files"] > 0:
         return 1
@@ -2,20 +2,34 @@
 """
 Traceability validator for specification architect skill.
 Validates that all requirements are covered by implementation tasks.
+
+WHY index: Coverage is answered from a bidirectional criterion <-> task index built
+in one pass, so large specs validate in linear time. The parsed spec and index are
+cached next to the spec files and reused while their content hashes match; when
+only tasks.md changes, just the task side is rebuilt.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
 import sys
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
 
 # WHY: Import cross-platform utilities for consistency
 SKILLS_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(SKILLS_DIR / "shared"))
 from thresholds import VERIFICATION  # type: ignore[import-not-found]  # noqa: E402
 
+# WHY: Hidden file next to the spec files; safe to delete at any time
+INDEX_CACHE_NAME = ".traceability_index.json"
+
+# WHY: Bump when the cache layout or parsing changes so old caches are ignored
+INDEX_CACHE_VERSION = 2
+
 
 class RequirementData(TypedDict):
     """Type for requirement data structure."""
@@ -51,6 +65,96 @@ class ResearchValidationResult(TypedDict, total=False):
     total_citations: int
 
 
+def _decode_spec(data: bytes) -> str:
+    """Decode spec file bytes the way read_text() would.
+
+    WHY: load_index() hashes the raw bytes, but the parsers expect the
+    universal-newline text read_text() returns; CRLF specs otherwise match
+    no headers at all.
+    """
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class TraceabilityIndex:
+    """Bidirectional index between acceptance criteria and tasks.
+
+    WHY: Coverage questions ("which tasks implement 1.2?", "is 3.4 covered?",
+    "which references are invalid?") become dictionary lookups instead of a
+    scan over every task per criterion.
+    """
+
+    def __init__(
+        self, requirements: dict[str, RequirementData], tasks: list[TaskData]
+    ) -> None:
+        """Build the index from parsed requirements and tasks.
+
+        Args:
+            requirements: Parsed requirements (see parse_requirements)
+            tasks: Parsed tasks (see parse_tasks)
+        """
+        # WHY: Criterion -> requirement number, in document order
+        self.criteria: dict[str, str] = {
+            ac_ref: req_num
+            for req_num, req_data in requirements.items()
+            for ac_ref in req_data["acceptance_criteria"]
+        }
+        self.criterion_tasks: dict[str, list[str]] = {}
+        self.task_criteria: dict[str, list[str]] = {}
+        self.invalid_references: list[str] = []
+        self.set_tasks(tasks)
+
+    def set_tasks(self, tasks: list[TaskData]) -> None:
+        """Rebuild the task side of the index.
+
+        WHY: The criteria side only depends on requirements.md, so a change to
+        tasks.md re-links tasks without touching it.
+        """
+        self.criterion_tasks = {ac_ref: [] for ac_ref in self.criteria}
+        self.task_criteria = {}
+        invalid: dict[str, None] = {}  # WHY: Ordered set, first occurrence wins
+
+        for task in tasks:
+            task_id = task["task_id"]
+            linked = self.task_criteria.setdefault(task_id, [])
+            # WHY: A task is listed once per criterion even if it repeats the reference
+            for req_ref in dict.fromkeys(task["requirement_references"]):
+                implementing = self.criterion_tasks.get(req_ref)
+                if implementing is None:
+                    invalid[req_ref] = None
+                    continue
+                implementing.append(task_id)
+                if req_ref not in linked:
+                    linked.append(req_ref)
+        self.invalid_references = list(invalid)
+
+    def covered(self) -> list[str]:
+        """Criteria implemented by at least one task, in document order."""
+        return [ac_ref for ac_ref, task_ids in self.criterion_tasks.items() if task_ids]
+
+    def missing(self) -> list[str]:
+        """Criteria no task implements, in document order."""
+        return [ac_ref for ac_ref, task_ids in self.criterion_tasks.items() if not task_ids]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the on-disk cache."""
+        return {
+            "criteria": self.criteria,
+            "criterion_tasks": self.criterion_tasks,
+            "task_criteria": self.task_criteria,
+            "invalid_references": self.invalid_references,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TraceabilityIndex:
+        """Restore an index saved with to_dict() without rebuilding it."""
+        index = cls.__new__(cls)
+        index.criteria = data["criteria"]
+        index.criterion_tasks = data["criterion_tasks"]
+        index.task_criteria = data["task_criteria"]
+        index.invalid_references = data["invalid_references"]
+        return index
+
+
 class TraceabilityValidator:
     """Validator for requirements traceability and research evidence."""
 
@@ -64,6 +168,8 @@ class TraceabilityValidator:
         self.requirements: dict[str, RequirementData] = {}
         self.tasks: list[TaskData] = []
         self.research_citations: dict[str, str] = {}
+        # WHY: Built lazily from requirements/tasks, dropped when either is re-parsed
+        self.index: TraceabilityIndex | None = None
 
     def parse_requirements(self, requirements_file: str) -> dict[str, RequirementData]:
         """Parse requirements.md to extract requirements and acceptance criteria.
@@ -82,7 +188,17 @@ class TraceabilityValidator:
             raise FileNotFoundError(f"Requirements file not found: {requirements_file}")
 
         content = req_file.read_text(encoding="utf-8")
+        self.requirements = self._parse_requirements_text(content)
+        self.index = None
+        return self.requirements
 
+    @staticmethod
+    def _parse_requirements_text(content: str) -> dict[str, RequirementData]:
+        """Parse requirements markdown content.
+
+        WHY: Separate from file reading so load_index() parses the exact bytes
+        it hashed.
+        """
         # WHY: Split content by requirement headers and capture requirement numbers
         pattern = r"\n### Requirement (\d+): ([^\n]+)"
         matches = list(re.finditer(pattern, content))
@@ -125,7 +241,6 @@ class TraceabilityValidator:
                     ac_text_item.strip()
                 )
 
-        self.requirements = requirements
         return requirements
 
     def parse_tasks(self, tasks_file: str) -> list[TaskData]:
@@ -145,7 +260,17 @@ class TraceabilityValidator:
             raise FileNotFoundError(f"Tasks file not found: {tasks_file}")
 
         content = task_file.read_text(encoding="utf-8")
+        self.tasks = self._parse_tasks_text(content)
+        self.index = None
+        return self.tasks
 
+    @staticmethod
+    def _parse_tasks_text(content: str) -> list[TaskData]:
+        """Parse tasks markdown content.
+
+        WHY: Separate from file reading so load_index() parses the exact bytes
+        it hashed.
+        """
         # WHY: Parse tasks and requirement references
         task_pattern = r"- \[ \] (\d+).+?_Requirements: (.+?)_"
         matches = re.findall(task_pattern, content, re.MULTILINE | re.DOTALL)
@@ -158,9 +283,125 @@ class TraceabilityValidator:
                 TaskData(task_id=task_num, requirement_references=req_refs_list)
             )
 
-        self.tasks = tasks
         return tasks
 
+    def get_index(self) -> TraceabilityIndex:
+        """Return the index for the current requirements and tasks.
+
+        WHY: Built on first use so callers that set requirements/tasks directly
+        still get correct coverage.
+        """
+        if self.index is None:
+            self.index = TraceabilityIndex(self.requirements, self.tasks)
+        return self.index
+
+    def load_index(
+        self,
+        requirements_file: str = "requirements.md",
+        tasks_file: str = "tasks.md",
+        use_cache: bool = True,
+    ) -> TraceabilityIndex:
+        """Parse the spec files and build the index, reusing the cache when valid.
+
+        WHY hashes: Each file's SHA-256 decides whether its cached parse can be
+        reused. With only tasks.md changed, the cached requirements and
+        criteria side are kept and only tasks are re-parsed and re-linked.
+
+        Args:
+            requirements_file: The name of the requirements file.
+            tasks_file: The name of the tasks file.
+            use_cache: Read and update INDEX_CACHE_NAME in the base path.
+
+        Returns:
+            The index, also stored on self.index.
+
+        Raises:
+            FileNotFoundError: If a spec file does not exist.
+        """
+        req_file = self.base_path / requirements_file
+        if not req_file.exists():
+            raise FileNotFoundError(f"Requirements file not found: {requirements_file}")
+        task_file = self.base_path / tasks_file
+        if not task_file.exists():
+            raise FileNotFoundError(f"Tasks file not found: {tasks_file}")
+
+        req_bytes = req_file.read_bytes()
+        task_bytes = task_file.read_bytes()
+        req_hash = hashlib.sha256(req_bytes).hexdigest()
+        task_hash = hashlib.sha256(task_bytes).hexdigest()
+
+        cache = self._read_index_cache() if use_cache else None
+        req_cached = (
+            cache is not None
+            and cache.get("requirements_file") == requirements_file
+            and cache.get("requirements_sha256") == req_hash
+        )
+        tasks_cached = (
+            req_cached
+            and cache is not None
+            and cache.get("tasks_file") == tasks_file
+            and cache.get("tasks_sha256") == task_hash
+        )
+
+        if req_cached and cache is not None:
+            self.requirements = cache["requirements"]
+            index = TraceabilityIndex.from_dict(cache["index"])
+            if tasks_cached:
+                self.tasks = cache["tasks"]
+            else:
+                # WHY: Incremental path - only the task side changes
+                self.tasks = self._parse_tasks_text(_decode_spec(task_bytes))
+                index.set_tasks(self.tasks)
+        else:
+            self.requirements = self._parse_requirements_text(_decode_spec(req_bytes))
+            self.tasks = self._parse_tasks_text(_decode_spec(task_bytes))
+            index = TraceabilityIndex(self.requirements, self.tasks)
+        self.index = index
+
+        if use_cache and not tasks_cached:
+            self._write_index_cache(
+                {
+                    "version": INDEX_CACHE_VERSION,
+                    "requirements_file": requirements_file,
+                    "requirements_sha256": req_hash,
+                    "tasks_file": tasks_file,
+                    "tasks_sha256": task_hash,
+                    "requirements": self.requirements,
+                    "tasks": self.tasks,
+                    "index": index.to_dict(),
+                }
+            )
+        return index
+
+    def _read_index_cache(self) -> dict[str, Any] | None:
+        """Load the index cache, or None if missing, unreadable or outdated."""
+        try:
+            with open(self.base_path / INDEX_CACHE_NAME, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_CACHE_VERSION:
+            return None
+        return data
+
+    def _write_index_cache(self, data: dict[str, Any]) -> None:
+        """Write the index cache atomically.
+
+        WHY: A read-only spec directory only costs re-parsing next time, so
+        write failures are ignored.
+        """
+        path = self.base_path / INDEX_CACHE_NAME
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def validate_traceability(
         self,
     ) -> tuple[TraceabilityResult, list[str], list[str]]:
@@ -169,36 +410,24 @@ class TraceabilityValidator:
         Returns:
             A tuple containing:
                 - TraceabilityResult with coverage statistics
-                - List of missing criteria
-                - List of invalid references
+                - List of missing criteria (document order)
+                - List of invalid references (first occurrence order)
         """
-        all_criteria: set[str] = set()
-        for req_data in self.requirements.values():
-            for ac_ref in req_data["acceptance_criteria"]:
-                all_criteria.add(ac_ref)
-
-        covered_criteria: set[str] = set()
-        invalid_references: set[str] = set()
-
-        for task in self.tasks:
-            for req_ref in task["requirement_references"]:
-                if req_ref in all_criteria:
-                    covered_criteria.add(req_ref)
-                else:
-                    invalid_references.add(req_ref)
-
-        coverage_pct = (
-            (len(covered_criteria) / len(all_criteria) * 100) if all_criteria else 100.0
-        )
+        index = self.get_index()
+        total = len(index.criteria)
+        missing = index.missing()
+        covered = total - len(missing)
+
+        coverage_pct = (covered / total * 100) if total else 100.0
 
         return (
             TraceabilityResult(
-                total_criteria=len(all_criteria),
-                covered_criteria=len(covered_criteria),
+                total_criteria=total,
+                covered_criteria=covered,
                 coverage_percentage=coverage_pct,
             ),
-            list(all_criteria - covered_criteria),
-            list(invalid_references),
+            missing,
+            list(index.invalid_references),
         )
 
     def validate_research_evidence(
@@ -315,6 +544,7 @@ class TraceabilityValidator:
         requirements_file: str = "requirements.md",
         tasks_file: str = "tasks.md",
         research_file: str = "example_research.md",
+        use_index_cache: bool = False,
     ) -> str:
         """Generate a complete validation report.
 
@@ -322,47 +552,40 @@ class TraceabilityValidator:
             requirements_file: The name of the requirements file.
             tasks_file: The name of the tasks file.
             research_file: The name of the research file.
+            use_index_cache: Reuse and update the on-disk index cache.
 
         Returns:
             A formatted validation report as a string.
         """
-        self.parse_requirements(requirements_file)
-        self.parse_tasks(tasks_file)
+        index = self.load_index(requirements_file, tasks_file, use_index_cache)
 
         validation_result, missing, invalid = self.validate_traceability()
         research_validation = self.validate_research_evidence(research_file)
 
-        report = """# Validation Report
+        # WHY: Collect parts and join once; repeated += is quadratic on large specs
+        parts = ["""# Validation Report
 
 ## 1. Requirements to Tasks Traceability Matrix
 
 | Requirement | Acceptance Criterion | Implementing Task(s) | Status |
-|---|---|---|---|"""
-
-        # WHY: Generate traceability matrix
-        for req_num, req_data in self.requirements.items():
-            for ac_ref, _ac_text in req_data["acceptance_criteria"].items():
-                # WHY: Find tasks implementing this criterion
-                implementing_tasks: list[str] = []
-                for task in self.tasks:
-                    if ac_ref in task["requirement_references"]:
-                        implementing_tasks.append(f"Task {task['task_id']}")
-
-                status = "Covered" if implementing_tasks else "Missing"
-                tasks_str = (
-                    ", ".join(implementing_tasks) if implementing_tasks else "None"
-                )
+|---|---|---|---|"""]
 
-                report += f"\n| {req_num} | {ac_ref} | {tasks_str} | {status} |"
+        # WHY: Generate traceability matrix from the index (one lookup per criterion)
+        for ac_ref, req_num in index.criteria.items():
+            implementing_tasks = [
+                f"Task {task_id}" for task_id in index.criterion_tasks[ac_ref]
+            ]
+
+            status = "Covered" if implementing_tasks else "Missing"
+            tasks_str = ", ".join(implementing_tasks) if implementing_tasks else "None"
+
+            parts.append(f"\n| {req_num} | {ac_ref} | {tasks_str} | {status} |")
+        report = "".join(parts)
 
         total_criteria = validation_result["total_criteria"]
         covered_criteria = validation_result["covered_criteria"]
         coverage_pct = validation_result["coverage_percentage"]
-        covered_list = [
-            ref
-            for ref in self._get_all_criteria()
-            if ref in self._get_covered_criteria()
-        ]
+        covered_list = index.covered()
         missing_str = str(missing) if missing else "None"
         invalid_str = str(invalid) if invalid else "None"
         total_sources = research_validation.get("total_sources", 0)
@@ -458,11 +681,7 @@ class TraceabilityValidator:
         Returns:
             A set of all acceptance criteria reference strings.
         """
-        all_criteria: set[str] = set()
-        for req_data in self.requirements.values():
-            for ac_ref in req_data["acceptance_criteria"]:
-                all_criteria.add(ac_ref)
-        return all_criteria
+        return set(self.get_index().criteria)
 
     def _get_covered_criteria(self) -> set[str]:
         """Get all covered acceptance criteria references.
@@ -470,15 +689,7 @@ class TraceabilityValidator:
         Returns:
             A set of covered acceptance criteria reference strings.
         """
-        covered_criteria: set[str] = set()
-        all_criteria = self._get_all_criteria()
-
-        for task in self.tasks:
-            for req_ref in task["requirement_references"]:
-                if req_ref in all_criteria:
-                    covered_criteria.add(req_ref)
-
-        return covered_criteria
+        return set(self.get_index().covered())
 
 
 def main() -> int:
@@ -502,13 +713,21 @@ def main() -> int:
     parser.add_argument(
         "--research", default="example_research.md", help="Research file name"
     )
+    parser.add_argument(
+        "--no-index-cache",
+        action="store_true",
+        help=f"Do not read or write the {INDEX_CACHE_NAME} cache next to the spec",
+    )
 
     args = parser.parse_args()
 
     try:
         validator = TraceabilityValidator(args.path)
         report = validator.generate_validation_report(
-            args.requirements, args.tasks, args.research
+            args.requirements,
+            args.tasks,
+            args.research,
+            use_index_cache=not args.no_index_cache,
         )
         print(report)
 
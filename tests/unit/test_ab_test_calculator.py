@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Tests for ab_test_calculator.py -- A/B test statistics.
+
+These tests check the z-test, t-test, confidence intervals and sample sizes
+against reference values (SciPy / statsmodels results and published normal and
+t tables), including zero-conversion and single-observation edge cases, and
+that the stdlib and NumPy batch paths agree with the single-test methods.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Path to the script under test, plus the shared modules it imports
+SCRIPTS_DIR = REPO_ROOT / "skills" / "eoa-verification-patterns" / "scripts"
+
+sys.path.insert(0, str(REPO_ROOT / "shared"))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# ab_test_calculator imports cross_platform from the installed skills/shared
+pytest.importorskip("cross_platform")
+
+from ab_test_calculator import ABTestCalculator  # noqa: E402
+
+
+@pytest.fixture
+def calc():
+    """Calculator with alpha=0.05, power=0.80, MDE=0.05."""
+    calculator = ABTestCalculator()
+    calculator.set_parameters(alpha=0.05, power=0.80, mde=0.05)
+    return calculator
+
+
+@pytest.fixture(params=["stdlib", "numpy"])
+def backend(request):
+    """Batch backend under test."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return request.param
+
+
+class TestDistributions:
+    """Normal and t distribution helpers match published tables."""
+
+    @pytest.mark.parametrize(
+        ("probability", "expected"),
+        [(0.975, 1.959964), (0.80, 0.841621), (0.90, 1.281552), (0.995, 2.575829), (0.5, 0.0)],
+    )
+    def test_inverse_normal(self, calc, probability, expected):
+        """_z_score is the inverse standard normal CDF."""
+        assert calc._z_score(probability) == pytest.approx(expected, abs=1e-6)
+
+    @pytest.mark.parametrize(("z", "expected"), [(1.0, 0.317311), (1.96, 0.049996), (-2.5, 0.012419)])
+    def test_normal_p_value(self, calc, z, expected):
+        """Two-tailed normal p-values (Abramowitz and Stegun, error < 1e-7)."""
+        assert calc._z_to_p_value(z) == pytest.approx(expected, abs=1e-6)
+
+    @pytest.mark.parametrize(
+        ("t", "df", "expected"),
+        [
+            (12.706, 1, 0.05),  # t table, alpha=0.05 two-tailed
+            (2.228, 10, 0.05),
+            (4.604, 4, 0.01),  # t table, alpha=0.01 two-tailed
+            (2.0, 10, 0.073388),  # scipy.stats.t.sf(2, 10) * 2
+            (0.5, 2, 2 / 3),  # closed form for df=2: 1 - t / sqrt(2 + t^2)
+            (0.0, 5, 1.0),
+        ],
+    )
+    def test_t_p_value(self, calc, t, df, expected):
+        """Two-tailed t p-values match t tables."""
+        assert calc._t_to_p_value(t, df) == pytest.approx(expected, abs=1e-4)
+        assert calc._t_to_p_value(-t, df) == calc._t_to_p_value(t, df)
+
+
+class TestProportionTest:
+    """Two-proportion z-test (statsmodels proportions_ztest reference)."""
+
+    def test_known_answer(self, calc):
+        """12% vs 15% conversion over 1000 users each."""
+        result = calc.run_proportion_test({"values": [120], "n": 1000}, {"values": [150], "n": 1000})
+
+        assert result["z_statistic"] == pytest.approx(1.963050, abs=1e-6)
+        assert result["p_value"] == pytest.approx(0.049640, abs=1e-6)
+        assert result["confidence_interval"] == pytest.approx((0.0000760, 0.0599240), abs=1e-6)
+        assert result["cohens_h"] == pytest.approx(2 * (math.asin(math.sqrt(0.15)) - math.asin(math.sqrt(0.12))))
+        assert result["significant"] is True
+
+    def test_zero_conversions(self, calc):
+        """No conversions in either group: no difference and no error."""
+        result = calc.run_proportion_test({"values": [0], "n": 1000}, {"values": [0], "n": 1000})
+
+        assert result["z_statistic"] == 0
+        assert result["p_value"] == pytest.approx(1.0, abs=1e-6)
+        assert result["confidence_interval"] == (0.0, 0.0)
+        assert result["significant"] is False
+
+    def test_zero_conversions_in_control(self, calc):
+        """0/100 vs 5/100 uses the pooled rate for the test, unpooled for the interval."""
+        result = calc.run_proportion_test({"values": [0], "n": 100}, {"values": [5], "n": 100})
+
+        assert result["z_statistic"] == pytest.approx(2.264554, abs=1e-6)
+        assert result["p_value"] == pytest.approx(0.023540, abs=1e-6)
+        assert result["confidence_interval"] == pytest.approx((0.05 - 0.042716, 0.05 + 0.042716), abs=1e-6)
+
+    def test_single_trial(self, calc):
+        """n=1 per group: 0/1 vs 1/1 gives z = sqrt(2)."""
+        result = calc.run_proportion_test({"values": [0], "n": 1}, {"values": [1], "n": 1})
+
+        assert result["z_statistic"] == pytest.approx(math.sqrt(2))
+        assert result["p_value"] == pytest.approx(0.157299, abs=1e-6)
+        assert result["significant"] is False
+
+
+class TestMeanTest:
+    """Pooled two-sample t-test (scipy.stats.ttest_ind reference)."""
+
+    def test_known_answer(self, calc):
+        """Means 3 and 5 with equal variance 2.5, n=5 each."""
+        result = calc.run_mean_test({"values": [1, 2, 3, 4, 5]}, {"values": [3, 4, 5, 6, 7]})
+
+        assert result["t_statistic"] == pytest.approx(2.0)
+        assert result["degrees_of_freedom"] == 8
+        assert result["p_value"] == pytest.approx(0.080516, abs=1e-6)
+        # t(0.975, 8) = 2.306 from the t table, standard error 1.0
+        assert result["confidence_interval"] == pytest.approx((-0.306, 4.306))
+        assert result["significant"] is False
+
+    def test_single_value_is_rejected(self, calc):
+        """Sample variance needs at least two values per group."""
+        with pytest.raises(ValueError):
+            calc.run_mean_test({"values": [1]}, {"values": [2, 3]})
+
+
+class TestConfidenceInterval:
+    """Single-sample mean confidence intervals."""
+
+    def test_small_sample_uses_t(self, calc):
+        """1..10: mean 5.5, standard error 0.957427, t(0.975, 9) = 2.262."""
+        low, high = calc.get_confidence_interval({"values": list(range(1, 11))})
+        assert (low, high) == pytest.approx((5.5 - 2.262 * 0.957427, 5.5 + 2.262 * 0.957427), abs=1e-5)
+
+    @pytest.mark.parametrize(("confidence", "z"), [(0.95, 1.959964), (0.90, 1.644854), (0.99, 2.575829)])
+    def test_large_sample_uses_two_tailed_z(self, calc, confidence, z):
+        """0..99: mean 49.5, standard error 2.901149."""
+        low, high = calc.get_confidence_interval({"values": list(range(100))}, confidence)
+        assert (low, high) == pytest.approx((49.5 - z * 2.901149, 49.5 + z * 2.901149), abs=1e-5)
+
+    def test_single_value_is_rejected(self, calc):
+        """A single value has no sample variance."""
+        with pytest.raises(ValueError):
+            calc.get_confidence_interval({"values": [4.0]})
+
+
+class TestSampleSize:
+    """n = 2 (z_alpha/2 + z_beta)^2 p (1 - p) / MDE^2, rounded up."""
+
+    @pytest.mark.parametrize(("power", "expected"), [(0.80, 566), (0.90, 757)])
+    def test_known_answer(self, calc, power, expected):
+        """Baseline 10%, MDE 5 points, two-tailed alpha 0.05."""
+        calc.set_parameters(alpha=0.05, power=power, mde=0.05)
+        assert calc.calculate_sample_size(0.10) == expected
+
+    def test_grid_matches_single_calculation(self, calc, backend):
+        """sample_size_grid agrees with calculate_sample_size for every cell."""
+        rates, mdes, powers = [0.05, 0.1, 0.5], [0.01, 0.05], [0.8, 0.9]
+        grid = list(calc.sample_size_grid(rates, mdes, powers, backend=backend))
+
+        expected = []
+        for rate in rates:
+            for mde in mdes:
+                for power in powers:
+                    calc.set_parameters(alpha=0.05, power=power, mde=mde)
+                    expected.append(calc.calculate_sample_size(rate))
+        assert [row["required_sample_size_per_group"] for row in grid] == expected
+
+    @pytest.mark.parametrize("rate", [0.0, 1.0])
+    def test_degenerate_baseline_is_rejected(self, calc, rate):
+        """A baseline of 0 or 1 has no variance to size against."""
+        with pytest.raises(ValueError):
+            calc.calculate_sample_size(rate)
+
+
+class TestBatch:
+    """Batch results match the single-test methods on both backends."""
+
+    ROWS = [
+        {"metric": "ctr", "control_successes": 120, "control_n": 1000, "treatment_successes": 150, "treatment_n": 1000},
+        {"metric": "zero", "control_successes": 0, "control_n": 1000, "treatment_successes": 0, "treatment_n": 1000},
+        {"metric": "one", "control_successes": 0, "control_n": 1, "treatment_successes": 1, "treatment_n": 1},
+        {"metric": "latency", "control": {"values": [1, 2, 3, 4, 5]}, "treatment": {"values": [3, 4, 5, 6, 7]}},
+        {"metric": "single", "test_type": "mean", "control": {"values": [1]}, "treatment": {"values": [2]}},
+    ]
+
+    def test_matches_single_tests(self, calc, backend):
+        """Each row equals the corresponding single-test result; bad rows become errors."""
+        results = list(calc.run_batch(self.ROWS, backend=backend))
+
+        assert [r["metric"] for r in results] == ["ctr", "zero", "one", "latency", "single"]
+        for row, result in zip(self.ROWS[:3], results):
+            single = calc.run_proportion_test(
+                {"values": [row["control_successes"]], "n": row["control_n"]},
+                {"values": [row["treatment_successes"]], "n": row["treatment_n"]},
+            )
+            for key in ("z_statistic", "p_value", "confidence_interval", "cohens_h", "significant"):
+                assert result[key] == pytest.approx(single[key], rel=1e-12, abs=1e-15)
+        single = calc.run_mean_test(self.ROWS[3]["control"], self.ROWS[3]["treatment"])
+        for key in ("t_statistic", "degrees_of_freedom", "p_value", "confidence_interval", "cohens_d"):
+            assert results[3][key] == pytest.approx(single[key], rel=1e-12)
+        assert "error" in results[4]
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Tests for benchmark_validation.py -- Validator benchmark and regression suite.
+
+These tests verify that the synthetic plugin generator is deterministic,
+that baseline comparison flags regressions, and that the CLI produces
+machine-readable results for a small tree.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Path to the script under test
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+SCRIPT_PATH = SCRIPTS_DIR / "benchmark_validation.py"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from benchmark_validation import compare_to_baseline, generate_synthetic_plugin  # noqa: E402
+
+
+class TestSyntheticPlugin:
+    """Test synthetic plugin generation."""
+
+    def test_generates_requested_counts(self, tmp_path):
+        """The tree has the requested skills, agents and total file count."""
+        info = generate_synthetic_plugin(tmp_path, skills=4, agents=3, files=40)
+        assert info["files"] == 40
+        assert len(list((tmp_path / "skills").iterdir())) == 4
+        assert len(list((tmp_path / "agents").glob("*.md"))) == 3
+        assert (tmp_path / ".claude-plugin" / "plugin.json").exists()
+
+    def test_same_seed_is_deterministic(self, tmp_path):
+        """Two trees generated with the same seed are byte-identical."""
+        a = generate_synthetic_plugin(tmp_path / "a", skills=2, agents=1, files=20, seed=7)
+        b = generate_synthetic_plugin(tmp_path / "b", skills=2, agents=1, files=20, seed=7)
+        assert a == b
+
+    def test_secret_density_injects_findings(self, tmp_path):
+        """A density of 1.0 puts a fake secret on every filler line."""
+        generate_synthetic_plugin(tmp_path, skills=1, agents=0, files=5, secret_density=1.0, path_density=0.0)
+        skill_md = (tmp_path / "skills" / "bench-skill-0000" / "SKILL.md").read_text(encoding="utf-8")
+        assert "Example credential:" in skill_md
+
+
+class TestBaselineComparison:
+    """Test regression detection against a stored baseline."""
+
+    def test_slowdown_beyond_tolerance_is_regression(self):
+        """A 50% slowdown with 20% tolerance is reported."""
+        baseline = {"results": {"validate_security": {"seconds": 1.0, "peak_rss_mb": 50.0}}}
+        current = {"results": {"validate_security": {"seconds": 1.5, "peak_rss_mb": 50.0}}}
+        regressions = compare_to_baseline(current, baseline, tolerance=0.2)
+        assert len(regressions) == 1
+        assert regressions[0]["metric"] == "seconds"
+        assert regressions[0]["change_pct"] == 50.0
+
+    def test_within_tolerance_is_not_regression(self):
+        """A 10% slowdown with 20% tolerance passes."""
+        baseline = {"results": {"validate_xref": {"seconds": 1.0, "peak_rss_mb": 50.0}}}
+        current = {"results": {"validate_xref": {"seconds": 1.1, "peak_rss_mb": 52.0}}}
+        assert compare_to_baseline(current, baseline, tolerance=0.2) == []
+
+
+class TestCli:
+    """Test the command-line interface end to end."""
+
+    def test_outputs_throughput_json(self, tmp_path):
+        """The CLI reports time, throughput and peak RSS per entry point."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT_PATH),
+                "--skills", "2",
+                "--agents", "1",
+                "--files", "30",
+                "--only", "validate_encoding",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+        output = json.loads(result.stdout)
+        entry = output["results"]["validate_encoding"]
+        assert output["tree"]["files"] == 30
+        assert entry["seconds"] > 0
+        assert entry["files_per_sec"] > 0
+        assert entry["mb_per_sec"] > 0
+        assert entry["errors"] == []
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for eoa_design_search.py -- Design document search.
+
+These tests verify that searches answered from the persistent inverted index
+return exactly what a scan of the design tree returns, including substrings
+that start or end in the middle of an indexed word, and that --query is
+rejected with options that bypass the search index.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Path to the script under test
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from eoa_design_search import DesignIndex, main, search_by_keyword, search_by_uuid  # noqa: E402
+
+DOCUMENTS = {
+    "requirements/auth/specs/tokenizer.md": "---\nuuid: REQ-123def-456\n---\n# Tokenizer\n\nSplits input into tokens.\n",
+    "requirements/auth/rdd/flow.md": "# Flow\n\nThe refresh-token flow maps a -> b for REQ-123def-456.\n",
+    "memory/notes.md": "# Notes\n\nTokenization notes; see EPIC-9f00.\n",
+    "handoffs/impl-1.md": "# Handoff\n\nContinue the parser work.\n",
+}
+
+NEEDLES = ["kenizer", "Tokeniz", "123def", "3def-45", "def-456", "sh-tok", "->", "notes;", "9F00", "missing", "tokens."]
+
+
+@pytest.fixture
+def design_root(tmp_path):
+    """Write a small design tree and return its root."""
+    for rel, content in DOCUMENTS.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+def paths(results):
+    return sorted(r["path"] for r in results)
+
+
+class TestIndexMatchesScan:
+    """Index-backed searches agree with --no-search-index."""
+
+    @pytest.mark.parametrize("needle", NEEDLES)
+    def test_keyword(self, design_root, needle):
+        """Keyword results are identical, including mid-word substrings."""
+        index = DesignIndex.open(design_root)
+        assert paths(index.search_keyword(needle)) == paths(search_by_keyword(design_root, needle))
+
+    @pytest.mark.parametrize("needle", NEEDLES)
+    def test_uuid(self, design_root, needle):
+        """Partial IDs match the same documents as a full scan."""
+        index = DesignIndex.open(design_root)
+        assert paths(index.search_uuid(needle)) == paths(search_by_uuid(design_root, needle))
+
+    def test_partial_ids_are_found(self, design_root):
+        """The reported regressions: mid-token keyword and UUID fragments."""
+        index = DesignIndex.open(design_root)
+        assert len(index.search_keyword("kenizer")) == 1
+        assert len(index.search_uuid("123def")) == 2
+
+
+class TestCommandLine:
+    """Option combinations main() rejects."""
+
+    @pytest.mark.parametrize("option", ["--use-index", "--no-search-index"])
+    def test_query_needs_search_index(self, design_root, monkeypatch, capsys, option):
+        """--query is an error rather than silently ignored."""
+        monkeypatch.setattr(sys, "argv", ["eoa_design_search.py", "--root", str(design_root), "--query", "token", option])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 2
+        assert "--query" in capsys.readouterr().err
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""Tests for eoa_download.py -- Batch document download into EOA storage.
+
+These tests run the batch downloader against a local HTTP server and verify
+that identical attachments are stored once and hardlinked, that stored
+documents are revalidated instead of re-downloaded, that an interrupted
+download resumes with a Range request, and that verification reuses cached
+digests only while a file is unchanged.
+"""
+
+import base64
+import hashlib
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Path to the script under test
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from eoa_batch_download import BatchDownloader, BlobStore, HTTPSession  # noqa: E402
+from eoa_download import (  # noqa: E402
+    VERIFY_CACHE_NAME,
+    download_document,
+    download_documents,
+    get_storage_root,
+    verify_storage,
+)
+
+
+class DocumentHandler(BaseHTTPRequestHandler):
+    """Serves DOCS with ETag and Range support.
+
+    Paths in TRUNCATE are cut short once; paths in BAD_LENGTH are sent with a
+    malformed Content-Length header.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    DOCS: dict[str, bytes] = {}
+    TRUNCATE: set[str] = set()
+    BAD_LENGTH: set[str] = set()
+    REQUESTS: list[dict[str, str]] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.REQUESTS.append({"path": self.path, **dict(self.headers)})
+        body = self.DOCS.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start = 0
+        if self.headers.get("Range") and self.headers.get("If-Range") == etag:
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        if self.path in self.BAD_LENGTH:
+            # Without a usable length the client reads until the connection closes
+            self.send_header("Content-Length", "not-a-number")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(body)
+            self.close_connection = True
+            return
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        if self.path in self.TRUNCATE:
+            self.TRUNCATE.discard(self.path)
+            self.wfile.write(body[start:len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+
+class ForwardProxyHandler(BaseHTTPRequestHandler):
+    """Plain HTTP forward proxy: relays absolute-URL GETs and records them."""
+
+    protocol_version = "HTTP/1.1"
+    REQUESTS: list[dict[str, str]] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.REQUESTS.append({"target": self.path, **dict(self.headers)})
+        parts = self.path.split("/", 3)
+        conn = http.client.HTTPConnection(parts[2], timeout=10)
+        conn.request("GET", "/" + parts[3])
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+        self.send_response(response.status)
+        for name in ("ETag", "Last-Modified"):
+            if response.getheader(name):
+                self.send_header(name, response.getheader(name))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(autouse=True)
+def no_proxy_environment(monkeypatch):
+    """Connect directly unless a test sets proxy variables itself."""
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+
+
+@pytest.fixture
+def proxy():
+    """Start a forward proxy; yields its host:port."""
+    ForwardProxyHandler.REQUESTS = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ForwardProxyHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    """Start a local document server and reset its state."""
+    DocumentHandler.DOCS = {f"/doc{i}.md": f"# Document {i}\n".encode() * 50 for i in range(10)}
+    DocumentHandler.TRUNCATE = set()
+    DocumentHandler.BAD_LENGTH = set()
+    DocumentHandler.REQUESTS = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), DocumentHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestBatchDownload:
+    """Test download_documents against a local server."""
+
+    def test_batch_stores_documents_with_metadata(self, server, tmp_path):
+        """Every item is stored read-only with metadata carrying its SHA256."""
+        items = [
+            {"url": f"{server}/doc{i}.md", "task_id": "GH-1", "category": "reports", "subcategory": "status"}
+            for i in range(5)
+        ]
+        results = download_documents(items, project_root=tmp_path, workers=4)
+
+        assert all(r["success"] for r in results)
+        assert len({r["file_path"] for r in results}) == 5
+        for item, result in zip(items, results):
+            path = Path(result["file_path"])
+            assert path.parent == get_storage_root(tmp_path) / "reports" / "GH-1" / "status"
+            assert path.read_bytes() == DocumentHandler.DOCS[item["url"][len(server):]]
+            metadata = json.loads((path.parent / f"{path.stem}_metadata.json").read_text(encoding="utf-8"))
+            assert metadata["download"]["sha256"] == result["sha256"]
+            assert not path.stat().st_mode & 0o222
+
+    def test_shared_attachment_is_stored_once(self, server, tmp_path):
+        """The same URL referenced from two tasks is fetched once and hardlinked."""
+        items = [
+            {"url": f"{server}/doc1.md", "task_id": "GH-1", "category": "tasks"},
+            {"url": f"{server}/doc1.md", "task_id": "GH-2", "category": "tasks"},
+        ]
+        results = download_documents(items, project_root=tmp_path)
+
+        assert sorted(r["status"] for r in results) == ["deduplicated", "downloaded"]
+        assert len(DocumentHandler.REQUESTS) == 1
+        assert os.stat(results[0]["file_path"]).st_ino == os.stat(results[1]["file_path"]).st_ino
+
+    def test_stored_document_is_revalidated(self, server, tmp_path):
+        """A second download of a stored URL sends If-None-Match and reuses the blob."""
+        first = download_document(f"{server}/doc2.md", "GH-1", "tasks", project_root=tmp_path)
+        results = download_documents(
+            [{"url": f"{server}/doc2.md", "task_id": "GH-3", "category": "tasks"}], project_root=tmp_path
+        )
+
+        assert first is not None
+        assert results[0]["status"] == "revalidated"
+        assert "If-None-Match" in DocumentHandler.REQUESTS[-1]
+        assert Path(results[0]["file_path"]).read_bytes() == first.read_bytes()
+
+    def test_failed_item_does_not_stop_batch(self, server, tmp_path):
+        """A missing document is reported while the rest of the batch succeeds."""
+        items = [
+            {"url": f"{server}/missing.md", "task_id": "GH-1", "category": "tasks"},
+            {"url": f"{server}/doc3.md", "task_id": "GH-1", "category": "tasks"},
+        ]
+        results = download_documents(items, project_root=tmp_path)
+
+        assert not results[0]["success"]
+        assert "404" in results[0]["error"]
+        assert results[1]["success"]
+
+    def test_unexpected_errors_fail_only_their_job(self, server, tmp_path):
+        """A resolver timeout or a malformed header is recorded as that job's error."""
+        def resolver(url):
+            raise subprocess.TimeoutExpired("gh", 30)
+
+        DocumentHandler.BAD_LENGTH.add("/doc5.md")
+        jobs = [
+            {"url": f"{server}/comment#issuecomment-1", "dest": tmp_path / "a.md"},
+            {"url": f"{server}/doc5.md", "dest": tmp_path / "b.md"},
+            {"url": f"{server}/doc6.md", "dest": tmp_path / "c.md"},
+        ]
+        results = BatchDownloader(tmp_path / ".blobs", resolver=resolver).run(jobs)
+
+        assert results[0]["error"].startswith("TimeoutExpired")
+        assert results[1]["error"].startswith("ValueError")
+        assert results[2]["success"]
+        assert (tmp_path / "c.md").read_bytes() == DocumentHandler.DOCS["/doc6.md"]
+
+
+class TestProxy:
+    """HTTPSession honors HTTP(S)_PROXY and NO_PROXY like curl."""
+
+    def test_http_goes_through_proxy(self, server, proxy, tmp_path, monkeypatch):
+        """http URLs are requested from the proxy by absolute URL, with credentials."""
+        monkeypatch.setenv("HTTP_PROXY", f"http://user:p%40ss@{proxy}")
+        results = BatchDownloader(tmp_path / ".blobs", session=HTTPSession()).run(
+            [{"url": f"{server}/doc1.md", "dest": tmp_path / "a.md"}]
+        )
+
+        assert results[0]["success"]
+        assert (tmp_path / "a.md").read_bytes() == DocumentHandler.DOCS["/doc1.md"]
+        request = ForwardProxyHandler.REQUESTS[0]
+        assert request["target"] == f"{server}/doc1.md"
+        assert request["Proxy-Authorization"] == "Basic " + base64.b64encode(b"user:p@ss").decode()
+
+    def test_no_proxy_connects_directly(self, server, proxy, tmp_path, monkeypatch):
+        """Hosts listed in NO_PROXY bypass the proxy."""
+        monkeypatch.setenv("HTTP_PROXY", f"http://{proxy}")
+        monkeypatch.setenv("NO_PROXY", "localhost,127.0.0.1")
+        results = BatchDownloader(tmp_path / ".blobs", session=HTTPSession()).run(
+            [{"url": f"{server}/doc1.md", "dest": tmp_path / "a.md"}]
+        )
+
+        assert results[0]["success"]
+        assert ForwardProxyHandler.REQUESTS == []
+
+    def test_https_uses_connect_tunnel(self, monkeypatch):
+        """https URLs connect to the proxy and tunnel to the origin with CONNECT."""
+        monkeypatch.setenv("HTTPS_PROXY", "proxy.internal:3128")
+        conn, forward = HTTPSession()._connection("https", "github.com")
+
+        assert (conn.host, conn.port) == ("proxy.internal", 3128)
+        assert conn._tunnel_host == "github.com"
+        assert forward is None
+
+    def test_unsupported_proxy_fails_the_job(self, tmp_path, monkeypatch):
+        """A proxy scheme http.client cannot speak is reported, not ignored."""
+        monkeypatch.setenv("HTTP_PROXY", "socks5://127.0.0.1:1080")
+        results = BatchDownloader(tmp_path / ".blobs", session=HTTPSession()).run(
+            [{"url": "http://example.com/doc.md", "dest": tmp_path / "a.md"}]
+        )
+
+        assert "Unsupported proxy" in results[0]["error"]
+
+
+class TestResume:
+    """Test resuming interrupted downloads."""
+
+    def test_interrupted_download_resumes_with_range(self, server, tmp_path):
+        """A truncated response is kept as a partial file and completed by the next run."""
+        DocumentHandler.DOCS["/big.md"] = os.urandom(200_000)
+        DocumentHandler.TRUNCATE.add("/big.md")
+        job = [{"url": f"{server}/big.md", "dest": tmp_path / "out" / "big.md"}]
+
+        first = BatchDownloader(tmp_path / ".blobs").run(job)[0]
+        second = BatchDownloader(tmp_path / ".blobs").run(job)[0]
+
+        assert not first["success"]
+        assert "Incomplete download" in first["error"]
+        assert second["status"] == "resumed"
+        assert DocumentHandler.REQUESTS[-1]["Range"] == "bytes=100000-"
+        assert (tmp_path / "out" / "big.md").read_bytes() == DocumentHandler.DOCS["/big.md"]
+
+    def test_completed_jobs_are_skipped_on_rerun(self, server, tmp_path):
+        """Re-running a batch that partly failed only fetches the failed jobs."""
+        jobs = [
+            {"url": f"{server}/doc4.md", "dest": tmp_path / "a.md"},
+            {"url": f"{server}/later.md", "dest": tmp_path / "b.md"},
+        ]
+        BatchDownloader(tmp_path / ".blobs").run(jobs)
+        DocumentHandler.DOCS["/later.md"] = b"# Later\n"
+        DocumentHandler.REQUESTS.clear()
+
+        results = BatchDownloader(tmp_path / ".blobs").run(jobs)
+
+        assert [r["status"] for r in results] == ["skipped", "downloaded"]
+        assert [r["path"] for r in DocumentHandler.REQUESTS] == ["/later.md"]
+
+
+class TestBlobStoreCache:
+    """Test the persisted URL validator cache."""
+
+    def test_concurrent_saves_do_not_collide(self, tmp_path):
+        """Threads saving at once each use their own temp file."""
+        store = BlobStore(tmp_path / ".blobs")
+        store.remember("https://example.com/a.md", "0" * 64, '"etag"', None)
+        errors: list[BaseException] = []
+
+        def save() -> None:
+            try:
+                for _ in range(20):
+                    store.save()
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        threads = [threading.Thread(target=save) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert BlobStore(tmp_path / ".blobs").http_cache == store.http_cache
+        assert not list((tmp_path / ".blobs").glob("*.tmp"))
+
+    def test_failed_save_is_ignored(self, tmp_path):
+        """An unwritable cache location does not raise."""
+        store = BlobStore(tmp_path / ".blobs")
+        store.cache_path = tmp_path / "missing-dir" / "http-cache.json"
+        store.save()
+        assert not store.cache_path.exists()
+
+
+class TestVerify:
+    """Test verify_storage digest caching and sampling."""
+
+    def test_second_run_trusts_cached_digests(self, server, tmp_path):
+        """Unchanged documents are not hashed again; sample=1.0 re-hashes all of them."""
+        items = [{"url": f"{server}/doc{i}.md", "task_id": "GH-1", "category": "tasks"} for i in range(3)]
+        download_documents(items, project_root=tmp_path)
+
+        first = verify_storage(tmp_path)["stats"]["verification"]
+        second = verify_storage(tmp_path)["stats"]["verification"]
+        sampled = verify_storage(tmp_path, sample=1.0)["stats"]["verification"]
+
+        assert first["hashed_files"] == 3
+        assert (second["hashed_files"], second["cached_files"]) == (0, 3)
+        assert sampled["hashed_files"] == sampled["sampled_files"] == 3
+
+    def test_modified_document_is_rehashed(self, server, tmp_path):
+        """A document rewritten after a verified run is reported as an integrity violation."""
+        result = download_documents(
+            [{"url": f"{server}/doc5.md", "task_id": "GH-1", "category": "tasks"}], project_root=tmp_path
+        )[0]
+        assert verify_storage(tmp_path)["issues"] == []
+
+        path = Path(result["file_path"])
+        path.chmod(0o644)
+        path.write_bytes(b"tampered")
+        path.chmod(0o444)
+        report = verify_storage(tmp_path)
+
+        assert [issue["type"] for issue in report["issues"]] == ["integrity_violation"]
+
+    def test_cache_save_leaves_other_writers_temp_files(self, server, tmp_path):
+        """The digest cache is written through a per-process temp file."""
+        download_documents([{"url": f"{server}/doc6.md", "task_id": "GH-1", "category": "tasks"}], project_root=tmp_path)
+        storage_root = get_storage_root(tmp_path)
+        other = storage_root / f"{VERIFY_CACHE_NAME}.99999.tmp"
+        legacy = (storage_root / VERIFY_CACHE_NAME).with_suffix(".tmp")
+        other.write_text("in flight", encoding="utf-8")
+        legacy.write_text("in flight", encoding="utf-8")
+
+        verify_storage(tmp_path)
+
+        assert other.read_text(encoding="utf-8") == legacy.read_text(encoding="utf-8") == "in flight"
+        assert json.loads((storage_root / VERIFY_CACHE_NAME).read_text(encoding="utf-8"))
+        assert not list(storage_root.glob(f"{VERIFY_CACHE_NAME}.{os.getpid()}.tmp"))
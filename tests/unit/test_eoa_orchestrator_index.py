@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""Tests for the cross-agent index in eoa_orchestrator_download.py.
+
+These tests verify that journaled index records survive concurrent appends,
+compaction running alongside appends and a crash before compaction, that
+eoa_search answers from the store, and that a design root indexed before the
+SQLite store existed keeps its entries when the store is first created.
+Incremental rebuilds must reindex exactly the added, changed and removed
+documents and leave the same views and manifest as a full rebuild, which
+index-rebuild --verify checks. A batch download that crashes partway must not
+leave documents that resume skips but the index never received.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Path to the scripts under test
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "skills" / "eoa-remote-agent-coordinator" / "scripts"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import eoa_orchestrator_download  # noqa: E402
+from eoa_orchestrator_download import (  # noqa: E402
+    IndexStore,
+    IndexWriter,
+    compact_indexes,
+    download_batch_to_agent_folders,
+    index_record,
+    rebuild_indexes,
+    update_index,
+    verify_indexes,
+    write_agent_document_metadata,
+)
+from eoa_search import (  # noqa: E402
+    search_blockers,
+    search_by_agent,
+    search_by_category,
+    search_by_date,
+    search_by_task,
+    search_fulltext,
+)
+
+
+def add_document(design_root, agent, task_id, name, timestamp, category="reports", text="# Report\n"):
+    """Store a received document with its metadata file, as a download does. Returns its relative path."""
+    md_file = design_root / "agents" / agent / "received" / category / task_id / f"{name}.md"
+    md_file.parent.mkdir(parents=True, exist_ok=True)
+    md_file.write_text(text, encoding="utf-8")
+    write_agent_document_metadata(
+        md_file, f"https://example.com/{name}.md", f"https://example.com/{name}.md",
+        "0" * 64, len(text), timestamp, agent, task_id, category,
+    )
+    return str(md_file.relative_to(design_root))
+
+
+def write_legacy_views(design_root, records):
+    """Write by-* JSON views the way the pre-store index writer did."""
+    index_dir = design_root / "index"
+    by_category: dict[str, list] = {}
+    by_task: dict[str, list] = {}
+    for record in records:
+        by_category.setdefault(record["category"], []).append(
+            {"task_id": record["task_id"], "agent": record["agent"], "path": record["path"], "timestamp": record["timestamp"]}
+        )
+        by_task.setdefault(record["task_id"], []).append(record)
+    for category, entries in by_category.items():
+        path = index_dir / "by-category" / f"{category}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(entries, indent=2))
+    for task_id, task_records in by_task.items():
+        path = index_dir / "by-task" / f"{task_id}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "task_id": task_id,
+            "created": task_records[0]["timestamp"],
+            "status": "in-progress",
+            "assigned_agents": [{"agent": r["agent"], "assigned_at": r["timestamp"]} for r in task_records],
+            "documents": [
+                {"type": r["category"], "path": r["path"], "agent": r["agent"], "timestamp": r["timestamp"]}
+                for r in task_records
+            ],
+        }, indent=2))
+
+
+@pytest.fixture
+def legacy_root(tmp_path):
+    """A design root with three documents indexed only as JSON views (no store)."""
+    records = []
+    for i, (agent, task_id) in enumerate([("agent-a", "GH-1"), ("agent-b", "GH-1"), ("agent-a", "GH-2")]):
+        timestamp = f"2026-01-0{i + 1}T10:00:00+00:00"
+        rel = add_document(tmp_path, agent, task_id, f"report{i}", timestamp)
+        records.append(index_record(task_id, agent, "reports", rel, timestamp))
+    write_legacy_views(tmp_path, records)
+    return tmp_path
+
+
+def make_records(prefix, count, task_id="GH-1"):
+    """Build count distinct index records (documents need not exist on disk)."""
+    return [
+        index_record(task_id, f"agent-{prefix}", "reports", f"agents/agent-{prefix}/received/reports/{task_id}/{prefix}{i}.md",
+                     f"2026-02-01T10:{i // 60:02d}:{i % 60:02d}+00:00")
+        for i in range(count)
+    ]
+
+
+def indexed_paths(design_root):
+    """Sorted paths of every document row in the store."""
+    with IndexStore(design_root) as store:
+        return sorted(path for (path,) in store.conn.execute("SELECT path FROM documents"))
+
+
+def all_views(design_root):
+    """Every by-* JSON view, keyed by its path under index/."""
+    index_dir = design_root / "index"
+    return {
+        str(path.relative_to(index_dir)): json.loads(path.read_text())
+        for path in sorted(index_dir.glob("by-*/**/*.json"))
+    }
+
+
+def rewrite(design_root, rel, text):
+    """Replace the content of a stored (read-only) document."""
+    path = design_root / rel
+    path.chmod(0o644)
+    path.write_text(text, encoding="utf-8")
+
+
+def category_view(design_root, category):
+    """Parsed by-category JSON view."""
+    return json.loads((design_root / "index" / "by-category" / f"{category}.json").read_text())
+
+
+class TestMigration:
+    """The first store created on a legacy design root is loaded from agents/."""
+
+    def test_download_keeps_legacy_entries(self, legacy_root):
+        """One update_index() after migration adds to the views instead of replacing them."""
+        timestamp = "2026-01-09T10:00:00+00:00"
+        rel = add_document(legacy_root, "agent-c", "GH-1", "report9", timestamp)
+        update_index(legacy_root, "GH-1", "agent-c", "reports", rel, timestamp)
+
+        assert len(category_view(legacy_root, "reports")) == 4
+        task = json.loads((legacy_root / "index" / "by-task" / "GH-1.json").read_text())
+        assert {d["agent"] for d in task["documents"]} == {"agent-a", "agent-b", "agent-c"}
+        assert search_by_category("reports", legacy_root)["count"] == 4
+
+    def test_search_bootstraps_legacy_root(self, legacy_root):
+        """A search on a legacy root sees every document."""
+        assert search_by_category("reports", legacy_root)["count"] == 3
+        assert len(search_by_task("GH-1", legacy_root)["documents"]) == 2
+
+    def test_empty_store_is_bootstrapped(self, legacy_root):
+        """A store created empty by an earlier run is still loaded before use."""
+        IndexStore(legacy_root).close()
+        timestamp = "2026-01-09T10:00:00+00:00"
+        rel = add_document(legacy_root, "agent-c", "GH-3", "report9", timestamp)
+        update_index(legacy_root, "GH-3", "agent-c", "reports", rel, timestamp)
+
+        assert len(category_view(legacy_root, "reports")) == 4
+        with IndexStore(legacy_root) as store:
+            assert store.loaded
+
+    def test_bootstrap_runs_once(self, legacy_root):
+        """After the first load, documents outside the journal are not picked up again."""
+        search_by_category("reports", legacy_root)
+        add_document(legacy_root, "agent-c", "GH-1", "unjournaled", "2026-01-09T10:00:00+00:00")
+
+        assert search_by_category("reports", legacy_root)["count"] == 3
+
+
+class TestJournal:
+    """IndexWriter journal appends and compaction."""
+
+    def test_concurrent_appends_are_all_journaled(self, tmp_path):
+        """Batches appended from many threads are all loaded by one compaction."""
+        writer = IndexWriter(tmp_path)
+        batches = [make_records(f"t{n}", 25) for n in range(8)]
+        threads = [threading.Thread(target=writer.append, args=(batch,)) for batch in batches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        lines = writer.journal.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 200
+        assert all(json.loads(line) for line in lines)
+        assert compact_indexes(tmp_path)["documents"] == 200
+        assert writer.pending_bytes() == 0
+        assert len(indexed_paths(tmp_path)) == 200
+
+    def test_compaction_during_appends_loses_nothing(self, tmp_path):
+        """Appends racing compactions end up in the store exactly once."""
+        writer = IndexWriter(tmp_path)
+        batches = [make_records(f"c{n}", 10) for n in range(20)]
+        done = threading.Event()
+
+        def append_all():
+            for batch in batches:
+                writer.append(batch)
+            done.set()
+
+        def compact_repeatedly():
+            while not done.is_set():
+                IndexWriter(tmp_path).compact()
+
+        appender = threading.Thread(target=append_all)
+        compactor = threading.Thread(target=compact_repeatedly)
+        compactor.start()
+        appender.start()
+        appender.join()
+        compactor.join()
+        compact_indexes(tmp_path)
+
+        expected = sorted(r["path"] for batch in batches for r in batch)
+        assert indexed_paths(tmp_path) == expected
+        view = category_view(tmp_path, "reports")
+        assert sorted(entry["path"] for entry in view) == expected
+
+    def test_journal_left_by_crash_is_replayed(self, tmp_path):
+        """A journal never compacted (torn last line included) is applied by the next compaction."""
+        writer = IndexWriter(tmp_path)
+        records = make_records("r", 3)
+        writer.append(records)
+        with open(writer.journal, "a", encoding="utf-8") as f:
+            f.write('{"task_id": "GH-1", "agent": "agent-r", "cat')
+
+        assert compact_indexes(tmp_path)["documents"] == 3
+        assert indexed_paths(tmp_path) == sorted(r["path"] for r in records)
+        assert not writer.journal.exists()
+
+    def test_interrupted_compaction_can_rerun(self, tmp_path):
+        """Records loaded before the journal was removed are not duplicated by a rerun."""
+        writer = IndexWriter(tmp_path)
+        records = make_records("i", 3)
+        writer.append(records)
+        compact_indexes(tmp_path)
+        # Crash after the store was written but before the journal was removed
+        writer.append(records)
+
+        assert compact_indexes(tmp_path)["documents"] == 0
+        assert len(indexed_paths(tmp_path)) == 3
+        assert len(category_view(tmp_path, "reports")) == 3
+
+
+class TestSearchStore:
+    """eoa_search answers from the store populated by downloads."""
+
+    @pytest.fixture
+    def design_root(self, tmp_path):
+        """Three documents stored and indexed through update_index()."""
+        documents = [
+            ("agent-a", "GH-1", "reports", "progress", "2026-03-01T09:00:00+00:00", "# Progress\nAll green.\n"),
+            ("agent-b", "GH-1", "reports", "blocker", "2026-03-02T09:00:00+00:00", "# Blocker\nWaiting on API keys.\n"),
+            ("agent-a", "GH-2", "acks", "ack", "2026-03-02T11:00:00+00:00", "# Ack\nReceived.\n"),
+        ]
+        for agent, task_id, category, name, timestamp, text in documents:
+            rel = add_document(tmp_path, agent, task_id, name, timestamp, category=category, text=text)
+            update_index(tmp_path, task_id, agent, category, rel, timestamp)
+        return tmp_path
+
+    def test_by_task(self, design_root):
+        """Task documents in timestamp order; unknown tasks are not found."""
+        result = search_by_task("GH-1", design_root)
+        assert result["found"]
+        assert [d["agent"] for d in result["documents"]] == ["agent-a", "agent-b"]
+        assert not search_by_task("GH-9", design_root)["found"]
+
+    def test_by_agent(self, design_root):
+        """An agent lists each of its tasks once."""
+        result = search_by_agent("agent-a", design_root)
+        assert result["tasks"] == ["GH-1", "GH-2"]
+
+    def test_by_date_and_category(self, design_root):
+        """Date and category views select the matching documents."""
+        assert search_by_date("2026-03-02", design_root)["count"] == 2
+        assert search_by_category("acks", design_root)["count"] == 1
+
+    def test_blockers(self, design_root):
+        """Only reports whose path names a blocker are blockers."""
+        result = search_blockers(design_root)
+        assert result["count"] == 1
+        assert result["blockers"][0]["agent"] == "agent-b"
+
+    def test_fulltext(self, design_root):
+        """Full-text matches are case-insensitive and confirmed on disk."""
+        result = search_fulltext("api keys", design_root)
+        assert [r["agent"] for r in result["results"]] == ["agent-b"]
+        assert not search_fulltext("nowhere", design_root)["found"]
+
+
+class TestRebuild:
+    """Incremental index-rebuild, its manifest and --verify."""
+
+    @pytest.fixture
+    def design_root(self, tmp_path):
+        """Three documents indexed by a full rebuild."""
+        for i, (agent, task_id) in enumerate([("agent-a", "GH-1"), ("agent-b", "GH-1"), ("agent-a", "GH-2")]):
+            add_document(tmp_path, agent, task_id, f"report{i}", f"2026-04-0{i + 1}T10:00:00+00:00")
+        rebuild_indexes(tmp_path, full=True)
+        return tmp_path
+
+    def assert_matches_full_rebuild(self, design_root):
+        """The current views equal the ones a full rebuild writes."""
+        incremental = all_views(design_root)
+        rebuild_indexes(design_root, full=True)
+        assert incremental == all_views(design_root)
+
+    def test_unchanged_tree_is_skipped(self, design_root):
+        """Nothing is reindexed when no document changed."""
+        result = rebuild_indexes(design_root)
+        assert (result["added"], result["changed"], result["removed"], result["unchanged"]) == (0, 0, 0, 3)
+
+    def test_added_document(self, design_root):
+        """A new document is indexed and appears in its views."""
+        add_document(design_root, "agent-c", "GH-1", "late", "2026-04-09T10:00:00+00:00")
+        result = rebuild_indexes(design_root)
+
+        assert (result["added"], result["changed"], result["unchanged"]) == (1, 0, 3)
+        assert len(category_view(design_root, "reports")) == 4
+        self.assert_matches_full_rebuild(design_root)
+
+    def test_changed_document_keeps_view_order(self, design_root):
+        """A changed document is reindexed without moving to the end of its views."""
+        rel = "agents/agent-a/received/reports/GH-1/report0.md"
+        rewrite(design_root, rel, "# Report\nRevised.\n")
+        result = rebuild_indexes(design_root)
+
+        assert (result["added"], result["changed"]) == (0, 1)
+        assert category_view(design_root, "reports")[0]["path"] == rel
+        self.assert_matches_full_rebuild(design_root)
+
+    def test_removed_document(self, design_root):
+        """A deleted document leaves the store, its views and the manifest."""
+        rel = "agents/agent-a/received/reports/GH-2/report2.md"
+        (design_root / rel).unlink()
+        result = rebuild_indexes(design_root)
+
+        assert result["removed"] == 1
+        assert not (design_root / "index" / "by-task" / "GH-2.json").exists()
+        with IndexStore(design_root) as store:
+            assert rel not in store.manifest()
+        self.assert_matches_full_rebuild(design_root)
+
+    def test_touched_document_only_refreshes_manifest(self, design_root):
+        """A new mtime with the same content is not reindexed, but its manifest entry is updated."""
+        rel = "agents/agent-b/received/reports/GH-1/report1.md"
+        path = design_root / rel
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        result = rebuild_indexes(design_root)
+
+        assert (result["changed"], result["unchanged"]) == (0, 3)
+        with IndexStore(design_root) as store:
+            assert store.manifest()[rel][1] == stat.st_mtime_ns + 10**9
+
+    def test_manifest_records_fingerprints(self, design_root):
+        """Each manifest entry holds size, mtime_ns and SHA-256 of the document and its metadata's stat."""
+        rel = "agents/agent-a/received/reports/GH-1/report0.md"
+        path = design_root / rel
+        metadata = path.with_name("report0_metadata.json")
+        with IndexStore(design_root) as store:
+            entry = store.manifest()[rel]
+
+        md_stat, meta_stat = path.stat(), metadata.stat()
+        assert entry == (
+            md_stat.st_size,
+            md_stat.st_mtime_ns,
+            meta_stat.st_size,
+            meta_stat.st_mtime_ns,
+            hashlib.sha256(path.read_bytes()).hexdigest(),
+        )
+
+    def test_verify_reports_drift(self, design_root):
+        """verify_indexes lists missing, stale, orphaned and metadata-less documents."""
+        assert verify_indexes(design_root)["in_sync"]
+
+        rewrite(design_root, "agents/agent-a/received/reports/GH-1/report0.md", "# Changed\n")
+        add_document(design_root, "agent-c", "GH-3", "new", "2026-04-09T10:00:00+00:00")
+        (design_root / "agents/agent-a/received/reports/GH-2/report2.md").unlink()
+        bare = design_root / "agents/agent-b/received/reports/GH-1/bare.md"
+        bare.write_text("# No metadata\n", encoding="utf-8")
+        report = verify_indexes(design_root)
+
+        assert not report["in_sync"]
+        assert report["stale"] == ["agents/agent-a/received/reports/GH-1/report0.md"]
+        assert report["missing"] == ["agents/agent-c/received/reports/GH-3/new.md"]
+        assert report["orphaned"] == ["agents/agent-a/received/reports/GH-2/report2.md"]
+        assert report["no_metadata"] == ["agents/agent-b/received/reports/GH-1/bare.md"]
+
+        bare.unlink()
+        rebuild_indexes(design_root)
+        assert verify_indexes(design_root)["in_sync"]
+
+    def test_verify_cli_exit_code(self, design_root):
+        """index-rebuild --verify exits 0 in sync and 1 on drift."""
+        command = [
+            sys.executable, str(SCRIPTS_DIR / "eoa_orchestrator_download.py"),
+            "index-rebuild", "--verify", "--json", "--design-root", str(design_root),
+        ]
+        in_sync = subprocess.run(command, capture_output=True, text=True)
+        assert in_sync.returncode == 0
+        assert json.loads(in_sync.stdout)["in_sync"]
+
+        add_document(design_root, "agent-c", "GH-3", "new", "2026-04-09T10:00:00+00:00")
+        drift = subprocess.run(command, capture_output=True, text=True)
+        assert drift.returncode == 1
+        assert json.loads(drift.stdout)["missing"] == ["agents/agent-c/received/reports/GH-3/new.md"]
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    """Serves a small markdown document for any path."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = f"# Document {self.path}\n".encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    """Start a local document server; yields its base URL."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StaticHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestBatchDownloadIndexing:
+    """download_batch_to_agent_folders journals records as it goes."""
+
+    def test_crash_after_metadata_keeps_record(self, server, tmp_path, monkeypatch):
+        """Documents whose metadata was written before a crash are already journaled."""
+        items = [
+            {"url": f"{server}/{name}.md", "agent": "agent-a", "task_id": "GH-1", "category": "reports"}
+            for name in ("first", "second")
+        ]
+        real_write = eoa_orchestrator_download.write_agent_document_metadata
+        written = []
+
+        def crash_on_second(file_path, *args, **kwargs):
+            if written:
+                raise KeyboardInterrupt
+            written.append(file_path)
+            return real_write(file_path, *args, **kwargs)
+
+        # A loaded store is only updated from the journal, never rescanned
+        IndexWriter(tmp_path).bootstrap()
+        monkeypatch.setattr(eoa_orchestrator_download, "write_agent_document_metadata", crash_on_second)
+        with pytest.raises(KeyboardInterrupt):
+            download_batch_to_agent_folders(items, design_root=tmp_path)
+
+        compact_indexes(tmp_path)
+        documents = search_by_task("GH-1", tmp_path)["documents"]
+        assert [d["path"] for d in documents] == [str(written[0].relative_to(tmp_path))]
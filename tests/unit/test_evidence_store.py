@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tests for evidence_store.py -- Evidence store CLI filters.
+
+These tests verify that --filter accepts type and severity values in any case
+and that an unknown value is reported like an unknown filter key.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Path to the script under test, plus the shared modules it imports
+SCRIPTS_DIR = REPO_ROOT / "skills" / "eoa-verification-patterns" / "scripts"
+
+sys.path.insert(0, str(REPO_ROOT / "shared"))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# evidence_store imports cross_platform from the installed skills/shared
+pytest.importorskip("cross_platform")
+
+from evidence_store import Evidence, EvidenceStore, main  # noqa: E402
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    """A JSON store with one CRITICAL finding and one LOW observation."""
+    store = EvidenceStore()
+    store.add(Evidence("e1", "FINDING", "pytest", "2025-01-01T00:00:00Z", "CRITICAL", "crash"))
+    store.add(Evidence("e2", "OBSERVATION", "lint", "2025-01-02T00:00:00Z", "LOW", "style"))
+    path = tmp_path / "audit.json"
+    store.save(path)
+    return path
+
+
+def run(monkeypatch, store_path, *args):
+    """Run the CLI and return its exit code."""
+    monkeypatch.setattr(sys, "argv", ["evidence_store.py", "--store", str(store_path), *args])
+    return main()
+
+
+def printed_ids(capsys) -> list:
+    """IDs of the evidence records the CLI printed as JSON."""
+    out = capsys.readouterr().out
+    decoder = json.JSONDecoder()
+    ids, pos = [], 0
+    while pos < len(out.rstrip()):
+        record, end = decoder.raw_decode(out, pos)
+        ids.append(record["id"])
+        pos = end + 1
+    return ids
+
+
+class TestFilter:
+    """--filter type=... and severity=... values."""
+
+    @pytest.mark.parametrize("value", ["CRITICAL", "critical", "Critical"])
+    def test_severity_is_case_insensitive(self, monkeypatch, capsys, store_path, value):
+        """Any case selects the matching severity."""
+        assert run(monkeypatch, store_path, "--filter", f"severity={value}") == 0
+        assert printed_ids(capsys) == ["e1"]
+
+    def test_type_is_case_insensitive(self, monkeypatch, capsys, store_path):
+        """type=observation matches OBSERVATION evidence."""
+        assert run(monkeypatch, store_path, "--filter", "type=observation") == 0
+        assert printed_ids(capsys) == ["e2"]
+
+    @pytest.mark.parametrize(("key", "value"), [("severity", "urgent"), ("type", "bug")])
+    def test_unknown_value_is_reported(self, monkeypatch, capsys, store_path, key, value):
+        """An unknown value fails with the accepted values listed."""
+        assert run(monkeypatch, store_path, "--filter", f"{key}={value}") == 1
+        err = capsys.readouterr().err
+        assert f"Unknown {key}: {value}" in err
+        assert "expected one of" in err
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for quality_pattern_detector.py -- Baseline scan counters.
+
+These tests verify that a baseline (incremental) scan reports the same
+files_scanned and lines_scanned totals as a full scan, with the files and
+lines actually read reported as files_rescanned and lines_rescanned.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Path to the script under test, plus the shared modules it imports
+SCRIPTS_DIR = REPO_ROOT / "skills" / "eoa-verification-patterns" / "scripts"
+
+sys.path.insert(0, str(REPO_ROOT / "shared"))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# quality_pattern_detector imports cross_platform from the installed skills/shared
+pytest.importorskip("cross_platform")
+
+from finding_baseline import FindingBaseline  # noqa: E402
+from quality_pattern_detector import PatternDetector  # noqa: E402
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Twelve small Python files of different lengths."""
+    for i in range(12):
+        (tmp_path / f"mod{i}.py").write_text("x = 1\n" * (i + 1) + "# TODO later\n", encoding="utf-8")
+    return tmp_path
+
+
+def summary(tree: Path, jobs: int, baseline: FindingBaseline | None = None) -> dict:
+    detector = PatternDetector()
+    detector.load_patterns()
+    if baseline is None:
+        detector.detect_all(tree, jobs=jobs)
+    else:
+        detector.detect_incremental(tree, baseline, jobs=jobs)
+    return detector.report()["summary"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_baseline_scan_counts_reused_lines(tree, jobs):
+    """Reused files count toward lines_scanned; only read lines are rescanned."""
+    baseline = FindingBaseline("quality_pattern_detector", "test")
+    first = summary(tree, jobs, baseline)
+    (tree / "mod3.py").write_text("y = 2\n" * 20, encoding="utf-8")
+    second = summary(tree, jobs, baseline)
+    full = summary(tree, jobs)
+
+    assert first["lines_rescanned"] == first["lines_scanned"] == 90
+    assert (second["files_scanned"], second["lines_scanned"]) == (full["files_scanned"], full["lines_scanned"])
+    assert (second["files_rescanned"], second["lines_rescanned"]) == (1, 20)
+    assert "lines_rescanned" not in full
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Tests for scoring_framework.py -- Weighted multi-metric scoring.
+
+These tests check the built-in normalizations against known values, that the
+column-wise normalizations match the scalar functions, that weights are
+normalized and applied as documented, and that the stdlib and NumPy scoring
+paths produce the same scores and rankings.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Path to the script under test, plus the shared modules it imports
+SCRIPTS_DIR = REPO_ROOT / "skills" / "eoa-verification-patterns" / "scripts"
+
+sys.path.insert(0, str(REPO_ROOT / "shared"))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# scoring_framework imports cross_platform from the installed skills/shared
+pytest.importorskip("cross_platform")
+
+import scoring_framework  # noqa: E402
+from scoring_framework import VECTOR_NORMALIZATIONS, ScoringFramework  # noqa: E402
+
+VALUES = [-5.0, 0.0, 0.5, 1.0, 9.0, 25.0, 50.0, 75.0, 99.0, 100.0, 150.0, 1e6, -1e6]
+
+SCALAR = {
+    "clamp": lambda x: min(100.0, max(0.0, x)),
+    "linear": ScoringFramework._linear_normalization,
+    "log": ScoringFramework._log_normalization,
+    "sigmoid": ScoringFramework._sigmoid_normalization,
+    "inverse": ScoringFramework._inverse_normalization,
+}
+
+
+@pytest.fixture(params=["stdlib", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test once with list arithmetic and once with NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(scoring_framework, "NUMPY_AVAILABLE", False)
+    return request.param
+
+
+def entities(count: int = 50) -> list:
+    """Entities with varied metric values, ties and a missing metric."""
+    result = []
+    for i in range(count):
+        metrics = {"volume": (i * 37) % 1000, "competition": (i * 13) % 120, "relevance": i % 7 * 15}
+        if i % 11 == 0:
+            del metrics["relevance"]
+        result.append({"name": f"entity-{i}", "metrics": metrics})
+    # Two identical entities tie; input order must decide their ranks
+    result.append({"name": "tie-a", "metrics": {"volume": 500, "competition": 10, "relevance": 60}})
+    result.append({"name": "tie-b", "metrics": {"volume": 500, "competition": 10, "relevance": 60}})
+    return result
+
+
+def framework(items: list) -> ScoringFramework:
+    """A framework using every built-in normalization, with unnormalized weights."""
+    fw = ScoringFramework()
+    fw.define_metric("volume", 0.8, lambda x: ScoringFramework._log_normalization(x), normalization="log")
+    fw.define_metric("competition", 0.6, lambda x: ScoringFramework._inverse_normalization(x), normalization="inverse")
+    fw.define_metric("relevance", 0.4, lambda x: ScoringFramework._sigmoid_normalization(x), normalization="sigmoid")
+    fw.define_metric("relevance_raw", 0.2)
+    fw.entities = items
+    return fw
+
+
+class TestNormalization:
+    """Built-in normalizations map raw values onto 0-100."""
+
+    @pytest.mark.parametrize(
+        ("kind", "value", "expected"),
+        [
+            ("linear", 50, 50.0),
+            ("linear", 150, 100.0),
+            ("linear", -5, 0.0),
+            ("log", 0, 0.0),
+            ("log", 9, 100.0),
+            ("log", 99, 100.0),
+            ("log", 0.5, math.log10(1.5) * 100),
+            ("sigmoid", 50, 50.0),
+            ("sigmoid", 60, 100 / (1 + math.exp(-1))),
+            ("sigmoid", -1e6, 0.0),
+            ("inverse", 0, 100.0),
+            ("inverse", 25, 75.0),
+            ("inverse", 200, 0.0),
+        ],
+    )
+    def test_known_values(self, kind, value, expected):
+        """Each scalar normalization returns the documented value."""
+        assert SCALAR[kind](value) == pytest.approx(expected)
+
+    def test_equal_bounds_map_to_midpoint(self):
+        """A linear range of zero width scores 50 instead of dividing by zero."""
+        assert ScoringFramework._linear_normalization(7, min_val=3, max_val=3) == 50.0
+
+    @pytest.mark.parametrize("kind", VECTOR_NORMALIZATIONS)
+    def test_column_matches_scalar(self, kind, backend):
+        """Column-wise normalization agrees with the scalar function value by value."""
+        fw = ScoringFramework()
+        fw.define_metric("m", 1.0, SCALAR[kind], normalization=kind)
+        column = list(fw._normalize_column(fw.metrics[0], VALUES))
+        assert column == pytest.approx([SCALAR[kind](v) for v in VALUES], rel=1e-12, abs=1e-12)
+
+    def test_custom_normalization_is_called_per_value(self, backend):
+        """A custom callable is applied to each value unchanged."""
+        fw = ScoringFramework()
+        fw.define_metric("m", 1.0, lambda x: x / 2)
+        assert list(fw._normalize_column(fw.metrics[0], [2, 4, 6])) == [1, 2, 3]
+
+
+class TestWeighting:
+    """Weights are normalized to sum to 1 and applied to normalized values."""
+
+    def test_weights_are_normalized(self):
+        """Weights that do not sum to 1 are scaled proportionally."""
+        fw = ScoringFramework()
+        fw.define_metric("a", 0.6)
+        fw.define_metric("b", 0.2)
+        fw._normalize_weights()
+        assert [m.weight for m in fw.metrics] == pytest.approx([0.75, 0.25])
+
+    def test_zero_total_weight_is_rejected(self):
+        """All-zero weights cannot be normalized."""
+        fw = ScoringFramework()
+        fw.define_metric("a", 0.0)
+        with pytest.raises(ValueError):
+            fw._normalize_weights()
+
+    def test_weight_out_of_range_is_rejected(self):
+        """Weights outside 0-1 are rejected when the metric is defined."""
+        with pytest.raises(ValueError):
+            ScoringFramework().define_metric("a", 1.5)
+
+    def test_weighted_score(self, backend):
+        """The score is the weighted sum of normalized values, times 100."""
+        fw = ScoringFramework()
+        fw.define_metric("a", 0.6)
+        fw.define_metric("b", 0.2)
+        fw.entities = [{"name": "x", "metrics": {"a": 80, "b": 40}}, {"name": "y", "metrics": {"a": 120}}]
+
+        ranked = fw.rank_all()
+
+        assert [(e.name, e.score) for e in ranked] == [
+            ("y", pytest.approx(7500.0)),
+            ("x", pytest.approx(7000.0)),
+        ]
+        assert ranked[1].normalized_metrics == {"a": 80, "b": 40}
+        assert fw.score_entity(fw.entities[0]).score == pytest.approx(7000.0)
+
+
+class TestBackends:
+    """The stdlib and NumPy paths agree with each other and with score_entity()."""
+
+    def results(self, monkeypatch, numpy: bool) -> dict:
+        monkeypatch.setattr(scoring_framework, "NUMPY_AVAILABLE", numpy)
+        fw = framework(entities())
+        ranked = fw.rank_all()
+        top = framework(entities()).select_top(5, iter(entities()))
+        bottom = framework(entities()).select_bottom(5, iter(entities()))
+        return {
+            "ranked": [(e.name, e.rank, e.score, e.normalized_metrics) for e in ranked],
+            "top": [(e.name, e.rank, e.score) for e in top],
+            "bottom": [(e.name, e.rank, e.score) for e in bottom],
+            "single": [fw.score_entity(e).score for e in fw.entities],
+        }
+
+    def test_stdlib_and_numpy_agree(self, monkeypatch):
+        """Scores, ranks, normalized values and selections match across backends."""
+        pytest.importorskip("numpy")
+        stdlib = self.results(monkeypatch, numpy=False)
+        numpy = self.results(monkeypatch, numpy=True)
+
+        assert [r[:2] for r in numpy["ranked"]] == [r[:2] for r in stdlib["ranked"]]
+        for ours, theirs in zip(numpy["ranked"], stdlib["ranked"]):
+            assert ours[2] == pytest.approx(theirs[2], rel=1e-12)
+            assert ours[3] == pytest.approx(theirs[3], rel=1e-12)
+        assert [r[:2] for r in numpy["top"]] == [r[:2] for r in stdlib["top"]]
+        assert [r[:2] for r in numpy["bottom"]] == [r[:2] for r in stdlib["bottom"]]
+
+    def test_batch_matches_single_entity_scoring(self, monkeypatch, backend):
+        """rank_all() scores equal score_entity() scores, and selections match the ranking."""
+        result = self.results(monkeypatch, numpy=backend == "numpy")
+        by_name = {name: score for name, _, score, _ in result["ranked"]}
+        names = [e["name"] for e in entities()]
+
+        assert [by_name[name] for name in names] == pytest.approx(result["single"], rel=1e-12)
+        assert result["top"] == [r[:3] for r in result["ranked"][:5]]
+        assert result["bottom"] == [r[:3] for r in result["ranked"][-5:]]
+
+    def test_ties_keep_input_order(self, backend):
+        """Entities with equal scores are ranked in input order."""
+        names = [e.name for e in framework(entities()).rank_all()]
+        assert names.index("tie-a") + 1 == names.index("tie-b")
+
+
+class TestExport:
+    """Streamed exports are written through a per-process temp file."""
+
+    @pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+    def test_export_leaves_other_temp_files(self, tmp_path, suffix):
+        """Another writer's temp file for the same output is left alone."""
+        out = tmp_path / f"scores{suffix}"
+        foreign = [tmp_path / f"scores{suffix}.tmp", tmp_path / f"scores{suffix}.99999.tmp"]
+        for path in foreign:
+            path.write_text("in flight", encoding="utf-8")
+        fw = framework(entities(5))
+        fw.rank_all()
+
+        fw.export(str(out))
+
+        assert len(out.read_text(encoding="utf-8").splitlines()) == 7 + (suffix == ".csv")
+        assert [p.read_text(encoding="utf-8") for p in foreign] == ["in flight", "in flight"]
+        assert sorted(tmp_path.glob("*.tmp")) == sorted(foreign)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests for traceability_validator.py -- Criteria/task traceability index.
+
+These tests verify that load_index() builds the same coverage from a cold
+parse, from the on-disk cache and from the incremental tasks-only path, and
+that specs with CRLF line endings parse like their LF equivalents.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Path to the script under test, plus the shared modules it imports
+SCRIPTS_DIR = REPO_ROOT / "skills" / "eoa-verification-patterns" / "scripts"
+
+sys.path.insert(0, str(REPO_ROOT / "shared"))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from traceability_validator import (  # noqa: E402
+    INDEX_CACHE_NAME,
+    TraceabilityIndex,
+    TraceabilityValidator,
+)
+
+REQUIREMENTS = """# Requirements
+
+### Requirement 1: Login
+
+#### Acceptance Criteria
+1. Users can sign in
+2. Failed sign-ins are logged
+
+### Requirement 2: Logout
+
+#### Acceptance Criteria
+1. Users can sign out
+"""
+
+TASKS = """# Tasks
+
+- [ ] 1. Implement sign-in
+  _Requirements: 1.1, 1.2_
+- [ ] 2. Implement sign-out
+  _Requirements: 2.1, 9.9_
+"""
+
+
+def write_spec(base: Path, requirements: str, tasks: str, newline: str = "\n") -> None:
+    """Write requirements.md and tasks.md with the given line endings."""
+    (base / "requirements.md").write_bytes(requirements.replace("\n", newline).encode("utf-8"))
+    (base / "tasks.md").write_bytes(tasks.replace("\n", newline).encode("utf-8"))
+
+
+def coverage(index: TraceabilityIndex) -> dict:
+    """The parts of an index that define coverage."""
+    return {
+        "criterion_tasks": index.criterion_tasks,
+        "task_criteria": index.task_criteria,
+        "invalid_references": index.invalid_references,
+    }
+
+
+class TestLoadIndex:
+    """load_index() agrees with a direct TraceabilityIndex build."""
+
+    def test_cold_path_writes_cache(self, tmp_path):
+        """Without a cache the spec is parsed and the cache is written."""
+        write_spec(tmp_path, REQUIREMENTS, TASKS)
+        validator = TraceabilityValidator(str(tmp_path))
+        index = validator.load_index()
+
+        assert list(index.criteria) == ["1.1", "1.2", "2.1"]
+        assert index.criterion_tasks == {"1.1": ["1"], "1.2": ["1"], "2.1": ["2"]}
+        assert index.invalid_references == ["9.9"]
+        assert index.missing() == []
+        assert (tmp_path / INDEX_CACHE_NAME).exists()
+
+    def test_cached_path_reuses_cache(self, tmp_path):
+        """Unchanged files are served from the cache, not re-parsed."""
+        write_spec(tmp_path, REQUIREMENTS, TASKS)
+        cold = TraceabilityValidator(str(tmp_path)).load_index()
+
+        validator = TraceabilityValidator(str(tmp_path))
+        validator._parse_requirements_text = None  # type: ignore[assignment]
+        validator._parse_tasks_text = None  # type: ignore[assignment]
+        cached = validator.load_index()
+
+        assert coverage(cached) == coverage(cold)
+        assert validator.requirements["1"]["title"] == "Login"
+
+    def test_incremental_path_relinks_tasks(self, tmp_path):
+        """A tasks.md change keeps the cached criteria and re-links tasks."""
+        write_spec(tmp_path, REQUIREMENTS, TASKS)
+        TraceabilityValidator(str(tmp_path)).load_index()
+
+        (tmp_path / "tasks.md").write_text(
+            "- [ ] 1. Implement sign-in\n  _Requirements: 1.1_\n", encoding="utf-8"
+        )
+        validator = TraceabilityValidator(str(tmp_path))
+        validator._parse_requirements_text = None  # type: ignore[assignment]
+        index = validator.load_index()
+
+        assert index.covered() == ["1.1"]
+        assert index.missing() == ["1.2", "2.1"]
+        assert index.invalid_references == []
+        cache = json.loads((tmp_path / INDEX_CACHE_NAME).read_text(encoding="utf-8"))
+        assert cache["index"]["criterion_tasks"]["1.2"] == []
+
+    @pytest.mark.parametrize("newline", ["\r\n", "\r"])
+    def test_crlf_spec_matches_lf(self, tmp_path, newline):
+        """CRLF and CR specs produce the same index as LF specs."""
+        lf_dir = tmp_path / "lf"
+        crlf_dir = tmp_path / "crlf"
+        lf_dir.mkdir()
+        crlf_dir.mkdir()
+        write_spec(lf_dir, REQUIREMENTS, TASKS)
+        write_spec(crlf_dir, REQUIREMENTS, TASKS, newline=newline)
+
+        expected = TraceabilityValidator(str(lf_dir)).load_index()
+        index = TraceabilityValidator(str(crlf_dir)).load_index()
+        assert coverage(index) == coverage(expected)
+        assert list(index.criteria) == ["1.1", "1.2", "2.1"]
+
+    def test_crlf_matches_parse_methods(self, tmp_path):
+        """load_index() and parse_requirements()/parse_tasks() agree on CRLF."""
+        write_spec(tmp_path, REQUIREMENTS, TASKS, newline="\r\n")
+        validator = TraceabilityValidator(str(tmp_path))
+        validator.parse_requirements("requirements.md")
+        validator.parse_tasks("tasks.md")
+        expected = TraceabilityIndex(validator.requirements, validator.tasks)
+
+        index = TraceabilityValidator(str(tmp_path)).load_index(use_cache=False)
+        assert coverage(index) == coverage(expected)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Tests for validation_common.py -- Shared validation report types.
+
+These tests verify that the per-level counters of a ResultList survive
+copying and pickling without being double-counted or lost, that relevel()
+finds results by their recorded position after any mutation, and that only
+the fixed level/phase strings are interned.
+"""
+
+import copy
+import pickle
+import sys
+from pathlib import Path
+
+# Path to the module under test
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from validation_common import ResultList, ValidationReport, ValidationResult  # noqa: E402
+
+
+def make_report() -> ValidationReport:
+    """A report with results at several levels."""
+    report = ValidationReport()
+    report.add("CRITICAL", "broken manifest", "plugin.json")
+    report.add("MAJOR", "missing field", "plugin.json", 3)
+    report.add("MAJOR", "missing field", "agents/a.md", 1)
+    report.add("PASSED", "structure ok")
+    return report
+
+
+class TestResultListCopies:
+    """Copies of a ResultList carry the same results and counters."""
+
+    def test_deepcopy_keeps_counts(self):
+        """deepcopy rebuilds counters from the copied results."""
+        report = make_report()
+        copied = copy.deepcopy(report)
+
+        assert isinstance(copied.results, ResultList)
+        assert copied.results == report.results
+        assert copied.results.counts == report.results.counts
+        assert copied.results.counts["MAJOR"] == 2
+
+    def test_copy_is_independent(self):
+        """Appending to a shallow copy does not change the original's counters."""
+        results = make_report().results
+        copied = copy.copy(results)
+        copied.append(ValidationResult("MINOR", "style"))
+
+        assert copied.counts["MINOR"] == 1
+        assert results.counts["MINOR"] == 0
+
+    def test_pickle_round_trip(self):
+        """Unpickling restores the results and their counters."""
+        report = make_report()
+        restored = pickle.loads(pickle.dumps(report))
+
+        assert isinstance(restored.results, ResultList)
+        assert restored.results == report.results
+        assert restored.results.counts == report.results.counts
+
+
+class TestRelevel:
+    """relevel() replaces the right result without scanning the list."""
+
+    def test_apply_fixes_relevels_each_fixed_result(self):
+        """Each successful fix turns its own result into a PASSED copy."""
+        report = ValidationReport()
+        for i in range(50):
+            report.add("INFO", f"note {i}")
+            report.add_fixable("MAJOR", f"issue {i}", lambda file, line: True, "fix it", f"f{i}.md")
+
+        assert report.apply_fixes() == {"applied": 50, "failed": 0, "skipped": 0}
+        assert report.results.counts["MAJOR"] == 0
+        assert report.results.counts["PASSED"] == 50
+        assert [r.message for r in report.results[1:6:2]] == [f"[FIXED] issue {i}" for i in range(3)]
+        assert all(fixable.result is report.results[2 * i + 1] for i, fixable in enumerate(report.fixable_issues))
+
+    def test_positions_follow_mutations(self):
+        """Results are found after inserts, deletions and replacements shift positions."""
+        results = ResultList(ValidationResult("MINOR", f"r{i}") for i in range(6))
+        target = results[4]
+        results.insert(0, ValidationResult("INFO", "first"))
+        results.pop(1)
+        del results[1]
+        results[0] = ValidationResult("INFO", "replaced")
+        results.extend(ResultList([ValidationResult("MAJOR", "tail")]))
+
+        updated = results.relevel(target, "PASSED")
+
+        assert results[3] is updated
+        assert [r.message for r in results] == ["replaced", "r2", "r3", "r4", "r5", "tail"]
+        assert results.counts == {"CRITICAL": 0, "MAJOR": 1, "MINOR": 3, "INFO": 1, "PASSED": 1}
+
+    def test_repeated_result_relevels_first_occurrence(self):
+        """A result added twice is replaced where it first appears, then at the next."""
+        shared = ValidationResult("MAJOR", "dup")
+        results = ResultList([ValidationResult("INFO", "a"), shared, shared])
+
+        results.relevel(shared, "PASSED")
+        results.relevel(shared, "MINOR")
+
+        assert [r.level for r in results] == ["INFO", "PASSED", "MINOR"]
+
+    def test_missing_result_is_left_alone(self):
+        """Relevelling a result that is not in the list changes nothing."""
+        results = ResultList([ValidationResult("MAJOR", "kept")])
+        results.relevel(ValidationResult("MAJOR", "kept"), "PASSED")
+        assert results.counts["MAJOR"] == 1
+
+
+class TestInterning:
+    """Only the small fixed sets of strings are interned."""
+
+    def test_level_and_phase_are_interned(self):
+        result = ValidationResult("".join(["MA", "JOR"]), "m", phase="".join(["sec", "urity"]))
+        assert result.level is sys.intern("MAJOR")
+        assert result.phase is sys.intern("security")
+
+    def test_message_and_file_are_not_interned(self):
+        message = "".join(["unique ", "message"])
+        file = "".join(["some/", "file.md"])
+        result = ValidationResult("MINOR", message, file)
+        assert result.message is message
+        assert result.file is file